@@ -0,0 +1,196 @@
+# Copyright [2025] [SOPTIM AG]
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""
+Times the conversion of synthetic CGMES grids of increasing size.
+
+    python benchmarks/conversion_benchmark.py --nodes 1000 --cgmes 3.0
+    python benchmarks/conversion_benchmark.py --nodes 1000 10000 100000 \\
+        --endpoint http://localhost:3030/bench
+
+The grids are generated by `synthetic_grid.py` for each CGMES version and size.
+Without `--endpoint` they are converted from the in-process store
+(`CgmesFileDataset`), which is only practical for small grids. With `--endpoint`
+the profiles are uploaded into named graphs of the triplestore dataset, which
+has to be empty, and are dropped afterwards.
+
+The time of every builder of `CgmesToPgmConverter` is reported per size, so
+builders not scaling linearly (e.g. loops over all terminals) stand out. The
+queries are timed as a whole, as they are fetched concurrently.
+Times are the best of `--repeat` runs.
+"""
+
+import argparse
+import logging
+import tempfile
+import time
+import zipfile
+from pathlib import Path
+
+from synthetic_grid import CGMES_VERSIONS, GRID_BASE, SyntheticGridGenerator
+
+from cgmes2pgm_converter import CgmesDataset, CgmesFileDataset, CgmesToPgmConverter
+from cgmes2pgm_converter.common import ConverterOptions
+
+
+class TimedConverter(CgmesToPgmConverter):
+    """Converter recording the time of the queries, the topology and each builder"""
+
+    def __init__(self, datasource: CgmesDataset, options: ConverterOptions):
+        super().__init__(datasource, options)
+        self.times: dict[str, float] = {}
+
+    def _record(self, name: str, start: float):
+        self.times[name] = self.times.get(name, 0.0) + time.perf_counter() - start
+
+    def _fetch_query_results(self, builders, measurement_only=False):
+        start = time.perf_counter()
+        results = super()._fetch_query_results(builders, measurement_only)
+        self._record("(queries)", start)
+        return results
+
+    def _get_topology(self):
+        start = time.perf_counter()
+        topology = super()._get_topology()
+        self._record("(topology)", start)
+        return topology
+
+    def _build_component(self, builder):
+        start = time.perf_counter()
+        result = super()._build_component(builder)
+        self._record(type(builder).__name__, start)
+        return result
+
+
+def convert(dataset: CgmesDataset, repeat: int) -> dict[str, float]:
+    """Converts the dataset `repeat` times
+
+    Returns:
+        dict[str, float]: Best time in seconds of each step and of the conversion
+    """
+    best: dict[str, float] = {}
+    for _ in range(repeat):
+        converter = TimedConverter(dataset, ConverterOptions())
+        start = time.perf_counter()
+        converter.convert()
+        converter.times["(conversion)"] = time.perf_counter() - start
+
+        for name, elapsed in converter.times.items():
+            best[name] = min(best.get(name, float("inf")), elapsed)
+    return best
+
+
+def upload(dataset: CgmesDataset, path: Path) -> list[str]:
+    """Uploads the documents of the archive into named graphs
+
+    Returns:
+        list[str]: The named graphs
+    """
+    graphs = []
+    with zipfile.ZipFile(path) as archive:
+        for name in archive.namelist():
+            graph = f"{dataset.base_url}/{Path(name).stem}"
+            dataset.upload_graph(
+                graph, archive.read(name), content_type="application/rdf+xml"
+            )
+            graphs.append(graph)
+    return graphs
+
+
+def benchmark(
+    nodes: int, cgmes_version: str, args: argparse.Namespace, workdir: Path
+) -> dict[str, float]:
+    """Generates, loads and converts one grid
+
+    Returns:
+        dict[str, float]: Time in seconds of each step
+    """
+    base_iri = args.endpoint or GRID_BASE
+    generator = SyntheticGridGenerator(nodes, cgmes_version, args.seed, base_iri)
+
+    start = time.perf_counter()
+    path = generator.write(workdir / f"synthetic-{cgmes_version}-{nodes}.zip")
+    times = {"(generation)": time.perf_counter() - start}
+
+    start = time.perf_counter()
+    graphs = []
+    if args.endpoint:
+        dataset = CgmesDataset(
+            args.endpoint, generator.cim_namespace, split_profiles=True
+        )
+        graphs = upload(dataset, path)
+        dataset.populate_named_graph_mapping()
+    else:
+        dataset = CgmesFileDataset(
+            path, base_url=base_iri, split_profiles=args.split_profiles
+        )
+        if args.split_profiles:
+            dataset.populate_named_graph_mapping()
+    times["(loading)"] = time.perf_counter() - start
+
+    try:
+        times.update(convert(dataset, args.repeat))
+    finally:
+        for graph in graphs:
+            dataset.drop_graph(graph)
+    return times
+
+
+def print_table(cgmes_version: str, sizes: list[int], results: list[dict[str, float]]):
+    steps = sorted({name for times in results for name in times})
+    # steps in parentheses are printed after the builders
+    steps.sort(key=lambda name: name.startswith("("))
+
+    print(f"\nCGMES {cgmes_version}, times in seconds")
+    print(f"{'':<40}" + "".join(f"{size:>12}" for size in sizes))
+    for step in steps:
+        times = "".join(
+            f"{times[step]:>12.4f}" if step in times else f"{'-':>12}"
+            for times in results
+        )
+        print(f"{step:<40}{times}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--nodes", type=int, nargs="+", default=[1000, 10000, 100000])
+    parser.add_argument(
+        "--cgmes", choices=sorted(CGMES_VERSIONS), nargs="+", default=["2.4", "3.0"]
+    )
+    parser.add_argument("--endpoint", help="Base URL of an empty triplestore dataset")
+    parser.add_argument(
+        "--split-profiles",
+        action="store_true",
+        help="Query the named graphs of the profiles, always set with --endpoint",
+    )
+    parser.add_argument("--repeat", type=int, default=3)
+    parser.add_argument("--seed", type=int, default=1)
+    parser.add_argument("--workdir", help="Directory to keep the generated grids")
+    args = parser.parse_args()
+
+    logging.getLogger().setLevel(logging.ERROR)
+
+    with tempfile.TemporaryDirectory() as tmp:
+        workdir = Path(args.workdir or tmp)
+        workdir.mkdir(parents=True, exist_ok=True)
+
+        for cgmes_version in args.cgmes:
+            results = [
+                benchmark(nodes, cgmes_version, args, workdir) for nodes in args.nodes
+            ]
+            print_table(cgmes_version, args.nodes, results)
+
+
+if __name__ == "__main__":
+    main()
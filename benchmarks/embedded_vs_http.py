@@ -0,0 +1,131 @@
+# Copyright [2025] [SOPTIM AG]
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""
+Compares the conversion of a CGMES model from the in-process store
+(`CgmesFileDataset` backed by `EmbeddedSparqlDataSource`) with the conversion
+from a triplestore via HTTP.
+
+    python benchmarks/embedded_vs_http.py path/to/igm.zip
+    python benchmarks/embedded_vs_http.py path/to/igm.zip \\
+        --endpoint http://localhost:3030/igm
+
+The HTTP path is only measured if `--endpoint` is given, the dataset of the
+triplestore needs to contain the same files. Times are the best of `--repeat` runs.
+"""
+
+import argparse
+import logging
+import time
+
+from cgmes2pgm_converter import CgmesDataset, CgmesFileDataset, CgmesToPgmConverter
+from cgmes2pgm_converter.common import ConverterOptions
+
+
+def best_of(repeat: int, func):
+    """Returns the result of the last run and the shortest time in seconds"""
+    best = float("inf")
+    result = None
+    for _ in range(repeat):
+        start = time.perf_counter()
+        result = func()
+        best = min(best, time.perf_counter() - start)
+    return result, best
+
+
+def time_queries(dataset: CgmesDataset, repeat: int) -> dict[str, tuple[float, int]]:
+    """Times the queries of all builders, identical queries are timed once
+
+    Returns:
+        dict[str, tuple[float, int]]: Time and number of rows by "Builder.query"
+    """
+    # pylint: disable=protected-access
+    converter = CgmesToPgmConverter(dataset, ConverterOptions())
+    timings = {}
+    seen = set()
+    for builder in converter._get_component_builders():
+        for name, query in builder.get_queries().items():
+            if query in seen:
+                continue
+            seen.add(query)
+            result, elapsed = best_of(
+                repeat,
+                lambda q=query, n=name, b=builder: dataset.query(
+                    q, dtypes=b.get_result_dtypes(n)
+                ),
+            )
+            timings[f"{type(builder).__name__}.{name}"] = (elapsed, len(result))
+    return timings
+
+
+def convert(dataset: CgmesDataset) -> int:
+    """Converts the dataset, returns the number of PGM components"""
+    input_data, _ = CgmesToPgmConverter(dataset, ConverterOptions()).convert()
+    return sum(len(arr) for arr in input_data.values())
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("sources", nargs="+", help="CGMES files, zips or directories")
+    parser.add_argument("--endpoint", help="Base URL of a triplestore dataset")
+    parser.add_argument("--cim-namespace", help="CIM namespace, detected if omitted")
+    parser.add_argument("--split-profiles", action="store_true")
+    parser.add_argument("--repeat", type=int, default=3)
+    args = parser.parse_args()
+
+    logging.getLogger().setLevel(logging.WARNING)
+
+    start = time.perf_counter()
+    embedded = CgmesFileDataset(
+        args.sources,
+        cim_namespace=args.cim_namespace,
+        split_profiles=args.split_profiles,
+    )
+    load_time = time.perf_counter() - start
+
+    datasets = {"embedded": embedded}
+    if args.endpoint:
+        datasets["http"] = CgmesDataset(
+            args.endpoint,
+            embedded.cim_namespace,
+            split_profiles=args.split_profiles,
+        )
+
+    if args.split_profiles:
+        for dataset in datasets.values():
+            dataset.populate_named_graph_mapping()
+
+    print(f"Loading files: {load_time:.3f} s")
+
+    queries = {
+        name: time_queries(dataset, args.repeat) for name, dataset in datasets.items()
+    }
+    conversions = {
+        name: best_of(args.repeat, lambda d=dataset: convert(d))
+        for name, dataset in datasets.items()
+    }
+
+    header = f"{'query':<60}" + "".join(f"{name:>12}" for name in datasets)
+    print(header + f"{'rows':>10}")
+    for query, (_, rows) in queries["embedded"].items():
+        times = "".join(f"{queries[name][query][0]:>12.4f}" for name in datasets)
+        print(f"{query:<60}{times}{rows:>10}")
+
+    print()
+    for name, (components, elapsed) in conversions.items():
+        print(f"Conversion {name}: {elapsed:.3f} s, {components} components")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,741 @@
+# Copyright [2025] [SOPTIM AG]
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""
+Generates synthetic CGMES 2.4 and 3.0 datasets of configurable size.
+
+    python benchmarks/synthetic_grid.py grid.zip --nodes 10000 --cgmes 3.0
+
+The grid consists of substations with three voltage levels (380/110/20 kV) with
+two busbars each, which are connected by switches. Substations are connected by
+lines, each substation contains 2W transformers and some of them 3W transformers,
+phase shifters, generators, loads, shunts and equivalent branches. All tap changer
+types are used from about 250 nodes on. Terminals have multiple P, Q and U
+measurements.
+
+The profiles EQ, TP, SSH, SV, OP and MEAS are written as RDF/XML documents
+into a zip archive. Measurements are written to the OP and MEAS profiles
+for both CGMES versions.
+"""
+
+import argparse
+import random
+import tempfile
+import zipfile
+from collections.abc import Iterable
+from contextlib import ExitStack
+from dataclasses import dataclass
+from pathlib import Path
+from typing import TextIO
+from xml.sax.saxutils import escape, quoteattr
+
+# Default base IRI of the resources, declared as xml:base in all documents
+GRID_BASE = "http://example.com/synthetic-grid"
+
+RDF_NS = "http://www.w3.org/1999/02/22-rdf-syntax-ns#"
+MD_NS = "http://iec.ch/TC57/61970-552/ModelDescription/1#"
+
+NODES_PER_SUBSTATION = 6
+VOLTAGES = (380.0, 110.0, 20.0)
+
+
+@dataclass(frozen=True)
+class CgmesVersion:
+    cim_namespace: str
+    profiles: dict[str, str]
+    in_service: bool
+
+
+CGMES_VERSIONS = {
+    "2.4": CgmesVersion(
+        cim_namespace="http://iec.ch/TC57/2013/CIM-schema-cim16#",
+        profiles={
+            "EQ": "http://entsoe.eu/CIM/EquipmentCore/3/1",
+            "TP": "http://entsoe.eu/CIM/Topology/4/1",
+            "SSH": "http://entsoe.eu/CIM/SteadyStateHypothesis/1/1",
+            "SV": "http://entsoe.eu/CIM/StateVariables/4/1",
+            "OP": "http://iec.ch/TC57/ns/CIM/Operation/4.0",
+            "MEAS": "http://iec.ch/TC57/ns/CIM/OperationMeas/4.0",
+        },
+        in_service=False,
+    ),
+    "3.0": CgmesVersion(
+        cim_namespace="http://iec.ch/TC57/CIM100#",
+        profiles={
+            "EQ": "http://iec.ch/TC57/ns/CIM/CoreEquipment-EU/3.0",
+            "TP": "http://iec.ch/TC57/ns/CIM/Topology-EU/3.0",
+            "SSH": "http://iec.ch/TC57/ns/CIM/SteadyStateHypothesis-EU/3.0",
+            "SV": "http://iec.ch/TC57/ns/CIM/StateVariables-EU/3.0",
+            "OP": "http://iec.ch/TC57/ns/CIM/Operation/4.0",
+            "MEAS": "http://iec.ch/TC57/ns/CIM/OperationMeas/4.0",
+        },
+        in_service=True,
+    ),
+}
+
+PHASE_TAP_CHANGER_TYPES = (
+    "PhaseTapChangerSymmetrical",
+    "PhaseTapChangerAsymmetrical",
+    "PhaseTapChangerLinear",
+    "PhaseTapChangerTabular",
+)
+
+
+class Ref(str):
+    """Reference to another resource of the grid"""
+
+
+class Enum(str):
+    """Value of a CIM enumeration, e.g. "UnitMultiplier.k" """
+
+
+class _Document:
+    """RDF/XML document of one profile, written to a file resource by resource"""
+
+    def __init__(
+        self,
+        file: TextIO,
+        cim_namespace: str,
+        profile_uri: str,
+        name: str,
+        base_iri: str,
+    ):
+        self._file = file
+        self._cim = cim_namespace
+        file.write('<?xml version="1.0" encoding="UTF-8"?>\n')
+        file.write(
+            f'<rdf:RDF xmlns:rdf="{RDF_NS}" xmlns:cim="{cim_namespace}" '
+            f'xmlns:md="{MD_NS}" xml:base="{base_iri}">\n'
+        )
+        file.write(
+            f'  <md:FullModel rdf:about="urn:uuid:{name}">\n'
+            f"    <md:Model.profile>{profile_uri}</md:Model.profile>\n"
+            "    <md:Model.scenarioTime>2025-01-01T00:00:00Z</md:Model.scenarioTime>\n"
+            f"    <md:Model.description>{name}</md:Model.description>\n"
+            "    <md:Model.modelingAuthoritySet>http://example.com"
+            "</md:Model.modelingAuthoritySet>\n"
+            "  </md:FullModel>\n"
+        )
+
+    def resource(
+        self, cls: str, rid: str, properties: Iterable[tuple[str, object]], about=False
+    ):
+        """Writes a resource, defined by `rdf:ID` or extended by `rdf:about`"""
+        attr = f'rdf:about="#{rid}"' if about else f'rdf:ID="{rid}"'
+        lines = [f"  <cim:{cls} {attr}>\n"]
+        for prop, value in properties:
+            if isinstance(value, Ref):
+                lines.append(f'    <cim:{prop} rdf:resource="#{value}"/>\n')
+            elif isinstance(value, Enum):
+                resource = quoteattr(self._cim + value)
+                lines.append(f"    <cim:{prop} rdf:resource={resource}/>\n")
+            else:
+                lines.append(
+                    f"    <cim:{prop}>{escape(_literal(value))}</cim:{prop}>\n"
+                )
+        lines.append(f"  </cim:{cls}>\n")
+        self._file.writelines(lines)
+
+    def finish(self):
+        self._file.write("</rdf:RDF>\n")
+
+
+def _literal(value) -> str:
+    if isinstance(value, bool):
+        return "true" if value else "false"
+    if isinstance(value, float):
+        return repr(round(value, 6))
+    return str(value)
+
+
+class SyntheticGridGenerator:
+    """
+    Writes a synthetic CGMES grid with the given number of topological nodes
+    (rounded up to full substations). The grid only depends on the size,
+    the version and the seed.
+
+    Args:
+        nodes (int): Number of topological nodes
+        cgmes_version (str, optional): "2.4" or "3.0". Defaults to "3.0".
+        seed (int, optional): Seed of the random values. Defaults to 1.
+        base_iri (str, optional): Base IRI of the resources, e.g. the URL of the
+            triplestore dataset the grid is loaded into. Defaults to GRID_BASE.
+    """
+
+    def __init__(
+        self,
+        nodes: int,
+        cgmes_version: str = "3.0",
+        seed: int = 1,
+        base_iri: str = GRID_BASE,
+    ):
+        if cgmes_version not in CGMES_VERSIONS:
+            raise ValueError(f"Unsupported CGMES version {cgmes_version}")
+
+        self.version = CGMES_VERSIONS[cgmes_version]
+        self.n_sub = max(3, -(-nodes // NODES_PER_SUBSTATION))
+        self.base_iri = base_iri
+        self._seed = seed
+        self._rnd = random.Random(seed)
+        self._docs: dict[str, _Document] = {}
+        self._count = 0
+
+    @property
+    def cim_namespace(self) -> str:
+        return self.version.cim_namespace
+
+    def write(self, path: str | Path) -> Path:
+        """Writes the profiles as RDF/XML documents into a zip archive
+
+        Args:
+            path (str | Path): Path of the zip archive
+
+        Returns:
+            Path: Path of the zip archive
+        """
+        path = Path(path)
+        self._rnd.seed(self._seed)
+        self._count = 0
+        with tempfile.TemporaryDirectory() as tmp:
+            files = {p: Path(tmp) / f"{p}.xml" for p in self.version.profiles}
+            with ExitStack() as stack:
+                for profile, file in files.items():
+                    self._docs[profile] = _Document(
+                        stack.enter_context(open(file, "w", encoding="utf-8")),
+                        self.cim_namespace,
+                        self.version.profiles[profile],
+                        f"{path.stem}-{profile}",
+                        self.base_iri,
+                    )
+                self._generate()
+                for doc in self._docs.values():
+                    doc.finish()
+            self._docs.clear()
+
+            with zipfile.ZipFile(path, "w", zipfile.ZIP_DEFLATED) as archive:
+                for profile, file in files.items():
+                    archive.write(file, f"{path.stem}_{profile}.xml")
+        return path
+
+    def _id(self, kind: str) -> Ref:
+        self._count += 1
+        return Ref(f"_{kind}{self._count:08d}")
+
+    def _eq(self, cls: str, rid: str, name: str, *properties: tuple[str, object]):
+        self._docs["EQ"].resource(
+            cls, rid, [("IdentifiedObject.name", name), *properties]
+        )
+
+    def _ssh(self, cls: str, rid: str, *properties: tuple[str, object]):
+        """Extends equipment in the SSH profile, CGMES 3.0 adds inService"""
+        if self.version.in_service:
+            properties = (("Equipment.inService", True), *properties)
+        self._docs["SSH"].resource(cls, rid, properties, about=True)
+
+    def _generate(self):
+        rnd = self._rnd
+        self._scada = self._id("SRC")
+        self._docs["OP"].resource(
+            "MeasurementValueSource",
+            self._scada,
+            [("IdentifiedObject.name", "SCADA")],
+        )
+
+        base_voltages = {}
+        for kv in VOLTAGES:
+            bv = self._id("BV")
+            self._eq("BaseVoltage", bv, f"{kv} kV", ("BaseVoltage.nominalVoltage", kv))
+            base_voltages[kv] = bv
+
+        # nodes by substation and voltage
+        nodes: dict[tuple[int, float], list[Ref]] = {}
+        containers: dict[tuple[int, float], Ref] = {}
+        island_nodes = []
+        for s in range(self.n_sub):
+            sub = self._id("SUB")
+            self._eq("Substation", sub, f"Sub{s}")
+            for kv in VOLTAGES:
+                vl = self._id("VL")
+                self._eq(
+                    "VoltageLevel",
+                    vl,
+                    f"Sub{s} {kv}",
+                    ("VoltageLevel.Substation", sub),
+                    ("VoltageLevel.BaseVoltage", base_voltages[kv]),
+                )
+                containers[(s, kv)] = vl
+                busbars = []
+                for b in range(2):
+                    tn = self._id("TN")
+                    self._docs["TP"].resource(
+                        "TopologicalNode",
+                        tn,
+                        [
+                            ("IdentifiedObject.name", f"N{s}_{int(kv)}_{b}"),
+                            ("TopologicalNode.BaseVoltage", base_voltages[kv]),
+                            ("TopologicalNode.ConnectivityNodeContainer", vl),
+                        ],
+                    )
+                    busbars.append(tn)
+                    island_nodes.append(tn)
+                nodes[(s, kv)] = busbars
+                self._coupler(s, kv, busbars)
+
+        island = self._id("TI")
+        self._docs["SV"].resource(
+            "TopologicalIsland",
+            island,
+            [
+                ("IdentifiedObject.name", "Network"),
+                ("TopologicalIsland.AngleRefTopologicalNode", nodes[(0, 380.0)][0]),
+                *(("TopologicalIsland.TopologicalNodes", tn) for tn in island_nodes),
+            ],
+        )
+
+        for kv in (380.0, 110.0):
+            for s in range(self.n_sub):
+                for offset in (1, 2):
+                    other = (s + offset) % self.n_sub
+                    self._line(
+                        kv,
+                        base_voltages[kv],
+                        rnd.choice(nodes[(s, kv)]),
+                        rnd.choice(nodes[(other, kv)]),
+                    )
+
+        for s in range(self.n_sub):
+            self._transformer(s, nodes, (380.0, 110.0), "RatioTapChanger")
+            self._transformer(
+                s, nodes, (110.0, 20.0), "RatioTapChanger" if s % 2 == 0 else None
+            )
+            if s % 3 == 0:
+                self._transformer(s, nodes, (380.0, 110.0, 20.0), "RatioTapChanger")
+            if s % 10 == 5:
+                kind = PHASE_TAP_CHANGER_TYPES[(s // 10) % len(PHASE_TAP_CHANGER_TYPES)]
+                self._transformer(s, nodes, (380.0, 380.0), kind)
+            if s % 30 == 7:
+                self._transformer(
+                    s, nodes, (380.0, 110.0, 20.0), "PhaseTapChangerSymmetrical"
+                )
+            if s % 10 == 3:
+                self._equivalent_branch(
+                    base_voltages[110.0],
+                    nodes[(s, 110.0)][1],
+                    nodes[((s + 1) % self.n_sub, 20.0)][1],
+                )
+
+            self._loads(s, nodes)
+            if s % 2 == 0:
+                self._generator(s, nodes[(s, 380.0)][0], containers[(s, 380.0)])
+            if s == 1:
+                self._external_injection(nodes[(s, 380.0)][1], containers[(s, 380.0)])
+            if s % 3 == 1:
+                self._linear_shunt(s, nodes[(s, 110.0)][0])
+            if s % 7 == 0:
+                self._nonlinear_shunt(s, nodes[(s, 20.0)][0])
+
+    def _terminal(self, eq: Ref, seq: int, tn: Ref, connected=True) -> Ref:
+        term = self._id("T")
+        self._eq(
+            "Terminal",
+            term,
+            f"T{seq}",
+            ("Terminal.ConductingEquipment", eq),
+            ("ACDCTerminal.sequenceNumber", seq),
+        )
+        self._docs["TP"].resource(
+            "Terminal", term, [("Terminal.TopologicalNode", tn)], about=True
+        )
+        self._docs["SSH"].resource(
+            "Terminal", term, [("ACDCTerminal.connected", connected)], about=True
+        )
+        return term
+
+    def _analog(self, term: Ref, meas_type: str, value: float, sigma=None, **kwargs):
+        meas = self._id("M")
+        properties = [
+            ("IdentifiedObject.name", f"{meas_type}-{meas}"),
+            ("Measurement.measurementType", meas_type),
+            ("Measurement.Terminal", term),
+        ]
+        if kwargs.get("psr") is not None:
+            properties.append(("Measurement.PowerSystemResource", kwargs["psr"]))
+        if kwargs.get("positive_flow_in") is not None:
+            properties.append(("Analog.positiveFlowIn", kwargs["positive_flow_in"]))
+        self._docs["OP"].resource("Analog", meas, properties)
+
+        value_id = self._id("MV")
+        properties = [
+            ("AnalogValue.Analog", meas),
+            ("MeasurementValue.MeasurementValueSource", self._scada),
+        ]
+        if sigma is not None:
+            properties.append(("MeasurementValue.sensorSigma", sigma))
+        self._docs["OP"].resource("AnalogValue", value_id, properties)
+        self._docs["MEAS"].resource(
+            "AnalogValue", value_id, [("AnalogValue.value", value)], about=True
+        )
+
+    def _pq_measurements(self, term: Ref, p: float, q: float):
+        """Zero to three P- and Q-measurements with noise"""
+        rnd = self._rnd
+        count = rnd.choice([0, 1, 1, 2, 3])
+        for _ in range(count):
+            self._analog(
+                term,
+                "ThreePhaseActivePower",
+                p + rnd.uniform(-1, 1),
+                rnd.choice([None, 0.5, 1.0, 2.0]),
+                positive_flow_in=rnd.choice([None, False, False, True]),
+            )
+        count_q = count if rnd.random() < 0.8 else rnd.choice([0, 1])
+        for _ in range(count_q):
+            self._analog(
+                term,
+                "ThreePhaseReactivePower",
+                q + rnd.uniform(-1, 1),
+                rnd.choice([None, 0.5, 1.0]),
+            )
+
+    def _u_measurements(self, term: Ref, kv: float):
+        rnd = self._rnd
+        for _ in range(rnd.choice([0, 1, 1, 2, 3])):
+            value = kv * rnd.uniform(0.95, 1.08) if rnd.random() > 0.05 else 0.0
+            self._analog(
+                term,
+                rnd.choice(["Voltage", "LineToLineVoltage"]),
+                value,
+                rnd.choice([None, 1.0, 2.0]),
+            )
+
+    def _coupler(self, s: int, kv: float, busbars: list[Ref]):
+        rnd = self._rnd
+        switch = self._id("SW")
+        cls = rnd.choice(["Breaker", "Disconnector", "LoadBreakSwitch", "Breaker"])
+        self._eq(cls, switch, f"SW{s}_{int(kv)}", ("Switch.retained", True))
+        self._ssh(cls, switch, ("Switch.open", rnd.random() >= 0.85))
+
+        t1 = self._terminal(switch, 1, busbars[0])
+        t2 = self._terminal(switch, 2, busbars[1])
+        if rnd.random() < 0.5:
+            self._pq_measurements(t1, rnd.uniform(-50, 50), rnd.uniform(-10, 10))
+        self._u_measurements(t1, kv)
+        self._u_measurements(t2, kv)
+
+    def _line(self, kv: float, base_voltage: Ref, node1: Ref, node2: Ref):
+        rnd = self._rnd
+        line = self._id("L")
+        if rnd.random() < 0.9:
+            cls = "ACLineSegment"
+            self._eq(
+                cls,
+                line,
+                f"Line{line}",
+                ("ConductingEquipment.BaseVoltage", base_voltage),
+                ("ACLineSegment.r", rnd.uniform(0.5, 5)),
+                ("ACLineSegment.x", rnd.uniform(5, 50)),
+                ("ACLineSegment.bch", rnd.uniform(1e-6, 1e-4)),
+                ("ACLineSegment.gch", 0.0),
+            )
+        else:
+            cls = "SeriesCompensator"
+            self._eq(
+                cls,
+                line,
+                f"Line{line}",
+                ("ConductingEquipment.BaseVoltage", base_voltage),
+                ("SeriesCompensator.r", 0.1),
+                ("SeriesCompensator.x", -3.0),
+            )
+        self._ssh(cls, line)
+
+        t1 = self._terminal(line, 1, node1)
+        t2 = self._terminal(line, 2, node2)
+        flow = rnd.uniform(-300, 300)
+        if rnd.random() < 0.8:
+            self._pq_measurements(t1, flow, flow / 5)
+        if rnd.random() < 0.6:
+            self._pq_measurements(t2, -flow, -flow / 5)
+
+    def _equivalent_branch(self, base_voltage: Ref, node1: Ref, node2: Ref):
+        branch = self._id("EB")
+        self._eq(
+            "EquivalentBranch",
+            branch,
+            f"EqB{branch}",
+            ("ConductingEquipment.BaseVoltage", base_voltage),
+            ("EquivalentBranch.r", 1.0),
+            ("EquivalentBranch.x", 10.0),
+        )
+        self._ssh("EquivalentBranch", branch)
+        self._terminal(branch, 1, node1)
+        self._terminal(branch, 2, node2)
+
+    def _transformer(
+        self,
+        s: int,
+        nodes: dict[tuple[int, float], list[Ref]],
+        voltages: tuple[float, ...],
+        tap_changer: str | None,
+    ):
+        """Transformer with one end per voltage, the tap changer at the first end"""
+        rnd = self._rnd
+        tr = self._id("PT")
+        self._eq("PowerTransformer", tr, f"TR{s}_{'_'.join(map(str, voltages))}")
+        self._ssh("PowerTransformer", tr)
+
+        terminals = []
+        ends = []
+        for num, kv in enumerate(voltages, start=1):
+            # 2W phase shifters connect both busbars of the same voltage level
+            busbar = num - 1 if voltages == (kv, kv) else num % 2
+            node = nodes[(s, kv)][busbar]
+            term = self._terminal(tr, num, node)
+            end = self._id("TE")
+            rated_u = kv * rnd.choice([1.0, 1.02]) if num == 1 else kv
+            self._eq(
+                "PowerTransformerEnd",
+                end,
+                f"E{num}",
+                ("PowerTransformerEnd.PowerTransformer", tr),
+                ("TransformerEnd.Terminal", term),
+                ("TransformerEnd.endNumber", num),
+                ("PowerTransformerEnd.b", 1e-6 if num == 1 else 0.0),
+                ("PowerTransformerEnd.g", 0.0),
+                ("PowerTransformerEnd.r", 0.5 / num),
+                ("PowerTransformerEnd.x", 20.0 / num),
+                ("PowerTransformerEnd.ratedU", rated_u),
+                ("PowerTransformerEnd.ratedS", 400.0),
+            )
+            terminals.append(term)
+            ends.append((end, rated_u))
+
+        if tap_changer is not None:
+            self._tap_changer(tap_changer, *ends[0])
+        if rnd.random() < 0.7:
+            self._pq_measurements(
+                terminals[0], rnd.uniform(-100, 100), rnd.uniform(-20, 20)
+            )
+
+    def _tap_changer(self, cls: str, end: Ref, neutral_u: float):
+        rnd = self._rnd
+        tc = self._id("TC")
+        low, high, neutral = 1, 21, 11
+        properties = [
+            ("TapChanger.normalStep", neutral),
+            ("TapChanger.neutralStep", neutral),
+            ("TapChanger.highStep", high),
+            ("TapChanger.lowStep", low),
+            ("TapChanger.neutralU", neutral_u),
+        ]
+
+        table = None
+        if cls == "RatioTapChanger":
+            properties += [
+                ("RatioTapChanger.TransformerEnd", end),
+                ("RatioTapChanger.stepVoltageIncrement", 1.25),
+            ]
+            if rnd.random() < 0.2:
+                table = self._id("TCT")
+                properties.append(("RatioTapChanger.RatioTapChangerTable", table))
+        else:
+            properties.append(("PhaseTapChanger.TransformerEnd", end))
+            if cls == "PhaseTapChangerTabular":
+                table = self._id("TCT")
+                properties.append(
+                    ("PhaseTapChangerTabular.PhaseTapChangerTable", table)
+                )
+            elif cls == "PhaseTapChangerLinear":
+                properties += [
+                    ("PhaseTapChangerLinear.stepPhaseShiftIncrement", 1.5),
+                    ("PhaseTapChangerLinear.xMax", 30.0),
+                ]
+            else:
+                properties += [
+                    ("PhaseTapChangerNonLinear.voltageStepIncrement", 1.2),
+                    ("PhaseTapChangerNonLinear.xMax", 30.0),
+                ]
+                if cls == "PhaseTapChangerAsymmetrical":
+                    properties.append(
+                        ("PhaseTapChangerAsymmetrical.windingConnectionAngle", 60.0)
+                    )
+
+        self._eq(cls, tc, f"TC{tc}", *properties)
+        if table is not None:
+            self._tap_changer_table(cls, table, low, high, neutral)
+
+        step = rnd.randint(low + 3, high - 3)
+        self._ssh(cls, tc, ("TapChanger.step", step))
+        if rnd.random() < 0.5:
+            self._docs["SV"].resource(
+                "SvTapStep",
+                self._id("SVT"),
+                [("SvTapStep.TapChanger", tc), ("SvTapStep.position", step + 1)],
+            )
+
+    def _tap_changer_table(
+        self, cls: str, table: Ref, low: int, high: int, neutral: int
+    ):
+        if cls == "RatioTapChanger":
+            table_cls, point_cls = "RatioTapChangerTable", "RatioTapChangerTablePoint"
+        else:
+            table_cls, point_cls = "PhaseTapChangerTable", "PhaseTapChangerTablePoint"
+
+        self._eq(table_cls, table, f"Table{table}")
+        for step in range(low, high + 1):
+            properties = [
+                (f"{point_cls}.{table_cls}", table),
+                ("TapChangerTablePoint.step", step),
+                ("TapChangerTablePoint.ratio", 1.0 + 0.0125 * (step - neutral)),
+                ("TapChangerTablePoint.r", 0.0),
+                ("TapChangerTablePoint.x", 0.5 * (step - neutral)),
+                ("TapChangerTablePoint.g", 0.0),
+                ("TapChangerTablePoint.b", 0.0),
+            ]
+            if point_cls == "PhaseTapChangerTablePoint":
+                properties.append(
+                    ("PhaseTapChangerTablePoint.angle", 1.5 * (step - neutral))
+                )
+            self._docs["EQ"].resource(point_cls, self._id("TCP"), properties)
+
+    def _loads(self, s: int, nodes: dict[tuple[int, float], list[Ref]]):
+        rnd = self._rnd
+        for kv in (110.0, 20.0):
+            for tn in nodes[(s, kv)]:
+                if rnd.random() >= 0.8:
+                    continue
+                load = self._id("LD")
+                cls = rnd.choice(["EnergyConsumer", "ConformLoad", "NonConformLoad"])
+                p, q = rnd.uniform(1, 50), rnd.uniform(-5, 10)
+                self._eq(cls, load, f"Load{load}")
+                self._ssh(cls, load, ("EnergyConsumer.p", p), ("EnergyConsumer.q", q))
+                term = self._terminal(load, 1, tn)
+                if rnd.random() < 0.7:
+                    self._pq_measurements(term, p, q)
+
+    def _generator(self, s: int, tn: Ref, container: Ref):
+        rnd = self._rnd
+        gen = self._id("SM")
+        self._eq(
+            "SynchronousMachine",
+            gen,
+            f"Gen{s}",
+            ("Equipment.EquipmentContainer", container),
+        )
+        p = rnd.uniform(100, 500)
+        self._ssh(
+            "SynchronousMachine",
+            gen,
+            ("SynchronousMachine.referencePriority", s // 2),
+            ("RotatingMachine.p", -p),
+            ("RotatingMachine.q", -p / 4),
+        )
+        term = self._terminal(gen, 1, tn)
+
+        control = self._id("RC")
+        self._eq(
+            "RegulatingControl",
+            control,
+            f"RC{s}",
+            ("RegulatingControl.Terminal", term),
+            ("RegulatingControl.mode", Enum("RegulatingControlModeKind.voltage")),
+        )
+        self._docs["SSH"].resource(
+            "RegulatingControl",
+            control,
+            [
+                ("RegulatingControl.targetValue", 400.0),
+                (
+                    "RegulatingControl.targetValueUnitMultiplier",
+                    Enum("UnitMultiplier.k"),
+                ),
+            ],
+            about=True,
+        )
+        self._pq_measurements(term, p, p / 4)
+
+    def _external_injection(self, tn: Ref, container: Ref):
+        injection = self._id("ENI")
+        self._eq(
+            "ExternalNetworkInjection",
+            injection,
+            "Ext",
+            ("Equipment.EquipmentContainer", container),
+        )
+        self._ssh(
+            "ExternalNetworkInjection",
+            injection,
+            ("ExternalNetworkInjection.referencePriority", 0),
+            ("ExternalNetworkInjection.p", 10.0),
+            ("ExternalNetworkInjection.q", 1.0),
+        )
+        self._terminal(injection, 1, tn)
+
+    def _linear_shunt(self, s: int, tn: Ref):
+        shunt = self._id("SH")
+        self._eq(
+            "LinearShuntCompensator",
+            shunt,
+            f"Shunt{s}",
+            ("LinearShuntCompensator.bPerSection", 0.001),
+            ("LinearShuntCompensator.gPerSection", 0.0),
+            ("ShuntCompensator.nomU", 110.0),
+        )
+        self._ssh("LinearShuntCompensator", shunt, ("ShuntCompensator.sections", 2))
+        term = self._terminal(shunt, 1, tn)
+        self._analog(term, "LineCurrent", 50.0, psr=shunt)
+        if self._rnd.random() < 0.5:
+            self._analog(term, "ThreePhaseReactivePower", -20.0, 1.0)
+
+    def _nonlinear_shunt(self, s: int, tn: Ref):
+        shunt = self._id("NLS")
+        self._eq(
+            "NonlinearShuntCompensator",
+            shunt,
+            f"NLShunt{s}",
+            ("ShuntCompensator.nomU", 20.0),
+        )
+        self._ssh("NonlinearShuntCompensator", shunt, ("ShuntCompensator.sections", 2))
+        for section in (1, 2, 3):
+            self._eq(
+                "NonlinearShuntCompensatorPoint",
+                self._id("NLP"),
+                f"P{section}",
+                ("NonlinearShuntCompensatorPoint.NonlinearShuntCompensator", shunt),
+                ("NonlinearShuntCompensatorPoint.sectionNumber", section),
+                ("NonlinearShuntCompensatorPoint.g", 0.0),
+                ("NonlinearShuntCompensatorPoint.b", 0.0005 * section),
+            )
+        self._terminal(shunt, 1, tn)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("path", help="Zip archive to write")
+    parser.add_argument("--nodes", type=int, default=1000)
+    parser.add_argument("--cgmes", choices=sorted(CGMES_VERSIONS), default="3.0")
+    parser.add_argument("--seed", type=int, default=1)
+    parser.add_argument("--base-iri", default=GRID_BASE, help="xml:base of the files")
+    args = parser.parse_args()
+
+    generator = SyntheticGridGenerator(args.nodes, args.cgmes, args.seed, args.base_iri)
+    generator.write(args.path)
+    print(
+        f"Wrote {generator.n_sub * NODES_PER_SUBSTATION} nodes "
+        f"(CGMES {args.cgmes}) to {args.path}"
+    )
+
+
+if __name__ == "__main__":
+    main()
@@ -22,8 +22,10 @@ and apply the State Estimation from
 import logging
 import sys
 
-from .common import CgmesDataset, ConverterOptions
+from .batch_converter import BatchConverter, BatchScenario
+from .common import CgmesDataset, CgmesFileDataset, ConverterOptions
 from .converter import CgmesToPgmConverter
+from .measurement_session import MeasurementSession
 
 logging.basicConfig(
     level=logging.INFO,  # or DEBUG, WARNING, etc.
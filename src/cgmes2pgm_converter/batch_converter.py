@@ -0,0 +1,247 @@
+# Copyright [2025] [SOPTIM AG]
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import copy
+import logging
+
+import numpy as np
+import pandas as pd
+from power_grid_model import ComponentType, initialize_array
+from power_grid_model_io.data_types import ExtraInfo
+
+from cgmes2pgm_converter.common import (
+    CgmesDataset,
+    ConverterOptions,
+    Profile,
+    Timer,
+)
+
+from .converter import CgmesToPgmConverter
+
+# Named graphs replacing the graphs of the base model per profile
+BatchScenario = dict[Profile, str | set[str]]
+
+# Attributes referencing other components by their PGM ID
+_ID_ATTRIBUTES = {
+    "node",
+    "from_node",
+    "to_node",
+    "node_1",
+    "node_2",
+    "node_3",
+    "measured_object",
+    "regulated_object",
+}
+
+
+class BatchConverter:
+    """
+    Converts a base model and multiple scenarios into a single PGM input dataset
+    and a batch update dataset, e.g. to run a state estimation for the snapshots
+    of a day in one batch calculation.
+
+    Each scenario replaces the named graphs of some profiles (usually SSH, SV and
+    MEAS) of the base model. The components of a scenario are matched with the
+    components of the base model by their CGMES IRIs, all attributes that can be
+    updated in PGM (statuses, tap positions, setpoints, measured values and sigmas)
+    are taken from the scenario.
+
+    Components that only exist in a scenario can't be part of the update and are
+    ignored, attributes of base components missing in a scenario remain unchanged.
+    Both are logged as warnings.
+
+    Queries on unchanged profiles are executed for every scenario, use a
+    `QueryResultCache` in the dataset to avoid that.
+    """
+
+    def __init__(
+        self,
+        datasource: CgmesDataset,
+        scenarios: list[BatchScenario],
+        options: ConverterOptions | None = None,
+    ):
+        """
+        Args:
+            datasource (CgmesDataset): Datasource containing the base model and the
+                named graphs of all scenarios. Requires `split_profiles` and
+                `populate_named_graph_mapping` to be called for the base model.
+            scenarios (list[BatchScenario]): Named graphs per profile for each scenario,
+                e.g. [{Profile.SSH: "<ssh graph>", Profile.MEAS: "<meas graph>"}, ...]
+            options (ConverterOptions, optional): Configuration options for the conversion.
+        """
+        self._datasource = datasource
+        self._scenarios = scenarios
+        self._options = options or ConverterOptions()
+
+    def convert(
+        self,
+    ) -> tuple[
+        dict[ComponentType, np.ndarray], dict[ComponentType, np.ndarray], ExtraInfo
+    ]:
+        """Convert the base model and all scenarios
+
+        Raises:
+            ValueError: If the dataset does not use split profiles
+
+        Returns:
+            tuple[dict, dict, dict]: input_data, update_data, extra_info.
+                The update data contains an array of shape (scenarios, components)
+                for each component type with updatable attributes.
+        """
+        if not self._datasource.split_profiles:
+            raise ValueError("Batch conversion requires a dataset with split profiles")
+
+        with Timer("Converting base model", loglevel=logging.DEBUG):
+            input_data, extra_info = CgmesToPgmConverter(
+                self._datasource, self._options
+            ).convert()
+
+        update_data = self._init_update_data(input_data)
+        base_iris = {
+            component: _get_iris(input_data[component]["id"], extra_info)
+            for component in update_data
+        }
+
+        for idx, scenario in enumerate(self._scenarios):
+            with Timer(f"Converting scenario {idx}", loglevel=logging.DEBUG):
+                scenario_data, scenario_extra_info = self._convert_scenario(scenario)
+
+            for component, update in update_data.items():
+                self._fill_update(
+                    component,
+                    update[idx],
+                    base_iris[component],
+                    input_data[component],
+                    scenario_data[component],
+                    scenario_extra_info,
+                    idx,
+                )
+
+        return input_data, update_data, extra_info
+
+    def _convert_scenario(self, scenario: BatchScenario):
+        base_graphs = self._datasource.named_graphs
+
+        named_graphs = copy.deepcopy(base_graphs)
+        for profile, graphs in scenario.items():
+            named_graphs.graphs[profile] = (
+                {graphs} if isinstance(graphs, str) else set(graphs)
+            )
+
+        # MEAS and OP share their graphs, if the base model has only one of them
+        if base_graphs.get(Profile.MEAS) == base_graphs.get(Profile.OP):
+            if Profile.MEAS in scenario and Profile.OP not in scenario:
+                named_graphs.graphs[Profile.OP] = named_graphs.graphs[Profile.MEAS]
+            if Profile.OP in scenario and Profile.MEAS not in scenario:
+                named_graphs.graphs[Profile.MEAS] = named_graphs.graphs[Profile.OP]
+
+        self._datasource.named_graphs = named_graphs
+        try:
+            return CgmesToPgmConverter(self._datasource, self._options).convert()
+        finally:
+            self._datasource.named_graphs = base_graphs
+
+    def _init_update_data(
+        self, input_data: dict[ComponentType, np.ndarray]
+    ) -> dict[ComponentType, np.ndarray]:
+        update_data = {}
+        for component, arr in input_data.items():
+            if arr.shape[0] == 0:
+                continue
+
+            update = initialize_array(
+                "update", component, (len(self._scenarios), arr.shape[0])
+            )
+            if len(update.dtype.names) <= 1:
+                # only the id can be updated
+                continue
+
+            update["id"] = arr["id"]
+            update_data[component] = update
+
+        return update_data
+
+    def _fill_update(
+        self,
+        component: ComponentType,
+        update: np.ndarray,
+        base_iris: pd.Index,
+        base: np.ndarray,
+        scenario: np.ndarray,
+        scenario_extra_info: ExtraInfo,
+        idx: int,
+    ):
+        scenario_iris = _get_iris(scenario["id"], scenario_extra_info)
+        positions = scenario_iris.get_indexer(base_iris)
+        found = positions >= 0
+
+        missing = np.count_nonzero(~found)
+        if missing:
+            logging.warning(
+                "Scenario %d: %d of %d %s not found, keeping their input values",
+                idx,
+                missing,
+                len(base_iris),
+                component,
+            )
+
+        added = len(scenario_iris) - np.count_nonzero(found)
+        if added:
+            logging.warning(
+                "Scenario %d: Ignoring %d %s that are not part of the base model",
+                idx,
+                added,
+                component,
+            )
+
+        for attr in update.dtype.names:
+            if attr != "id":
+                update[attr][found] = scenario[attr][positions[found]]
+
+        self._check_fixed_attributes(
+            component, base[found], scenario[positions[found]], update.dtype.names, idx
+        )
+
+    def _check_fixed_attributes(
+        self,
+        component: ComponentType,
+        base: np.ndarray,
+        scenario: np.ndarray,
+        updatable: tuple[str, ...],
+        idx: int,
+    ):
+        """Warn about attributes that differ in a scenario but can't be updated"""
+        for attr in base.dtype.names:
+            if attr in updatable or attr in _ID_ATTRIBUTES:
+                continue
+
+            base_values = base[attr]
+            scenario_values = scenario[attr]
+            if np.issubdtype(base_values.dtype, np.floating):
+                equal = np.isclose(base_values, scenario_values, equal_nan=True)
+            else:
+                equal = base_values == scenario_values
+
+            if not np.all(equal):
+                logging.warning(
+                    "Scenario %d: %s.%s differs for %d components but can't be updated",
+                    idx,
+                    component,
+                    attr,
+                    np.count_nonzero(~equal),
+                )
+
+
+def _get_iris(ids: np.ndarray, extra_info: ExtraInfo) -> pd.Index:
+    return pd.Index([extra_info[pgm_id]["_mrid"] for pgm_id in ids.tolist()])
@@ -17,6 +17,8 @@ This module contains common classes and functions used throughout the package.
 """
 
 from .cgmes_dataset import CgmesDataset
+from .cgmes_file_dataset import CgmesFileDataset
+from .cgmes_file_reader import CgmesDocument, CgmesFileReader, Triple
 from .cgmes_literals import (
     CIM_ID_OBJ,
     CIM_MEAS,
@@ -28,6 +30,9 @@ from .cgmes_literals import (
 )
 from .converter_literals import COMPONENT_TYPE, NodeType, SymPowerType, VoltageMeasType
 from .converter_options import BranchType, ConverterOptions
+from .embedded_datasource import EmbeddedSparqlDataSource
+from .graph_store import GraphStoreOptions
+from .http_transport import HttpError, HttpTransport
 from .id_mapper import AbstractCgmesIdMapping, CgmesPgmIdMapping
 from .measurement_substitution import (
     BranchMeasurements,
@@ -42,6 +47,22 @@ from .measurement_substitution import (
     UMeasurementSubstitutionOptions,
 )
 from .network_splitting import NetworkSplittingOptions
-from .pgm_literals import APPLIANCE_COMPONENTS, BRANCH_COMPONENTS, SENSOR_COMPONENTS
+from .pgm_literals import (
+    APPLIANCE_COMPONENTS,
+    BRANCH_COMPONENTS,
+    SENSOR_COMPONENTS,
+    TOPOLOGY_COMPONENTS,
+)
+from .query_cache import QueryResultCache
+from .query_template import QueryTemplate
+from .result_decoder import (
+    AbstractResultDecoder,
+    ArrowResultDecoder,
+    CsvResultDecoder,
+    JsonResultDecoder,
+    ResultDtypes,
+    TsvResultDecoder,
+)
 from .timer import Timer
 from .topology import Topology
+from .topology_index import ComponentIdIndex, TopologyIndex
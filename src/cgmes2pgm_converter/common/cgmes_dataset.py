@@ -13,7 +13,13 @@
 # limitations under the License.
 
 
+import gzip
+import io
 import logging
+import re
+import threading
+from collections.abc import Iterable, Iterator
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
 from typing import override
 
 import pandas as pd
@@ -21,10 +27,19 @@ import pandas as pd
 from cgmes2pgm_converter.common.cgmes_literals import ProfileInfo
 
 from .cgmes_literals import CIM_ID_OBJ, Profile
-from .sparql_datasource import SparqlDataSource
+from .graph_store import GraphStoreOptions
+from .http_transport import HttpTransport
+from .query_cache import QueryResultCache
+from .result_decoder import AbstractResultDecoder, ResultDtypes
+from .sparql_datasource import DEFAULT_CHUNK_SIZE, SparqlDataSource
 
 MAX_TRIPLES_PER_INSERT = 10000
 
+_IRI_PATTERN = re.compile(r"<([^<>\s]*)>")
+_UPDATED_GRAPH_PATTERN = re.compile(
+    r"\b(?:GRAPH|INTO|WITH)\s+<([^<>\s]*)>", re.IGNORECASE
+)
+
 RDF_PREFIXES = {
     "rdfs": "http://www.w3.org/2000/01/rdf-schema#",
     "rdf": "http://www.w3.org/1999/02/22-rdf-syntax-ns#",
@@ -164,6 +179,19 @@ class CgmesDataset(SparqlDataSource):
             - CGMES 3: "http://iec.ch/TC57/CIM100#"
         graphs (dict[Profile, str]): A dictionary mapping profiles to their RDF graph URIs
         split_profiles (bool): Whether to split profiles into separate graphs
+        transport (HttpTransport | None): Transport used for the requests to the endpoint
+        result_decoder (AbstractResultDecoder | None): Decoder for query results,
+            defaults to the CSV format
+        result_cache (QueryResultCache | None): Cache for query results. Results are
+            cached per FullModel of the named graphs read by a query, so queries on
+            unchanged profiles (e.g. EQ, TP) are served from the cache.
+            The FullModels are read on the first query and again on
+            `refresh_fingerprints`, which the converters call before each
+            conversion. Graphs modified through the dataset (`update`,
+            `insert_df`, ...) are not cached until their FullModels change.
+            Data changed in place by other writers, without a new FullModel IRI
+            or scenarioTime, is never detected; call `result_cache.clear()` then.
+            Defaults to None.
     """
 
     def __init__(
@@ -171,15 +199,32 @@ class CgmesDataset(SparqlDataSource):
         base_url: str,
         cim_namespace: str,
         split_profiles: bool = False,
+        transport: HttpTransport | None = None,
+        result_decoder: AbstractResultDecoder | None = None,
+        result_cache: QueryResultCache | None = None,
+        graph_store: GraphStoreOptions | None = None,
     ):
         rdf_prefixes = RDF_PREFIXES.copy()
         rdf_prefixes["cim"] = cim_namespace
 
-        super().__init__(base_url, rdf_prefixes)
+        super().__init__(
+            base_url,
+            rdf_prefixes,
+            transport=transport,
+            result_decoder=result_decoder,
+        )
         self.base_url = base_url
         self.named_graphs = NamedGraphs(base_url)
         self.split_profiles = split_profiles
         self.cim_namespace = cim_namespace
+        self.result_cache = result_cache
+        self.graph_store = graph_store or GraphStoreOptions()
+
+        # FullModels per named graph, None if the graph has been modified
+        self._graph_fingerprints: dict[str, str | None] | None = None
+        # graphs modified through the dataset and their FullModels before
+        self._modified_graphs: dict[str, str | None] = {}
+        self._fingerprint_lock = threading.RLock()
 
     def update_cim_namespace(self, new_namespace: str) -> bool:
         """Update the CIM namespace in the dataset and RDF prefixes."""
@@ -211,7 +256,7 @@ class CgmesDataset(SparqlDataSource):
 
     def populate_named_graph_mapping(self):
         # read fullmodels from all graphs
-        dataset_profiles = self.query(fullmodel_query)
+        dataset_profiles = self._query_full_models()
 
         named_graphs = self.named_graphs
         for idx, item in dataset_profiles.iterrows():
@@ -235,40 +280,185 @@ class CgmesDataset(SparqlDataSource):
             named_graphs.graphs[Profile.OP] = named_graphs.graphs[Profile.MEAS]
 
     def query(
-        self, query: str, add_prefixes=True, remove_uuid_base_uri=True
+        self,
+        query: str,
+        add_prefixes=True,
+        remove_uuid_base_uri=True,
+        dtypes: ResultDtypes | None = None,
+        use_cache=True,
     ) -> pd.DataFrame:
-        result = super().query(query, add_prefixes)
-        if remove_uuid_base_uri:
-            # Remove the base URI from all IRIs (if wanted) -> helps to keep the output clean
-            prefix = self.base_url + "#"
-            for col in result.select_dtypes(include="object"):
-                result[col] = result[col].str.replace(f"^{prefix}", "", regex=True)
+        """Executes a SPARQL query, see `SparqlDataSource.query`
+
+        Args:
+            query (str): The SPARQL query to execute
+            add_prefixes (bool, optional): Add defined Sparql-Prefixes.
+                Defaults to True.
+            remove_uuid_base_uri (bool, optional): Remove the base URI of the
+                dataset from all IRIs. Defaults to True.
+            dtypes (ResultDtypes | None, optional): Types of the result columns.
+            use_cache (bool, optional): Serve the result from `result_cache`,
+                if the dataset has one. Defaults to True.
+
+        Returns:
+            pd.DataFrame: Result of the query as a DataFrame
+        """
+        # Remove the base URI from all IRIs (if wanted) -> helps to keep the output clean
+        prefix = self.base_url + "#" if remove_uuid_base_uri else None
+
+        use_cache = use_cache and self.result_cache is not None
+        fingerprint = self._query_fingerprint(query) if use_cache else None
+        if self.result_cache is None or fingerprint is None:
+            return super().query(
+                query, add_prefixes, dtypes=dtypes, strip_prefix=prefix
+            )
+
+        text = (self._build_prefixes() + query) if add_prefixes else query
+        key = self.result_cache.make_key(
+            text, f"{self.base_url}|{prefix}|{dtypes}|{fingerprint}"
+        )
+        result = self.result_cache.get(key, dtypes)
+        if result is None:
+            result = super().query(
+                query, add_prefixes, dtypes=dtypes, strip_prefix=prefix
+            )
+            self.result_cache.put(key, result)
         return result
 
+    @override
+    def query_chunks(
+        self,
+        query: str,
+        order_by: str | Iterable[str],
+        chunk_size: int = DEFAULT_CHUNK_SIZE,
+        add_prefixes=True,
+        remove_uuid_base_uri=True,
+        dtypes: ResultDtypes | None = None,
+    ) -> Iterator[pd.DataFrame]:
+        """Executes a SPARQL SELECT query page by page, see `SparqlDataSource.query_chunks`.
+        The pages are not cached.
+        """
+        prefix = self.base_url + "#" if remove_uuid_base_uri else None
+        return super().query_chunks(
+            query,
+            order_by,
+            chunk_size,
+            add_prefixes,
+            dtypes=dtypes,
+            strip_prefix=prefix,
+        )
+
+    @override
+    def update(self, query: str, add_prefixes=True) -> None:
+        # before updating, so neither queries running concurrently nor a failed
+        # update leave partially updated results in the cache
+        self._invalidate_graphs(query)
+        super().update(query, add_prefixes)
+
+    def refresh_fingerprints(self) -> None:
+        """Reads the FullModels of all graphs again, so that results cached for
+        models that have been replaced since, e.g. by another writer, are no
+        longer served. Does nothing if the dataset has no result cache.
+        """
+        if self.result_cache is not None:
+            self._query_full_models()
+
+    def _query_full_models(self) -> pd.DataFrame:
+        """Queries the FullModels of all graphs without using the result cache
+        and updates the fingerprints of the graphs"""
+        dataset_profiles = super().query(
+            fullmodel_query, strip_prefix=self.base_url + "#"
+        )
+
+        # identify the content of each graph by its FullModels and scenario times
+        models: dict[str, set[str]] = {}
+        for row in dataset_profiles.itertuples(index=False):
+            graph = row.graph if isinstance(row.graph, str) else ""
+            models.setdefault(graph, set()).add(f"{row.fullModel}@{row.scenarioTime}")
+
+        fingerprints: dict[str, str | None] = {
+            g: " ".join(sorted(m)) for g, m in models.items()
+        }
+        with self._fingerprint_lock:
+            # modified graphs stay excluded from caching until their FullModels
+            # change, the modification does not change them
+            self._modified_graphs = {
+                g: fp
+                for g, fp in self._modified_graphs.items()
+                if fingerprints.get(g) == fp
+            }
+            for graph in self._modified_graphs.keys() & fingerprints.keys():
+                fingerprints[graph] = None
+            self._graph_fingerprints = fingerprints
+
+        return dataset_profiles
+
+    def _query_fingerprint(self, query: str) -> str | None:
+        """Fingerprint of the named graphs referenced by a query,
+        None if the query can't be cached"""
+        iris = set(_IRI_PATTERN.findall(query))
+
+        # updates modify the fingerprints concurrently, so they are read
+        # under the lock
+        with self._fingerprint_lock:
+            if self._graph_fingerprints is None:
+                self._query_full_models()
+            fingerprints = dict(self._graph_fingerprints)
+            modified = set(self._modified_graphs)
+
+        graphs = iris & fingerprints.keys()
+        if not graphs:
+            # default graph or unrestricted named graphs
+            graphs = set(fingerprints.keys())
+        if (iris | graphs) & modified:
+            return None
+        if not graphs:
+            # without FullModels the content of the dataset is unknown
+            return None
+
+        parts = []
+        for graph in sorted(graphs):
+            if fingerprints[graph] is None:
+                return None
+            parts.append(f"{graph}={fingerprints[graph]}")
+        return "\n".join(parts)
+
+    def _invalidate_graphs(self, update: str) -> None:
+        """Excludes graphs modified by an update from caching"""
+        self._invalidate_graph_names(set(_UPDATED_GRAPH_PATTERN.findall(update)))
+
+    def _invalidate_graph_names(self, graphs: set[str]) -> None:
+        """Excludes the given graphs from caching, all graphs if none are given"""
+        with self._fingerprint_lock:
+            fingerprints = self._graph_fingerprints
+            if fingerprints is None:
+                return
+
+            if not graphs:
+                # default graph
+                graphs = set(fingerprints.keys())
+
+            for graph in graphs:
+                # keep the FullModels before the first modification
+                self._modified_graphs.setdefault(graph, fingerprints.get(graph))
+                if graph in fingerprints:
+                    fingerprints[graph] = None
+
     def insert_df(
         self, df: pd.DataFrame, profile: Profile | str, include_mrid=True
     ) -> None:
         """Insert a DataFrame into the specified profile.
         The DataFrame must have a column "IdentifiedObject.mRID"
         The column names are used as predicates in the RDF triples.
-        Maximum number of rows per INSERT-Statement is defined by MAX_TRIPLES_PER_INSERT
+        Maximum number of rows per INSERT-Statement is defined by MAX_TRIPLES_PER_INSERT,
+        if enabled, the triples are uploaded via the graph store protocol instead
+        (see `GraphStoreOptions`).
 
         Args:
             df (pd.DataFrame): The DataFrame to insert
             profile (Profile | str): The profile or URI of the graph to insert the DataFrame into.
             include_mrid (bool, optional): Include the mRID in the triples. Defaults to True.
         """
-        profile_uris = self._get_profile_uri(profile)
-        if len(profile_uris) == 0:
-            raise ValueError(
-                f"Profile {profile} has no named graph assigned, cannot insert DataFrame."
-            )
-        elif len(profile_uris) > 1:
-            raise ValueError(
-                f"Profile {profile} has multiple named graphs assigned, cannot insert DataFrame."
-            )
-
-        profile_uri = profile_uris[0]
+        profile_uri = self._get_single_profile_uri(profile, "DataFrame")
 
         logging.debug(
             "Inserting %s triples into %s",
@@ -276,50 +466,60 @@ class CgmesDataset(SparqlDataSource):
             profile_uri,
         )
 
+        if self.graph_store.enable:
+            self._upload_documents(self._df_documents(df, include_mrid), profile_uri)
+            return
+
         max_rows_per_insert = MAX_TRIPLES_PER_INSERT // df.shape[1]
 
-        # Split Dataframe if it has more than MAX_TRIPLES_PER_INSERT rows
-        if df.shape[0] > max_rows_per_insert:
-            num_chunks = df.shape[0] // max_rows_per_insert
-            for i in range(num_chunks):
-                self._insert_df(
-                    df.iloc[i * max_rows_per_insert : (i + 1) * max_rows_per_insert],
-                    profile_uri,
-                    include_mrid,
-                )
-            if df.shape[0] % max_rows_per_insert != 0:
-                self._insert_df(
-                    df.iloc[num_chunks * max_rows_per_insert :],
-                    profile_uri,
-                    include_mrid,
-                )
+        # Split Dataframe if it has more than MAX_TRIPLES_PER_INSERT rows,
+        # the buffer is reused for all chunks
+        buffer = io.StringIO()
+        for start in range(0, df.shape[0], max_rows_per_insert):
+            self._insert_df(
+                df.iloc[start : start + max_rows_per_insert],
+                profile_uri,
+                include_mrid,
+                buffer,
+            )
+
+    def _insert_df(
+        self, df: pd.DataFrame, graph: str, include_mrid, buffer: io.StringIO
+    ):
+        buffer.seek(0)
+        buffer.truncate()
+
+        if graph == "default":
+            buffer.write("INSERT DATA {\n")
+            self._write_df_triples(df, include_mrid, buffer)
+            buffer.write("}\n")
         else:
-            self._insert_df(df, profile_uri, include_mrid)
+            buffer.write(f"INSERT DATA {{\nGRAPH <{graph}> {{\n")
+            self._write_df_triples(df, include_mrid, buffer)
+            buffer.write("}\n}\n")
 
-    def _insert_df(self, df: pd.DataFrame, graph: str, include_mrid):
-        uris = [self.mrid_to_urn(row) for row in df[f"{CIM_ID_OBJ}.mRID"]]
-        triples = []
+        self.update(buffer.getvalue())
+
+    def _write_df_triples(
+        self, df: pd.DataFrame, include_mrid, buffer: io.StringIO
+    ) -> None:
+        """Writes the triples of a DataFrame as statements `subject predicate object.`
+        into the buffer, one line per statement, column by column.
+        """
+        mrid_col = f"{CIM_ID_OBJ}.mRID"
+
+        # see mrid_to_urn, applied to the whole column
+        subjects = (
+            "<urn:uuid:"
+            + df[mrid_col].astype(str).str.replace('"', "", regex=False)
+            + "> "
+        )
         for col in df.columns:
-            if col == f"{CIM_ID_OBJ}.mRID" and not include_mrid:
+            if col == mrid_col and not include_mrid:
                 continue
 
-            triples += [f"{uri} {col} {row}." for uri, row in zip(uris, df[col])]
-
-        if graph == "default":
-            insert_query = f"""
-                INSERT DATA {{
-                    {"".join(triples)}
-                }}
-            """
-        else:
-            insert_query = f"""
-                INSERT DATA {{
-                    GRAPH <{graph}> {{
-                        {"".join(triples)}
-                    }}
-                }}
-            """
-        self.update(insert_query)
+            statements = subjects + f"{col} " + df[col].astype(str) + ".\n"
+            buffer.writelines(statements.to_numpy())
 
     def insert_triples(
         self, triples: list[tuple[str, str, str]], profile: Profile | str
@@ -330,6 +530,11 @@ class CgmesDataset(SparqlDataSource):
             profile (Profile | str): The profile or URI of the graph to insert the triples into.
         """
 
+        if self.graph_store.enable:
+            profile_uri = self._get_single_profile_uri(profile, "triples")
+            self._upload_documents(self._triple_documents(triples), profile_uri)
+            return
+
         # Split triples if they exceed MAX_TRIPLES_PER_INSERT
         if len(triples) > MAX_TRIPLES_PER_INSERT:
             num_chunks = len(triples) // MAX_TRIPLES_PER_INSERT
@@ -350,16 +555,7 @@ class CgmesDataset(SparqlDataSource):
     def _insert_triples(
         self, triples: list[tuple[str, str, str]], profile: Profile | str
     ):
-        profile_uris = self._get_profile_uri(profile)
-        if len(profile_uris) == 0:
-            raise ValueError(
-                f"Profile {profile} has no named graph assigned, cannot insert triples."
-            )
-        elif len(profile_uris) > 1:
-            raise ValueError(
-                f"Profile {profile} has multiple named graphs assigned, cannot insert triples."
-            )
-        profile_uri = profile_uris[0]
+        profile_uri = self._get_single_profile_uri(profile, "triples")
         triples_str = []
 
         for subject, predicate, obj in triples:
@@ -381,6 +577,79 @@ class CgmesDataset(SparqlDataSource):
             """
         self.update(insert_query)
 
+    def _df_documents(self, df: pd.DataFrame, include_mrid) -> Iterator[bytes]:
+        """Turtle documents with the triples of a DataFrame,
+        split by `max_triples_per_request`
+        """
+        max_rows = max(1, self.graph_store.max_triples_per_request // df.shape[1])
+        buffer = io.StringIO()
+        for start in range(0, df.shape[0], max_rows):
+            self._begin_document(buffer)
+            self._write_df_triples(
+                df.iloc[start : start + max_rows], include_mrid, buffer
+            )
+            yield buffer.getvalue().encode("utf-8")
+
+    def _triple_documents(self, triples: list[tuple[str, str, str]]) -> Iterator[bytes]:
+        """Turtle documents with the given triples, split by `max_triples_per_request`"""
+        size = max(1, self.graph_store.max_triples_per_request)
+        buffer = io.StringIO()
+        for start in range(0, len(triples), size):
+            self._begin_document(buffer)
+            buffer.writelines(
+                f"{subject} {predicate} {obj}.\n"
+                for subject, predicate, obj in triples[start : start + size]
+            )
+            yield buffer.getvalue().encode("utf-8")
+
+    def _begin_document(self, buffer: io.StringIO) -> None:
+        """Clears the buffer and writes the prefixes of a Turtle document"""
+        buffer.seek(0)
+        buffer.truncate()
+        buffer.writelines(
+            f"@prefix {p}: <{uri}> .\n" for p, uri in self._prefixes.items()
+        )
+
+    def _upload_documents(self, documents: Iterable[bytes], graph: str) -> None:
+        """Uploads Turtle documents into a graph via the graph store protocol"""
+        # before uploading, see `update`
+        self._invalidate_graph_names(set() if graph == "default" else {graph})
+        options = self.graph_store
+
+        def upload(data: bytes):
+            if options.compress:
+                data = gzip.compress(data)
+            self.upload_graph(graph, data, compressed=options.compress)
+
+        if options.workers > 1:
+            # the documents are created while uploading, at most `workers`
+            # of them are held in memory
+            with ThreadPoolExecutor(max_workers=options.workers) as executor:
+                pending: set[Future] = set()
+                for data in documents:
+                    if len(pending) >= options.workers:
+                        done, pending = wait(pending, return_when=FIRST_COMPLETED)
+                        for future in done:
+                            future.result()
+                    pending.add(executor.submit(upload, data))
+                for future in pending:
+                    future.result()
+        else:
+            for data in documents:
+                upload(data)
+
+    def _get_single_profile_uri(self, profile: Profile | str, content: str) -> str:
+        profile_uris = self._get_profile_uri(profile)
+        if len(profile_uris) == 0:
+            raise ValueError(
+                f"Profile {profile} has no named graph assigned, cannot insert {content}."
+            )
+        elif len(profile_uris) > 1:
+            raise ValueError(
+                f"Profile {profile} has multiple named graphs assigned, cannot insert {content}."
+            )
+        return profile_uris[0]
+
     def _get_profile_uri(self, profile: Profile | str) -> list[str]:
         if isinstance(profile, Profile):
             return list(self.named_graphs.get(profile))
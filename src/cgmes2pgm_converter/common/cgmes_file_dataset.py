@@ -0,0 +1,125 @@
+# Copyright [2025] [SOPTIM AG]
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+from collections.abc import Iterable
+from pathlib import Path
+from typing import override
+
+from .cgmes_dataset import CgmesDataset
+from .embedded_datasource import DEFAULT_EMBEDDED_BASE_URL, EmbeddedSparqlDataSource
+from .graph_store import GraphStoreOptions
+from .query_cache import QueryResultCache
+from .result_decoder import CsvResultDecoder
+
+DEFAULT_FILE_BASE_URL = DEFAULT_EMBEDDED_BASE_URL
+
+
+class CgmesFileDataset(CgmesDataset):
+    """
+    CGMES dataset read from RDF/XML files into an in-memory store,
+    so a conversion does not require a triplestore.
+
+    The files are loaded into an `EmbeddedSparqlDataSource`, each document is
+    stored in its own named graph. The queries of the builders are evaluated by
+    the embedded SPARQL engine of rdflib, updates like the SV write-back are
+    applied to the in-memory store.
+
+    As for other datasets, `populate_named_graph_mapping` has to be called
+    if `split_profiles` is set.
+
+    Requires `rdflib`, see the `embedded` extra.
+
+    Args:
+        sources (str | Path | Iterable[str | Path]): RDF/XML files,
+            zip archives (e.g. IGM/CGM bundles) or directories containing them
+        base_url (str, optional): Base IRI of the resources without `xml:base`.
+            Defaults to DEFAULT_FILE_BASE_URL.
+        cim_namespace (str | None, optional): CIM namespace, detected from the
+            `cim` prefix of the files if not provided. Defaults to None.
+        split_profiles (bool, optional): Query the profiles from their named
+            graphs instead of the union of all documents. Defaults to False.
+        result_cache (QueryResultCache | None, optional): Cache for query results.
+            Defaults to None.
+        graph_store (GraphStoreOptions | None, optional): If enabled, inserted
+            triples are parsed as Turtle documents instead of SPARQL updates.
+            Defaults to None.
+    """
+
+    def __init__(
+        self,
+        sources: str | Path | Iterable[str | Path],
+        base_url: str = DEFAULT_FILE_BASE_URL,
+        cim_namespace: str | None = None,
+        split_profiles: bool = False,
+        result_cache: QueryResultCache | None = None,
+        graph_store: GraphStoreOptions | None = None,
+    ):
+        self._embedded = EmbeddedSparqlDataSource(
+            base_url, default_union=not split_profiles
+        )
+        self._embedded.load(sources)
+
+        cim_namespace = cim_namespace or self._embedded.namespaces.get("cim")
+        if cim_namespace is None:
+            raise ValueError(
+                "CIM namespace not declared in the CGMES files, provide `cim_namespace`"
+            )
+
+        super().__init__(
+            base_url,
+            cim_namespace,
+            split_profiles=split_profiles,
+            result_decoder=CsvResultDecoder(),
+            result_cache=result_cache,
+            graph_store=graph_store,
+        )
+
+    @property
+    def embedded(self) -> EmbeddedSparqlDataSource:
+        """The in-memory store containing the files"""
+        return self._embedded
+
+    def load(self, sources: str | Path | Iterable[str | Path]) -> list[str]:
+        """Reads further RDF/XML files, zip archives or directories into the store,
+        e.g. measurement profiles of another snapshot.
+
+        Args:
+            sources (str | Path | Iterable[str | Path]): Paths to read
+
+        Returns:
+            list[str]: Named graphs of the loaded documents
+        """
+        return self._embedded.load(sources)
+
+    def graph_name(self, document_name: str) -> str:
+        """Named graph of the document with the given name"""
+        return self._embedded.graph_name(document_name)
+
+    @override
+    def upload_graph(
+        self,
+        graph_iri: str,
+        data: bytes,
+        content_type: str = "text/turtle",
+        replace: bool = False,
+        compressed: bool = False,
+    ) -> None:
+        self._embedded.upload_graph(graph_iri, data, content_type, replace, compressed)
+
+    @override
+    def _execute(
+        self, query: str, *, method: str = "GET", add_prefixes: bool = True
+    ) -> bytes:
+        text = (self._build_prefixes() + query) if add_prefixes else query
+        return self._embedded.execute(text, method)
@@ -0,0 +1,238 @@
+# Copyright [2025] [SOPTIM AG]
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import io
+import zipfile
+from collections.abc import Iterable, Iterator
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import IO, NamedTuple
+from urllib.parse import urljoin
+from xml.etree.ElementTree import iterparse
+
+RDF_NS = "http://www.w3.org/1999/02/22-rdf-syntax-ns#"
+RDF_TYPE = RDF_NS + "type"
+
+_RDF_ABOUT = f"{{{RDF_NS}}}about"
+_RDF_ID = f"{{{RDF_NS}}}ID"
+_RDF_RESOURCE = f"{{{RDF_NS}}}resource"
+_RDF_DATATYPE = f"{{{RDF_NS}}}datatype"
+_RDF_DESCRIPTION = f"{{{RDF_NS}}}Description"
+_XML_BASE = "{http://www.w3.org/XML/1998/namespace}base"
+_XML_LANG = "{http://www.w3.org/XML/1998/namespace}lang"
+
+RDF_FILE_SUFFIXES = (".xml", ".rdf")
+
+
+class Triple(NamedTuple):
+    """RDF triple with the object either being an IRI or a literal"""
+
+    subject: str
+    predicate: str
+    object: str
+    literal: bool = False
+    datatype: str | None = None
+    language: str | None = None
+
+
+@dataclass
+class CgmesDocument:
+    """Triples of one RDF/XML document, e.g. one profile of an IGM
+
+    Attributes:
+        name (str): Path of the document, members of zip archives are
+            named `archive.zip/member.xml`
+        triples (list[Triple]): Triples of the document
+        namespaces (dict[str, str]): Namespaces declared in the document by prefix
+    """
+
+    name: str
+    triples: list[Triple] = field(default_factory=list)
+    namespaces: dict[str, str] = field(default_factory=dict)
+
+
+class CgmesFileReader:
+    """
+    Reads CGMES 2.4 and 3.0 RDF/XML documents without a triplestore.
+
+    The documents are parsed incrementally, each element is released as soon
+    as its triples have been extracted, so the memory is bounded by the triples
+    and not by the XML tree. Zip archives, including nested archives of
+    CGM bundles, and directories are read member by member.
+
+    Only the RDF/XML subset used by CGMES is supported: one element per
+    resource identified by `rdf:ID` or `rdf:about`, with properties referencing
+    other resources via `rdf:resource` or containing a literal.
+
+    Args:
+        base_iri (str): Base IRI to resolve `rdf:ID` and relative references
+            of documents without `xml:base`, e.g. the base URL of the dataset
+    """
+
+    def __init__(self, base_iri: str):
+        self.base_iri = base_iri
+
+    def read(
+        self, sources: str | Path | Iterable[str | Path]
+    ) -> Iterator[CgmesDocument]:
+        """Reads all RDF/XML documents of the given files, zip archives or directories
+
+        Args:
+            sources (str | Path | Iterable[str | Path]): Paths to read
+
+        Raises:
+            FileNotFoundError: If a path does not exist
+            ValueError: If a file is neither an RDF/XML document nor a zip archive
+
+        Yields:
+            CgmesDocument: One document per RDF/XML file or archive member
+        """
+        if isinstance(sources, (str, Path)):
+            sources = [sources]
+
+        for source in sources:
+            path = Path(source)
+            if path.is_dir():
+                for child in sorted(path.iterdir()):
+                    if child.is_dir() or _is_supported(child.name):
+                        yield from self.read(child)
+            elif not path.exists():
+                raise FileNotFoundError(f"CGMES file {path} not found")
+            elif zipfile.is_zipfile(path):
+                with zipfile.ZipFile(path) as archive:
+                    yield from self._read_zip(archive, str(path))
+            elif path.suffix.lower() in RDF_FILE_SUFFIXES:
+                with open(path, "rb") as stream:
+                    yield self.read_xml(stream, str(path))
+            else:
+                raise ValueError(f"Unsupported CGMES file {path}")
+
+    def read_xml(self, stream: IO[bytes], name: str) -> CgmesDocument:
+        """Reads a single RDF/XML document
+
+        Args:
+            stream (IO[bytes]): Binary stream of the document
+            name (str): Name of the document
+
+        Returns:
+            CgmesDocument: Triples of the document
+        """
+        document = CgmesDocument(name)
+        document.triples.extend(self.iter_triples(stream, document.namespaces))
+        return document
+
+    def iter_triples(
+        self, stream: IO[bytes], namespaces: dict[str, str] | None = None
+    ) -> Iterator[Triple]:
+        """Parses a RDF/XML document incrementally
+
+        Args:
+            stream (IO[bytes]): Binary stream of the document
+            namespaces (dict[str, str], optional): Filled with the namespaces
+                declared in the document by prefix
+
+        Yields:
+            Triple: Triples in the order of the document
+        """
+        base = _document_base(self.base_iri)
+        root = None
+        subject = None
+        depth = 0
+
+        for event, item in iterparse(stream, events=("start-ns", "start", "end")):
+            if event == "start-ns":
+                if namespaces is not None:
+                    prefix, uri = item
+                    namespaces.setdefault(prefix, uri)
+                continue
+
+            if event == "start":
+                depth += 1
+                if depth == 1:
+                    root = item
+                    base = _document_base(item.get(_XML_BASE, self.base_iri))
+                elif depth == 2:
+                    subject = self._subject(item, base)
+                    if subject is not None and item.tag != _RDF_DESCRIPTION:
+                        yield Triple(subject, RDF_TYPE, _tag_iri(item.tag))
+                continue
+
+            depth -= 1
+            if depth == 2 and subject is not None:
+                yield self._property(subject, item, base)
+            elif depth == 1 and root is not None:
+                # the resource is complete, release it
+                root.clear()
+
+    def _read_zip(self, archive: zipfile.ZipFile, name: str) -> Iterator[CgmesDocument]:
+        for info in archive.infolist():
+            if info.is_dir():
+                continue
+            member = f"{name}/{info.filename}"
+            lower = info.filename.lower()
+            if lower.endswith(".zip"):
+                # nested archives need to be seekable
+                with zipfile.ZipFile(io.BytesIO(archive.read(info))) as nested:
+                    yield from self._read_zip(nested, member)
+            elif lower.endswith(RDF_FILE_SUFFIXES):
+                with archive.open(info) as stream:
+                    yield self.read_xml(stream, member)
+
+    def _subject(self, element, base: str) -> str | None:
+        about = element.get(_RDF_ABOUT)
+        if about is not None:
+            return _resolve(about, base)
+        rdf_id = element.get(_RDF_ID)
+        if rdf_id is not None:
+            return f"{base}#{rdf_id}"
+        return None
+
+    def _property(self, subject: str, element, base: str) -> Triple:
+        predicate = _tag_iri(element.tag)
+        resource = element.get(_RDF_RESOURCE)
+        if resource is not None:
+            return Triple(subject, predicate, _resolve(resource, base))
+
+        return Triple(
+            subject,
+            predicate,
+            element.text or "",
+            literal=True,
+            datatype=element.get(_RDF_DATATYPE),
+            language=element.get(_XML_LANG),
+        )
+
+
+def _tag_iri(tag: str) -> str:
+    """Converts a tag in ElementTree notation `{namespace}name` to an IRI"""
+    namespace, _, local = tag[1:].partition("}")
+    return namespace + local
+
+
+def _document_base(base: str) -> str:
+    """Base IRI without fragment, `rdf:ID` and `#id` references append their own"""
+    return base.partition("#")[0]
+
+
+def _resolve(reference: str, base: str) -> str:
+    if reference.startswith("#"):
+        return base + reference
+    if ":" in reference:
+        # absolute IRI, e.g. urn:uuid:... or http://...
+        return reference
+    return urljoin(base, reference)
+
+
+def _is_supported(name: str) -> bool:
+    return name.lower().endswith((*RDF_FILE_SUFFIXES, ".zip"))
@@ -52,6 +52,9 @@ class ConverterOptions:
         use_generic_branch (dict): A dictionary indicating the use of generic branches for
             various branch types. Generic branches are used for all branch types.
             It is only possible to disable the use of generic branches for lines.
+        query_workers (int): Maximum number of queries that are sent concurrently
+            to the datasource. Set to 1 to execute the queries sequentially.
+            Defaults to 8.
     """
 
     only_topo_island: bool = False
@@ -66,6 +69,7 @@ class ConverterOptions:
     link_as_short_line: LinkAsShortLineOptions = field(
         default_factory=LinkAsShortLineOptions
     )
+    query_workers: int = 8
 
     # Deprecated: support for disabling the use of generic branches has been removed
     # Generic branches are used for all branch types
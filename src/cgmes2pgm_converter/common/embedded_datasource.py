@@ -0,0 +1,235 @@
+# Copyright [2025] [SOPTIM AG]
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import gzip
+import logging
+import threading
+from collections.abc import Iterable
+from pathlib import Path
+from urllib.parse import quote
+
+import pandas as pd
+
+from .cgmes_file_reader import RDF_TYPE, CgmesDocument, CgmesFileReader, Triple
+from .result_decoder import CsvResultDecoder, ResultDtypes
+from .sparql_datasource import AbstractSparqlDataSource, _prefix_header
+
+DEFAULT_EMBEDDED_BASE_URL = "urn:cgmes:files"
+
+
+class EmbeddedSparqlDataSource(AbstractSparqlDataSource):
+    """
+    In-process SPARQL datasource backed by an rdflib dataset,
+    e.g. for tests or small grids without a triplestore.
+
+    CGMES files are read with `CgmesFileReader`, each document is stored
+    in its own named graph, so queries on named graphs (`GRAPH` and `VALUES`)
+    are answered like by a triplestore. Results are decoded from the
+    SPARQL CSV format, equal to the results of a `SparqlDataSource`.
+
+    Requires `rdflib`, see the `embedded` extra.
+
+    Args:
+        base_url (str, optional): Base IRI of the resources without `xml:base`.
+            Defaults to DEFAULT_EMBEDDED_BASE_URL.
+        prefixes (dict[str, str] | None, optional): Sparql-Prefixes added to the
+            queries. Defaults to None.
+        default_union (bool, optional): Query the union of all named graphs
+            as default graph. Defaults to True.
+    """
+
+    def __init__(
+        self,
+        base_url: str = DEFAULT_EMBEDDED_BASE_URL,
+        prefixes: dict[str, str] | None = None,
+        default_union: bool = True,
+    ):
+        try:
+            import rdflib  # pylint: disable=import-outside-toplevel
+        except ImportError as e:
+            raise ImportError(
+                "rdflib is required to query CGMES files without a triplestore, "
+                "install it with: pip install cgmes2pgm_converter[embedded]"
+            ) from e
+
+        super().__init__(base_url, prefixes or {})
+        self.namespaces: dict[str, str] = {}
+
+        self._store = rdflib.Dataset(default_union=default_union)
+        self._lock = threading.RLock()
+        self._reader = CgmesFileReader(base_url)
+        self._result_decoder = CsvResultDecoder()
+
+    def get_prefixes(self) -> dict[str, str]:
+        return self._prefixes
+
+    def load(self, sources: str | Path | Iterable[str | Path]) -> list[str]:
+        """Reads RDF/XML files, zip archives or directories into the store
+
+        Args:
+            sources (str | Path | Iterable[str | Path]): Paths to read
+
+        Returns:
+            list[str]: Named graphs of the loaded documents
+        """
+        graphs = []
+        for document in self._reader.read(sources):
+            graphs.append(self.add_document(document))
+        return graphs
+
+    def graph_name(self, document_name: str) -> str:
+        """Named graph of the document with the given name"""
+        return f"{self._reader.base_iri}/graph/{quote(document_name, safe='/._-')}"
+
+    def add_document(self, document: CgmesDocument) -> str:
+        """Stores the triples of a document in its named graph
+
+        Args:
+            document (CgmesDocument): The document, e.g. read by `CgmesFileReader`
+
+        Returns:
+            str: Named graph of the document
+        """
+        from rdflib import Literal, URIRef  # pylint: disable=import-outside-toplevel
+
+        graph_name = self.graph_name(document.name)
+        logging.debug(
+            "Loading %d triples of %s into %s",
+            len(document.triples),
+            document.name,
+            graph_name,
+        )
+
+        for prefix, uri in document.namespaces.items():
+            self.namespaces.setdefault(prefix, uri)
+
+        # predicates and classes repeat for every resource
+        iris: dict[str, URIRef] = {}
+
+        def iri(value: str) -> URIRef:
+            term = iris.get(value)
+            if term is None:
+                term = iris[value] = URIRef(value)
+            return term
+
+        def obj(triple: Triple):
+            if triple.literal:
+                return Literal(
+                    triple.object, datatype=triple.datatype, lang=triple.language
+                )
+            if triple.predicate == RDF_TYPE:
+                return iri(triple.object)
+            return URIRef(triple.object)
+
+        with self._lock:
+            context = self._store.graph(URIRef(graph_name))
+            context.addN(
+                (URIRef(t.subject), iri(t.predicate), obj(t), context)
+                for t in document.triples
+            )
+        return graph_name
+
+    def query(
+        self,
+        query: str,
+        add_prefixes: bool = True,
+        dtypes: ResultDtypes | None = None,
+        strip_prefix: str | None = None,
+    ) -> pd.DataFrame:
+        """Executes a SPARQL query and returns the result as a pandas DataFrame
+
+        Args:
+            query (str): The SPARQL query to execute
+            add_prefixes (bool, optional): Add defined Sparql-Prefixes (e.g. xsd:, cim:)
+                at the beginning of the query. Defaults to True.
+            dtypes (ResultDtypes | None, optional): Types of the result columns.
+                Defaults to None.
+            strip_prefix (str | None, optional): Prefix removed from all string values
+                starting with it while decoding. Defaults to None.
+
+        Returns:
+            pd.DataFrame: Result of the query as a DataFrame
+        """
+        raw = self.execute(self._with_prefixes(query, add_prefixes))
+        return self._result_decoder.decode(raw, dtypes, strip_prefix)
+
+    def update(self, query: str, add_prefixes: bool = True) -> None:
+        """Executes a SPARQL update query
+
+        Args:
+            query (str): The SPARQL update query to execute
+            add_prefixes (bool, optional): Add defined Sparql-Prefixes (e.g. xsd:, cim:)
+                at the beginning of the query. Defaults to True.
+        """
+        self.execute(self._with_prefixes(query, add_prefixes), method="POST")
+
+    def drop_graph(self, graph_iri: str) -> None:
+        """Drops a named graph
+
+        Args:
+            graph_iri (str): The IRI of the graph to drop
+        """
+        if graph_iri == "default":
+            self.update("DROP DEFAULT")
+        else:
+            self.update(f"DROP GRAPH <{graph_iri}>")
+
+    def upload_graph(
+        self,
+        graph_iri: str,
+        data: bytes,
+        content_type: str = "text/turtle",
+        replace: bool = False,
+        compressed: bool = False,
+    ) -> None:
+        """Parses an RDF document into a graph of the store,
+        see `SparqlDataSource.upload_graph`
+        """
+        from rdflib import URIRef  # pylint: disable=import-outside-toplevel
+
+        if compressed:
+            data = gzip.decompress(data)
+        rdf_format = "nt" if content_type == "application/n-triples" else "turtle"
+
+        with self._lock:
+            if graph_iri == "default":
+                graph = self._store.default_context
+            else:
+                graph = self._store.graph(URIRef(graph_iri))
+            if replace:
+                graph.remove((None, None, None))
+            graph.parse(data=data, format=rdf_format)
+
+    def execute(self, text: str, method: str = "GET") -> bytes:
+        """Executes a complete query (GET) or update (POST) on the store
+
+        Args:
+            text (str): Query or update including its prefixes
+            method (str, optional): "GET" for queries, "POST" for updates.
+                Defaults to "GET".
+
+        Returns:
+            bytes: Result of a query in the SPARQL CSV format, empty for updates
+        """
+        with self._lock:
+            if method == "GET":
+                return self._store.query(text).serialize(format="csv")
+
+            self._store.update(text)
+            return b""
+
+    def _with_prefixes(self, query: str, add_prefixes: bool) -> str:
+        if not add_prefixes:
+            return query
+        return _prefix_header(tuple(self._prefixes.items())) + query
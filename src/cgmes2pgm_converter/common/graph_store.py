@@ -0,0 +1,42 @@
+# Copyright [2025] [SOPTIM AG]
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+from dataclasses import dataclass
+
+
+@dataclass
+class GraphStoreOptions:
+    """
+    Options to insert triples via the SPARQL 1.1 Graph Store HTTP Protocol.
+
+    Instead of `INSERT DATA` updates, the triples are sent as Turtle documents
+    that are posted to the graph store endpoint of the dataset (`/data` for Fuseki),
+    which avoids parsing the triples as SPARQL updates on the server.
+
+        `POST {base_url}/data?graph=<graph>`
+
+    Attributes:
+        enable (bool): If True, `insert_df` and `insert_triples` upload the
+            triples via the graph store protocol, otherwise `INSERT DATA`
+            updates are sent. Defaults to False.
+        max_triples_per_request (int): Maximum number of triples per request.
+            Defaults to 250000.
+        workers (int): Number of requests sent concurrently. Defaults to 1.
+        compress (bool): Send the documents gzip compressed. Defaults to False.
+    """
+
+    enable: bool = False
+    max_triples_per_request: int = 250_000
+    workers: int = 1
+    compress: bool = False
@@ -12,10 +12,13 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
+import threading
 from abc import abstractmethod
+from collections.abc import Iterable
 from typing import ItemsView
 
-from bidict import bidict
+import numpy as np
+import pandas as pd
 from power_grid_model_io.data_types import ExtraInfo
 
 
@@ -44,6 +47,25 @@ class AbstractCgmesIdMapping:
     def get_pgm_id(self, cgmes_iri: str, cgmes_term_iri: str | None = None) -> int:
         raise NotImplementedError
 
+    def get_pgm_ids(
+        self,
+        cgmes_iris: Iterable[str],
+        cgmes_term_iris: Iterable[str] | None = None,
+    ) -> np.ndarray:
+        """Get the PGM IDs for multiple CGMES IRIs, see `get_pgm_id`
+
+        Returns:
+            np.ndarray: PGM IDs as int32 array
+        """
+        if cgmes_term_iris is None:
+            ids = [self.get_pgm_id(iri) for iri in cgmes_iris]
+        else:
+            ids = [
+                self.get_pgm_id(iri, term)
+                for iri, term in zip(cgmes_iris, cgmes_term_iris)
+            ]
+        return np.array(ids, dtype=np.int32)
+
     @abstractmethod
     def get_cgmes_iri(self, pgm_id: int) -> str:
         raise NotImplementedError
@@ -66,31 +88,89 @@ class AbstractCgmesIdMapping:
 
 class CgmesPgmIdMapping(AbstractCgmesIdMapping):
     """
-    Class to map cim:IdentifiedObjects (mrid, name) to PGM IDs using bidict
+    Class to map cim:IdentifiedObjects (mrid, name) to PGM IDs.
+
+    PGM IDs are assigned consecutively starting at 1, so IRIs and names are stored
+    in lists indexed by the PGM ID. Single IRIs are looked up in a dict holding
+    the same string objects, `get_pgm_ids` resolves whole columns with a
+    `pandas.Index` of the IRIs, which is rebuilt after IRIs were added.
+    Bulk operations return int32 arrays.
+
+    New IDs are allocated under a lock, so the mapping may be shared
+    between threads.
     """
 
     def __init__(self):
-        self._idx: int = 1
-        self._cgmes_to_pgm: bidict[str, int] = bidict()
-        self._cgmes_to_name: dict[str, str] = {}
+        self._lock = threading.RLock()
+
+        # IRI and name of each PGM ID at position PGM ID - 1
+        self._iris: list[str] = []
+        self._names: list[str] = []
+        self._iri_to_pgm: dict[str, int] = {}
 
         self._eq_to_term_to_pgm: dict[str, dict[str, int]] = {}
 
+        # index of the IRIs for bulk lookups and the PGM ID of each entry
+        self._index: tuple[pd.Index, np.ndarray] | None = None
+
+    def copy(self) -> "CgmesPgmIdMapping":
+        """Independent copy of the mapping, IDs added to the copy
+        continue from the same next ID"""
+        mapping = CgmesPgmIdMapping()
+        with self._lock:
+            mapping._iris = self._iris.copy()
+            mapping._names = self._names.copy()
+            mapping._iri_to_pgm = self._iri_to_pgm.copy()
+            mapping._eq_to_term_to_pgm = {
+                eq: terms.copy() for eq, terms in self._eq_to_term_to_pgm.items()
+            }
+        return mapping
+
     def add_cgmes_iri(self, cgmes_iri: str, name: str) -> int:
-        if cgmes_iri in self._cgmes_to_pgm:
-            raise ValueError(f"{cgmes_iri} already exists")
+        with self._lock:
+            if cgmes_iri in self._iri_to_pgm:
+                raise ValueError(f"{cgmes_iri} already exists")
 
-        self._cgmes_to_pgm[cgmes_iri] = self._idx
-        self._cgmes_to_name[cgmes_iri] = name
-        self._idx += 1
-        return self._idx - 1
+            return self._append(cgmes_iri, name)
 
-    def add_cgmes_iris(self, cgmes_iris, names):
-        ids = []
-        for cgmes_iri, name in zip(cgmes_iris, names):
-            ids.append(self.add_cgmes_iri(cgmes_iri, name))
+    def add_cgmes_iris(self, cgmes_iris, names) -> np.ndarray:
+        """Creates consecutive PGM IDs for multiple IRIs
 
-        return ids
+        Args:
+            cgmes_iris (Iterable[str]): IRIs to add, e.g. a column of a query result
+            names (Iterable[str]): Names of the IRIs
+
+        Raises:
+            ValueError: If an IRI already exists or is contained twice,
+                or the number of names differs, no IRI is added in that case
+
+        Returns:
+            np.ndarray: New PGM IDs as int32 array
+        """
+        iris = list(cgmes_iris)
+        names = list(names)
+        if len(iris) != len(names):
+            raise ValueError(f"Got {len(iris)} IRIs but {len(names)} names")
+
+        with self._lock:
+            start = len(self._iris) + 1
+            new_ids = dict(zip(iris, range(start, start + len(iris))))
+
+            if len(new_ids) != len(iris) or not self._iri_to_pgm.keys().isdisjoint(
+                new_ids
+            ):
+                seen = set(self._iri_to_pgm)
+                for iri in iris:
+                    if iri in seen:
+                        raise ValueError(f"{iri} already exists")
+                    seen.add(iri)
+
+            self._iri_to_pgm.update(new_ids)
+            self._iris.extend(iris)
+            self._names.extend(names)
+            self._index = None
+
+        return np.arange(start, start + len(iris), dtype=np.int32)
 
     def add_cgmes_term_iri(self, eq_iri, term_iri, name):
         """Creates a new PGM ID for an equipment IRI in combination with a terminal IRI.
@@ -101,64 +181,115 @@ class CgmesPgmIdMapping(AbstractCgmesIdMapping):
         newly created loads. Otherwise, the measurement would still refer to the original
         (removed) object.
         """
-        new_id = self._idx
-        self._idx += 1
-        self._eq_to_term_to_pgm.setdefault(eq_iri, {})[term_iri] = new_id
-
-        # also add both ids (concatenated with ",") to the main dictionary so that
-        # you can get the corresponding cgmes ids for a pgm id (if needed)
-        self._cgmes_to_pgm[eq_iri + "," + term_iri] = new_id
-        self._cgmes_to_name[eq_iri + "," + term_iri] = name
+        with self._lock:
+            # also add both ids (concatenated with ",") to the main mapping so that
+            # you can get the corresponding cgmes ids for a pgm id (if needed)
+            new_id = self._append(eq_iri + "," + term_iri, name)
+            self._eq_to_term_to_pgm.setdefault(eq_iri, {})[term_iri] = new_id
 
         return new_id
 
-    def add_cgmes_term_iris(self, eq_iris, term_iris, names):
+    def add_cgmes_term_iris(self, eq_iris, term_iris, names) -> np.ndarray:
         ids = []
-        for eq_iri, term_iri, name in zip(eq_iris, term_iris, names):
-            ids.append(self.add_cgmes_term_iri(eq_iri, term_iri, name))
-
-        return ids
+        with self._lock:
+            for eq_iri, term_iri, name in zip(eq_iris, term_iris, names, strict=True):
+                ids.append(self.add_cgmes_term_iri(eq_iri, term_iri, name))
+
+        return np.array(ids, dtype=np.int32)
+
+    def _append(self, key: str, name: str) -> int:
+        self._iris.append(key)
+        self._names.append(name)
+        new_id = len(self._iris)
+        self._iri_to_pgm[key] = new_id
+        self._index = None
+        return new_id
 
     def __contains__(self, item: str | int) -> bool:
         if isinstance(item, str):
-            return (
-                item in self._cgmes_to_pgm.keys()
-                or item in self._eq_to_term_to_pgm.keys()
-            )
-        if isinstance(item, int):
-            return item in self._cgmes_to_pgm.inv.keys()
+            return item in self._iri_to_pgm or item in self._eq_to_term_to_pgm
+        if isinstance(item, (int, np.integer)):
+            return 1 <= item <= len(self._iris)
 
         return False
 
     def get_pgm_id(self, cgmes_iri: str, cgmes_term_iri: str | None = None) -> int:
         """Get PGM ID for a given CGMES IRI alone or in combination with a terminal IRI"""
         if cgmes_term_iri is None:
-            return self._cgmes_to_pgm[cgmes_iri]
+            return self._iri_to_pgm[cgmes_iri]
 
         eq_dict = self._eq_to_term_to_pgm.get(cgmes_iri)
         if eq_dict is None:
             # nothing in this dict, check the main dict
-            return self._cgmes_to_pgm[cgmes_iri]
+            return self._iri_to_pgm[cgmes_iri]
 
         pgm_id = eq_dict.get(cgmes_term_iri)
 
         if pgm_id is None:
             # if no id for term found, then search again in the main dict with just the eq id
-            return self._cgmes_to_pgm[cgmes_iri]
+            return self._iri_to_pgm[cgmes_iri]
 
         return pgm_id
 
+    def get_pgm_ids(
+        self,
+        cgmes_iris: Iterable[str],
+        cgmes_term_iris: Iterable[str] | None = None,
+    ) -> np.ndarray:
+        """Get the PGM IDs for multiple CGMES IRIs, see `get_pgm_id`
+
+        Raises:
+            KeyError: If an IRI is unknown
+            ValueError: If the number of terminal IRIs differs
+
+        Returns:
+            np.ndarray: PGM IDs as int32 array
+        """
+        index, pgm_ids = self._get_index()
+        iris = _as_series(cgmes_iris)
+        positions = index.get_indexer(iris)
+
+        if cgmes_term_iris is not None and self._eq_to_term_to_pgm:
+            terms = _as_series(cgmes_term_iris)
+            if len(terms) != len(iris):
+                raise ValueError(f"Got {len(iris)} IRIs but {len(terms)} terminal IRIs")
+            # IDs per terminal are stored as "eq,term", else the ID of the equipment
+            term_positions = index.get_indexer(iris + "," + terms)
+            positions = np.where(term_positions >= 0, term_positions, positions)
+
+        missing = np.flatnonzero(positions < 0)
+        if missing.size:
+            raise KeyError(iris.iloc[missing[0]])
+        return pgm_ids[positions]
+
+    def _get_index(self) -> tuple[pd.Index, np.ndarray]:
+        with self._lock:
+            if self._index is None:
+                index = pd.Index(self._iris, dtype=object)
+                pgm_ids = np.arange(1, len(self._iris) + 1, dtype=np.int32)
+                if not index.is_unique:
+                    # IRIs added again map to their last PGM ID, like in the dict
+                    last = ~index.duplicated(keep="last")
+                    index, pgm_ids = index[last], pgm_ids[last]
+                self._index = (index, pgm_ids)
+            return self._index
+
     def get_cgmes_iri(self, pgm_id: int) -> str:
-        return self._cgmes_to_pgm.inv[pgm_id]
+        return self._iris[self._position(pgm_id)]
 
     def get_name_from_pgm(self, pgm_id: int) -> str:
-        return self._cgmes_to_name[self.get_cgmes_iri(pgm_id)]
+        return self._names[self._position(pgm_id)]
 
     def get_name_from_cgmes(self, cgmes_iri: str) -> str:
-        return self._cgmes_to_name[cgmes_iri]
+        return self._names[self._iri_to_pgm[cgmes_iri] - 1]
+
+    def _position(self, pgm_id: int) -> int:
+        if not 1 <= pgm_id <= len(self._iris):
+            raise KeyError(pgm_id)
+        return int(pgm_id) - 1
 
     def items(self) -> ItemsView[str, int]:
-        return self._cgmes_to_pgm.items()
+        return self._iri_to_pgm.items()
 
     def build_extra_info(self) -> ExtraInfo:
         """Build extra info for the PGM JSON file,
@@ -168,10 +299,19 @@ class CgmesPgmIdMapping(AbstractCgmesIdMapping):
             ExtraInfo: Extra Info
         """
         d = {}
-        for cgmes_iri, pgm_id in self._cgmes_to_pgm.items():
+        for pgm_id, (cgmes_iri, name) in enumerate(
+            zip(self._iris, self._names), start=1
+        ):
             d[pgm_id] = {
-                "_name": str(self.get_name_from_pgm(pgm_id)),
+                "_name": str(name),
                 "_mrid": cgmes_iri,
             }
 
         return d
+
+
+def _as_series(values: Iterable[str]) -> pd.Series:
+    """Values as object Series with a default index, so that they align by position"""
+    if not isinstance(values, (pd.Series, pd.Index, np.ndarray, list)):
+        values = list(values)
+    return pd.Series(np.asarray(values, dtype=object), dtype=object)
@@ -15,6 +15,7 @@
 from dataclasses import dataclass, field
 from typing import Literal
 
+import numpy as np
 from power_grid_model import ComponentType
 
 
@@ -62,20 +63,65 @@ class DefaultSigma:
 
     def get_sigma_pq(self, voltage_level: float) -> float:
         """Get the sigma value for a given voltage level."""
-        ## TODO: Optimize search with bisect?!
-        sorted_levels = dict(sorted(self.discrete_p_q.items()))
-        for level, sigma in sorted_levels.items():
-            if voltage_level <= level:
-                return sigma
-        return self.sigma_p_q
+        return float(self.get_sigma_pq_array(voltage_level))
 
     def get_sigma_u(self, voltage_level: float) -> float:
         """Get the sigma value for a given voltage level."""
-        sorted_levels = dict(sorted(self.discrete_u.items()))
-        for level, sigma in sorted_levels.items():
-            if voltage_level <= level:
-                return sigma
-        return self.sigma_u
+        return float(self.get_sigma_u_array(voltage_level))
+
+    def get_sigma_pq_array(self, voltage_levels) -> np.ndarray:
+        """Get the sigma values for an array of voltage levels.
+
+        Args:
+            voltage_levels (array_like): Voltage levels (kV)
+
+        Returns:
+            np.ndarray: Sigma of the next higher or equal level in `discrete_p_q`,
+                `sigma_p_q` above all levels
+        """
+        return _lookup_upper_level(self.discrete_p_q, self.sigma_p_q, voltage_levels)
+
+    def get_sigma_u_array(self, voltage_levels) -> np.ndarray:
+        """Get the sigma values for an array of voltage levels.
+
+        Args:
+            voltage_levels (array_like): Voltage levels (kV)
+
+        Returns:
+            np.ndarray: Sigma of the next higher or equal level in `discrete_u`,
+                `sigma_u` above all levels
+        """
+        return _lookup_upper_level(self.discrete_u, self.sigma_u, voltage_levels)
+
+
+def _level_table(levels: dict[float, float]) -> tuple[np.ndarray, np.ndarray]:
+    """Voltage levels in ascending order and their values"""
+    sorted_levels = sorted(levels.items())
+    keys = np.array([level for level, _ in sorted_levels], dtype=float)
+    values = np.array([value for _, value in sorted_levels], dtype=float)
+    return keys, values
+
+
+def _lookup_upper_level(
+    levels: dict[float, float], default: float, voltage_levels
+) -> np.ndarray:
+    """Value of the smallest level greater or equal to each voltage level"""
+    keys, values = _level_table(levels)
+    pos = np.searchsorted(keys, np.asarray(voltage_levels, dtype=float))
+    # voltages above all levels (and NaN) are sorted behind the last level
+    return np.append(values, default)[pos]
+
+
+def _lookup_exact_level(
+    levels: dict[float, float], voltage_levels: np.ndarray
+) -> tuple[np.ndarray, np.ndarray]:
+    """Value of each voltage level and whether the level is defined"""
+    keys, values = _level_table(levels)
+    if len(keys) == 0:
+        return np.zeros(voltage_levels.shape), np.zeros(voltage_levels.shape, bool)
+
+    pos = np.minimum(np.searchsorted(keys, voltage_levels), len(keys) - 1)
+    return values[pos], keys[pos] == voltage_levels
 
 
 @dataclass
@@ -152,6 +198,44 @@ class UMeasurementSubstitutionOptions:
             discrete_sigma,
         )
 
+    def map_v_array(self, nominal_voltages_v) -> tuple[np.ndarray, np.ndarray]:
+        """Array version of `map_v`
+
+        Args:
+            nominal_voltages_v (array_like): Nominal voltages (V)
+
+        Returns:
+            tuple[np.ndarray, np.ndarray]: Measured values and sigmas (V)
+        """
+        nominal_voltages_kv = np.asarray(nominal_voltages_v, dtype=float) / 1e3
+        meas_kv, sigma_kv = self.map_kv_array(nominal_voltages_kv)
+        return meas_kv * 1e3, sigma_kv * 1e3
+
+    def map_kv_array(self, nominal_voltages_kv) -> tuple[np.ndarray, np.ndarray]:
+        """Array version of `map_kv`
+
+        Args:
+            nominal_voltages_kv (array_like): Nominal voltages (kV)
+
+        Returns:
+            tuple[np.ndarray, np.ndarray]: Measured values and sigmas (kV)
+        """
+        nominal_voltages_kv = np.asarray(nominal_voltages_kv, dtype=float)
+
+        sigma, has_sigma = _lookup_exact_level(self.discrete_sigma, nominal_voltages_kv)
+        meas, has_meas = _lookup_exact_level(self.discrete_meas, nominal_voltages_kv)
+
+        # like `map_kv`, a discrete measurement of 0 falls back to the factor
+        use_discrete = has_meas & (meas != 0)
+        return (
+            np.where(
+                use_discrete,
+                meas,
+                nominal_voltages_kv * self.nomv_to_measv_factor,
+            ),
+            np.where(has_sigma, sigma, float(self.sigma)),
+        )
+
 
 @dataclass
 class PassiveNodeOptions:
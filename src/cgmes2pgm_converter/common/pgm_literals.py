@@ -36,3 +36,19 @@ SENSOR_COMPONENTS = [
     ComponentType.sym_voltage_sensor,
     ComponentType.asym_voltage_sensor,
 ]
+
+# Components evaluated by `Topology`
+TOPOLOGY_COMPONENTS = [
+    ComponentType.node,
+    ComponentType.line,
+    ComponentType.generic_branch,
+    ComponentType.link,
+    ComponentType.transformer,
+    ComponentType.three_winding_transformer,
+    ComponentType.source,
+    ComponentType.sym_gen,
+    ComponentType.sym_load,
+    ComponentType.shunt,
+    ComponentType.sym_voltage_sensor,
+    ComponentType.sym_power_sensor,
+]
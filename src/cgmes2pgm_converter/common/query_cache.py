@@ -0,0 +1,133 @@
+# Copyright [2025] [SOPTIM AG]
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import hashlib
+import logging
+import os
+import re
+import tempfile
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+
+from .result_decoder import ResultDtypes, _as_dtype
+
+_WHITESPACE = re.compile(r"\s+")
+
+
+class QueryResultCache:
+    """
+    Persistent cache for query results stored as files in a local directory.
+
+    Results are stored under a key built from the normalized query text and a
+    fingerprint of the data the query reads, e.g. the FullModel IRIs and scenario
+    times of the named graphs. A changed model leads to a new key, so results of
+    replaced models are not returned but remain on disk until `clear` is called.
+    Data changed in place under an unchanged fingerprint can't be detected,
+    `clear` has to be called in that case.
+
+    The results are stored as Parquet files, which requires `pyarrow`
+    (`pip install cgmes2pgm_converter[arrow]`). Reading a file can't execute
+    code, the declared column types are applied again when reading.
+    Results that can't be stored as Parquet, e.g. columns of mixed types,
+    are not cached.
+
+    Attributes:
+        directory (str | Path): Directory of the cache files, created if missing
+    """
+
+    def __init__(self, directory: str | Path):
+        try:
+            import pyarrow  # noqa: F401 pylint: disable=import-outside-toplevel,unused-import
+        except ImportError as e:
+            raise ImportError(
+                "pyarrow is required to cache query results, "
+                "install it with: pip install cgmes2pgm_converter[arrow]"
+            ) from e
+
+        self.directory = Path(directory)
+        self.directory.mkdir(parents=True, exist_ok=True)
+
+    def make_key(self, query: str, fingerprint: str) -> str:
+        """Builds the cache key of a query
+
+        Args:
+            query (str): Query text, whitespace is ignored
+            fingerprint (str): Fingerprint of the data the query reads
+
+        Returns:
+            str: Cache key
+        """
+        normalized = _WHITESPACE.sub(" ", query).strip()
+        digest = hashlib.sha256()
+        digest.update(fingerprint.encode("utf-8"))
+        digest.update(b"\0")
+        digest.update(normalized.encode("utf-8"))
+        return digest.hexdigest()
+
+    def get(self, key: str, dtypes: ResultDtypes | None = None) -> pd.DataFrame | None:
+        """Returns the cached result or None if the key is not cached
+
+        Args:
+            key (str): Cache key, see `make_key`
+            dtypes (ResultDtypes | None, optional): Types of the result columns,
+                as used when decoding the result. Defaults to None.
+        """
+        path = self._path(key)
+        if not path.exists():
+            return None
+
+        try:
+            result = pd.read_parquet(path, engine="pyarrow")
+        except Exception as e:  # pylint: disable=broad-exception-caught
+            logging.warning("Ignoring unreadable cache file %s: %s", path, e)
+            return None
+        return _restore_dtypes(result, dtypes or {})
+
+    def put(self, key: str, result: pd.DataFrame) -> None:
+        """Stores a result, replacing an existing entry with the same key"""
+        fd, tmp = tempfile.mkstemp(dir=self.directory, suffix=".tmp")
+        os.close(fd)
+        try:
+            result.to_parquet(tmp, engine="pyarrow", index=False)
+            # atomic, concurrent readers see either the old or the new file
+            os.replace(tmp, self._path(key))
+        except (TypeError, ValueError) as e:
+            # pyarrow errors derive from these, e.g. for mixed object columns
+            os.remove(tmp)
+            logging.debug("Result not cached: %s", e)
+        except BaseException:
+            os.remove(tmp)
+            raise
+
+    def clear(self) -> None:
+        """Removes all cached results"""
+        for path in self.directory.glob("*.parquet"):
+            path.unlink(missing_ok=True)
+
+    def _path(self, key: str) -> Path:
+        return self.directory / f"{key}.parquet"
+
+
+def _restore_dtypes(result: pd.DataFrame, dtypes: ResultDtypes) -> pd.DataFrame:
+    """Applies the declared types, missing values of other object columns
+    are read as None and restored to NaN like in the decoded result"""
+    for col in result.columns:
+        dtype = dtypes.get(col)
+        if dtype is not None:
+            result[col] = _as_dtype(result[col], dtype)
+        elif result[col].dtype == object:
+            result[col] = result[col].where(result[col].notna(), np.nan)
+    return result
@@ -0,0 +1,78 @@
+# Copyright [2025] [SOPTIM AG]
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import re
+from functools import lru_cache
+
+PLACEHOLDER_PATTERN = re.compile(r"(\$[A-Za-z_][A-Za-z0-9_]*)")
+
+
+class QueryTemplate:
+    """
+    SPARQL query with `$NAME` placeholders, e.g. `$EQ_GRAPH`.
+
+    The query is split once into its literal parts and the placeholder slots,
+    rendering only joins the parts with the values of the slots.
+    Use `QueryTemplate.get` to reuse the templates of queries rendered before.
+
+    Attributes:
+        text (str): Query text including the placeholders
+    """
+
+    def __init__(self, text: str):
+        self.text = text
+
+        parts = PLACEHOLDER_PATTERN.split(text)
+        self._literals = parts[0::2]
+        self._slots = parts[1::2]
+
+    @staticmethod
+    def get(text: str) -> "QueryTemplate":
+        """Returns the template of a query text, parsed on first use"""
+        return _get_template(text)
+
+    @property
+    def slots(self) -> frozenset[str]:
+        """Names of all placeholders, including the `$`"""
+        return frozenset(self._slots)
+
+    def render(self, params: dict) -> str:
+        """Replaces the placeholders with the given values
+
+        Values may contain placeholders themselves, which are replaced as well.
+        Placeholders without a value remain unchanged.
+
+        Args:
+            params (dict): Values by placeholder name, e.g. {"$EQ_GRAPH": "<...>"}
+
+        Returns:
+            str: The query text
+        """
+        parts = [self._literals[0]]
+        for slot, literal in zip(self._slots, self._literals[1:]):
+            if slot in params:
+                value = str(params[slot])
+                if "$" in value:
+                    nested = {k: v for k, v in params.items() if k != slot}
+                    value = QueryTemplate.get(value).render(nested)
+                parts.append(value)
+            else:
+                parts.append(slot)
+            parts.append(literal)
+        return "".join(parts)
+
+
+@lru_cache(maxsize=1024)
+def _get_template(text: str) -> QueryTemplate:
+    return QueryTemplate(text)
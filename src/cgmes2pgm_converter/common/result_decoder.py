@@ -0,0 +1,274 @@
+# Copyright [2025] [SOPTIM AG]
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import csv
+import json
+from abc import ABC, abstractmethod
+from io import BytesIO
+
+import numpy as np
+import pandas as pd
+
+# Column types that can be declared for a query result,
+# columns without a declared type are inferred like in `pandas.read_csv`
+ResultDtypes = dict[str, str]
+
+_TRUE_VALUES = {"true", "True", "TRUE"}
+_FALSE_VALUES = {"false", "False", "FALSE"}
+_BOOL_DTYPES = ("bool", "boolean")
+
+# N-Triples literal: "lexical form" followed by an optional datatype or language tag
+_LITERAL_PATTERN = r'^"(.*)"(?:\^\^<[^>]*>|@[A-Za-z0-9-]+)?$'
+_ESCAPES = {"\\t": "\t", "\\n": "\n", "\\r": "\r", '\\"': '"', "\\\\": "\\"}
+
+
+class AbstractResultDecoder(ABC):
+    """Decodes the response of a SPARQL endpoint into a DataFrame"""
+
+    @property
+    @abstractmethod
+    def accept(self) -> str:
+        """Media type requested from the endpoint"""
+        raise NotImplementedError
+
+    @abstractmethod
+    def decode(
+        self,
+        raw: bytes,
+        dtypes: ResultDtypes | None = None,
+        strip_prefix: str | None = None,
+    ) -> pd.DataFrame:
+        """Decodes a query result
+
+        Args:
+            raw (bytes): Response of the endpoint
+            dtypes (ResultDtypes | None, optional): Types of columns by variable name,
+                e.g. {"status1": "bool", "r": "float64", "name": "str"}.
+                Columns that are not part of the result are ignored.
+            strip_prefix (str | None, optional): Prefix removed from all string values
+                starting with it, e.g. the base URI of the dataset. Defaults to None.
+
+        Returns:
+            pd.DataFrame: One column per variable, one row per solution
+        """
+        raise NotImplementedError
+
+
+class CsvResultDecoder(AbstractResultDecoder):
+    """SPARQL 1.1 Query Results CSV Format (text/csv)"""
+
+    @property
+    def accept(self) -> str:
+        return "text/csv"
+
+    def decode(
+        self,
+        raw: bytes,
+        dtypes: ResultDtypes | None = None,
+        strip_prefix: str | None = None,
+    ) -> pd.DataFrame:
+        # read_csv rejects bool columns with missing values (unbound variables),
+        # so they are converted after parsing
+        dtypes = dtypes or {}
+        flags = [col for col, dtype in dtypes.items() if dtype in _BOOL_DTYPES]
+        result = pd.read_csv(
+            BytesIO(raw),
+            dtype={col: t for col, t in dtypes.items() if t not in _BOOL_DTYPES},
+        )
+        if strip_prefix:
+            for col in result.select_dtypes(include="object"):
+                result[col] = _strip_prefix(result[col], strip_prefix)
+        for col in flags:
+            if col in result:
+                result[col] = _as_dtype(result[col], dtypes[col])
+        return result
+
+
+class TsvResultDecoder(AbstractResultDecoder):
+    """SPARQL 1.1 Query Results TSV Format (text/tab-separated-values)
+
+    IRIs are returned without angle brackets and literals with their
+    lexical form only, equal to the CSV format.
+    """
+
+    @property
+    def accept(self) -> str:
+        return "text/tab-separated-values"
+
+    def decode(
+        self,
+        raw: bytes,
+        dtypes: ResultDtypes | None = None,
+        strip_prefix: str | None = None,
+    ) -> pd.DataFrame:
+        terms = pd.read_csv(
+            BytesIO(raw),
+            sep="\t",
+            dtype=str,
+            quoting=csv.QUOTE_NONE,
+            keep_default_na=False,
+            na_values=[""],
+        )
+        columns = {
+            str(col).removeprefix("?"): self._term_values(terms[col])
+            for col in terms.columns
+        }
+        return _to_frame(columns, dtypes, strip_prefix)
+
+    def _term_values(self, terms: pd.Series) -> pd.Series:
+        values = terms.copy()
+
+        iris = terms.str.startswith("<", na=False)
+        values[iris] = terms[iris].str[1:-1]
+
+        literals = terms.str.startswith('"', na=False)
+        if literals.any():
+            lexical = terms[literals].str.extract(_LITERAL_PATTERN, expand=False)
+            escaped = lexical.str.contains("\\", regex=False, na=False)
+            for escape, char in _ESCAPES.items():
+                lexical[escaped] = lexical[escaped].str.replace(
+                    escape, char, regex=False
+                )
+            values[literals] = lexical
+
+        return values
+
+
+class JsonResultDecoder(AbstractResultDecoder):
+    """SPARQL 1.1 Query Results JSON Format (application/sparql-results+json)"""
+
+    @property
+    def accept(self) -> str:
+        return "application/sparql-results+json"
+
+    def decode(
+        self,
+        raw: bytes,
+        dtypes: ResultDtypes | None = None,
+        strip_prefix: str | None = None,
+    ) -> pd.DataFrame:
+        result = json.loads(raw)
+        bindings = result["results"]["bindings"]
+
+        columns = {}
+        for var in result["head"]["vars"]:
+            columns[var] = pd.Series(
+                [b[var]["value"] if var in b else None for b in bindings],
+                dtype=object,
+            )
+        return _to_frame(columns, dtypes, strip_prefix)
+
+
+class ArrowResultDecoder(AbstractResultDecoder):
+    """Apache Arrow IPC stream (application/vnd.apache.arrow.stream)
+
+    Requires `pyarrow`, which is installed with the `arrow` extra:
+    `pip install cgmes2pgm_converter[arrow]`.
+    """
+
+    @property
+    def accept(self) -> str:
+        return "application/vnd.apache.arrow.stream"
+
+    def decode(
+        self,
+        raw: bytes,
+        dtypes: ResultDtypes | None = None,
+        strip_prefix: str | None = None,
+    ) -> pd.DataFrame:
+        try:
+            import pyarrow as pa  # pylint: disable=import-outside-toplevel
+        except ImportError as e:
+            raise ImportError(
+                "pyarrow is required to decode Arrow query results, "
+                "install it with: pip install cgmes2pgm_converter[arrow]"
+            ) from e
+
+        table = pa.ipc.open_stream(raw).read_all()
+        columns = {}
+        for name, column in zip(table.column_names, table.columns):
+            series = column.to_pandas()
+            if pa.types.is_string(column.type) or pa.types.is_large_string(column.type):
+                series = series.astype(object).where(series.notna(), None)
+            columns[name] = series
+        return _to_frame(columns, dtypes, strip_prefix, infer=False)
+
+
+def _to_frame(
+    columns: dict[str, pd.Series],
+    dtypes: ResultDtypes | None,
+    strip_prefix: str | None = None,
+    infer: bool = True,
+) -> pd.DataFrame:
+    """Converts raw string columns to the declared or inferred types"""
+    dtypes = dtypes or {}
+    converted = {}
+    for name, values in columns.items():
+        values = values.reset_index(drop=True)
+        if strip_prefix and values.dtype == object:
+            values = _strip_prefix(values, strip_prefix)
+        dtype = dtypes.get(name)
+        if dtype is not None:
+            converted[name] = _as_dtype(values, dtype)
+        elif infer and values.dtype == object:
+            converted[name] = _infer(values)
+        else:
+            converted[name] = values
+    return pd.DataFrame(converted)
+
+
+def _strip_prefix(values: pd.Series, prefix: str) -> pd.Series:
+    """Removes the prefix from all strings starting with it, other values are kept"""
+    # object columns may hold other values, e.g. bools with unbound variables
+    if pd.api.types.infer_dtype(values, skipna=True) not in ("string", "mixed"):
+        return values
+
+    matches = values.str.startswith(prefix, na=False)
+    if not matches.any():
+        return values
+
+    values = values.copy()
+    values[matches] = values[matches].str.slice(len(prefix))
+    return values
+
+
+def _as_dtype(values: pd.Series, dtype: str) -> pd.Series:
+    if dtype in _BOOL_DTYPES and values.dtype != bool:
+        return values.isin(_TRUE_VALUES | {True}).astype(dtype)
+    if dtype == "str":
+        return values.astype(object).where(values.notna(), np.nan)
+    if values.dtype == object:
+        return pd.to_numeric(values).astype(dtype)
+    return values.astype(dtype)
+
+
+def _infer(values: pd.Series) -> pd.Series:
+    """Infers the type of a string column like `pandas.read_csv`"""
+    if len(values) == 0:
+        return values
+
+    present = values.dropna()
+    if len(present) == 0:
+        return pd.Series(np.nan, index=values.index, dtype="float64")
+
+    if set(present) <= _TRUE_VALUES | _FALSE_VALUES:
+        flags = values.isin(_TRUE_VALUES)
+        if len(present) == len(values):
+            return flags
+        return flags.astype(object).where(values.notna(), np.nan)
+
+    try:
+        return pd.to_numeric(values)
+    except (ValueError, TypeError):
+        return values.where(values.notna(), np.nan)
@@ -13,10 +13,18 @@
 # limitations under the License.
 
 from abc import abstractmethod
-from io import BytesIO
+from collections.abc import Iterable, Iterator
+from functools import lru_cache
+from urllib.parse import urlencode
 
 import pandas as pd
-from SPARQLWrapper import SPARQLWrapper
+
+from .http_transport import HttpTransport
+from .query_template import PLACEHOLDER_PATTERN, QueryTemplate
+from .result_decoder import AbstractResultDecoder, CsvResultDecoder, ResultDtypes
+
+# Default number of rows per page of `SparqlDataSource.query_chunks`
+DEFAULT_CHUNK_SIZE = 100_000
 
 
 class AbstractSparqlDataSource:
@@ -25,7 +33,13 @@ class AbstractSparqlDataSource:
         self._prefixes = prefixes
 
     @abstractmethod
-    def query(self, query: str, add_prefixes: bool = True) -> pd.DataFrame: ...
+    def query(
+        self,
+        query: str,
+        add_prefixes: bool = True,
+        dtypes: ResultDtypes | None = None,
+        strip_prefix: str | None = None,
+    ) -> pd.DataFrame: ...
 
     @abstractmethod
     def update(self, query: str, add_prefixes: bool = True) -> None: ...
@@ -35,45 +49,146 @@ class AbstractSparqlDataSource:
 
 
 class SparqlDataSource(AbstractSparqlDataSource):
+    """
+    Datasource for a SPARQL endpoint.
+    Requests are sent via a pool of persistent connections,
+    queries can be executed concurrently from multiple threads.
+
+    Args:
+        base_url (str): Base URL of the dataset
+        prefixes (dict[str, str]): Sparql-Prefixes added to the queries
+        query_endpoint (str, optional): Path of the query endpoint. Defaults to "/query".
+        update_endpoint (str, optional): Path of the update endpoint. Defaults to "/update".
+        graph_store_endpoint (str, optional): Path of the SPARQL Graph Store
+            HTTP Protocol endpoint. Defaults to "/data".
+        transport (HttpTransport | None, optional): Transport used for the requests,
+            e.g. to configure pool size and timeouts. Defaults to `HttpTransport()`.
+        result_decoder (AbstractResultDecoder | None, optional): Format in which query
+            results are requested and decoded. Defaults to `CsvResultDecoder()`,
+            which is supported by all endpoints.
+    """
+
     def __init__(
         self,
         base_url,
         prefixes: dict[str, str],
         query_endpoint="/query",
         update_endpoint="/update",
+        graph_store_endpoint="/data",
+        transport: HttpTransport | None = None,
+        result_decoder: AbstractResultDecoder | None = None,
     ):
         super().__init__(base_url, prefixes)
-        self._wrapper = SPARQLWrapper(
-            endpoint=base_url + query_endpoint,
-            updateEndpoint=base_url + update_endpoint,
-        )
-        self._wrapper.addCustomHttpHeader("Accept", "text/csv")
-        self._wrapper.setOnlyConneg(True)
+        self._query_endpoint = base_url + query_endpoint
+        self._update_endpoint = base_url + update_endpoint
+        self._graph_store_endpoint = base_url + graph_store_endpoint
+        self._transport = transport or HttpTransport()
+        self._result_decoder = result_decoder or CsvResultDecoder()
 
     def get_prefixes(self) -> dict[str, str]:
         return self._prefixes
 
     def _build_prefixes(self) -> str:
         """Builds a string of SPARQL prefixes from the provided dictionary"""
-        prefix_str = ""
-        for prefix, uri in self._prefixes.items():
-            prefix_str += f"PREFIX {prefix}: <{uri}>\n"
-        return prefix_str + "\n"
+        # the prefixes may be changed, e.g. the cim namespace, so the header
+        # is cached by the current prefixes
+        return _prefix_header(tuple(self._prefixes.items()))
 
-    def query(self, query: str, add_prefixes=True) -> pd.DataFrame:
+    def query(
+        self,
+        query: str,
+        add_prefixes=True,
+        dtypes: ResultDtypes | None = None,
+        strip_prefix: str | None = None,
+    ) -> pd.DataFrame:
         """Executes a SPARQL query and returns the result as a pandas DataFrame
 
         Args:
             query (str): The SPARQL query to execute
             add_prefixes (bool, optional): Add defined Sparql-Prefixes (e.g. xsd:, cim:)
                 at the beginning of the query. Defaults to True.
+            dtypes (ResultDtypes | None, optional): Types of the result columns,
+                e.g. {"status1": "bool", "r": "float64", "name": "str"}.
+                Other columns are inferred. Defaults to None.
+            strip_prefix (str | None, optional): Prefix removed from all string values
+                starting with it while decoding. Defaults to None.
+
+        Raises:
+            HttpError: If the endpoint rejects the query, e.g. with 400 if it is
+                malformed
 
         Returns:
             pd.DataFrame: Result of the query as a DataFrame
         """
 
         raw = self._execute(query, method="GET", add_prefixes=add_prefixes)
-        return pd.read_csv(BytesIO(raw))
+        return self._result_decoder.decode(raw, dtypes, strip_prefix)
+
+    def query_chunks(
+        self,
+        query: str,
+        order_by: str | Iterable[str],
+        chunk_size: int = DEFAULT_CHUNK_SIZE,
+        add_prefixes=True,
+        dtypes: ResultDtypes | None = None,
+        strip_prefix: str | None = None,
+    ) -> Iterator[pd.DataFrame]:
+        """Executes a SPARQL SELECT query page by page, so only one page of a
+        very large result has to be held in memory at a time.
+
+        The query is wrapped in a subquery that is ordered by `order_by` and
+        paged with LIMIT and OFFSET. The variables in `order_by` need to identify
+        a solution uniquely, e.g. the measurement IRI, otherwise rows may be
+        repeated or skipped between pages. The query must not contain a prologue
+        (PREFIX/BASE declarations). Depending on the endpoint, the columns may
+        be in a different order than projected by the query.
+
+        Only provided for callers of the API for now, the component builders
+        read their results at once, e.g. the measurement selection needs all
+        measurements of a terminal.
+
+        Args:
+            query (str): The SPARQL SELECT query to execute
+            order_by (str | Iterable[str]): Variables ordering the solutions,
+                e.g. "?meas" or ["?term", "?meas"]
+            chunk_size (int, optional): Maximum number of rows per page.
+                Defaults to DEFAULT_CHUNK_SIZE.
+            add_prefixes (bool, optional): Add defined Sparql-Prefixes (e.g. xsd:, cim:)
+                at the beginning of the query. Defaults to True.
+            dtypes (ResultDtypes | None, optional): Types of the result columns.
+                Defaults to None.
+            strip_prefix (str | None, optional): Prefix removed from all string values
+                starting with it while decoding. Defaults to None.
+
+        Raises:
+            ValueError: If `chunk_size` is less than 1 or no variable to order by is given
+
+        Yields:
+            pd.DataFrame: Pages of the result in order, the first page is
+                returned even if the result is empty
+        """
+        if chunk_size < 1:
+            raise ValueError("chunk_size must be at least 1")
+
+        if isinstance(order_by, str):
+            order_by = [order_by]
+        order = " ".join(order_by)
+        if not order:
+            raise ValueError("order_by is required to page a query")
+
+        offset = 0
+        while True:
+            paged = (
+                f"SELECT * WHERE {{\n{query}\n}}\n"
+                f"ORDER BY {order}\nLIMIT {chunk_size} OFFSET {offset}"
+            )
+            raw = self._execute(paged, method="GET", add_prefixes=add_prefixes)
+            chunk = self._result_decoder.decode(raw, dtypes, strip_prefix)
+            if offset == 0 or chunk.shape[0] > 0:
+                yield chunk
+            if chunk.shape[0] < chunk_size:
+                return
+            offset += chunk_size
 
     def update(self, query: str, add_prefixes=True) -> None:
         """Executes a SPARQL update query
@@ -82,6 +197,9 @@ class SparqlDataSource(AbstractSparqlDataSource):
             query (str): The SPARQL update query to execute
             add_prefixes (bool, optional): Add defined Sparql-Prefixes (e.g. xsd:, cim:)
                 at the beginning of the query. Defaults to True.
+
+        Raises:
+            HttpError: If the endpoint rejects the update
         """
 
         self._execute(query, method="POST", add_prefixes=add_prefixes)
@@ -100,7 +218,56 @@ class SparqlDataSource(AbstractSparqlDataSource):
 
         self.update(q)
 
+    def upload_graph(
+        self,
+        graph_iri: str,
+        data: bytes,
+        content_type: str = "text/turtle",
+        replace: bool = False,
+        compressed: bool = False,
+    ) -> None:
+        """Uploads an RDF document via the SPARQL Graph Store HTTP Protocol
+
+        Args:
+            graph_iri (str): The IRI of the graph or "default" for the default graph
+            data (bytes): The document, e.g. Turtle or N-Triples
+            content_type (str, optional): Media type of the document.
+                Defaults to "text/turtle".
+            replace (bool, optional): Replace the content of the graph (PUT)
+                instead of adding the triples (POST). Defaults to False.
+            compressed (bool, optional): Whether `data` is gzip compressed.
+                Defaults to False.
+        """
+        if graph_iri == "default":
+            target = "default"
+        else:
+            target = urlencode({"graph": graph_iri})
+
+        headers = {"Content-Type": content_type}
+        if compressed:
+            headers["Content-Encoding"] = "gzip"
+
+        self._transport.request(
+            "PUT" if replace else "POST",
+            self._graph_store_endpoint + "?" + target,
+            body=data,
+            headers=headers,
+        )
+
     def format_query(self, string: str, query_params: dict):
+        """Replaces the placeholders of a query with the given values.
+        Placeholders named `$NAME` are replaced using a cached `QueryTemplate`.
+
+        Args:
+            string (str): Query text
+            query_params (dict): Values by placeholder, e.g. {"$EQ_GRAPH": "<...>"}
+
+        Returns:
+            str: The query text
+        """
+        if all(PLACEHOLDER_PATTERN.fullmatch(str(a)) for a in query_params):
+            return QueryTemplate.get(string).render(query_params)
+
         for a, b in query_params.items():
             string = string.replace(a, str(b))
         return string
@@ -109,7 +276,22 @@ class SparqlDataSource(AbstractSparqlDataSource):
         self, query: str, *, method: str = "GET", add_prefixes: bool = True
     ) -> bytes:
         text = (self._build_prefixes() + query) if add_prefixes else query
-        self._wrapper.setQuery(text)
-        self._wrapper.setMethod(method)
 
-        return self._wrapper.query().response.read()
+        if method == "GET":
+            url = self._query_endpoint + "?" + urlencode({"query": text})
+            return self._transport.request(
+                "GET", url, headers={"Accept": self._result_decoder.accept}
+            )
+
+        return self._transport.request(
+            "POST",
+            self._update_endpoint,
+            body=urlencode({"update": text}).encode("utf-8"),
+            headers={"Content-Type": "application/x-www-form-urlencoded"},
+        )
+
+
+@lru_cache(maxsize=16)
+def _prefix_header(prefixes: tuple[tuple[str, str], ...]) -> str:
+    prefix_str = "".join(f"PREFIX {prefix}: <{uri}>\n" for prefix, uri in prefixes)
+    return prefix_str + "\n"
@@ -19,10 +19,20 @@ import numpy as np
 from power_grid_model import ComponentType, MeasuredTerminalType
 
 from .converter_literals import COMPONENT_TYPE, NodeType
-from .topology_subnets import TopologySubnets
+from .pgm_literals import SENSOR_COMPONENTS, TOPOLOGY_COMPONENTS
+from .topology_index import APPLIANCE_TYPES, BRANCH2_TYPES, TopologyIndex
+from .topology_subnets import TopologySubnets, label_subnets, subnet_name
 
 
 class Topology:
+    """Connectivity of the PGM components by their id.
+
+    Each entry references the row of its component in the input data, so changes
+    made via the topology are applied to the input data and vice versa.
+    Components appended to, replaced in or removed from the input data afterwards
+    are taken over by `update`, which only evaluates the changed component types.
+    """
+
     def __init__(
         self,
         input_data: dict[ComponentType, np.ndarray],
@@ -35,7 +45,16 @@ class Topology:
         self._result_data = result_data
 
         self._topology: dict[str | int, dict[str | ComponentType, Any]] = {}
-        self._topology_subnets = TopologySubnets()
+        # union-find markers of the subnets, only evaluated on request
+        self._topology_subnets: TopologySubnets | None = None
+        # subnet label per node, see `label_subnets`
+        self._subnet_labels = np.empty(0, dtype=np.int64)
+
+        # arrays of the input data the topology refers to
+        self._arrays: dict[ComponentType, np.ndarray] = {}
+        # branch statuses the subnets have been evaluated with
+        self._subnet_statuses = np.empty(0, dtype=np.int8)
+        self._index: TopologyIndex | None = None
         self._build_topology(eval_measurements)
 
     def get_topology(self):
@@ -44,6 +63,70 @@ class Topology:
     def __getitem__(self, key):
         return self._topology[key]
 
+    def update(self, input_data: dict[ComponentType, np.ndarray] | None = None):
+        """Take over the changes of the input data since the topology was built
+        or last updated.
+
+        Builders replace the arrays of the input data when appending or removing
+        components. The entries of a replaced array are rebound to the new array,
+        new components are added and removed ones are detached from their nodes.
+        The subnets are reevaluated if branches or their statuses have changed.
+
+        Args:
+            input_data (dict[ComponentType, np.ndarray], optional): Input data
+                replacing the current one, e.g. a restored copy. Defaults to None.
+        """
+        if input_data is not None:
+            self._input_data = input_data
+
+        changed = {}
+        for component_type in TOPOLOGY_COMPONENTS:
+            arr = self._input_data[component_type]
+            if arr is not self._arrays[component_type]:
+                changed[component_type] = self._arrays[component_type]
+                self._arrays[component_type] = arr
+                self._index = None
+
+        # remove first, components may be replaced by others with the same id,
+        # e.g. links by generic branches; sensors before their measured objects
+        removed_entries = {}
+        for component_type in reversed(TOPOLOGY_COMPONENTS):
+            if component_type not in changed:
+                continue
+            old = changed[component_type]
+            for removed in old[~np.isin(old["id"], self._arrays[component_type]["id"])]:
+                entry = self._remove_component(component_type, removed)
+                if entry is not None:
+                    removed_entries[removed["id"]] = entry
+
+        for component_type, old in changed.items():
+            arr = self._arrays[component_type]
+            kept = np.isin(arr["id"], old["id"])
+            for component, is_kept in zip(arr, kept):
+                if is_kept:
+                    self._rebind_component(component_type, component)
+                else:
+                    self._add_component(component_type, component)
+
+        # keep the unchanged sensors of replaced components
+        for pgm_id, old_entry in removed_entries.items():
+            entry = self._topology.get(pgm_id)
+            if entry is None:
+                continue
+            for key, sensor in old_entry.items():
+                if isinstance(key, str) and key.startswith("_sensor"):
+                    entry.setdefault(key, sensor)
+
+        # statuses may also have been changed in place
+        branches_changed = changed.keys() & {
+            *BRANCH2_TYPES,
+            ComponentType.three_winding_transformer,
+        }
+        if branches_changed or not np.array_equal(
+            self._branch_statuses(), self._subnet_statuses
+        ):
+            self._eval_subnets()
+
     def add_results(self, result_data: dict[str, np.ndarray]):
         self._result_data = result_data
 
@@ -59,23 +142,14 @@ class Topology:
         self._assign_result(ComponentType.shunt)
 
     def _build_topology(self, eval_measurements: bool):
-        self._add_nodes()
-
-        self._add_branch2(ComponentType.line)
-        self._add_branch2(ComponentType.generic_branch)
-        self._add_branch2(ComponentType.link)
-        self._add_branch2(ComponentType.transformer)
-        self._add_transformer_3w()
+        # nodes first, all other components refer to them
+        for component_type in TOPOLOGY_COMPONENTS:
+            arr = self._input_data[component_type]
+            self._arrays[component_type] = arr
+            for component in arr:
+                self._add_component(component_type, component)
 
-        self._add_appliance(ComponentType.source)
-        self._add_appliance(ComponentType.sym_gen)
-        self._add_appliance(ComponentType.sym_load)
-        self._add_appliance(ComponentType.shunt)
-
-        self._add_voltage_sensors()
-        self._add_power_sensors()
-
-        self._assign_subnets_to_nodes()
+        self._eval_subnets()
 
         if eval_measurements:
             self._eval_measurements()
@@ -83,16 +157,77 @@ class Topology:
         if self._result_data is not None:
             self.add_results(self._result_data)
 
-    def _add_nodes(self):
-        topology = self._topology
-        nodes = self._input_data[ComponentType.node]
-        for n in nodes:
-            pgm_id = n["id"]
-            topology[pgm_id] = {
-                COMPONENT_TYPE: ComponentType.node,
-                ComponentType.node: n,
-                "_extra": self._extra_info.get(pgm_id),
-            }
+    def _add_component(self, component_type: ComponentType, component):
+        if component_type == ComponentType.node:
+            self._add_entry(component_type, component)
+        elif component_type in BRANCH2_TYPES:
+            self._add_branch2(component_type, component)
+        elif component_type == ComponentType.three_winding_transformer:
+            self._add_transformer_3w(component)
+        elif component_type in APPLIANCE_TYPES:
+            self._add_appliance(component_type, component)
+        elif component_type == ComponentType.sym_voltage_sensor:
+            self._add_voltage_sensor(component)
+        elif component_type == ComponentType.sym_power_sensor:
+            self._add_power_sensor(component)
+
+    def _rebind_component(self, component_type: ComponentType, component):
+        if component_type in SENSOR_COMPONENTS:
+            # sensors are stored at their measured object only
+            self._add_component(component_type, component)
+        else:
+            entry = self._topology[component["id"]]
+            entry[component_type] = component
+            if entry["_extra"] is None:
+                entry["_extra"] = self._extra_info.get(component["id"])
+
+    def _remove_component(self, component_type: ComponentType, component):
+        """Detaches the component from its nodes and returns its removed entry"""
+        if component_type == ComponentType.sym_voltage_sensor:
+            self._remove_sensor(component, "_sensor_v")
+            return None
+        if component_type == ComponentType.sym_power_sensor:
+            sensor_name = self.sensor_name(component["measured_terminal_type"])
+            self._remove_sensor(component, sensor_name)
+            return None
+
+        pgm_id = component["id"]
+        if component_type in BRANCH2_TYPES:
+            node_ids = [component["from_node"], component["to_node"]]
+            self._detach(node_ids, "_branches", pgm_id)
+        elif component_type == ComponentType.three_winding_transformer:
+            node_ids = [component["node_1"], component["node_2"], component["node_3"]]
+            self._detach(node_ids, "_branches", pgm_id)
+        elif component_type in APPLIANCE_TYPES:
+            self._detach([component["node"]], component_type, pgm_id)
+
+        return self._topology.pop(pgm_id, None)
+
+    def _detach(self, node_ids, key: str | ComponentType, pgm_id):
+        for node_id in node_ids:
+            node = self._topology.get(node_id)
+            if node is None or key not in node:
+                continue
+            node[key].remove(pgm_id)
+            # nodes only have the key if something is attached
+            if not node[key]:
+                del node[key]
+
+    def _remove_sensor(self, sensor, sensor_name: str):
+        meas_obj = self._topology.get(sensor["measured_object"])
+        if meas_obj is None:
+            return
+        current = meas_obj.get(sensor_name)
+        if current is not None and current["id"] == sensor["id"]:
+            del meas_obj[sensor_name]
+
+    def _add_entry(self, component_type: ComponentType, component):
+        pgm_id = component["id"]
+        self._topology[pgm_id] = {
+            COMPONENT_TYPE: component_type,
+            component_type: component,
+            "_extra": self._extra_info.get(pgm_id),
+        }
 
     def _add_branch2(
         self,
@@ -102,53 +237,38 @@ class Topology:
             ComponentType.link,
             ComponentType.transformer,
         ],
+        branch,
     ):
         topology = self._topology
-        branches = self._input_data[branch_type]
-        for branch in branches:
-            branch_id = branch["id"]
-
-            from_node_id = branch["from_node"]
-            from_node = topology[from_node_id]
-            from_node.setdefault("_branches", []).append(branch_id)
+        branch_id = branch["id"]
 
-            to_node_id = branch["to_node"]
-            to_node = topology[to_node_id]
-            to_node.setdefault("_branches", []).append(branch_id)
+        from_node_id = branch["from_node"]
+        from_node = topology[from_node_id]
+        from_node.setdefault("_branches", []).append(branch_id)
 
-            topology[branch_id] = {
-                COMPONENT_TYPE: branch_type,
-                branch_type: branch,
-                "_extra": self._extra_info.get(branch_id),
-            }
+        to_node_id = branch["to_node"]
+        to_node = topology[to_node_id]
+        to_node.setdefault("_branches", []).append(branch_id)
 
-            self._topology_subnets.eval_branch2(branch)
+        self._add_entry(branch_type, branch)
 
-    def _add_transformer_3w(self):
+    def _add_transformer_3w(self, tr3w):
         topology = self._topology
-        transformer_3w = self._input_data[ComponentType.three_winding_transformer]
-        for tr3w in transformer_3w:
-            tr_id = tr3w["id"]
+        tr_id = tr3w["id"]
 
-            node1_id = tr3w["node_1"]
-            node1 = topology[node1_id]
-            node1.setdefault("_branches", []).append(tr_id)
+        node1_id = tr3w["node_1"]
+        node1 = topology[node1_id]
+        node1.setdefault("_branches", []).append(tr_id)
 
-            node2_id = tr3w["node_2"]
-            node2 = topology[node2_id]
-            node2.setdefault("_branches", []).append(tr_id)
+        node2_id = tr3w["node_2"]
+        node2 = topology[node2_id]
+        node2.setdefault("_branches", []).append(tr_id)
 
-            node3_id = tr3w["node_3"]
-            node3 = topology[node3_id]
-            node3.setdefault("_branches", []).append(tr_id)
+        node3_id = tr3w["node_3"]
+        node3 = topology[node3_id]
+        node3.setdefault("_branches", []).append(tr_id)
 
-            topology[tr_id] = {
-                COMPONENT_TYPE: ComponentType.three_winding_transformer,
-                ComponentType.three_winding_transformer: tr3w,
-                "_extra": self._extra_info.get(tr_id),
-            }
-
-            self._topology_subnets.eval_branch3(tr3w)
+        self._add_entry(ComponentType.three_winding_transformer, tr3w)
 
     def _add_appliance(
         self,
@@ -158,35 +278,23 @@ class Topology:
             ComponentType.sym_load,
             ComponentType.shunt,
         ],
+        appliance,
     ):
-        topology = self._topology
-        srcs = self._input_data[component_type]
-        for src in srcs:
-            src_id = src["id"]
-            node_id = src["node"]
-            node = topology[node_id]
-            node.setdefault(component_type, []).append(src_id)
-            topology[src_id] = {
-                COMPONENT_TYPE: component_type,
-                component_type: src,
-                "_extra": self._extra_info.get(src_id),
-            }
-
-    def _add_voltage_sensors(self):
-        v_sensor = self._input_data[ComponentType.sym_voltage_sensor]
-        for sensor in v_sensor:
-            node_id = sensor["measured_object"]
-            self._topology[node_id]["_sensor_v"] = sensor
-
-    def _add_power_sensors(self):
-        power_sensor = self._input_data[ComponentType.sym_power_sensor]
-        for p_sensor in power_sensor:
-            obj_id = p_sensor["measured_object"]
-            obj_type = p_sensor["measured_terminal_type"]
-
-            meas_obj = self._topology[obj_id]
-            sensor_name = self.sensor_name(obj_type)
-            meas_obj[sensor_name] = p_sensor
+        node = self._topology[appliance["node"]]
+        node.setdefault(component_type, []).append(appliance["id"])
+        self._add_entry(component_type, appliance)
+
+    def _add_voltage_sensor(self, sensor):
+        node_id = sensor["measured_object"]
+        self._topology[node_id]["_sensor_v"] = sensor
+
+    def _add_power_sensor(self, p_sensor):
+        obj_id = p_sensor["measured_object"]
+        obj_type = p_sensor["measured_terminal_type"]
+
+        meas_obj = self._topology[obj_id]
+        sensor_name = self.sensor_name(obj_type)
+        meas_obj[sensor_name] = p_sensor
 
     def sensor_name(self, obj_type: MeasuredTerminalType) -> str:
         match obj_type:
@@ -218,52 +326,62 @@ class Topology:
                 for comp in components:
                     self._topology[comp["id"]]["_result"] = comp
 
-    def _assign_subnets_to_nodes(self):
-        subnet_names = self._topology_subnets.get_subnets()
-        nodes = self.get_nodes()
+    def _eval_subnets(self):
+        self._topology_subnets = None
+        self._subnet_labels = label_subnets(self._arrays)
+        self._subnet_statuses = self._branch_statuses()
+        self._assign_subnets_to_nodes()
 
-        marker_dict = self._topology_subnets.get_marker()
-        for node in nodes:
-            node_id = node[ComponentType.node]["id"]
-            node_marker = marker_dict.get(node_id)
-            node["_subnet"] = (
-                subnet_names[node_marker.get_island_marker().id]
-                if node_marker is not None
-                else "isolated"
-            )
+    def _branch_statuses(self) -> np.ndarray:
+        statuses = [
+            self._arrays[branch_type][status]
+            for branch_type in BRANCH2_TYPES
+            for status in ("from_status", "to_status")
+        ]
+        statuses += [
+            self._arrays[ComponentType.three_winding_transformer][status]
+            for status in ("status_1", "status_2", "status_3")
+        ]
+        return np.concatenate(statuses)
+
+    def _assign_subnets_to_nodes(self):
+        node_ids = self._arrays[ComponentType.node]["id"]
+        labels = self._subnet_labels.tolist()
+        names = {label: subnet_name(label) for label in set(labels)}
+        for node_id, label in zip(node_ids, labels):
+            self._topology[node_id]["_subnet"] = names[label]
+
+    def get_subnet_labels(self) -> np.ndarray:
+        """Subnet label per node in the order of the node array,
+        see `label_subnets`
+        """
+        return self._subnet_labels
+
+    def get_index(self) -> TopologyIndex:
+        """Array based index of the connectivity, built on first use
+        and again after `update` has taken over changes.
+        """
+        if self._index is None:
+            self._index = TopologyIndex(self._input_data)
+        return self._index
 
     def get_nodes(self):
-        return [
-            node
-            for node in self._topology.values()
-            if node.get(ComponentType.node) is not None
-        ]
+        return self._get_entries([ComponentType.node])
 
     def get_branches(self):
-        return [
-            branch
-            for branch in self._topology.values()
-            if branch.get(ComponentType.line) is not None
-            or branch.get(ComponentType.generic_branch) is not None
-            or branch.get(ComponentType.link) is not None
-            or branch.get(ComponentType.transformer) is not None
-        ]
+        return self._get_entries(BRANCH2_TYPES)
 
     def get_branches3(self):
-        return [
-            branch
-            for branch in self._topology.values()
-            if branch.get(ComponentType.three_winding_transformer) is not None
-        ]
+        return self._get_entries([ComponentType.three_winding_transformer])
 
     def get_appliances(self):
+        return self._get_entries(APPLIANCE_TYPES)
+
+    def _get_entries(self, component_types):
         return [
-            appl
-            for appl in self._topology.values()
-            if appl.get(ComponentType.source) is not None
-            or appl.get(ComponentType.sym_gen) is not None
-            or appl.get(ComponentType.sym_load) is not None
-            or appl.get(ComponentType.shunt) is not None
+            self._topology[pgm_id]
+            for component_type in component_types
+            for pgm_id in self._arrays[component_type]["id"]
         ]
 
     def get_attached_branches(self, node_id: str | int):
@@ -271,13 +389,11 @@ class Topology:
         return [self._topology[branch_id] for branch_id in branch_ids]
 
     def get_attached_appliances(self, node_id: str | int):
+        node = self._topology[node_id]
         return [
-            appl
-            for appl in self._topology[node_id].values()
-            if appl.get(ComponentType.source) is not None
-            or appl.get(ComponentType.sym_gen) is not None
-            or appl.get(ComponentType.sym_load) is not None
-            or appl.get(ComponentType.shunt) is not None
+            self._topology[appl_id]
+            for component_type in APPLIANCE_TYPES
+            for appl_id in node.get(component_type, [])
         ]
 
     def _eval_measurements(self):
@@ -323,4 +439,11 @@ class Topology:
         return self._extra_info
 
     def get_topology_subnets(self):
+        if self._topology_subnets is None:
+            self._topology_subnets = TopologySubnets()
+            for branch_type in BRANCH2_TYPES:
+                for branch in self._arrays[branch_type]:
+                    self._topology_subnets.eval_branch2(branch)
+            for tr3w in self._arrays[ComponentType.three_winding_transformer]:
+                self._topology_subnets.eval_branch3(tr3w)
         return self._topology_subnets
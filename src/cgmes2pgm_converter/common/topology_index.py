@@ -0,0 +1,257 @@
+# Copyright [2025] [SOPTIM AG]
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import numpy as np
+from power_grid_model import ComponentType
+
+# Components connecting two nodes, in the order evaluated by `Topology`
+BRANCH2_TYPES = (
+    ComponentType.line,
+    ComponentType.generic_branch,
+    ComponentType.link,
+    ComponentType.transformer,
+)
+
+# Components connected to one node, in the order evaluated by `Topology`
+APPLIANCE_TYPES = (
+    ComponentType.source,
+    ComponentType.sym_gen,
+    ComponentType.sym_load,
+    ComponentType.shunt,
+)
+
+
+class TopologyIndex:
+    """
+    Array based view of the connectivity of the PGM input data.
+
+    The branches and appliances connected to each node are stored in CSR format:
+    the entries of the node at position `i` of the node array are
+    `ids[indptr[i]:indptr[i + 1]]`, ordered like the components in the input data.
+    All queries accept arrays of node ids and return arrays, so the topology can be
+    evaluated for many nodes at once instead of walking the `Topology` per node.
+
+    The index refers to the arrays of the input data at the time it was built,
+    it has to be built again after components have been appended or removed.
+    """
+
+    def __init__(self, input_data: dict[ComponentType, np.ndarray]):
+        self._node_ids = input_data[ComponentType.node]["id"]
+        self._id_order = {
+            component_type: np.argsort(input_data[component_type]["id"], kind="stable")
+            for component_type in (ComponentType.node, *BRANCH2_TYPES, *APPLIANCE_TYPES)
+        }
+        self._input_data = input_data
+
+        branch_ids = []
+        branch_nodes = []
+        for branch_type in BRANCH2_TYPES:
+            branches = input_data[branch_type]
+            # interleave both sides to keep the order of the branches per node
+            branch_ids.append(np.repeat(branches["id"], 2))
+            branch_nodes.append(
+                np.stack((branches["from_node"], branches["to_node"]), axis=1).ravel()
+            )
+        tr3w = input_data[ComponentType.three_winding_transformer]
+        branch_ids.append(np.repeat(tr3w["id"], 3))
+        branch_nodes.append(
+            np.stack((tr3w["node_1"], tr3w["node_2"], tr3w["node_3"]), axis=1).ravel()
+        )
+
+        self._branch_indptr, order = self._build_csr(np.concatenate(branch_nodes))
+        self._branch_ids = np.concatenate(branch_ids)[order]
+
+        appliance_ids = []
+        appliance_nodes = []
+        appliance_types = []
+        for type_idx, appliance_type in enumerate(APPLIANCE_TYPES):
+            appliances = input_data[appliance_type]
+            appliance_ids.append(appliances["id"])
+            appliance_nodes.append(appliances["node"])
+            appliance_types.append(np.full(appliances.shape[0], type_idx, np.int8))
+
+        self._appliance_indptr, order = self._build_csr(np.concatenate(appliance_nodes))
+        self._appliance_ids = np.concatenate(appliance_ids)[order]
+        self._appliance_types = np.concatenate(appliance_types)[order]
+
+    @property
+    def node_ids(self) -> np.ndarray:
+        """Ids of all nodes in the order of the input data"""
+        return self._node_ids
+
+    def rows(self, component_type: ComponentType, ids) -> np.ndarray:
+        """Positions of the components in the array of the input data
+
+        Args:
+            component_type (ComponentType): Node, branch or appliance type
+            ids (array_like): PGM ids of the components
+
+        Raises:
+            KeyError: If an id is not part of the array
+
+        Returns:
+            np.ndarray: Positions in `input_data[component_type]`
+        """
+        arr_ids = self._input_data[component_type]["id"]
+        order = self._id_order[component_type]
+        ids = np.asarray(ids)
+
+        if len(order) == 0:
+            if ids.size > 0:
+                raise KeyError(f"Unknown {component_type} ids: {ids[:10].tolist()}")
+            return np.empty(0, dtype=np.intp)
+
+        sorted_pos = np.searchsorted(arr_ids, ids, sorter=order)
+        rows = order[np.minimum(sorted_pos, len(order) - 1)]
+        found = arr_ids[rows] == ids
+        if not np.all(found):
+            missing = ids[~found]
+            raise KeyError(f"Unknown {component_type} ids: {missing[:10].tolist()}")
+        return rows
+
+    def branch_degree(self, node_ids=None) -> np.ndarray:
+        """Number of branches connected to each node, three-winding transformers
+        included. Defaults to all nodes in the order of `node_ids`.
+        """
+        return self._degree(self._branch_indptr, node_ids)
+
+    def appliance_count(self, node_ids=None) -> np.ndarray:
+        """Number of appliances connected to each node.
+        Defaults to all nodes in the order of `node_ids`.
+        """
+        return self._degree(self._appliance_indptr, node_ids)
+
+    def branches_at(self, node_ids) -> tuple[np.ndarray, np.ndarray]:
+        """All branches connected to the given nodes
+
+        Returns:
+            tuple[np.ndarray, np.ndarray]: Branch ids and the node id each branch
+                has been found at, grouped by node in the order of `node_ids`
+        """
+        positions = self.rows(ComponentType.node, node_ids)
+        idx = _csr_gather(self._branch_indptr, positions)
+        owners = self._node_ids[_csr_owner(self._branch_indptr, positions)]
+        return self._branch_ids[idx], owners
+
+    def appliances_at(
+        self, node_ids, component_types: list[ComponentType] | None = None
+    ) -> tuple[np.ndarray, np.ndarray]:
+        """All appliances connected to the given nodes
+
+        Args:
+            node_ids (array_like): PGM ids of the nodes
+            component_types (list[ComponentType], optional): Only return appliances
+                of these types. Defaults to all appliance types.
+
+        Returns:
+            tuple[np.ndarray, np.ndarray]: Appliance ids and the node id of each
+                appliance, grouped by node in the order of `node_ids`
+        """
+        positions = self.rows(ComponentType.node, node_ids)
+        idx = _csr_gather(self._appliance_indptr, positions)
+        owners = self._node_ids[_csr_owner(self._appliance_indptr, positions)]
+
+        if component_types is not None:
+            type_codes = [APPLIANCE_TYPES.index(t) for t in component_types]
+            mask = np.isin(self._appliance_types[idx], type_codes)
+            idx = idx[mask]
+            owners = owners[mask]
+
+        return self._appliance_ids[idx], owners
+
+    def _degree(self, indptr: np.ndarray, node_ids) -> np.ndarray:
+        degree = np.diff(indptr)
+        if node_ids is None:
+            return degree
+        return degree[self.rows(ComponentType.node, node_ids)]
+
+    def _build_csr(self, node_ids: np.ndarray) -> tuple[np.ndarray, np.ndarray]:
+        """Returns the index pointer and the order of the entries grouped by node"""
+        positions = self.rows(ComponentType.node, node_ids)
+        counts = np.bincount(positions, minlength=len(self._node_ids))
+
+        indptr = np.zeros(len(self._node_ids) + 1, dtype=np.int64)
+        np.cumsum(counts, out=indptr[1:])
+        return indptr, np.argsort(positions, kind="stable")
+
+
+def _csr_gather(indptr: np.ndarray, positions: np.ndarray) -> np.ndarray:
+    """Indices of all entries of the given rows, grouped by row"""
+    starts = indptr[positions]
+    counts = indptr[positions + 1] - starts
+    # offset of each row between its position in the output and in the entries
+    offsets = np.repeat(starts - (np.cumsum(counts) - counts), counts)
+    return offsets + np.arange(counts.sum())
+
+
+def _csr_owner(indptr: np.ndarray, positions: np.ndarray) -> np.ndarray:
+    """Row of each entry returned by `_csr_gather`"""
+    return np.repeat(positions, indptr[positions + 1] - indptr[positions])
+
+
+class ComponentIdIndex:
+    """
+    Resolves PGM ids to the component type and row of the component
+    across several arrays of the input data.
+
+    Like the index, it refers to the arrays at the time it was built.
+    """
+
+    def __init__(
+        self,
+        input_data: dict[ComponentType, np.ndarray],
+        component_types: list[ComponentType],
+    ):
+        """
+        Args:
+            input_data (dict[ComponentType, np.ndarray]): PGM input data
+            component_types (list[ComponentType]): Component types to index.
+                If an id occurs in several arrays, the first type is returned.
+        """
+        self.component_types = list(component_types)
+
+        ids = [input_data[t]["id"] for t in self.component_types]
+        sizes = [len(type_ids) for type_ids in ids]
+        self._ids = np.concatenate([np.empty(0, dtype=np.int32), *ids])
+        self._types = np.repeat(np.arange(len(ids), dtype=np.int8), sizes)
+        self._rows = np.concatenate(
+            [np.empty(0, dtype=np.intp), *(np.arange(size) for size in sizes)]
+        )
+        # stable, so duplicates keep the order of the component types
+        self._order = np.argsort(self._ids, kind="stable")
+
+    def lookup(self, ids) -> tuple[np.ndarray, np.ndarray]:
+        """Resolve the given ids
+
+        Args:
+            ids (array_like): PGM ids
+
+        Returns:
+            tuple[np.ndarray, np.ndarray]: Position of the component type in
+                `component_types` and row in its array per id,
+                both -1 for ids not found
+        """
+        ids = np.asarray(ids)
+        types = np.full(ids.shape, -1, dtype=np.int8)
+        rows = np.full(ids.shape, -1, dtype=np.intp)
+        if len(self._ids) == 0:
+            return types, rows
+
+        sorted_pos = np.searchsorted(self._ids, ids, sorter=self._order)
+        candidates = self._order[np.minimum(sorted_pos, len(self._ids) - 1)]
+        found = self._ids[candidates] == ids
+
+        types[found] = self._types[candidates[found]]
+        rows[found] = self._rows[candidates[found]]
+        return types, rows
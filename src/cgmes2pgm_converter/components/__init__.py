@@ -22,3 +22,4 @@ from .component import AbstractPgmComponentBuilder
 from .measurement import *
 from .network_splitting import *
 from .node import NodeBuilder
+from .scheduler import BuilderScheduler
@@ -19,6 +19,8 @@ from ..component import AbstractPgmComponentBuilder
 
 
 class DcAsLoadBuilder(AbstractPgmComponentBuilder):
+    _reads = frozenset({ComponentType.node})
+
     _query = """
     SELECT DISTINCT ?name ?terminal ?topologicalNode ?connected ?converter ?type
             WHERE
@@ -48,22 +50,22 @@ class DcAsLoadBuilder(AbstractPgmComponentBuilder):
             ORDER BY ?conductingEquipment
     """
 
-    def build_from_cgmes(self, _) -> tuple[np.ndarray, dict | None]:
+    def get_queries(self) -> dict[str, str]:
         # TODO: read from named graphs too
         args = {
             "$IN_SERVICE": self._in_service(),
             "$TOPO_ISLAND": self._at_topo_island_node("?topologicalNode"),
         }
-        q = self._replace(self._query, args)
-        res = self._source.query(q)
+        return {"converters": self._replace(self._query, args)}
+
+    def build_from_cgmes(self, _) -> tuple[np.ndarray, dict | None]:
+        res = self._fetch_result("converters")
 
         arr = initialize_array(self._data_type, self.component_name(), res.shape[0])
         arr["id"] = self._id_mapping.add_cgmes_term_iris(
             res["converter"], res["terminal"], res["name"]
         )
-        arr["node"] = [
-            self._id_mapping.get_pgm_id(uuid) for uuid in res["topologicalNode"]
-        ]
+        arr["node"] = self._id_mapping.get_pgm_ids(res["topologicalNode"])
         arr["status"] = res["connected"]
         arr["type"] = LoadGenType.const_power
 
@@ -21,6 +21,19 @@ from ..component import AbstractPgmComponentBuilder
 
 
 class NonLinearShuntBuilder(AbstractPgmComponentBuilder):
+    _reads = frozenset({ComponentType.node})
+    _result_dtypes = {
+        "shunts": {
+            "name": "str",
+            "topologicalNode": "str",
+            "connected": "bool",
+            "terminal": "str",
+            "ShuntCompensator": "str",
+            "b": "float64",
+            "g": "float64",
+        },
+    }
+
     _query = """
         SELECT  (SAMPLE(?_name) as ?name)
                 (SAMPLE(?_topologicalNode) as ?topologicalNode)
@@ -111,7 +124,7 @@ class NonLinearShuntBuilder(AbstractPgmComponentBuilder):
         ORDER BY ?ShuntCompensator
     """
 
-    def build_from_cgmes(self, _) -> tuple[np.ndarray, dict | None]:
+    def get_queries(self) -> dict[str, str]:
         if self._source.split_profiles:
             named_graphs = self._source.named_graphs
             args = {
@@ -122,23 +135,22 @@ class NonLinearShuntBuilder(AbstractPgmComponentBuilder):
                 "$SSH_GRAPH": named_graphs.format_for_query(Profile.SSH),
                 "$SV_GRAPH": named_graphs.format_for_query(Profile.SV),
             }
-            q = self._replace(self._query_graph, args)
-            res = self._source.query(q)
-        else:
-            args = {
-                "$IN_SERVICE": self._in_service(),
-                "$TOPO_ISLAND": self._at_topo_island_node("?_topologicalNode"),
-            }
-            q = self._replace(self._query, args)
-            res = self._source.query(q)
+            return {"shunts": self._replace(self._query_graph, args)}
+
+        args = {
+            "$IN_SERVICE": self._in_service(),
+            "$TOPO_ISLAND": self._at_topo_island_node("?_topologicalNode"),
+        }
+        return {"shunts": self._replace(self._query, args)}
+
+    def build_from_cgmes(self, _) -> tuple[np.ndarray, dict | None]:
+        res = self._fetch_result("shunts")
 
         arr = initialize_array(self._data_type, self.component_name(), res.shape[0])
         arr["id"] = self._id_mapping.add_cgmes_iris(
             res["ShuntCompensator"], res["name"]
         )
-        arr["node"] = [
-            self._id_mapping.get_pgm_id(uuid) for uuid in res["topologicalNode"]
-        ]
+        arr["node"] = self._id_mapping.get_pgm_ids(res["topologicalNode"])
         arr["status"] = res["connected"]
         arr["b1"] = res["b"]
         arr["g1"] = res["g"]
@@ -28,6 +28,10 @@ class SourceBuilder(AbstractPgmComponentBuilder):
     One sym_gen component is removed and an source component is created
     """
 
+    _reads = frozenset({ComponentType.node})
+    _modifies = frozenset({ComponentType.sym_gen})
+    _requires = frozenset({ComponentType.sym_gen})
+
     _default_query = """
         SELECT ?EnergyProducer ?ref ?uref
         WHERE {
@@ -140,7 +144,7 @@ class SourceBuilder(AbstractPgmComponentBuilder):
         extra_info = {}
         return sources, extra_info
 
-    def get_source(self) -> tuple[int, float]:
+    def get_queries(self) -> dict[str, str]:
         if self._source.split_profiles:
             named_graphs = self._source.named_graphs
             args = {
@@ -151,15 +155,16 @@ class SourceBuilder(AbstractPgmComponentBuilder):
                 "$SSH_GRAPH": named_graphs.format_for_query(Profile.SSH),
                 "$SV_GRAPH": named_graphs.format_for_query(Profile.SV),
             }
-            q = self._replace(self._graph_query, args)
-            res = self._source.query(q)
-        else:
-            args = {
-                "$IN_SERVICE": self._in_service(),
-                "$TOPO_ISLAND": self._at_topo_island_node("?topologicalNode"),
-            }
-            q = self._replace(self._default_query, args)
-            res = self._source.query(q)
+            return {"sources": self._replace(self._graph_query, args)}
+
+        args = {
+            "$IN_SERVICE": self._in_service(),
+            "$TOPO_ISLAND": self._at_topo_island_node("?topologicalNode"),
+        }
+        return {"sources": self._replace(self._default_query, args)}
+
+    def get_source(self) -> tuple[int, float]:
+        res = self._fetch_result("sources")
 
         if res.shape[0] == 0:
             raise ValueError(
@@ -27,6 +27,8 @@ class SourceFromIslandBuilder(AbstractPgmComponentBuilder):
     Based on `cim:TopologicalIsland.AngleRefTopologicalNode`.
     """
 
+    _reads = frozenset({ComponentType.node})
+
     _query = """
         SELECT ?topologicalNode ?islandName
         WHERE {
@@ -78,9 +80,7 @@ class SourceFromIslandBuilder(AbstractPgmComponentBuilder):
         arr["id"] = self._id_mapping.add_cgmes_iris(
             res["topologicalNode"] + "_angleRef", res["islandName"]
         )
-        arr["node"] = [
-            self._id_mapping.get_pgm_id(uuid) for uuid in res["topologicalNode"]
-        ]
+        arr["node"] = self._id_mapping.get_pgm_ids(res["topologicalNode"])
 
         arr["status"] = 1
         arr["u_ref"] = 1
@@ -91,21 +91,22 @@ class SourceFromIslandBuilder(AbstractPgmComponentBuilder):
         extra_info = self._create_extra_info_with_types(arr, res["angle_ref"])
         return arr, extra_info
 
-    def get_source(self):
+    def get_queries(self) -> dict[str, str]:
         if self._source.split_profiles:
             named_graphs = self._source.named_graphs
             args = {
                 "$TOPO_ISLAND": self._at_topo_island_node_graph("?topologicalNode"),
                 "$SV_GRAPH": named_graphs.format_for_query(Profile.SV),
             }
-            q = self._replace(self._query_graph, args)
-            return self._source.query(q)
-        else:
-            args = {
-                "$TOPO_ISLAND": self._at_topo_island_node("?topologicalNode"),
-            }
-            q = self._replace(self._query, args)
-            return self._source.query(q)
+            return {"islands": self._replace(self._query_graph, args)}
+
+        args = {
+            "$TOPO_ISLAND": self._at_topo_island_node("?topologicalNode"),
+        }
+        return {"islands": self._replace(self._query, args)}
+
+    def get_source(self):
+        return self._fetch_result("islands")
 
     def component_name(self) -> ComponentType:
         return ComponentType.source
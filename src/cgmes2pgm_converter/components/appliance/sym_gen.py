@@ -22,6 +22,21 @@ from ..component import AbstractPgmComponentBuilder
 
 
 class SymGenBuilder(AbstractPgmComponentBuilder):
+    _reads = frozenset({ComponentType.node})
+    _result_dtypes = {
+        "generators": {
+            "name": "str",
+            "topologicalNode": "str",
+            "connected": "bool",
+            "EnergyProducer": "str",
+            "p": "float64",
+            "q": "float64",
+            "targetVoltage": "float64",
+            "type": "str",
+            "terminal": "str",
+        },
+    }
+
     _query = """
         SELECT ?name ?topologicalNode ?connected ?EnergyProducer ?p ?q ?targetVoltage ?valMultiplier ?type ?terminal
         WHERE {
@@ -172,7 +187,7 @@ class SymGenBuilder(AbstractPgmComponentBuilder):
 
     """
 
-    def build_from_cgmes(self, _) -> tuple[np.ndarray, dict | dict]:
+    def get_queries(self) -> dict[str, str]:
         if self._source.split_profiles:
             named_graphs = self._source.named_graphs
             args = {
@@ -183,15 +198,16 @@ class SymGenBuilder(AbstractPgmComponentBuilder):
                 "$SSH_GRAPH": named_graphs.format_for_query(Profile.SSH),
                 "$SV_GRAPH": named_graphs.format_for_query(Profile.SV),
             }
-            q = self._replace(self._query_graph, args)
-            res = self._source.query(q)
-        else:
-            args = {
-                "$IN_SERVICE": self._in_service(),
-                "$TOPO_ISLAND": self._at_topo_island_node("?topologicalNode"),
-            }
-            q = self._replace(self._query, args)
-            res = self._source.query(q)
+            return {"generators": self._replace(self._query_graph, args)}
+
+        args = {
+            "$IN_SERVICE": self._in_service(),
+            "$TOPO_ISLAND": self._at_topo_island_node("?topologicalNode"),
+        }
+        return {"generators": self._replace(self._query, args)}
+
+    def build_from_cgmes(self, _) -> tuple[np.ndarray, dict | dict]:
+        res = self._fetch_result("generators")
 
         # Mw, MVar to W, Var
         res["p"] = -res["p"] * 1e6
@@ -199,9 +215,7 @@ class SymGenBuilder(AbstractPgmComponentBuilder):
 
         arr = initialize_array(self._data_type, self.component_name(), res.shape[0])
         arr["id"] = self._id_mapping.add_cgmes_iris(res["EnergyProducer"], res["name"])
-        arr["node"] = [
-            self._id_mapping.get_pgm_id(uuid) for uuid in res["topologicalNode"]
-        ]
+        arr["node"] = self._id_mapping.get_pgm_ids(res["topologicalNode"])
         arr["status"] = res["connected"]
         arr["type"] = LoadGenType.const_power
         arr["p_specified"] = res["p"]
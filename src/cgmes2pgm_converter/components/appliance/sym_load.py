@@ -21,6 +21,20 @@ from ..component import AbstractPgmComponentBuilder
 
 
 class SymLoadBuilder(AbstractPgmComponentBuilder):
+    _reads = frozenset({ComponentType.node})
+    _result_dtypes = {
+        "loads": {
+            "topologicalNode": "str",
+            "name": "str",
+            "connected": "bool",
+            "EnergyConsumer": "str",
+            "p": "float64",
+            "q": "float64",
+            "type": "str",
+            "terminal": "str",
+        },
+    }
+
     _query = """
         SELECT DISTINCT ?topologicalNode ?name ?connected ?EnergyConsumer ?p ?q ?type ?terminal
         WHERE
@@ -114,7 +128,7 @@ class SymLoadBuilder(AbstractPgmComponentBuilder):
         ORDER BY ?EnergyConsumer
     """
 
-    def build_from_cgmes(self, _) -> tuple[np.ndarray, dict | None]:
+    def get_queries(self) -> dict[str, str]:
         if self._source.split_profiles:
             named_graphs = self._source.named_graphs
             args = {
@@ -125,15 +139,16 @@ class SymLoadBuilder(AbstractPgmComponentBuilder):
                 "$SSH_GRAPH": named_graphs.format_for_query(Profile.SSH),
                 "$SV_GRAPH": named_graphs.format_for_query(Profile.SV),
             }
-            q = self._replace(self._query_graph, args)
-            res = self._source.query(q)
-        else:
-            args = {
-                "$IN_SERVICE": self._in_service(),
-                "$TOPO_ISLAND": self._at_topo_island_node("?topologicalNode"),
-            }
-            q = self._replace(self._query, args)
-            res = self._source.query(q)
+            return {"loads": self._replace(self._query_graph, args)}
+
+        args = {
+            "$IN_SERVICE": self._in_service(),
+            "$TOPO_ISLAND": self._at_topo_island_node("?topologicalNode"),
+        }
+        return {"loads": self._replace(self._query, args)}
+
+    def build_from_cgmes(self, _) -> tuple[np.ndarray, dict | None]:
+        res = self._fetch_result("loads")
 
         # Mw, MVar to W, Var
         res["p"] = res["p"] * 1e6
@@ -141,9 +156,7 @@ class SymLoadBuilder(AbstractPgmComponentBuilder):
 
         arr = initialize_array(self._data_type, self.component_name(), res.shape[0])
         arr["id"] = self._id_mapping.add_cgmes_iris(res["EnergyConsumer"], res["name"])
-        arr["node"] = [
-            self._id_mapping.get_pgm_id(uuid) for uuid in res["topologicalNode"]
-        ]
+        arr["node"] = self._id_mapping.get_pgm_ids(res["topologicalNode"])
         arr["status"] = res["connected"]
         arr["type"] = LoadGenType.const_power
         arr["p_specified"] = res["p"]
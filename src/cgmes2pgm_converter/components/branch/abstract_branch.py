@@ -0,0 +1,208 @@
+# Copyright [2025] [SOPTIM AG]
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import pandas as pd
+
+from cgmes2pgm_converter.common import ResultDtypes
+from cgmes2pgm_converter.common.cgmes_literals import Profile
+
+from ..component import AbstractPgmComponentBuilder
+
+
+class AbstractBranchBuilder(AbstractPgmComponentBuilder):
+    """
+    Base class for builders of branch-like components.
+
+    The terminals of all conducting equipment are fetched with one shared query
+    ("terminals") and joined locally with the equipment of the builder,
+    so the queries of the builders only fetch the type specific parameters.
+    The query text is the same for all builders, so the converter executes it
+    once when fetching the query results in advance. The terminals are only
+    read, so all builders share the same result.
+    """
+
+    _read_only_queries = frozenset({"terminals"})
+
+    _terminal_dtypes: ResultDtypes = {
+        "term": "str",
+        "eq": "str",
+        "seq": "str",
+        "tn": "str",
+        "connected": "bool",
+        "nomv": "float64",
+        "topoIsland": "str",
+    }
+
+    _terminal_query = """
+        SELECT ?term ?eq ?seq ?tn ?connected ?nomv ?topoIsland
+        WHERE {
+            ?term a cim:Terminal;
+                cim:Terminal.ConductingEquipment ?eq;
+                cim:Terminal.TopologicalNode ?tn;
+                cim:ACDCTerminal.connected ?connected.
+
+            OPTIONAL { ?term cim:ACDCTerminal.sequenceNumber ?seq. }
+            OPTIONAL {
+                ?tn cim:TopologicalNode.BaseVoltage/cim:BaseVoltage.nominalVoltage ?nomv.
+            }
+
+            OPTIONAL {
+                $TOPO_ISLAND
+                #?topoIsland cim:IdentifiedObject.name "Network";
+                #            cim:TopologicalIsland.TopologicalNodes ?tn.
+            }
+        }
+    """
+
+    _terminal_query_graph = """
+        SELECT ?term ?eq ?seq ?tn ?connected ?nomv ?topoIsland
+        WHERE {
+            VALUES ?eq_graph { $EQ_GRAPH }
+            GRAPH ?eq_graph {
+                ?term a cim:Terminal;
+                    cim:Terminal.ConductingEquipment ?eq.
+
+                OPTIONAL { ?term cim:ACDCTerminal.sequenceNumber ?seq. }
+            }
+
+            VALUES ?tp_graph { $TP_GRAPH }
+            GRAPH ?tp_graph {
+                ?term cim:Terminal.TopologicalNode ?tn.
+            }
+
+            VALUES ?ssh_graph { $SSH_GRAPH }
+            GRAPH ?ssh_graph {
+                ?term cim:ACDCTerminal.connected ?connected.
+            }
+
+            OPTIONAL {
+                VALUES ?tp_graph_bv { $TP_GRAPH }
+                GRAPH ?tp_graph_bv {
+                    ?tn cim:TopologicalNode.BaseVoltage ?_bv.
+                }
+                VALUES ?eq_graph_bv { $EQ_GRAPH }
+                GRAPH ?eq_graph_bv {
+                    ?_bv cim:BaseVoltage.nominalVoltage ?nomv.
+                }
+            }
+
+            OPTIONAL {
+                $TOPO_ISLAND
+                # GRAPH ?sv_graph {
+                #     ?topoIsland # cim:IdentifiedObject.name "Network";
+                #                 cim:TopologicalIsland.TopologicalNodes ?tn.
+                # }
+            }
+        }
+    """
+
+    _terminals: pd.DataFrame | None = None
+
+    def get_result_dtypes(self, name: str) -> ResultDtypes | None:
+        if name == "terminals":
+            return self._terminal_dtypes
+        return super().get_result_dtypes(name)
+
+    def _build_terminal_query(self) -> str:
+        """Returns the formatted query for the terminal table,
+        to be provided as "terminals" by `get_queries`.
+        """
+        if self._source.split_profiles:
+            named_graphs = self._source.named_graphs
+            args = {
+                "$TOPO_ISLAND": self._at_topo_island_node_graph("?tn"),
+                "$TP_GRAPH": named_graphs.format_for_query(Profile.TP),
+                "$SSH_GRAPH": named_graphs.format_for_query(Profile.SSH),
+                "$EQ_GRAPH": named_graphs.format_for_query(Profile.EQ),
+                "$SV_GRAPH": named_graphs.format_for_query(Profile.SV),
+            }
+            return self._replace(self._terminal_query_graph, args)
+
+        args = {"$TOPO_ISLAND": self._at_topo_island_node("?tn")}
+        return self._replace(self._terminal_query, args)
+
+    def _get_terminals(self) -> pd.DataFrame:
+        """Returns the terminal table, fetched on first use.
+        The table may be shared with other builders and must not be modified.
+
+        Returns:
+            pd.DataFrame: One row per terminal with the columns
+                term, eq, seq, tn, connected, nomv and topoIsland
+        """
+        if self._terminals is None:
+            self._terminals = self._fetch_result("terminals")
+        return self._terminals
+
+    def _join_terminal_sides(self, res: pd.DataFrame, eq_col: str) -> pd.DataFrame:
+        """Joins the terminals with sequence number 1 and 2 of each equipment.
+
+        The columns of the terminals are added with the suffix of their sequence
+        number: term1, tn1, status1, nomv1, topoIsland1, term2, ...
+        Equipment connecting a node with itself, equipment with a disconnected
+        terminal and, if configured, equipment outside of the topological island
+        are removed.
+
+        Args:
+            res (pd.DataFrame): Query result with one row per equipment
+            eq_col (str): Column with the IRI of the equipment
+
+        Returns:
+            pd.DataFrame: Joined rows in the order of `res`
+        """
+        terminals = self._get_terminals()
+        for seq in ("1", "2"):
+            side = terminals.loc[
+                terminals["seq"] == seq,
+                ["eq", "term", "tn", "connected", "nomv", "topoIsland"],
+            ]
+            side = side.rename(
+                columns={
+                    "eq": eq_col,
+                    "term": f"term{seq}",
+                    "tn": f"tn{seq}",
+                    "connected": f"status{seq}",
+                    "nomv": f"nomv{seq}",
+                    "topoIsland": f"topoIsland{seq}",
+                }
+            )
+            res = res.merge(side, on=eq_col, how="inner")
+
+        keep = (res["tn1"] != res["tn2"]) & res["status1"] & res["status2"]
+        if self._at_topo_island_node("?tn"):
+            keep &= res["topoIsland1"].notna() & (
+                res["topoIsland1"] == res["topoIsland2"]
+            )
+
+        return res[keep].reset_index(drop=True)
+
+    def _join_terminal_nodes(self, res: pd.DataFrame, term_col: str) -> pd.DataFrame:
+        """Adds the node, connected status, nominal voltage and topological
+        island of the terminal in `term_col` to each row.
+        Rows with a terminal without node or nominal voltage are removed.
+
+        Args:
+            res (pd.DataFrame): Query result with one row per terminal
+            term_col (str): Column with the IRI of the terminal
+
+        Returns:
+            pd.DataFrame: Joined rows in the order of `res`
+                with the columns node, connected, nomU and topoIsland
+        """
+        terminals = self._get_terminals()
+        nodes = terminals.loc[
+            terminals["nomv"].notna(),
+            ["term", "tn", "connected", "nomv", "topoIsland"],
+        ]
+        nodes = nodes.rename(columns={"term": term_col, "tn": "node", "nomv": "nomU"})
+        return res.merge(nodes, on=term_col, how="inner")
@@ -13,10 +13,9 @@
 # limitations under the License.
 
 import numpy as np
+import pandas as pd
 from power_grid_model import ComponentType, initialize_array
 
-from cgmes2pgm_converter.common.cgmes_literals import Profile
-
 from .line import LineBuilder
 
 
@@ -31,32 +30,12 @@ class EquivalentBranchBuilder(LineBuilder):
     """
 
     def build_from_cgmes(self, _) -> tuple[np.ndarray, dict | None]:
-        if self._source.split_profiles:
-            named_graphs = self._source.named_graphs
-            args = {
-                "$TOPO_ISLAND": self._at_topo_island_node_graph("?tn1", "?tn2"),
-                "$IN_SERVICE": self._in_service_graph("?line"),
-                "$TP_GRAPH": named_graphs.format_for_query(Profile.TP),
-                "$SSH_GRAPH": named_graphs.format_for_query(Profile.SSH),
-                "$EQ_GRAPH": named_graphs.format_for_query(Profile.EQ),
-                "$SV_GRAPH": named_graphs.format_for_query(Profile.SV),
-                "$NOMV_FILTER": "FILTER(?nomv1 != ?nomv2)",  # <- filter for different voltage levels
-            }
-            q = self._replace(self._query_graph, args)
-            res = self._source.query(q)
-        else:
-            args = {
-                "$IN_SERVICE": self._in_service(),
-                "$TOPO_ISLAND": self._at_topo_island_node("?tn1", "?tn2"),
-                "$NOMV_FILTER": "FILTER(?nomv1 != ?nomv2)",  # <- filter for different voltage levels
-            }
-            q = self._replace(self._query, args)
-            res = self._source.query(q)
+        res = self._get_lines()
 
         arr = initialize_array(self._data_type, self.component_name(), res.shape[0])
         arr["id"] = self._id_mapping.add_cgmes_iris(res["line"], res["name"])
-        arr["from_node"] = [self._id_mapping.get_pgm_id(uuid) for uuid in res["tn1"]]
-        arr["to_node"] = [self._id_mapping.get_pgm_id(uuid) for uuid in res["tn2"]]
+        arr["from_node"] = self._id_mapping.get_pgm_ids(res["tn1"])
+        arr["to_node"] = self._id_mapping.get_pgm_ids(res["tn2"])
         arr["from_status"] = res["status1"]
         arr["to_status"] = res["status2"]
 
@@ -93,6 +72,10 @@ class EquivalentBranchBuilder(LineBuilder):
 
         return arr, extra_info
 
+    def _select_voltage_levels(self, nomv1: pd.Series, nomv2: pd.Series) -> pd.Series:
+        """Equivalent branches connect nodes of different voltage levels"""
+        return nomv1 != nomv2
+
     def _compute_ratio(self, v1, v2):
         maxv, minv = (v1, v2) if v1 > v2 else (v2, v1)
         if (maxv - minv) / maxv > 0.1:
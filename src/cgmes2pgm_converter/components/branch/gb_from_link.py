@@ -21,6 +21,10 @@ from ..component import AbstractPgmComponentBuilder
 
 
 class GenericBranchFromLinkBuilder(AbstractPgmComponentBuilder):
+    _reads = frozenset({"_type"})
+    _modifies = frozenset({ComponentType.link, ComponentType.sym_power_sensor})
+    _requires = frozenset({ComponentType.link})
+
     def __init__(
         self,
         cgmes_source: CgmesDataset,
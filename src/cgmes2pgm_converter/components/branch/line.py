@@ -13,33 +13,39 @@
 # limitations under the License.
 
 import numpy as np
+import pandas as pd
 from power_grid_model import ComponentType, initialize_array
 
 from cgmes2pgm_converter.common import AbstractCgmesIdMapping, BranchType, CgmesDataset
 from cgmes2pgm_converter.common.cgmes_literals import Profile
 
-from ..component import AbstractPgmComponentBuilder
+from .abstract_branch import AbstractBranchBuilder
 
 
-class LineBuilder(AbstractPgmComponentBuilder):
+class LineBuilder(AbstractBranchBuilder):
+    _reads = frozenset({ComponentType.node})
+    _result_dtypes = {
+        "lines": {
+            "line": "str",
+            "name": "str",
+            "bch": "float64",
+            "gch": "float64",
+            "r": "float64",
+            "x": "float64",
+            "eq_nomv": "float64",
+            "type": "str",
+        },
+    }
+
     _query = """
         SELECT  ?line
                 ?name
                 ?bch
                 ?gch
-                ?length
                 ?r
                 ?x
-                ?tn1
-                ?tn2
-                ?nomv1
-                ?nomv2
                 ?eq_nomv
-                ?status1
-                ?status2
                 ?type
-                ?term1
-                ?term2
         WHERE {
             VALUES ?_type {
                 cim:ACLineSegment
@@ -65,36 +71,10 @@ class LineBuilder(AbstractPgmComponentBuilder):
             OPTIONAL { ?line cim:SeriesCompensator.r ?_srcR. }
             OPTIONAL { ?line cim:SeriesCompensator.x ?_srcX. }
 
-            ?term1 a cim:Terminal;
-                cim:Terminal.ConductingEquipment ?line;
-                cim:Terminal.TopologicalNode ?tn1;
-                cim:ACDCTerminal.sequenceNumber "1"; ## order Terminal/Node by sequence number
-                cim:ACDCTerminal.connected ?status1.
-
-            ?term2 a cim:Terminal;
-                      cim:Terminal.ConductingEquipment ?line;
-                      cim:Terminal.TopologicalNode ?tn2;
-                      cim:ACDCTerminal.sequenceNumber "2";
-                      cim:ACDCTerminal.connected ?status2.
-
-            ?tn1 cim:TopologicalNode.BaseVoltage/cim:BaseVoltage.nominalVoltage ?nomv1.
-            ?tn2 cim:TopologicalNode.BaseVoltage/cim:BaseVoltage.nominalVoltage ?nomv2.
-
-            $TOPO_ISLAND
-            #?topoIsland cim:IdentifiedObject.name "Network";
-            #            cim:TopologicalIsland.TopologicalNodes ?tn1;
-            #            cim:TopologicalIsland.TopologicalNodes ?tn2.
-
             BIND(COALESCE(?_aclR, ?_eqbR, ?_srcR, "0.0") as ?r)
             BIND(COALESCE(?_aclX, ?_eqbX, ?_srcX, "0.0") as ?x)
             BIND(COALESCE(?_aclBch, "0.0") as ?bch)
             BIND(COALESCE(?_aclGch, "0.0") as ?gch)
-
-            FILTER(?tn1 != ?tn2)
-            FILTER(?status1 = "true" &&  ?status2 = "true")
-
-            $NOMV_FILTER
-            #FILTER(?nomv1 = ?nomv2)
         }
         ORDER BY ?line
     """
@@ -104,19 +84,10 @@ class LineBuilder(AbstractPgmComponentBuilder):
                 ?name
                 ?bch
                 ?gch
-                ?length
                 ?r
                 ?x
-                ?tn1
-                ?tn2
-                ?nomv1
-                ?nomv2
                 ?eq_nomv
-                ?status1
-                ?status2
                 ?type
-                ?term1
-                ?term2
         WHERE {
             VALUES ?_type {
                 cim:ACLineSegment
@@ -129,60 +100,18 @@ class LineBuilder(AbstractPgmComponentBuilder):
                 ?line a ?_type;
                     cim:ConductingEquipment.BaseVoltage ?eq_bv;
                     cim:IdentifiedObject.name ?name.
-
-                ?term1 a cim:Terminal;
-                    cim:Terminal.ConductingEquipment ?line;
-                    cim:ACDCTerminal.sequenceNumber "1".
-
-                ?term2 a cim:Terminal;
-                        cim:Terminal.ConductingEquipment ?line;
-                        cim:ACDCTerminal.sequenceNumber "2".
             }
             BIND(STRAFTER(STR(?_type), "#") AS ?type)
 
+            VALUES ?ssh_graph { $SSH_GRAPH }
             $IN_SERVICE
             # GRAPH ?ssh_graph { ?line cim:Equipment.inService "true". }
 
-            VALUES ?ssh_graph { $SSH_GRAPH }
-            GRAPH ?ssh_graph {
-                ?term1 cim:ACDCTerminal.connected ?status1.
-                ?term2 cim:ACDCTerminal.connected ?status2.
-            }
-
-            VALUES ?tp_graph { $TP_GRAPH }
-            VALUES ?tp_graph_bv1 { $TP_GRAPH }
-            VALUES ?tp_graph_bv2 { $TP_GRAPH }
-            GRAPH ?tp_graph {
-                ?term1 cim:Terminal.TopologicalNode ?tn1.
-                ?term2 cim:Terminal.TopologicalNode ?tn2.
-            }
-            GRAPH ?tp_graph_bv1 {
-                ?tn1 cim:TopologicalNode.BaseVoltage ?_bv1.
-            }
-            GRAPH ?tp_graph_bv2 {
-                ?tn2 cim:TopologicalNode.BaseVoltage ?_bv2.
-            }
-
-            VALUES ?eq_graph_bv1 { $EQ_GRAPH }
-            GRAPH ?eq_graph_bv1 {
-               ?_bv1 cim:BaseVoltage.nominalVoltage ?nomv1.
-            }
-            VALUES ?eq_graph_bv2 { $EQ_GRAPH }
-            GRAPH ?eq_graph_bv2 {
-               ?_bv2 cim:BaseVoltage.nominalVoltage ?nomv2.
-            }
-            VALUES ?eq_graph_bv3 { $EQ_GRAPH }
-            GRAPH ?eq_graph_bv3 {
+            VALUES ?eq_graph_bv { $EQ_GRAPH }
+            GRAPH ?eq_graph_bv {
                 ?eq_bv cim:BaseVoltage.nominalVoltage ?eq_nomv
             }
 
-            $TOPO_ISLAND
-            # GRAPH ?sv_graph {
-            #     ?topoIsland # cim:IdentifiedObject.name "Network";
-            #                 cim:TopologicalIsland.TopologicalNodes ?tn1;
-            #                 cim:TopologicalIsland.TopologicalNodes ?tn2.
-            # }
-
             OPTIONAL {
                 GRAPH ?eq_graph {
                     ?line cim:ACLineSegment.r ?_aclR.
@@ -212,12 +141,6 @@ class LineBuilder(AbstractPgmComponentBuilder):
             BIND(COALESCE(?_aclX, ?_eqbX, ?_srcX, "0.0") as ?x)
             BIND(COALESCE(?_aclBch, "0.0") as ?bch)
             BIND(COALESCE(?_aclGch, "0.0") as ?gch)
-
-            FILTER(?tn1 != ?tn2)
-            FILTER(?status1 = "true" &&  ?status2 = "true")
-
-            $NOMV_FILTER
-            # FILTER(?nomv1 = ?nomv2)
         }
         ORDER BY ?line
     """
@@ -235,33 +158,28 @@ class LineBuilder(AbstractPgmComponentBuilder):
             else ComponentType.line
         )
 
-    def build_from_cgmes(self, _) -> tuple[np.ndarray, dict | None]:
+    def get_queries(self) -> dict[str, str]:
         if self._source.split_profiles:
             named_graphs = self._source.named_graphs
             args = {
-                "$TOPO_ISLAND": self._at_topo_island_node_graph("?tn1", "?tn2"),
                 "$IN_SERVICE": self._in_service_graph("?line"),
-                "$TP_GRAPH": named_graphs.format_for_query(Profile.TP),
                 "$SSH_GRAPH": named_graphs.format_for_query(Profile.SSH),
                 "$EQ_GRAPH": named_graphs.format_for_query(Profile.EQ),
-                "$SV_GRAPH": named_graphs.format_for_query(Profile.SV),
-                "$NOMV_FILTER": "FILTER(?nomv1 = ?nomv2)",  # <- filter for same voltage levels
             }
-            q = self._replace(self._query_graph, args)
-            res = self._source.query(q)
+            query = self._replace(self._query_graph, args)
         else:
-            args = {
-                "$IN_SERVICE": self._in_service(),
-                "$TOPO_ISLAND": self._at_topo_island_node("?tn1", "?tn2"),
-                "$NOMV_FILTER": "FILTER(?nomv1 = ?nomv2)",  # <- filter for same voltage levels
-            }
-            q = self._replace(self._query, args)
-            res = self._source.query(q)
+            args = {"$IN_SERVICE": self._in_service()}
+            query = self._replace(self._query, args)
+
+        return {"terminals": self._build_terminal_query(), "lines": query}
+
+    def build_from_cgmes(self, _) -> tuple[np.ndarray, dict | None]:
+        res = self._get_lines()
 
         arr = initialize_array(self._data_type, self.component_name(), res.shape[0])
         arr["id"] = self._id_mapping.add_cgmes_iris(res["line"], res["name"])
-        arr["from_node"] = [self._id_mapping.get_pgm_id(uuid) for uuid in res["tn1"]]
-        arr["to_node"] = [self._id_mapping.get_pgm_id(uuid) for uuid in res["tn2"]]
+        arr["from_node"] = self._id_mapping.get_pgm_ids(res["tn1"])
+        arr["to_node"] = self._id_mapping.get_pgm_ids(res["tn2"])
         arr["from_status"] = res["status1"]
         arr["to_status"] = res["status2"]
         arr["r1"] = res["r"]
@@ -299,5 +217,21 @@ class LineBuilder(AbstractPgmComponentBuilder):
 
         return arr, extra_info
 
+    def _get_lines(self) -> pd.DataFrame:
+        """Returns the lines joined with their terminals,
+        restricted to the voltage levels selected by `_select_voltage_levels`.
+        """
+        res = self._join_terminal_sides(self._fetch_result("lines"), "line")
+        keep = (
+            res["nomv1"].notna()
+            & res["nomv2"].notna()
+            & self._select_voltage_levels(res["nomv1"], res["nomv2"])
+        )
+        return res[keep].reset_index(drop=True)
+
+    def _select_voltage_levels(self, nomv1: pd.Series, nomv2: pd.Series) -> pd.Series:
+        """Lines connect nodes of the same voltage level"""
+        return nomv1 == nomv2
+
     def component_name(self) -> ComponentType:
         return self._component_name
@@ -17,19 +17,23 @@ from power_grid_model import ComponentType, initialize_array
 
 from cgmes2pgm_converter.common.cgmes_literals import Profile
 
-from ..component import AbstractPgmComponentBuilder
+from .abstract_branch import AbstractBranchBuilder
 
 
-class LinkBuilder(AbstractPgmComponentBuilder):
+class LinkBuilder(AbstractBranchBuilder):
+    _reads = frozenset({ComponentType.node})
+    _result_dtypes = {
+        "links": {
+            "eq": "str",
+            "name": "str",
+            "open": "bool",
+            "type": "str",
+        },
+    }
+
     _query = """
         SELECT  ?eq
                 ?name
-                ?tn1
-                ?tn2
-                ?status1
-                ?status2
-                ?term1
-                ?term2
                 ?open
                 ?type
         WHERE {
@@ -44,37 +48,13 @@ class LinkBuilder(AbstractPgmComponentBuilder):
 
             BIND(STRAFTER(STR(?_type), "#") AS ?type)
 
-            ?term1 a cim:Terminal;
-                    cim:Terminal.ConductingEquipment ?eq;
-                    cim:Terminal.TopologicalNode ?tn1;
-                    cim:ACDCTerminal.sequenceNumber "1";
-                    cim:ACDCTerminal.connected ?status1.
-
-            ?term2 a cim:Terminal;
-                      cim:Terminal.ConductingEquipment ?eq;
-                      cim:Terminal.TopologicalNode ?tn2;
-                      cim:ACDCTerminal.sequenceNumber "2";
-                      cim:ACDCTerminal.connected ?status2.
-
-            $TOPO_ISLAND
-            #?topoIsland cim:IdentifiedObject.name "Network";
-            #            cim:TopologicalIsland.TopologicalNodes ?tn1;
-            #            cim:TopologicalIsland.TopologicalNodes ?tn2.
-
-            FILTER(?tn1 != ?tn2)
-            FILTER(?status1 = "true" && ?status2 = "true" && ?open = "false")
+            FILTER(?open = "false")
         }
         ORDER BY ?eq
     """
     _query_graph = """
         SELECT  ?eq
                 ?name
-                ?tn1
-                ?tn2
-                ?status1
-                ?status2
-                ?term1
-                ?term2
                 ?open
                 ?type
                 # ?retained
@@ -86,14 +66,6 @@ class LinkBuilder(AbstractPgmComponentBuilder):
                 ?eq a ?_type;
                     cim:Switch.retained "true";
                     cim:IdentifiedObject.name ?name.
-
-                ?term1 a cim:Terminal;
-                        cim:Terminal.ConductingEquipment ?eq;
-                        cim:ACDCTerminal.sequenceNumber "1".
-
-                ?term2 a cim:Terminal;
-                        cim:Terminal.ConductingEquipment ?eq;
-                        cim:ACDCTerminal.sequenceNumber "2".
             }
             BIND(STRAFTER(STR(?_type), "#") AS ?type)
 
@@ -103,54 +75,35 @@ class LinkBuilder(AbstractPgmComponentBuilder):
             VALUES ?ssh_graph { $SSH_GRAPH }
             GRAPH ?ssh_graph {
                 ?eq cim:Switch.open ?open.
-                ?term1 cim:ACDCTerminal.connected ?status1.
-                ?term2 cim:ACDCTerminal.connected ?status2.
             }
 
-            VALUES ?tp_graph { $TP_GRAPH }
-            GRAPH ?tp_graph {
-                ?term1 cim:Terminal.TopologicalNode ?tn1.
-                ?term2 cim:Terminal.TopologicalNode ?tn2.
-            }
-
-            $TOPO_ISLAND
-            # GRAPH ?sv_graph {
-            #     ?topoIsland # cim:IdentifiedObject.name "Network";
-            #                 cim:TopologicalIsland.TopologicalNodes ?tn1;
-            #                 cim:TopologicalIsland.TopologicalNodes ?tn2.
-            # }
-
-            FILTER(?tn1 != ?tn2)
-            FILTER(?status1 = "true" && ?status2 = "true" && ?open = "false")
+            FILTER(?open = "false")
         }
         ORDER BY ?eq
     """
 
-    def build_from_cgmes(self, _) -> tuple[np.ndarray, dict | None]:
+    def get_queries(self) -> dict[str, str]:
         if self._source.split_profiles:
             named_graphs = self._source.named_graphs
             args = {
                 "$IN_SERVICE": self._in_service_graph("?eq"),
-                "$TOPO_ISLAND": self._at_topo_island_node_graph("?tn1", "?tn2"),
                 "$EQ_GRAPH": named_graphs.format_for_query(Profile.EQ),
-                "$TP_GRAPH": named_graphs.format_for_query(Profile.TP),
                 "$SSH_GRAPH": named_graphs.format_for_query(Profile.SSH),
-                "$SV_GRAPH": named_graphs.format_for_query(Profile.SV),
             }
-            q = self._replace(self._query_graph, args)
-            res = self._source.query(q)
+            query = self._replace(self._query_graph, args)
         else:
-            args = {
-                "$IN_SERVICE": self._in_service(),
-                "$TOPO_ISLAND": self._at_topo_island_node("?tn1", "?tn2"),
-            }
-            q = self._replace(self._query, args)
-            res = self._source.query(q)
+            args = {"$IN_SERVICE": self._in_service()}
+            query = self._replace(self._query, args)
+
+        return {"terminals": self._build_terminal_query(), "links": query}
+
+    def build_from_cgmes(self, _) -> tuple[np.ndarray, dict | None]:
+        res = self._join_terminal_sides(self._fetch_result("links"), "eq")
 
         arr = initialize_array(self._data_type, self.component_name(), res.shape[0])
         arr["id"] = self._id_mapping.add_cgmes_iris(res["eq"], res["name"])
-        arr["from_node"] = [self._id_mapping.get_pgm_id(uuid) for uuid in res["tn1"]]
-        arr["to_node"] = [self._id_mapping.get_pgm_id(uuid) for uuid in res["tn2"]]
+        arr["from_node"] = self._id_mapping.get_pgm_ids(res["tn1"])
+        arr["to_node"] = self._id_mapping.get_pgm_ids(res["tn2"])
         arr["from_status"] = res["status1"] & ~res["open"]
         arr["to_status"] = res["status2"] & ~res["open"]
 
@@ -16,15 +16,59 @@ from abc import abstractmethod
 
 import numpy as np
 import pandas as pd
+from power_grid_model import ComponentType
 
 from cgmes2pgm_converter.common.cgmes_literals import Profile
 
-from ...component import AbstractPgmComponentBuilder
+from ..abstract_branch import AbstractBranchBuilder
+
+
+class AbstractTransformerBuilder(AbstractBranchBuilder):
+    _reads = frozenset({ComponentType.node})
+    _result_dtypes = {
+        "transformers": {
+            "tr": "str",
+            "name": "str",
+            "_term": "str",
+            "trEnd": "str",
+            "connectionType": "str",
+            "r": "float64",
+            "x": "float64",
+            "g": "float64",
+            "b": "float64",
+            "ratedS": "float64",
+            "ratedU": "float64",
+            "tapchanger": "str",
+            "taptype": "str",
+            "neutralU": "float64",
+            "stepSize": "float64",
+        },
+        "psts": {
+            "tr": "str",
+            "name": "str",
+            "_term": "str",
+            "trEnd": "str",
+            "connectionType": "str",
+            "r": "float64",
+            "x": "float64",
+            "g": "float64",
+            "b": "float64",
+            "ratedS": "float64",
+            "ratedU": "float64",
+            "tapchanger": "str",
+            "taptype": "str",
+            "tcRatio": "float64",
+            "tcAngle": "float64",
+            "neutralU": "float64",
+            "stepPhaseShift": "float64",
+            "xMax": "float64",
+            "stepVoltageIncrement": "float64",
+            "windingConnectionAngle": "float64",
+        },
+    }
 
-
-class AbstractTransformerBuilder(AbstractPgmComponentBuilder):
     _query = """
-        SELECT ?tr ?name ?_term ?trEnd ?node ?b ?connectionType ?g ?r ?x ?_tratio ?_tstep ?ratedS ?ratedU ?nomU ?connected ?tapchanger ?highStep ?lowStep ?neutralStep ?neutralU ?normalStep ?step ?stepSize ?endNumber ?taptype ?topoIsland ?_ratiotap_type
+        SELECT ?tr ?name ?_term ?trEnd ?b ?connectionType ?g ?r ?x ?_tratio ?_tstep ?ratedS ?ratedU ?tapchanger ?highStep ?lowStep ?neutralStep ?neutralU ?normalStep ?step ?stepSize ?endNumber ?taptype ?_ratiotap_type
         WHERE {
 
         {
@@ -39,7 +83,7 @@ class AbstractTransformerBuilder(AbstractPgmComponentBuilder):
                     cim:PowerTransformerEnd.PowerTransformer ?tr.
             }
             GROUP BY ?tr
-            HAVING (?n = $WINDING_COUNT)
+            HAVING (COUNT(?_trEnd) = $WINDING_COUNT)
         }
 
 
@@ -108,17 +152,6 @@ class AbstractTransformerBuilder(AbstractPgmComponentBuilder):
         }
 
 
-        ?_term cim:Terminal.TopologicalNode ?node;
-            cim:ACDCTerminal.connected ?connected.
-
-        ?node cim:TopologicalNode.BaseVoltage/cim:BaseVoltage.nominalVoltage ?nomU.
-
-        OPTIONAL {
-            $TOPO_ISLAND
-            #?topoIsland cim:IdentifiedObject.name "Network";
-            #            cim:TopologicalIsland.TopologicalNodes ?node.
-        }
-
         BIND(COALESCE(?_phasetapchanger, ?_ratiotapchanger) as ?tapchanger)
         BIND(COALESCE(?_phasetap_type, ?_ratiotap_type) as ?taptype)
 
@@ -127,7 +160,7 @@ class AbstractTransformerBuilder(AbstractPgmComponentBuilder):
     """
 
     _query_graph = """
-        SELECT ?tr ?name ?_term ?trEnd ?node ?connectionType ?r ?x ?g ?b ?_tratio ?_tstep ?ratedS ?ratedU ?nomU ?connected ?tapchanger ?highStep ?lowStep ?neutralStep ?neutralU ?normalStep ?step ?stepSize ?endNumber ?taptype ?topoIsland ?_ratiotap_type
+        SELECT ?tr ?name ?_term ?trEnd ?connectionType ?r ?x ?g ?b ?_tratio ?_tstep ?ratedS ?ratedU ?tapchanger ?highStep ?lowStep ?neutralStep ?neutralU ?normalStep ?step ?stepSize ?endNumber ?taptype ?_ratiotap_type
         WHERE {
             {
                 SELECT ?tr (COUNT(?_trEnd) as ?n) (SAMPLE(?_name) as ?name)
@@ -145,7 +178,7 @@ class AbstractTransformerBuilder(AbstractPgmComponentBuilder):
                     # GRAPH ?ssh_graph { ?tr cim:Equipment.inService "true". }
                 }
                 GROUP BY ?tr
-                HAVING (?n = $WINDING_COUNT)
+                HAVING (COUNT(?_trEnd) = $WINDING_COUNT)
             }
 
             VALUES ?eq_graph { $EQ_GRAPH }
@@ -225,28 +258,6 @@ class AbstractTransformerBuilder(AbstractPgmComponentBuilder):
                 }
             }
 
-            VALUES ?tp_graph { $TP_GRAPH }
-            GRAPH ?tp_graph {
-                ?_term cim:Terminal.TopologicalNode ?node.
-                ?node cim:TopologicalNode.BaseVoltage ?_bv1.
-            }
-            GRAPH ?ssh_graph {
-                ?_term cim:ACDCTerminal.connected ?connected.
-            }
-
-            VALUES ?eq_graph_bv { $EQ_GRAPH }
-            GRAPH ?eq_graph_bv {
-                ?_bv1 cim:BaseVoltage.nominalVoltage ?nomU.
-            }
-
-            OPTIONAL {
-                $TOPO_ISLAND
-                # GRAPH ?sv_graph {
-                #     ?topoIsland # cim:IdentifiedObject.name "Network";
-                #                 cim:TopologicalIsland.TopologicalNodes ?node.
-                # }
-            }
-
             BIND(COALESCE(?_phasetapchanger, ?_ratiotapchanger) as ?tapchanger)
             BIND(COALESCE(?_phasetap_type, ?_ratiotap_type) as ?taptype)
 
@@ -256,13 +267,12 @@ class AbstractTransformerBuilder(AbstractPgmComponentBuilder):
 
     _pst_query = """
         SELECT
-            ?tr ?name ?_term ?trEnd ?node ?connectionType
+            ?tr ?name ?_term ?trEnd ?connectionType
             ?r ?x ?g ?b ?tcRatio ?tcStep ?tcAngle
-            ?ratedS ?ratedU ?nomU ?connected ?endNumber
+            ?ratedS ?ratedU ?endNumber
             ?tapchanger
             ?lowStep ?highStep ?neutralStep ?normalStep ?step ?svStep ?neutralU
             ?stepPhaseShift ?xMax ?stepVoltageIncrement ?windingConnectionAngle ?taptype
-            ?topoIsland
         WHERE {
 
         {
@@ -279,7 +289,7 @@ class AbstractTransformerBuilder(AbstractPgmComponentBuilder):
                 optional {?_ptc cim:PhaseTapChanger.TransformerEnd ?_trEnd.}
             }
             GROUP BY ?tr
-            HAVING (bound(?ptc) && ?n = $WINDING_COUNT)
+            HAVING (COUNT(?_ptc) > 0 && COUNT(?_trEnd) = $WINDING_COUNT)
         }
 
 
@@ -359,36 +369,22 @@ class AbstractTransformerBuilder(AbstractPgmComponentBuilder):
 
         BIND(COALESCE(?_phasetap_type, ?_ratiotap_type) as ?_taptype)
         BIND(STRAFTER(STR(?_taptype), "#") AS ?taptype)
-
-        ?_term cim:Terminal.TopologicalNode ?node;
-            cim:ACDCTerminal.connected ?connected.
-
-        ?node cim:TopologicalNode.BaseVoltage/cim:BaseVoltage.nominalVoltage ?nomU.
-
-        OPTIONAL {
-            $TOPO_ISLAND
-            #?topoIsland cim:IdentifiedObject.name "Network";
-            #            cim:TopologicalIsland.TopologicalNodes ?node.
-        }
         }
         ORDER BY ?tr ?endNumber
     """
 
     _pst_query_graph = """
         SELECT
-            ?tr ?name ?_term ?trEnd ?node ?connectionType
+            ?tr ?name ?_term ?trEnd ?connectionType
             ?r ?x ?g ?b ?tcRatio ?tcStep ?tcAngle
-            ?ratedS ?ratedU ?nomU ?connected ?endNumber
+            ?ratedS ?ratedU ?endNumber
             ?tapchanger
             ?lowStep ?highStep ?neutralStep ?normalStep ?step ?svStep ?neutralU
             ?stepPhaseShift ?xMax ?stepVoltageIncrement ?windingConnectionAngle ?taptype
-            ?topoIsland
         WHERE {
 
             VALUES ?eq_graph { $EQ_GRAPH }
-            VALUES ?eq_graph_bv { $EQ_GRAPH }
             VALUES ?ssh_graph { $SSH_GRAPH }
-            VALUES ?tp_graph { $TP_GRAPH }
 
             {
                 SELECT ?tr (COUNT(?_trEnd) as ?n) (SAMPLE(?_name) as ?name) (SAMPLE(?_ptc) as ?ptc)
@@ -407,7 +403,7 @@ class AbstractTransformerBuilder(AbstractPgmComponentBuilder):
                     # GRAPH ?ssh_graph { ?tr cim:Equipment.inService "true". }
                 }
                 GROUP BY ?tr
-                HAVING (bound(?ptc) && ?n = $WINDING_COUNT)
+                HAVING (COUNT(?_ptc) > 0 && COUNT(?_trEnd) = $WINDING_COUNT)
             }
 
 
@@ -498,26 +494,6 @@ class AbstractTransformerBuilder(AbstractPgmComponentBuilder):
 
             BIND(COALESCE(?_phasetap_type, ?_ratiotap_type) as ?_taptype)
             BIND(STRAFTER(STR(?_taptype), "#") AS ?taptype)
-
-            GRAPH ?tp_graph {
-                ?_term cim:Terminal.TopologicalNode ?node.
-                ?node cim:TopologicalNode.BaseVoltage ?_bv.
-            }
-            GRAPH ?ssh_graph {
-                ?_term cim:ACDCTerminal.connected ?connected.
-            }
-
-            GRAPH ?eq_graph_bv {
-                ?_bv cim:BaseVoltage.nominalVoltage ?nomU.
-            }
-
-            OPTIONAL {
-                $TOPO_ISLAND
-                # GRAPH ?sv_graph {
-                #     ?topoIsland # cim:IdentifiedObject.name "Network";
-                #                 cim:TopologicalIsland.TopologicalNodes ?node.
-                # }
-            }
         }
         ORDER BY ?tr ?endNumber
     """
@@ -526,68 +502,68 @@ class AbstractTransformerBuilder(AbstractPgmComponentBuilder):
     def winding_count(self) -> int:
         raise NotImplementedError
 
-    def _get_pst_result(self) -> pd.DataFrame:
-        """Returns Query Result for PST Transformers.
-
-        Returns:
-            pd.DataFrame: Query Result
-        """
+    def _build_pst_query(self) -> str:
+        """Returns the formatted query for PST Transformers."""
 
         if self._source.split_profiles:
             named_graphs = self._source.named_graphs
             args = {
-                "$TOPO_ISLAND": self._at_topo_island_node_graph("?node"),
                 "$IN_SERVICE": self._in_service_graph("?tr"),
-                "$TP_GRAPH": named_graphs.format_for_query(Profile.TP),
                 "$SSH_GRAPH": named_graphs.format_for_query(Profile.SSH),
                 "$EQ_GRAPH": named_graphs.format_for_query(Profile.EQ),
                 "$SV_GRAPH": named_graphs.format_for_query(Profile.SV),
                 "$WINDING_COUNT": str(self.winding_count()),
             }
-            q = self._replace(self._pst_query_graph, args)
-            res = self._source.query(q)
-        else:
-            args = {
-                "$IN_SERVICE": self._in_service(),
-                "$TOPO_ISLAND": self._at_topo_island_node("?node"),
-                "$WINDING_COUNT": str(self.winding_count()),
-            }
-            q = self._replace(self._pst_query, args)
-            res = self._source.query(q)
-
-        return self._process_query_result(res)
+            return self._replace(self._pst_query_graph, args)
 
-    def _get_query_result(self) -> pd.DataFrame:
-        """Returns Query Result for Transformer.
-        Columns are named as per _queryColNames,
-        with trailing number for each side (eg. trEnd1, trEnd2, ...)
+        args = {
+            "$IN_SERVICE": self._in_service(),
+            "$WINDING_COUNT": str(self.winding_count()),
+        }
+        return self._replace(self._pst_query, args)
 
-        Returns:
-            pd.DataFrame: Query Result
-        """
+    def _build_query(self) -> str:
+        """Returns the formatted query for Transformers."""
 
         if self._source.split_profiles:
             named_graphs = self._source.named_graphs
             args = {
-                "$TOPO_ISLAND": self._at_topo_island_node_graph("?node"),
                 "$IN_SERVICE": self._in_service_graph("?tr"),
-                "$TP_GRAPH": named_graphs.format_for_query(Profile.TP),
                 "$SSH_GRAPH": named_graphs.format_for_query(Profile.SSH),
                 "$EQ_GRAPH": named_graphs.format_for_query(Profile.EQ),
                 "$SV_GRAPH": named_graphs.format_for_query(Profile.SV),
                 "$WINDING_COUNT": str(self.winding_count()),
             }
-            q = self._replace(self._query_graph, args)
-            res = self._source.query(q)
-        else:
-            args = {
-                "$IN_SERVICE": self._in_service(),
-                "$TOPO_ISLAND": self._at_topo_island_node("?node"),
-                "$WINDING_COUNT": str(self.winding_count()),
-            }
-            q = self._replace(self._query, args)
-            res = self._source.query(q)
+            return self._replace(self._query_graph, args)
+
+        args = {
+            "$IN_SERVICE": self._in_service(),
+            "$WINDING_COUNT": str(self.winding_count()),
+        }
+        return self._replace(self._query, args)
+
+    def _get_pst_result(self) -> pd.DataFrame:
+        """Returns Query Result for PST Transformers.
+        Requires `get_queries` to provide the query as "psts"
+        and the terminal table as "terminals".
+
+        Returns:
+            pd.DataFrame: Query Result
+        """
+        res = self._join_terminal_nodes(self._fetch_result("psts"), "_term")
+        return self._process_query_result(res)
+
+    def _get_query_result(self) -> pd.DataFrame:
+        """Returns Query Result for Transformer.
+        Columns are named as per _queryColNames,
+        with trailing number for each side (eg. trEnd1, trEnd2, ...).
+        Requires `get_queries` to provide the query as "transformers"
+        and the terminal table as "terminals".
 
+        Returns:
+            pd.DataFrame: Query Result
+        """
+        res = self._join_terminal_nodes(self._fetch_result("transformers"), "_term")
         return self._process_query_result(res)
 
     def _process_query_result(self, res: pd.DataFrame) -> pd.DataFrame:
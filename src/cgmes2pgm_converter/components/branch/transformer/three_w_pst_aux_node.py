@@ -24,6 +24,12 @@ class Pst3WAuxNodeBuilder(AbstractTransformerBuilder):
     def is_active(self):
         return self._converter_options.use_generic_branch[BranchType.THREE_WINDING_PST]
 
+    def get_queries(self) -> dict[str, str]:
+        return {
+            "terminals": self._build_terminal_query(),
+            "psts": self._build_pst_query(),
+        }
+
     def build_from_cgmes(self, _) -> tuple[np.ndarray, dict | None]:
         res = self._get_pst_result()
 
@@ -43,7 +49,7 @@ class Pst3WAuxNodeBuilder(AbstractTransformerBuilder):
         arr["u_rated"] = res["nomU1"] * 1e3
 
         # get node ids for the HV side
-        hv_node_id = [self._id_mapping.get_pgm_id(niri) for niri in res["node1"]]
+        hv_node_id = self._id_mapping.get_pgm_ids(res["node1"])
         hv_node_info = [self._extra_info[nid] for nid in hv_node_id]
 
         extra_info = {}
@@ -27,6 +27,12 @@ class Transformer3WAsGenericBranchBuilder(AbstractTransformerBuilder):
             BranchType.THREE_WINDING_TRANSFORMER
         ]
 
+    def get_queries(self) -> dict[str, str]:
+        return {
+            "terminals": self._build_terminal_query(),
+            "transformers": self._build_query(),
+        }
+
     def build_from_cgmes(self, _) -> tuple[np.ndarray, dict | None]:
         res = self._get_query_result()
 
@@ -63,18 +69,6 @@ class Transformer3WAsGenericBranchBuilder(AbstractTransformerBuilder):
         props = TransformerProps(self.winding_count())
 
         for _, trafo in res.iterrows():
-            u_node1 = trafo["nomU1"] * 1e3
-            u_node2 = trafo["nomU2"] * 1e3
-            u_node3 = trafo["nomU3"] * 1e3
-
-            u_node_aux = u_node1
-
-            u_trafo1 = trafo["ratedU1"]
-            u_trafo2 = trafo["ratedU2"]
-            u_trafo3 = trafo["ratedU3"]
-
-            u_trafo_aux = u_trafo1
-
             name1 = trafo["name1"] + "-w1"
             name2 = trafo["name2"] + "-w2"
             name3 = trafo["name3"] + "-w3"
@@ -104,14 +98,6 @@ class Transformer3WAsGenericBranchBuilder(AbstractTransformerBuilder):
                 trafo["connected1"],
                 trafo["ratedS1"],
             )
-            props.append_electric_props(
-                trafo=trafo,
-                winding=1,
-                node_u1=u_node1,
-                node_u2=u_node_aux,
-                trafo_u1=u_trafo1,
-                trafo_u2=u_trafo_aux,
-            )
             props.add_extra_info(
                 wid=wid1,
                 name=name1,
@@ -127,14 +113,6 @@ class Transformer3WAsGenericBranchBuilder(AbstractTransformerBuilder):
                 trafo["connected2"],
                 trafo["ratedS2"],
             )
-            props.append_electric_props(
-                trafo=trafo,
-                winding=2,
-                node_u1=u_node_aux,
-                node_u2=u_node2,
-                trafo_u1=u_trafo_aux,
-                trafo_u2=u_trafo2,
-            )
             props.add_extra_info(
                 wid=wid2,
                 name=name2,
@@ -150,14 +128,6 @@ class Transformer3WAsGenericBranchBuilder(AbstractTransformerBuilder):
                 trafo["connected3"],
                 trafo["ratedS3"],
             )
-            props.append_electric_props(
-                trafo=trafo,
-                winding=3,
-                node_u1=u_node_aux,
-                node_u2=u_node3,
-                trafo_u1=u_trafo_aux,
-                trafo_u2=u_trafo3,
-            )
             props.add_extra_info(
                 wid=wid3,
                 name=name3,
@@ -165,6 +135,18 @@ class Transformer3WAsGenericBranchBuilder(AbstractTransformerBuilder):
                 term2=trafo["_term3"],
             )
 
+        props.set_electric_props(
+            res,
+            node_u=tuple(
+                res[f"nomU{side}"].to_numpy(dtype=float) * 1e3
+                for side in range(1, self.winding_count() + 1)
+            ),
+            trafo_u=tuple(
+                res[f"ratedU{side}"].to_numpy(dtype=float)
+                for side in range(1, self.winding_count() + 1)
+            ),
+        )
+
         arr["id"] = props.ids
         arr["from_node"] = props.from_node
         arr["to_node"] = props.to_node
@@ -26,6 +26,12 @@ class Transformer3WAuxNodeBuilder(AbstractTransformerBuilder):
             BranchType.THREE_WINDING_TRANSFORMER
         ]
 
+    def get_queries(self) -> dict[str, str]:
+        return {
+            "terminals": self._build_terminal_query(),
+            "transformers": self._build_query(),
+        }
+
     def build_from_cgmes(self, _) -> tuple[np.ndarray, dict | None]:
         res = self._get_query_result()
 
@@ -58,7 +64,7 @@ class Transformer3WAuxNodeBuilder(AbstractTransformerBuilder):
         arr["u_rated"] = res["nomU1"] * 1e3
 
         # get node ids for the HV side
-        hv_node_id = [self._id_mapping.get_pgm_id(niri) for niri in res["node1"]]
+        hv_node_id = self._id_mapping.get_pgm_ids(res["node1"])
         hv_node_info = [self._extra_info[nid] for nid in hv_node_id]
 
         extra_info = {}
@@ -18,13 +18,20 @@ from power_grid_model import ComponentType, initialize_array
 from cgmes2pgm_converter.common import BranchType
 
 from .abstract_two_2_transformer import Abstract2WTransformerBuilder
-from .util.pst_tapchanger_calculation import calc_theta_k_2w
+from .util.pst_tapchanger_calculation import calc_theta_k_2w_array
 
 
 class Pst2WAsGenericBranchBuilder(Abstract2WTransformerBuilder):
     def is_active(self):
         return self._converter_options.use_generic_branch[BranchType.PST]
 
+    def get_queries(self) -> dict[str, str]:
+        return {
+            "terminals": self._build_terminal_query(),
+            "psts": self._build_pst_query(),
+            "transformers": self._build_query(),
+        }
+
     def build_from_cgmes(self, _) -> tuple[np.ndarray, dict | None]:
         res_ptc = self._get_pst_result()
 
@@ -43,8 +50,8 @@ class Pst2WAsGenericBranchBuilder(Abstract2WTransformerBuilder):
             return arr, None
 
         arr["id"] = self._id_mapping.add_cgmes_iris(res["tr1"], res["name1"])
-        arr["from_node"] = [self._id_mapping.get_pgm_id(uuid) for uuid in res["node1"]]
-        arr["to_node"] = [self._id_mapping.get_pgm_id(uuid) for uuid in res["node2"]]
+        arr["from_node"] = self._id_mapping.get_pgm_ids(res["node1"])
+        arr["to_node"] = self._id_mapping.get_pgm_ids(res["node2"])
         arr["from_status"] = res["connected1"]
         arr["to_status"] = res["connected2"]
 
@@ -64,22 +71,11 @@ class Pst2WAsGenericBranchBuilder(Abstract2WTransformerBuilder):
         arr["g1"] = g * y_conv
         arr["b1"] = b * y_conv
 
-        theta = []
-        k = []
-        for idx, trafo in res.iterrows():
-            tapside_pst = 1 if isinstance(trafo["tapchanger1"], str) else 2
-            tapside_rtc = 0
-            if isinstance(trafo["_ratiotap_type1"], str):
-                tapside_rtc = 1
-            elif isinstance(trafo["_ratiotap_type2"], str):
-                tapside_rtc = 2
-            theta_, k_ = calc_theta_k_2w(trafo, tapside_pst, tapside_rtc)
-
-            theta.append(theta_)
-            k.append(k_)
-
-        arr["k"] = k
-        arr["theta"] = theta
+        tapside_pst = np.where(res["tapchanger1"].notna(), 1, 2)
+        tapside_rtc = np.select(
+            [res["_ratiotap_type1"].notna(), res["_ratiotap_type2"].notna()], [1, 2], 0
+        )
+        arr["theta"], arr["k"] = calc_theta_k_2w_array(res, tapside_pst, tapside_rtc)
 
         # add r,x, ... to extra_info
         extra_info = {}
@@ -29,6 +29,12 @@ class Transformer2WAsGenericBranchBuilder(Abstract2WTransformerBuilder):
     def component_name(self) -> ComponentType:
         return ComponentType.generic_branch
 
+    def get_queries(self) -> dict[str, str]:
+        return {
+            "terminals": self._build_terminal_query(),
+            "transformers": self._build_query(),
+        }
+
     def build_from_cgmes(self, _) -> tuple[np.ndarray, dict | None]:
         res = self._get_query_result()
 
@@ -51,8 +57,8 @@ class Transformer2WAsGenericBranchBuilder(Abstract2WTransformerBuilder):
             return arr, None
 
         arr["id"] = self._id_mapping.add_cgmes_iris(res["tr1"], res["name1"])
-        arr["from_node"] = [self._id_mapping.get_pgm_id(uuid) for uuid in res["node1"]]
-        arr["to_node"] = [self._id_mapping.get_pgm_id(uuid) for uuid in res["node2"]]
+        arr["from_node"] = self._id_mapping.get_pgm_ids(res["node1"])
+        arr["to_node"] = self._id_mapping.get_pgm_ids(res["node2"])
         arr["from_status"] = res["connected1"]
         arr["to_status"] = res["connected2"]
 
@@ -72,16 +78,7 @@ class Transformer2WAsGenericBranchBuilder(Abstract2WTransformerBuilder):
         arr["g1"] = g * y_conv
         arr["b1"] = b * y_conv
 
-        arr["k"] = [
-            self._calc_ratio(
-                trafo["ratedU1"],
-                trafo["ratedU2"],
-                trafo["nomU1"],
-                trafo["nomU2"],
-                trafo,
-            )
-            for _, trafo in res.iterrows()
-        ]
+        arr["k"] = self._calc_ratios(res)
         arr["theta"] = 0.0
 
         # add r,x, ... to extra_info
@@ -105,106 +102,54 @@ class Transformer2WAsGenericBranchBuilder(Abstract2WTransformerBuilder):
 
         return arr, extra_info
 
-    def _calc_ratio(self, rated_u1, rated_u2, nom_u1, nom_u2, trafo):
-        """Calculate the ratio (k) for the transformer."""
+    def _calc_ratios(self, res) -> np.ndarray:
+        """Calculate the ratio (k) for all transformers."""
 
-        nominal_ratio_ = nom_u1 / nom_u2
+        rated_u1 = res["ratedU1"].to_numpy(dtype=float)
+        rated_u2 = res["ratedU2"].to_numpy(dtype=float)
+        nom_u1 = res["nomU1"].to_numpy(dtype=float)
+        nom_u2 = res["nomU2"].to_numpy(dtype=float)
+        nominal_ratio = nom_u1 / nom_u2
 
-        side = self._get_tap_changer_side(trafo)
-        if side == -1:
-            k = self._calc_rated_ratio(rated_u1, rated_u2, nominal_ratio_)
-        else:
-            k = self._calc_ratio_from_tap_changer(
-                side, rated_u1, rated_u2, nominal_ratio_, trafo
-            )
+        side = self._get_tap_changer_sides(res)
+        corr_u1 = rated_u1.copy()
+        corr_u2 = rated_u2.copy()
 
-        return k
+        ratio = _side_values(res, "_tratio", side)
+        from_table = (side != -1) & ~np.isnan(ratio)
+        from_step = (side != -1) & np.isnan(ratio)
 
-    def _get_tap_changer_side(self, trafo):
-        step_1_ = trafo["step1"]
-        step_2_ = trafo["step2"]
+        # tap changers with a ratio table
+        corr_u1 = np.where(from_table & (side == 1), rated_u1 * ratio, corr_u1)
+        corr_u2 = np.where(from_table & (side == 2), rated_u2 * ratio, corr_u2)
 
-        side = -1
-        if not np.isnan(step_1_) and not np.isnan(step_2_):
-            logging.warning(
-                "Transformer %s has steps on both sides. Choosing side 1.",
-                trafo["name1"],
-            )
-            side = 1
-        elif not np.isnan(step_1_):
-            side = 1
-        elif not np.isnan(step_2_):
-            side = 2
-
-        return side
-
-    def _calc_ratio_from_tap_changer(
-        self,
-        end,
-        rated_u1,
-        rated_u2,
-        nominal_ratio,
-        trafo,
-    ) -> float:
-        """
-        Calculate the ratio (k) for the transformer based on the tap changer.
-        """
-        ratio = trafo[f"_tratio{end}"]
-        if np.isnan(ratio):
-            k = self._calc_ratio_from_step(
-                end, rated_u1, rated_u2, nominal_ratio, trafo
-            )
-        else:
-            k = self._calc_ratio_from_table(
-                end,
-                rated_u1,
-                rated_u2,
-                nominal_ratio,
-                ratio,
-            )
+        # tap changers with a step size
+        step_size = _side_values(res, "stepSize", side)
+        step_size_kv = np.where(
+            side == 1, rated_u1 * (step_size / 100), rated_u2 * (step_size / 100)
+        )
+        corr_u_tc = (
+            _side_values(res, "step", side) - _side_values(res, "neutralStep", side)
+        ) * step_size_kv
+        corr_u_tc = np.where(np.isnan(corr_u_tc), 0.0, corr_u_tc)
 
-        return k
-
-    def _calc_ratio_from_step(
-        self,
-        end,
-        rated_u1,
-        rated_u2,
-        nominal_ratio,
-        trafo,
-    ):
-        step_ = trafo[f"step{end}"]
-        step_neutral_ = trafo[f"neutralStep{end}"]
-        step_size_ = trafo[f"stepSize{end}"]
-        if end == 1:
-            step_size_kv = rated_u1 * (step_size_ / 100)
-        elif end == 2:
-            step_size_kv = rated_u2 * (step_size_ / 100)
-        else:
-            step_size_kv = 0.0
-
-        corr_u_tc = (step_ - step_neutral_) * step_size_kv
-        corr_u_tc = 0.0 if np.isnan(corr_u_tc) else corr_u_tc
-
-        corr_u1 = rated_u1
-        corr_u2 = rated_u2
-        if end == 1:
-            corr_u1 += corr_u_tc
-        elif end == 2:
-            corr_u2 += corr_u_tc
+        corr_u1 = np.where(from_step & (side == 1), rated_u1 + corr_u_tc, corr_u1)
+        corr_u2 = np.where(from_step & (side == 2), rated_u2 + corr_u_tc, corr_u2)
 
         return self._calc_rated_ratio(corr_u1, corr_u2, nominal_ratio)
 
-    def _calc_ratio_from_table(self, end, rated_u1, rated_u2, nominal_ratio, ratio):
-        corr_u1 = rated_u1
-        corr_u2 = rated_u2
-        if end == 1:
-            corr_u1 *= ratio
-        elif end == 2:
-            corr_u2 *= ratio
-        else:
-            raise ValueError("end must be 1 or 2")
-        return self._calc_rated_ratio(corr_u1, corr_u2, nominal_ratio)
+    def _get_tap_changer_sides(self, res) -> np.ndarray:
+        """Side of the tap changer per transformer, -1 if there is none"""
+        has_step1 = res["step1"].notna().to_numpy()
+        has_step2 = res["step2"].notna().to_numpy()
+
+        for name in res["name1"][has_step1 & has_step2]:
+            logging.warning(
+                "Transformer %s has steps on both sides. Choosing side 1.",
+                name,
+            )
+
+        return np.select([has_step1, has_step2], [1, 2], -1)
 
     def _calc_rated_ratio(self, rated_u1, rated_u2, nominal_ratio):
         return (rated_u1 / rated_u2) / nominal_ratio
@@ -216,3 +161,12 @@ class Transformer2WAsGenericBranchBuilder(Abstract2WTransformerBuilder):
         z_conv = (rated_u_min * rated_u_min) / (rated_u_max * rated_u_max)
         y_conv = 1 / z_conv
         return z_conv, y_conv
+
+
+def _side_values(res, column, side) -> np.ndarray:
+    """Values of `column` at the given side (1 or 2) of each transformer"""
+    return np.where(
+        side == 1,
+        res[f"{column}1"].to_numpy(dtype=float),
+        res[f"{column}2"].to_numpy(dtype=float),
+    )
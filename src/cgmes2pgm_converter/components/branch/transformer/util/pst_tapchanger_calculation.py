@@ -414,3 +414,324 @@ def calc_k_tabular_in_phase2(
     k = k_tap * tc_ratio
 
     return k
+
+
+# Array versions of the calculations above, evaluating all transformers at once.
+# The results agree with the scalar functions up to floating point rounding.
+
+
+def calc_theta_k_2w_array(
+    trafos: pd.DataFrame, tapside, tapside_rtc
+) -> tuple[np.ndarray, np.ndarray]:
+    """Calculates theta and k for 2-winding transformers
+    based on the tapchanger type, see `calc_theta_k_2w`.
+
+    Args:
+        trafos (pd.DataFrame): Transformer data, one row per transformer
+        tapside (array_like): Tap side (1 or 2) per transformer
+        tapside_rtc (array_like): Tap side of the ratio tap changer
+            per transformer (0 if there is none)
+    Returns:
+        tuple[np.ndarray, np.ndarray]: theta and k per transformer
+    """
+    count = trafos.shape[0]
+    tapside = np.broadcast_to(tapside, count)
+    tapside_rtc = np.broadcast_to(tapside_rtc, count)
+
+    theta = np.zeros(count)
+    k = np.ones(count)
+
+    taptype = _side_values(trafos, "taptype", tapside, dtype=object)
+    has_rtc = tapside_rtc != 0
+    taptype[(taptype == "PhaseTapChangerAsymmetrical") & has_rtc] = "InPhaseAndAsymPST"
+    taptype[(taptype == "PhaseTapChangerTabular") & has_rtc] = "InPhaseAndTabularPST"
+
+    # only evaluate present types, the columns of the others may be missing,
+    # e.g. there are no ratio tap changer columns for 3-winding transformers
+    mask = taptype == "PhaseTapChangerTabular"
+    if mask.any():
+        theta[mask] = _calc_theta_tabular_array(trafos[mask], tapside[mask])
+        k[mask] = _calc_k_tabular_array(trafos[mask])
+
+    mask = taptype == "InPhaseAndTabularPST"
+    if mask.any():
+        theta[mask] = _calc_theta_tabular_array(trafos[mask], tapside[mask])
+        k[mask] = _calc_k_tabular_in_phase_array(
+            trafos[mask], tapside[mask], tapside_rtc[mask]
+        )
+
+    mask = taptype == "PhaseTapChangerLinear"
+    if mask.any():
+        logging.warning(
+            "Found %s Transformer(s) with a PhaseTapChangerLinear.",
+            np.count_nonzero(mask),
+        )
+        logging.warning("\tElectrical Parameters may be inaccurate.")
+        theta[mask] = _calc_theta_linear_array(trafos[mask], tapside[mask])
+        k[mask] = _calc_k_tabular_array(trafos[mask])
+
+    mask = taptype == "PhaseTapChangerSymmetrical"
+    if mask.any():
+        theta[mask], k[mask] = _calc_theta_symmetrical_array(
+            trafos[mask], tapside[mask]
+        )
+
+    mask = taptype == "PhaseTapChangerAsymmetrical"
+    if mask.any():
+        theta[mask], k[mask] = _calc_theta_k_asymmetrical_array(
+            trafos[mask], tapside[mask]
+        )
+
+    mask = taptype == "InPhaseAndAsymPST"
+    if mask.any():
+        theta[mask], k[mask] = _calc_theta_k_asymmetrical_in_phase_array(
+            trafos[mask], tapside[mask], tapside_rtc[mask]
+        )
+
+    abstract = np.isin(taptype, ["PhaseTapChanger", "PhaseTapChangerNonLinear"])
+    for idx in np.flatnonzero(abstract):
+        logging.warning(
+            "Tapchanger type %s for transformer %s is an abstract class",
+            taptype[idx],
+            trafos["name1"].iloc[idx],
+        )
+
+    unknown = ~np.isin(taptype, _TAPCHANGER_TYPES) & ~abstract
+    for idx in np.flatnonzero(unknown):
+        logging.warning(
+            "Unknown tapchanger type %s for transformer %s",
+            taptype[idx],
+            trafos["name1"].iloc[idx],
+        )
+
+    return theta, k
+
+
+def calc_theta_k_3w_array(
+    trafos: pd.DataFrame, tapside, current_side
+) -> tuple[np.ndarray, np.ndarray]:
+    """Calculates theta and k for a winding of 3-winding transformers,
+    see `calc_theta_k_3w`.
+
+    Args:
+        trafos (pd.DataFrame): Transformer data, one row per transformer
+        tapside (array_like): Tap side per transformer
+        current_side (array_like): Current side per transformer
+
+    Returns:
+        tuple[np.ndarray, np.ndarray]: theta and k per transformer
+    """
+    count = trafos.shape[0]
+    tapside = np.broadcast_to(tapside, count)
+    on_tapside = tapside == np.broadcast_to(current_side, count)
+
+    # windings without a tapchanger
+    theta = np.zeros(count)
+    k = _calc_k_tabular_array(trafos)
+
+    # TODO: determine tapside_rtc
+    theta[on_tapside], k[on_tapside] = calc_theta_k_2w_array(
+        trafos[on_tapside], tapside[on_tapside], 0
+    )
+    return theta, k
+
+
+_TAPCHANGER_TYPES = [
+    "PhaseTapChangerTabular",
+    "InPhaseAndTabularPST",
+    "PhaseTapChangerLinear",
+    "PhaseTapChangerSymmetrical",
+    "PhaseTapChangerAsymmetrical",
+    "InPhaseAndAsymPST",
+]
+
+
+def _side_values(trafos: pd.DataFrame, column, side, suffix="", dtype=float):
+    """Values of `column` at the given side (1 or 2) of each transformer"""
+    return np.where(
+        side == 1,
+        trafos[f"{column}1{suffix}"].to_numpy(dtype=dtype),
+        trafos[f"{column}2{suffix}"].to_numpy(dtype=dtype),
+    )
+
+
+def _column(trafos: pd.DataFrame, column) -> np.ndarray:
+    return trafos[column].to_numpy(dtype=float)
+
+
+def unit_phasor_deg_array(angle_deg) -> np.ndarray:
+    angle_rad = np.asarray(angle_deg, dtype=float) * deg_to_rad
+    phasor = np.empty(angle_rad.shape, dtype=complex)
+    phasor.real = np.cos(angle_rad)
+    phasor.imag = np.sin(angle_rad)
+    return phasor
+
+
+def _calc_theta_tabular_array(trafos, tapside):
+    tc_angle1 = _column(trafos, "tcAngle1")
+    tc_angle2 = _column(trafos, "tcAngle2")
+
+    tc_angle = np.where(np.isnan(tc_angle1), tc_angle2, tc_angle1)
+    theta = tc_angle * deg_to_rad
+
+    return np.where(tapside == 2, -theta, theta)
+
+
+def _calc_theta_linear_array(trafos, tapside):
+    steps = _side_values(trafos, "neutralStep", tapside) - _side_values(
+        trafos, "step", tapside
+    )
+    shift_per_step = _side_values(trafos, "stepPhaseShift", tapside) * deg_to_rad
+    theta = steps * shift_per_step
+
+    return np.where(tapside == 1, -theta, theta)
+
+
+def _calc_theta_symmetrical_array(trafos, tapside):
+    steps = _side_values(trafos, "step", tapside) - _side_values(
+        trafos, "neutralStep", tapside
+    )
+    voltage_increment = _side_values(trafos, "stepVoltageIncrement", tapside)
+
+    w0 = (_column(trafos, "ratedU2") / _column(trafos, "nomU2")) / (
+        _column(trafos, "ratedU1") / _column(trafos, "nomU1")
+    )
+    w0 = 1 / w0
+
+    denominator_pst = 1 + ((voltage_increment / 100) * steps) * unit_phasor_deg_array(
+        np.full(steps.shape, 90)
+    )
+    t = w0 / denominator_pst
+
+    return -np.angle(t), np.abs(t)
+
+
+def _calc_theta_k_asymmetrical_array(trafos, tapside):
+    steps = _side_values(trafos, "step", tapside) - _side_values(
+        trafos, "neutralStep", tapside
+    )
+    voltage_increment = _side_values(trafos, "stepVoltageIncrement", tapside)
+    winding_connection_angle = _side_values(trafos, "windingConnectionAngle", tapside)
+
+    regulated_side2 = tapside == 2
+    steps = np.where(regulated_side2, -steps, steps)
+
+    theta, k = _calc_theta_k_generic_array(
+        trafos,
+        regulated_side2,
+        pst_step=steps,
+        pst_voltage_increment=voltage_increment,
+        winding_connection_angle=winding_connection_angle,
+    )
+    return -theta, 1 / k
+
+
+def _calc_theta_k_asymmetrical_in_phase_array(trafos, tapside_pst, tapside_rtc):
+    steps_pst = _side_values(trafos, "step", tapside_pst) - _side_values(
+        trafos, "neutralStep", tapside_pst
+    )
+    voltage_increment_pst = _side_values(trafos, "stepVoltageIncrement", tapside_pst)
+    winding_connection_angle = _side_values(
+        trafos, "windingConnectionAngle", tapside_pst
+    )
+
+    steps_rtc = _side_values(trafos, "step", tapside_rtc, "_rtc") - _side_values(
+        trafos, "neutralStep", tapside_rtc, "_rtc"
+    )
+    steps_rtc = np.where(tapside_rtc != tapside_pst, -steps_rtc, steps_rtc)
+    voltage_increment_rtc = _side_values(trafos, "stepSize", tapside_rtc)
+
+    theta, k = _calc_theta_k_generic_array(
+        trafos,
+        tapside_pst == 2,
+        pst_step=steps_pst,
+        pst_voltage_increment=voltage_increment_pst,
+        winding_connection_angle=winding_connection_angle,
+        rtc_step=steps_rtc,
+        rtc_voltage_increment=voltage_increment_rtc,
+    )
+    return -theta, 1 / k
+
+
+def _calc_theta_k_generic_array(
+    trafos,
+    regulated_side2,
+    pst_step,
+    pst_voltage_increment,
+    winding_connection_angle,
+    rtc_step=None,
+    rtc_voltage_increment=None,
+):
+    """See `calc_theta_k_generic`, the rated and nominal voltages of both sides
+    are swapped for transformers regulated on side 1."""
+    nom_u1 = _column(trafos, "nomU1")
+    nom_u2 = _column(trafos, "nomU2")
+    rated_u1 = _column(trafos, "ratedU1")
+    rated_u2 = _column(trafos, "ratedU2")
+
+    u_netz1 = np.where(regulated_side2, nom_u1, nom_u2)
+    u_netz2 = np.where(regulated_side2, nom_u2, nom_u1)
+    u_rated1 = np.where(regulated_side2, rated_u1, rated_u2)
+    u_rated2 = np.where(regulated_side2, rated_u2, rated_u1)
+
+    w0 = (u_rated2 / u_netz2) / (u_rated1 / u_netz1)
+    t = 1 / w0
+
+    # RTC
+    if rtc_step is not None:
+        denominator_rtc = 1 + (
+            (rtc_voltage_increment / 100) * rtc_step
+        ) * unit_phasor_deg_array(np.zeros(rtc_step.shape))
+        t = t / denominator_rtc
+
+    # PST
+    denominator_pst = 1 + (
+        (pst_voltage_increment / 100) * pst_step
+    ) * unit_phasor_deg_array(winding_connection_angle)
+    t = t / denominator_pst
+
+    return np.angle(t), np.abs(t)
+
+
+def _calc_k_tabular_array(trafos):
+    nominal_ratio_ = _column(trafos, "nomU1") / _column(trafos, "nomU2")
+
+    tc_ratio1 = _column(trafos, "tcRatio1")
+    tc_ratio2 = _column(trafos, "tcRatio2")
+    has_ratio1 = ~np.isnan(tc_ratio1)
+    has_ratio2 = ~has_ratio1 & ~np.isnan(tc_ratio2)
+
+    rated_u1_ = _column(trafos, "ratedU1")
+    rated_u2_ = _column(trafos, "ratedU2")
+    corr_u1_ = np.where(has_ratio1, rated_u1_ * tc_ratio1, rated_u1_)
+    corr_u2_ = np.where(has_ratio2, rated_u2_ * tc_ratio2, rated_u2_)
+
+    return (corr_u1_ / corr_u2_) / nominal_ratio_
+
+
+def _calc_k_tabular_in_phase_array(trafos, tapside, tapside_rtc):
+    ## RTC
+    steps_rtc = _side_values(trafos, "step", tapside_rtc, "_rtc") - _side_values(
+        trafos, "neutralStep", tapside_rtc, "_rtc"
+    )
+    voltage_increment_rtc = _side_values(trafos, "stepSize", tapside_rtc)
+
+    w0 = (_column(trafos, "ratedU2") / _column(trafos, "nomU2")) / (
+        _column(trafos, "ratedU1") / _column(trafos, "nomU1")
+    )
+    w0 = np.where(tapside == 1, 1 / w0, w0)
+
+    ### PST
+    tc_ratio1 = _column(trafos, "tcRatio1")
+    tc_ratio2 = _column(trafos, "tcRatio2")
+    tc_ratio = np.where(
+        ~np.isnan(tc_ratio1),
+        tc_ratio1,
+        np.where(~np.isnan(tc_ratio2), tc_ratio2, 1.0),
+    )
+
+    ### RTC
+    k_tap = w0 * (1 + (voltage_increment_rtc / 100 * steps_rtc))
+
+    ## COMBINED
+    return k_tap * tc_ratio
@@ -13,8 +13,9 @@
 # limitations under the License.
 
 import numpy as np
+import pandas as pd
 
-from .pst_tapchanger_calculation import calc_theta_k_3w
+from .pst_tapchanger_calculation import calc_theta_k_3w_array
 
 
 class TransformerProps:
@@ -66,52 +67,74 @@ class TransformerProps:
             "_term2": term2,
         }
 
-    def append_electric_props(
+    def set_electric_props(
         self,
-        trafo,
+        trafos: pd.DataFrame,
+        node_u: tuple[np.ndarray, ...],
+        trafo_u: tuple[np.ndarray, ...],
+    ):
+        """Sets the electric properties of all windings, ordered per transformer
+        like the windings added by `append_base_props`.
+
+        Each winding connects the auxiliary node (with the voltages of side 1)
+        to the node of its side.
+
+        Args:
+            trafos (pd.DataFrame): Transformer data, one row per transformer
+            node_u (tuple[np.ndarray, ...]): Nominal voltages of the nodes per side
+            trafo_u (tuple[np.ndarray, ...]): Rated voltages of the windings per side
+        """
+        props = {"r": [], "x": [], "g": [], "b": [], "k": [], "theta": []}
+        for winding in range(1, self.winding_count + 1):
+            for attr in ("r", "x", "g", "b"):
+                props[attr].append(trafos[f"{attr}{winding}"].to_numpy(dtype=float))
+
+            theta, k = self._calc_theta_k(
+                trafos,
+                winding,
+                node_u1=node_u[0],
+                node_u2=node_u[winding - 1],
+                trafo_u1=trafo_u[0],
+                trafo_u2=trafo_u[winding - 1],
+            )
+            props["k"].append(k)
+            props["theta"].append(theta)
+
+        # windings of the same transformer are consecutive
+        self.r, self.x, self.g, self.b, self.k, self.theta = (
+            np.stack(values, axis=1).ravel() for values in props.values()
+        )
+
+    def _calc_theta_k(
+        self,
+        trafos,
         winding,
         node_u1,
         node_u2,
         trafo_u1,
         trafo_u2,
-    ):
-        _r = trafo[f"r{winding}"]
-        _x = trafo[f"x{winding}"]
-        _g = trafo[f"g{winding}"]
-        _b = trafo[f"b{winding}"]
-
-        step = trafo[f"step{winding}"]
-        if np.isnan(step):
-            step = 0
-            neutral_step = 0
-            step_size_kv = 0
+    ) -> tuple[np.ndarray, np.ndarray]:
+        step = trafos[f"step{winding}"].to_numpy(dtype=float)
+        neutral_step = trafos[f"neutralStep{winding}"].to_numpy(dtype=float)
+        step_size = trafos[f"stepSize{winding}"].to_numpy(dtype=float)
 
-        else:
-            neutral_step = trafo[f"neutralStep{winding}"]
-            step_size = trafo[f"stepSize{winding}"]
-            if winding == 1:
-                step_size_kv = trafo_u1 * (step_size / 100)
-            elif winding == 2:
-                step_size_kv = trafo_u2 * (step_size / 100)
-            else:
-                step_size_kv = 0.0
-
-        u1_corr = trafo_u1
-        u2_corr = trafo_u2
         if winding == 1:
-            u1_corr += (step - neutral_step) * step_size_kv
+            step_size_kv = trafo_u1 * (step_size / 100)
         elif winding == 2:
-            u2_corr += (step - neutral_step) * step_size_kv
+            step_size_kv = trafo_u2 * (step_size / 100)
+        else:
+            step_size_kv = np.zeros(step.shape)
+
+        # windings without a tap changer
+        corr_u = np.where(np.isnan(step), 0.0, (step - neutral_step) * step_size_kv)
+
+        u1_corr = trafo_u1 + corr_u if winding == 1 else trafo_u1
+        u2_corr = trafo_u2 + corr_u if winding == 2 else trafo_u2
 
         nominal_ratio = node_u1 / node_u2
 
         _k = (u1_corr / u2_corr) / nominal_ratio
-
-        self.r.append(_r)
-        self.x.append(_x)
-        self.g.append(_g)
-        self.b.append(_b)
-        self.k.append(_k)
+        return np.zeros(_k.shape), _k
 
 
 class PstTransformerProps(TransformerProps):
@@ -119,27 +142,14 @@ class PstTransformerProps(TransformerProps):
         super().__init__(winding_count)
         self._type = "PST-" + str(winding_count) + "W"
 
-    def append_electric_props(
+    def _calc_theta_k(
         self,
-        trafo,
+        trafos,
         winding,
         node_u1,
         node_u2,
         trafo_u1,
         trafo_u2,
-    ):
-        _r = trafo[f"r{winding}"]
-        _x = trafo[f"x{winding}"]
-        _g = trafo[f"g{winding}"]
-        _b = trafo[f"b{winding}"]
-
-        tapside = 1 if isinstance(trafo["tapchanger1"], str) else 2
-        _theta, _k = calc_theta_k_3w(trafo, winding, tapside)
-
-        self.r.append(_r)
-        self.x.append(_x)
-        self.g.append(_g)
-        self.b.append(_b)
-
-        self.k.append(_k)
-        self.theta.append(_theta)
+    ) -> tuple[np.ndarray, np.ndarray]:
+        tapside = np.where(trafos["tapchanger1"].notna(), 1, 2)
+        return calc_theta_k_3w_array(trafos, winding, tapside)
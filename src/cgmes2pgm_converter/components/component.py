@@ -17,12 +17,15 @@ from abc import ABC, abstractmethod
 from collections import Counter
 
 import numpy as np
+import pandas as pd
 from power_grid_model import ComponentType
 
 from cgmes2pgm_converter.common import (
     AbstractCgmesIdMapping,
     CgmesDataset,
     ConverterOptions,
+    ResultDtypes,
+    Topology,
 )
 
 log = logging.debug
@@ -32,6 +35,25 @@ class AbstractPgmComponentBuilder(ABC):
     """Abstract class to build an PGM-Component from a CGMES dataset."""
 
     _extra_info: dict = {}
+    _topology: Topology | None = None
+
+    # Data dependencies on the existing PGM model: component types and keys of
+    # the shared extra info, see `reads`, `modifies` and `requires`.
+    _reads: frozenset[str] = frozenset()
+    _modifies: frozenset[str] = frozenset()
+    _requires: frozenset[str] = frozenset()
+
+    # Column types of the query results by query name, see `get_result_dtypes`
+    _result_dtypes: dict[str, ResultDtypes] = {}
+
+    # Names of the queries reading measurement values, see `measurement_queries`
+    _measurement_queries: frozenset[str] = frozenset()
+
+    # Names of the queries whose results are not modified, see `read_only_queries`
+    _read_only_queries: frozenset[str] = frozenset()
+
+    # Whether the builder evaluates the topology of the existing PGM model
+    _uses_topology: bool = False
 
     def __init__(
         self,
@@ -44,6 +66,60 @@ class AbstractPgmComponentBuilder(ABC):
         self._converter_options = converter_options
         self._data_type = data_type
         self._id_mapping = id_mapping
+        self._query_results: dict[str, pd.DataFrame] = {}
+
+    def get_queries(self) -> dict[str, str]:
+        """SPARQL queries required to build the component.
+
+        The queries only depend on the dataset and the converter options, so they
+        can be executed before any component is built. Builders that derive their
+        component from already existing PGM data do not need any queries.
+
+        Returns:
+            dict[str, str]: Formatted queries by a name that is unique within the builder
+        """
+        return {}
+
+    def get_result_dtypes(self, name: str) -> ResultDtypes | None:
+        """Column types of the result of the query with the given name.
+        Columns without a declared type are inferred while decoding the result.
+        """
+        return self._result_dtypes.get(name)
+
+    def measurement_queries(self) -> set[str]:
+        """Names of the queries in `get_queries` that read measurement values
+        (cim:AnalogValue.value). Their results change with every measurement
+        snapshot, while the results of all other queries only depend on the grid.
+        """
+        return set(self._measurement_queries)
+
+    def read_only_queries(self) -> set[str]:
+        """Names of the queries in `get_queries` whose results are only read by
+        the builder, so a result fetched in advance can be shared with other
+        builders instead of being copied.
+        """
+        return set(self._read_only_queries)
+
+    def set_query_results(self, query_results: dict[str, pd.DataFrame]):
+        """Provide the results of the queries returned by `get_queries`,
+        e.g. if they have been fetched in advance.
+
+        Args:
+            query_results (dict[str, pd.DataFrame]): Query results by query name
+        """
+        self._query_results = query_results
+
+    def _fetch_result(self, name: str) -> pd.DataFrame:
+        """Returns the result of the query with the given name.
+        Uses the result provided via `set_query_results` if available,
+        otherwise the query is executed.
+        """
+        result = self._query_results.pop(name, None)
+        if result is None:
+            result = self._source.query(
+                self.get_queries()[name], dtypes=self.get_result_dtypes(name)
+            )
+        return result
 
     @abstractmethod
     def build_from_cgmes(self, input_data: dict) -> tuple[np.ndarray, dict | None]:
@@ -69,9 +145,51 @@ class AbstractPgmComponentBuilder(ABC):
     def is_active(self) -> bool:
         return True
 
+    def reads(self) -> set[str]:
+        """Components and extra info keys of the existing PGM model that are read
+        in `build_from_cgmes`, including the components whose PGM IDs are resolved
+        via the id mapping.
+        """
+        return set(self._reads) | self.modifies()
+
+    def modifies(self) -> set[str]:
+        """Components and extra info keys of the existing PGM model that are
+        modified in place in `build_from_cgmes`.
+        """
+        return set(self._modifies)
+
+    def writes(self) -> set[str]:
+        """Components and extra info keys written by the builder:
+        the created component and everything modified in place.
+        """
+        return {self.component_name()} | self.modifies()
+
+    def requires(self) -> set[str]:
+        """Components or extra info keys without which the builder has nothing to do.
+        The builder is skipped if no active builder writes one of them.
+        """
+        return set(self._requires)
+
     def set_extra_info(self, extra_info: dict):
         self._extra_info = extra_info
 
+    def uses_topology(self) -> bool:
+        """Whether the builder evaluates the `Topology` of the components built
+        before. The converter provides its shared topology via `set_topology`.
+        """
+        return self._uses_topology
+
+    def set_topology(self, topology: Topology):
+        self._topology = topology
+
+    def _get_topology(self, input_data: dict) -> Topology:
+        """Returns the topology provided via `set_topology`,
+        otherwise it is built from the given input data.
+        """
+        if self._topology is None:
+            return Topology(input_data, self._extra_info)
+        return self._topology
+
     def _in_service(self):
         if self._source.cim_namespace == "http://iec.ch/TC57/CIM100#":
             return 'cim:Equipment.inService "true";'
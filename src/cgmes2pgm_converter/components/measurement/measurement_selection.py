@@ -0,0 +1,60 @@
+# Copyright [2025] [SOPTIM AG]
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import numpy as np
+
+
+def select_median_measurements(
+    groups: np.ndarray,
+    n_groups: int,
+    values: np.ndarray,
+    sigmas: np.ndarray,
+) -> tuple[np.ndarray, np.ndarray]:
+    """Selects one of the potentially many measurements per group, e.g. per terminal.
+
+    If a group has measurements with a sigma, the median by value of these is
+    selected, otherwise the median of all measurements. Missing values are sorted
+    last. For an even number of measurements the upper median is used, equal
+    values keep the order of the rows.
+
+    Args:
+        groups (np.ndarray): Group of each measurement in [0, n_groups)
+        n_groups (int): Number of groups
+        values (np.ndarray): Measured values, NaN if missing
+        sigmas (np.ndarray): Sigmas of the measurements, NaN if missing
+
+    Returns:
+        tuple[np.ndarray, np.ndarray]: Row of the selected measurement per group
+            (-1 if the group has no value) and whether its sigma can be used
+    """
+    has_value = np.bincount(groups[~np.isnan(values)], minlength=n_groups) > 0
+    has_sigma = np.bincount(groups[~np.isnan(sigmas)], minlength=n_groups) > 0
+    use_sigma = has_value & has_sigma
+
+    # groups with a sigma only consider measurements with a sigma
+    candidates = np.flatnonzero(
+        np.where(use_sigma[groups], ~np.isnan(sigmas), has_value[groups])
+    )
+
+    # sort by group, then value, keep the order of the rows for equal values
+    order = np.lexsort((candidates, values[candidates], groups[candidates]))
+    sorted_rows = candidates[order]
+
+    counts = np.bincount(groups[sorted_rows], minlength=n_groups)
+    starts = np.cumsum(counts) - counts
+
+    selected = np.full(n_groups, -1, dtype=np.intp)
+    found = counts > 0
+    selected[found] = sorted_rows[starts[found] + counts[found] // 2]
+    return selected, use_sigma
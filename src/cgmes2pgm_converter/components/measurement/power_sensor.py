@@ -19,12 +19,27 @@ import pandas as pd
 from power_grid_model import ComponentType, MeasuredTerminalType, initialize_array
 from power_grid_model_io.data_types import ExtraInfo
 
-from cgmes2pgm_converter.common import Profile, SymPowerType
+from cgmes2pgm_converter.common import (
+    SENSOR_COMPONENTS,
+    TOPOLOGY_COMPONENTS,
+    ComponentIdIndex,
+    Profile,
+    SymPowerType,
+)
 
 from ..component import AbstractPgmComponentBuilder
+from .measurement_selection import select_median_measurements
 
 log = logging.debug
 
+# Terminal types of measurements at appliances, checked in this order
+_APPLIANCE_TERMINAL_TYPES = {
+    ComponentType.sym_gen: MeasuredTerminalType.generator,
+    ComponentType.sym_load: MeasuredTerminalType.load,
+    ComponentType.source: MeasuredTerminalType.source,
+    ComponentType.shunt: MeasuredTerminalType.shunt,
+}
+
 
 class SymPowerBuilder(AbstractPgmComponentBuilder):
     """
@@ -34,6 +49,35 @@ class SymPowerBuilder(AbstractPgmComponentBuilder):
     interpreted as sigma.
     """
 
+    _reads = frozenset(TOPOLOGY_COMPONENTS) - frozenset(SENSOR_COMPONENTS)
+    _measurement_queries = frozenset({"active_power", "reactive_power"})
+    _result_dtypes = {
+        "active_power": {
+            "eq": "str",
+            "tn": "str",
+            "nomv": "float64",
+            "term": "str",
+            "value": "float64",
+            "sigma": "float64",
+            "acc": "float64",
+            "name": "str",
+            "meas": "str",
+            "pfi": "bool",
+        },
+        "reactive_power": {
+            "eq": "str",
+            "tn": "str",
+            "nomv": "float64",
+            "term": "str",
+            "value": "float64",
+            "sigma": "float64",
+            "acc": "float64",
+            "name": "str",
+            "meas": "str",
+            "pfi": "bool",
+        },
+    }
+
     _query_meas_in_graph = """
         SELECT
             ?eq
@@ -148,10 +192,7 @@ class SymPowerBuilder(AbstractPgmComponentBuilder):
     """
 
     def build_from_cgmes(self, input_data: dict) -> tuple[np.ndarray, dict | None]:
-        if self._source.split_profiles:
-            res = self._read_meas_from_graph()
-        else:
-            res = self._read_meas_from_default_graph()
+        res = self._read_meas()
 
         terminal_types = self.get_terminal_types(res, input_data)
         res = res[terminal_types != -1]
@@ -171,10 +212,7 @@ class SymPowerBuilder(AbstractPgmComponentBuilder):
         # transformers). Such replacement objects are identified by an additional
         # terminal IRI. Here, we pass on both the equipment and the terminal IRIs and let
         # the ID mapper look up the correct PGM ID.
-        arr["measured_object"] = [
-            self._id_mapping.get_pgm_id(eq, term)
-            for eq, term in zip(res["eq"], res["term"])
-        ]
+        arr["measured_object"] = self._id_mapping.get_pgm_ids(res["eq"], res["term"])
         arr["measured_terminal_type"] = terminal_types
         arr["p_measured"] = res["p"]
         arr["q_measured"] = res["q"]
@@ -216,7 +254,12 @@ class SymPowerBuilder(AbstractPgmComponentBuilder):
 
         return arr, extra_info
 
-    def _read_meas_from_graph(self):
+    def get_queries(self) -> dict[str, str]:
+        if self._source.split_profiles:
+            return self._build_queries_for_graph()
+        return self._build_queries_for_default_graph()
+
+    def _build_queries_for_graph(self) -> dict[str, str]:
         args = {
             "$TOPO_ISLAND": self._at_topo_island_node_graph("?_tn"),
             "$MEASUREMENT_TYPE": '"ThreePhaseActivePower"',
@@ -234,9 +277,9 @@ class SymPowerBuilder(AbstractPgmComponentBuilder):
         args["$MEASUREMENT_TYPE"] = '"ThreePhaseReactivePower"'
         q_q = self._replace(self._query_meas_in_graph, args)
 
-        return self._read_meas_from_query(q_p, q_q)
+        return {"active_power": q_p, "reactive_power": q_q}
 
-    def _read_meas_from_default_graph(self):
+    def _build_queries_for_default_graph(self) -> dict[str, str]:
         args = {
             "$TOPO_ISLAND": self._at_topo_island_node("?tn"),
             "$MEASUREMENT_TYPE": '"ThreePhaseActivePower"',
@@ -248,93 +291,75 @@ class SymPowerBuilder(AbstractPgmComponentBuilder):
         args["$MEASUREMENT_TYPE"] = '"ThreePhaseReactivePower"'
         q_q = self._replace(self._query_meas_in_default, args)
 
-        return self._read_meas_from_query(q_p, q_q)
+        return {"active_power": q_p, "reactive_power": q_q}
 
-    def _read_meas_from_query(self, q_p, q_q):
+    def _read_meas(self):
         # # Read active power measurements
-        res_p = self._source.query(q_p)
+        res_p = self._fetch_result("active_power")
 
         # Invert Measurement if "positiveFlowIn" is set to true
         res_p["value"] = res_p["value"].where(~res_p["pfi"], res_p["value"] * -1)
 
         # Read reactive power measurements
-        res_q = self._source.query(q_q)
+        res_q = self._fetch_result("reactive_power")
 
         # Invert Measurement if "positiveFlowIn" is set to true
         res_q["value"] = res_q["value"].where(~res_q["pfi"], res_q["value"] * -1)
 
-        meas_by_term = {}
-        self._join_measurements_by_terminal(
-            res_p, meas_by_term, "ThreePhaseActivePower"
-        )
-        self._join_measurements_by_terminal(
-            res_q, meas_by_term, "ThreePhaseReactivePower"
-        )
+        meas = pd.concat([res_p, res_q], ignore_index=True)
+        is_p = np.arange(meas.shape[0]) < res_p.shape[0]
 
-        p = []
-        q = []
-        p_sigma = []
-        q_sigma = []
-        p_meas = []
-        p_name = []
-        meas_type = []
+        # one row per terminal in the order of their first measurement
+        term_codes, terms = pd.factorize(meas["term"], use_na_sentinel=False)
+        first_rows = np.unique(term_codes, return_index=True)[1]
+        self._check_unique_per_terminal(meas, term_codes, first_rows)
+        n_terms = len(terms)
 
         # get one p- and q-measurement per terminal for the potentially many available
-        for val in meas_by_term.values():
-            meas_p = val.get("ThreePhaseActivePower")
-            meas_q = val.get("ThreePhaseReactivePower")
-
-            if meas_p is None and meas_q is None:
-                continue
-
-            p_m, p_s, p_n, p_mm, p_is_default = self._get_one_measurement_and_sigma(
-                meas_p, val["nomv"]
-            )
-
-            q_m, q_s, q_n, q_mm, q_is_default = self._get_one_measurement_and_sigma(
-                meas_q, val["nomv"]
-            )
-
-            p.append(p_m)
-            p_sigma.append(p_s)
+        groups = 2 * term_codes + (~is_p).astype(np.intp)
+        selected, use_sigma = select_median_measurements(
+            groups,
+            2 * n_terms,
+            meas["value"].to_numpy(dtype=float),
+            meas["sigma"].to_numpy(dtype=float),
+        )
 
-            q.append(q_m)
-            q_sigma.append(q_s)
+        # terminals without a p- or q-measurement get a default value and sigma
+        nomv = meas["nomv"].to_numpy(dtype=float)[first_rows]
+        substitution = self._converter_options.measurement_substitution
+        default_sigma = substitution.default_sigma_pq.get_sigma_pq_array(nomv)
 
-            if p_n is not None:
-                p_name.append(p_n)
-            else:
-                p_name.append(q_n)
+        p_selected, q_selected = selected[0::2], selected[1::2]
+        p_is_default = p_selected == -1
+        q_is_default = q_selected == -1
 
-            if p_mm is not None:
-                p_meas.append(p_mm)
-            else:
-                p_meas.append(q_mm)
+        if np.any(p_is_default & q_is_default):
+            # This should not happen here. Terminals without any power measurements
+            # are handled in power_sensor_from_branch.py
+            raise RuntimeError("Unexpected: Both P and Q are default values.")
 
-            if p_is_default and q_is_default:
-                # This should not happen here. Terminals without any power measurements
-                # are handled in power_sensor_from_branch.py
-                raise RuntimeError("Unexpected: Both P and Q are default values.")
+        p, p_sigma = self._selected_values(
+            meas, p_selected, use_sigma[0::2], default_sigma
+        )
+        q, q_sigma = self._selected_values(
+            meas, q_selected, use_sigma[1::2], default_sigma
+        )
 
-            if p_is_default:
-                meas_type.append(SymPowerType.P_ZERO)
-            elif q_is_default:
-                meas_type.append(SymPowerType.Q_ZERO)
-            else:
-                meas_type.append(SymPowerType.FIELD)
+        # name and iri of the sensor are taken from p, if available
+        name_row = np.where(p_is_default, q_selected, p_selected)
 
-        # Because of I-measurements there might be more terminals than needed for P/Q-measurements.
-        # Filter out terminals with only I-measurements
-        term, eq, tn = self._get_valid_values(meas_by_term)
+        meas_type = np.full(n_terms, SymPowerType.FIELD, dtype=object)
+        meas_type[q_is_default] = SymPowerType.Q_ZERO
+        meas_type[p_is_default] = SymPowerType.P_ZERO
 
         res_data = {
-            "term": term,
-            "eq": eq,
-            "tn": tn,
+            "term": meas["term"].to_numpy()[first_rows],
+            "eq": meas["eq"].to_numpy()[first_rows],
+            "tn": meas["tn"].to_numpy()[first_rows],
             "p": p,
             "q": q,
-            "meas_p": p_meas,
-            "name_p": p_name,
+            "meas_p": meas["meas"].to_numpy()[name_row],
+            "name_p": meas["name"].to_numpy()[name_row],
             "sigma_p": p_sigma,
             "sigma_q": q_sigma,
             "meas_type": meas_type,
@@ -343,27 +368,35 @@ class SymPowerBuilder(AbstractPgmComponentBuilder):
 
         return res
 
-    def _get_valid_values(self, meas_by_term):
-        term = []
-        eq = []
-        tn = []
-        for key, val in meas_by_term.items():
-            if self._is_valid_value(val):
-                term.append(key)
-                eq.append(val["eq"])
-                tn.append(val["tn"])
-
-        return term, eq, tn
-
-    def _get_valid_values_for_key(self, meas_by_term, key):
-        return [val[key] for val in meas_by_term.values() if self._is_valid_value(val)]
-
-    def _is_valid_value(self, val):
-        """A value is not valid if only the current measurement is available."""
-        return (
-            val.get("ThreePhaseActivePower") is not None
-            or val.get("ThreePhaseReactivePower") is not None
-        )
+    def _check_unique_per_terminal(
+        self, meas: pd.DataFrame, term_codes: np.ndarray, first_rows: np.ndarray
+    ):
+        """All measurements of a terminal have to share equipment, node and voltage"""
+        for key in ("eq", "tn", "nomv"):
+            values = meas[key].to_numpy()
+            expected = values[first_rows][term_codes]
+            differs = (values != expected) & ~(pd.isna(values) & pd.isna(expected))
+            if np.any(differs):
+                idx = np.flatnonzero(differs)[0]
+                raise ValueError(
+                    f"Key {key} already set to {expected[idx]}, cannot set to {values[idx]}"
+                )
+
+    def _selected_values(
+        self,
+        meas: pd.DataFrame,
+        selected: np.ndarray,
+        use_sigma: np.ndarray,
+        default_sigma: np.ndarray,
+    ) -> tuple[np.ndarray, np.ndarray]:
+        """Value and sigma of the selected measurements, defaults if none is selected"""
+        is_selected = selected != -1
+        values = meas["value"].to_numpy(dtype=float)[selected]
+        sigmas = meas["sigma"].to_numpy(dtype=float)[selected]
+
+        value = np.where(is_selected, values, 0.0)
+        sigma = np.where(is_selected & use_sigma, sigmas, default_sigma)
+        return value, sigma
 
     def _build_sensors_for_replaced_lines(
         self, arr, input_data: dict, extra_info: ExtraInfo
@@ -496,193 +529,69 @@ class SymPowerBuilder(AbstractPgmComponentBuilder):
         self, res: pd.DataFrame, input_data: dict[ComponentType, np.ndarray]
     ) -> np.ndarray:
         # eq may not be in id_mapping
+        known = np.fromiter(
+            (eq in self._id_mapping for eq in res["eq"]), dtype=bool, count=len(res)
+        )
         eq_ids = -np.ones(res.shape[0], dtype=int)
-        for i, (eq, term) in enumerate(zip(res["eq"], res["term"])):
-            if eq in self._id_mapping:
-                eq_ids[i] = self._id_mapping.get_pgm_id(eq, term)
-            else:
-                eq_ids[i] = -1
+        eq_ids[known] = self._id_mapping.get_pgm_ids(
+            res["eq"][known], res["term"][known]
+        )
+        meas_nodes = self._id_mapping.get_pgm_ids(res["tn"])
+
+        # checked in this order, links only if they are converted to short lines
+        component_types = [
+            *_APPLIANCE_TERMINAL_TYPES,
+            ComponentType.line,
+            ComponentType.link,
+            ComponentType.generic_branch,
+            ComponentType.transformer,
+            ComponentType.three_winding_transformer,
+        ]
+        if not self._converter_options.link_as_short_line.enable:
+            component_types.remove(ComponentType.link)
 
-        terminal_types = -np.ones(len(eq_ids), dtype=int)
+        index = ComponentIdIndex(input_data, component_types)
+        type_positions, rows = index.lookup(eq_ids)
 
-        for i, eq_id in enumerate(eq_ids):
-            meas_node = self._id_mapping.get_pgm_id(res["tn"].iloc[i])
-
-            if eq_id in input_data[ComponentType.sym_gen]["id"]:
-                terminal_types[i] = MeasuredTerminalType.generator
-            elif eq_id in input_data[ComponentType.sym_load]["id"]:
-                terminal_types[i] = MeasuredTerminalType.load
-            elif eq_id in input_data[ComponentType.source]["id"]:
-                terminal_types[i] = MeasuredTerminalType.source
-            elif eq_id in input_data[ComponentType.shunt]["id"]:
-                terminal_types[i] = MeasuredTerminalType.shunt
-            elif eq_id in input_data[ComponentType.line]["id"]:
-                node_from = input_data[ComponentType.line]["from_node"][
-                    input_data[ComponentType.line]["id"] == eq_id
-                ]
-                node_to = input_data[ComponentType.line]["to_node"][
-                    input_data[ComponentType.line]["id"] == eq_id
-                ]
-
-                if meas_node == node_from:
-                    terminal_types[i] = MeasuredTerminalType.branch_from
-                elif meas_node == node_to:
-                    terminal_types[i] = MeasuredTerminalType.branch_to
-
-            elif (
-                eq_id in input_data[ComponentType.link]["id"]
-                and self._converter_options.link_as_short_line.enable
-            ):
-                node_from = input_data[ComponentType.link]["from_node"][
-                    input_data[ComponentType.link]["id"] == eq_id
-                ]
-                node_to = input_data[ComponentType.link]["to_node"][
-                    input_data[ComponentType.link]["id"] == eq_id
-                ]
-
-                if meas_node == node_from:
-                    terminal_types[i] = MeasuredTerminalType.branch_from
-                elif meas_node == node_to:
-                    terminal_types[i] = MeasuredTerminalType.branch_to
-
-            elif eq_id in input_data[ComponentType.generic_branch]["id"]:
-                node_from = input_data[ComponentType.generic_branch]["from_node"][
-                    input_data[ComponentType.generic_branch]["id"] == eq_id
-                ]
-                node_to = input_data[ComponentType.generic_branch]["to_node"][
-                    input_data[ComponentType.generic_branch]["id"] == eq_id
-                ]
-
-                if meas_node == node_from:
-                    terminal_types[i] = MeasuredTerminalType.branch_from
-                elif meas_node == node_to:
-                    terminal_types[i] = MeasuredTerminalType.branch_to
-
-            elif eq_id in input_data[ComponentType.transformer]["id"]:
-                node_from = input_data[ComponentType.transformer]["from_node"][
-                    input_data[ComponentType.transformer]["id"] == eq_id
-                ]
-                node_to = input_data[ComponentType.transformer]["to_node"][
-                    input_data[ComponentType.transformer]["id"] == eq_id
-                ]
-
-                if meas_node == node_from:
-                    terminal_types[i] = MeasuredTerminalType.branch_from
-                elif meas_node == node_to:
-                    terminal_types[i] = MeasuredTerminalType.branch_to
-
-            elif eq_id in input_data[ComponentType.three_winding_transformer]["id"]:
-                node_1 = input_data[ComponentType.three_winding_transformer]["node_1"][
-                    input_data[ComponentType.three_winding_transformer]["id"] == eq_id
-                ]
-                node_2 = input_data[ComponentType.three_winding_transformer]["node_2"][
-                    input_data[ComponentType.three_winding_transformer]["id"] == eq_id
-                ]
-                node_3 = input_data[ComponentType.three_winding_transformer]["node_3"][
-                    input_data[ComponentType.three_winding_transformer]["id"] == eq_id
-                ]
-
-                if meas_node == node_1:
-                    terminal_types[i] = MeasuredTerminalType.branch3_1
-                elif meas_node == node_2:
-                    terminal_types[i] = MeasuredTerminalType.branch3_2
-                elif meas_node == node_3:
-                    terminal_types[i] = MeasuredTerminalType.branch3_3
+        terminal_types = -np.ones(len(eq_ids), dtype=int)
+        for type_position, component_type in enumerate(component_types):
+            found = type_positions == type_position
+            if not found.any():
+                continue
 
+            components = input_data[component_type][rows[found]]
+            nodes = meas_nodes[found]
+
+            if component_type in _APPLIANCE_TERMINAL_TYPES:
+                terminal_types[found] = _APPLIANCE_TERMINAL_TYPES[component_type]
+            elif component_type == ComponentType.three_winding_transformer:
+                terminal_types[found] = np.select(
+                    [
+                        nodes == components["node_1"],
+                        nodes == components["node_2"],
+                        nodes == components["node_3"],
+                    ],
+                    [
+                        MeasuredTerminalType.branch3_1,
+                        MeasuredTerminalType.branch3_2,
+                        MeasuredTerminalType.branch3_3,
+                    ],
+                    default=-1,
+                )
             else:
-                terminal_types[i] = -1
+                terminal_types[found] = np.select(
+                    [
+                        nodes == components["from_node"],
+                        nodes == components["to_node"],
+                    ],
+                    [
+                        MeasuredTerminalType.branch_from,
+                        MeasuredTerminalType.branch_to,
+                    ],
+                    default=-1,
+                )
 
         return terminal_types
 
     def component_name(self) -> ComponentType:
         return ComponentType.sym_power_sensor
-
-    def _get_one_measurement_and_sigma(
-        self, meas_pq, nomv
-    ) -> tuple[float | None, float | None, str | None, str | None, bool]:
-        has_sigma = (
-            any(not np.isnan(m["sigma"]) for m in meas_pq)
-            if meas_pq is not None
-            else False
-        )
-        has_value = (
-            any(not np.isnan(m["value"]) for m in meas_pq)
-            if meas_pq is not None
-            else False
-        )
-
-        value = None
-        sigma = None
-        name = None
-        meas = None
-        is_default = False
-
-        if has_sigma and has_value:
-            # remove measurements that have no sigma
-            meas_filtered = [v for v in meas_pq if not np.isnan(v["sigma"])]
-
-            # get median value if the available measurements
-            meas_val = self._get_median_value(meas_filtered, "value")
-
-            value = meas_val["value"]
-            sigma = meas_val["sigma"]
-            name = meas_val["name"]
-            meas = meas_val["meas"]
-        elif has_value:
-            # there is no sigma -> get median value and use default sigma
-            meas_val = self._get_median_value(meas_pq, "value")
-
-            value = meas_val["value"]
-            sigma = self._converter_options.measurement_substitution.default_sigma_pq.get_sigma_pq(
-                nomv
-            )
-            name = meas_val["name"]
-            meas = meas_val["meas"]
-        else:
-            # there is no value (e.g. only Q but no P) -> use default value and sigma
-            value = 0.0
-            sigma = self._converter_options.measurement_substitution.default_sigma_pq.get_sigma_pq(
-                nomv
-            )
-            is_default = True
-
-        return value, sigma, name, meas, is_default
-
-    def _get_median_value(self, arr: list[dict], key: str):
-        arr.sort(key=lambda x: x[key])
-        ll = len(arr)
-        return arr[ll // 2]
-
-    def _join_measurements_by_terminal(
-        self, res_p, meas_by_term: dict, measurement_type: str
-    ):
-        for idx in range(res_p.shape[0]):
-            term = res_p["term"][idx]
-            val = meas_by_term.setdefault(term, {})
-            self.set(val, "eq", res_p["eq"][idx])
-            self.set(val, "tn", res_p["tn"][idx])
-            self.set(val, "nomv", res_p["nomv"][idx])
-            self.append(
-                val,
-                measurement_type,
-                {
-                    "name": res_p["name"][idx],
-                    "meas": res_p["meas"][idx],
-                    "value": res_p["value"][idx],
-                    "sigma": res_p["sigma"][idx],
-                },
-            )
-
-    def set(self, dic, key, val):
-        old_val = dic.get(key)
-        if old_val is None:
-            dic[key] = val
-        elif old_val != val:
-            raise ValueError(f"Key {key} already set to {old_val}, cannot set to {val}")
-
-    def append(self, dic, key, val):
-        old_val = dic.get(key)
-        if old_val is None:
-            dic[key] = [val]
-        else:
-            dic[key].append(val)
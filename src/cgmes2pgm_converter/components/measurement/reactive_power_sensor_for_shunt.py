@@ -21,6 +21,10 @@ from ..component import AbstractPgmComponentBuilder
 
 
 class ReactivePowerForShuntBuilder(AbstractPgmComponentBuilder):
+    _reads = frozenset({ComponentType.shunt, ComponentType.sym_power_sensor})
+    _requires = frozenset({ComponentType.shunt})
+    _measurement_queries = frozenset({"shunt_currents"})
+
     def is_active(self):
         return (
             self._converter_options.measurement_substitution.imeas_used_for_qcalc.enable
@@ -145,10 +149,7 @@ class ReactivePowerForShuntBuilder(AbstractPgmComponentBuilder):
             if shunt_id not in measured_objects_dict:
                 shunt_without_q_meas.append(shunt_id)
 
-        if self._source.split_profiles:
-            res_orig = self._read_meas_from_named_graph()
-        else:
-            res_orig = self._read_meas_from_default_graph()
+        res_orig = self._fetch_result("shunt_currents")
 
         # Determine median value of measured u
         agg_dict = {
@@ -162,9 +163,7 @@ class ReactivePowerForShuntBuilder(AbstractPgmComponentBuilder):
         res = res_orig.groupby("eq").agg(agg_dict).reset_index()
 
         # get the pgm_id for the shunts with i meas
-        shunt_pgm_with_i_meas = [
-            self._id_mapping.get_pgm_id(uuid) for uuid in res["eq"]
-        ]
+        shunt_pgm_with_i_meas = self._id_mapping.get_pgm_ids(res["eq"])
 
         # determine the intersection of shunts with I but without Q measurement
         shunt_with_i_without_q_meas = list(
@@ -213,24 +212,20 @@ class ReactivePowerForShuntBuilder(AbstractPgmComponentBuilder):
             arr["power_sigma"] = arr["q_sigma"]
         return arr, None
 
-    def _read_meas_from_default_graph(self):
-        args = {
-            "$IN_SERVICE": self._in_service(),
-            "$TOPO_ISLAND": self._at_topo_island_node("?tn"),
-        }
-        q = self._replace(self._query_meas_in_default, args)
-        res = self._source.query(q)
-        return res
+    def get_queries(self) -> dict[str, str]:
+        if self._source.split_profiles:
+            args = {
+                "$IN_SERVICE": self._in_service(),
+                "$TOPO_ISLAND": self._at_topo_island_node_graph("?tn"),
+                "$SV_GRAPH": self._source.named_graphs.format_for_query(Profile.SV),
+            }
+            return {"shunt_currents": self._replace(self._query_meas_in_graph, args)}
 
-    def _read_meas_from_named_graph(self):
         args = {
             "$IN_SERVICE": self._in_service(),
-            "$TOPO_ISLAND": self._at_topo_island_node_graph("?tn"),
-            "$SV_GRAPH": self._source.named_graphs.format_for_query(Profile.SV),
+            "$TOPO_ISLAND": self._at_topo_island_node("?tn"),
         }
-        q = self._replace(self._query_meas_in_graph, args)
-        res = self._source.query(q)
-        return res
+        return {"shunt_currents": self._replace(self._query_meas_in_default, args)}
 
     def component_name(self) -> ComponentType:
         return ComponentType.sym_power_sensor
@@ -15,15 +15,24 @@
 import numpy as np
 from power_grid_model import ComponentType, LoadGenType, initialize_array
 
-from cgmes2pgm_converter.common import NodeType, Topology
+from cgmes2pgm_converter.common import TOPOLOGY_COMPONENTS, NodeType
 
 from ...component import AbstractPgmComponentBuilder
 
+# Extra info type of the appliances created for passive nodes
+PASSIVE_NODE_APPLIANCE = "SymLoadOrGenPassiveNode"
+
 
 class SymLoadOrGenForPassiveNodeBuilder(AbstractPgmComponentBuilder):
+    _reads = frozenset({*TOPOLOGY_COMPONENTS, "_type"})
+    _uses_topology = True
+
     def is_active(self):
         return self._converter_options.measurement_substitution.passive_nodes.enable
 
+    def writes(self) -> set[str]:
+        return super().writes() | {PASSIVE_NODE_APPLIANCE}
+
     def component_name(self) -> ComponentType:
         if (
             self._converter_options.measurement_substitution.passive_nodes.appliance_type
@@ -34,16 +43,23 @@ class SymLoadOrGenForPassiveNodeBuilder(AbstractPgmComponentBuilder):
 
     def build_from_cgmes(self, input_data: dict) -> tuple[np.ndarray, dict | None]:
         # find passive nodes
-        topo = Topology(input_data, self._extra_info)
-        nodes = [
-            n
-            for n in topo.get_topology().values()
-            if n.get(ComponentType.node) is not None
-        ]
-        passive_nodes = [n for n in nodes if self._is_passive_node(n)]
+        index = self._get_topology(input_data).get_index()
+        node_ids = index.node_ids
+        is_aux_node = np.array(
+            [
+                self._extra_info.get(node_id, {}).get("_type") == NodeType.AUX_NODE
+                for node_id in node_ids.tolist()
+            ],
+            dtype=bool,
+        )
+
+        # A passive node is not an AuxNode, has no appliances, but is connected with branches
+        is_passive = (
+            (index.appliance_count() == 0) & (index.branch_degree() > 0) & ~is_aux_node
+        )
+        passive_node_ids = node_ids[is_passive]
 
         # create new IDs and names for the sym_loads or sym_gens
-        passive_node_ids = [x[ComponentType.node]["id"] for x in passive_nodes]
         load_or_gen_iris = [
             self._id_mapping.get_cgmes_iri(x) + "_PASS" for x in passive_node_ids
         ]
@@ -57,7 +73,7 @@ class SymLoadOrGenForPassiveNodeBuilder(AbstractPgmComponentBuilder):
 
         # create array with generation
         arr = initialize_array(
-            self._data_type, self.component_name(), len(passive_nodes)
+            self._data_type, self.component_name(), len(passive_node_ids)
         )
         arr["id"] = self._id_mapping.add_cgmes_iris(load_or_gen_iris, load_or_gen_names)
         arr["node"] = passive_node_ids
@@ -67,24 +83,10 @@ class SymLoadOrGenForPassiveNodeBuilder(AbstractPgmComponentBuilder):
         arr["p_specified"] = 0.0
         arr["q_specified"] = 0.0
 
-        extra_info = self._create_extra_info_with_type(arr, "SymLoadOrGenPassiveNode")
+        extra_info = self._create_extra_info_with_type(arr, PASSIVE_NODE_APPLIANCE)
 
         return arr, extra_info
 
-    def _is_passive_node(self, node):
-        appliances = [
-            ComponentType.sym_gen,
-            ComponentType.source,
-            ComponentType.sym_load,
-            ComponentType.shunt,
-        ]
-        has_no_appliances = all(node.get(appliance) is None for appliance in appliances)
-        has_branches = node.get("_branches") is not None
-        is_not_aux_node = node.get("_extra").get("_type") != NodeType.AUX_NODE
-
-        # A passive node is not an AuxNode, has no appliances, but is connected with branches
-        return has_no_appliances and has_branches and is_not_aux_node
-
     def get_type(self) -> str:
         appliance_type = self._converter_options.measurement_substitution.passive_nodes.appliance_type
         return " Gen P" if appliance_type == ComponentType.sym_gen else " Load P"
@@ -36,6 +36,17 @@ class SymPowerSensorIncompleteBranch(AbstractPgmComponentBuilder):
     with a values of zero and a large sigma.
     """
 
+    _reads = frozenset(
+        {
+            ComponentType.line,
+            ComponentType.generic_branch,
+            ComponentType.sym_power_sensor,
+            "_type",
+            "source1",
+            "source2",
+        }
+    )
+
     def __init__(
         self,
         cgmes_source: CgmesDataset,
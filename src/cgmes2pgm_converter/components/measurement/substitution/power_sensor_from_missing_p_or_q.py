@@ -19,11 +19,11 @@ from power_grid_model import ComponentType, MeasuredTerminalType, initialize_arr
 
 from cgmes2pgm_converter.common import (
     COMPONENT_TYPE,
+    TOPOLOGY_COMPONENTS,
     AbstractCgmesIdMapping,
     CgmesDataset,
     ConverterOptions,
     SymPowerType,
-    Topology,
 )
 
 from ...component import AbstractPgmComponentBuilder
@@ -42,6 +42,10 @@ class SymPowerSensorIncompleteAppliance(AbstractPgmComponentBuilder):
     These values correspond to the ssh values
     """
 
+    _reads = frozenset({*TOPOLOGY_COMPONENTS, "_type"})
+    _modifies = frozenset({ComponentType.sym_power_sensor, "_type"})
+    _uses_topology = True
+
     def __init__(
         self,
         cgmes_source: CgmesDataset,
@@ -78,7 +82,7 @@ class SymPowerSensorIncompleteAppliance(AbstractPgmComponentBuilder):
         and try to determine a better value by looking at the appliances in the neighborhood.
         """
 
-        self._topo = Topology(input_data, self._extra_info)
+        self._topo = self._get_topology(input_data)
 
         sensors = input_data[ComponentType.sym_power_sensor]
         by_id = {s["id"]: s for s in sensors}
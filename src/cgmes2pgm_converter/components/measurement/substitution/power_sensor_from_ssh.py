@@ -30,6 +30,15 @@ class SymPowerFromSshBuilder(AbstractPgmComponentBuilder):
     These values correspond to the ssh values
     """
 
+    _reads = frozenset(
+        {
+            ComponentType.sym_gen,
+            ComponentType.sym_load,
+            ComponentType.sym_power_sensor,
+            "_type",
+        }
+    )
+
     def is_active(self) -> bool:
         return self._converter_options.measurement_substitution.use_ssh.enable
 
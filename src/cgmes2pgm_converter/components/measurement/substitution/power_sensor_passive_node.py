@@ -18,9 +18,13 @@ from power_grid_model import ComponentType, MeasuredTerminalType, initialize_arr
 from cgmes2pgm_converter.common import SymPowerType
 
 from ...component import AbstractPgmComponentBuilder
+from .appliance_passive_node import PASSIVE_NODE_APPLIANCE
 
 
 class SymPowerForPassiveNodeBuilder(AbstractPgmComponentBuilder):
+    _reads = frozenset({"_type", PASSIVE_NODE_APPLIANCE})
+    _requires = frozenset({PASSIVE_NODE_APPLIANCE})
+
     def is_active(self):
         return self._converter_options.measurement_substitution.passive_nodes.enable
 
@@ -31,7 +35,7 @@ class SymPowerForPassiveNodeBuilder(AbstractPgmComponentBuilder):
         # find ids of sym_gens of the passive nodes
         appliance_ids = []
         for gen_id, info in self._extra_info.items():
-            if info.get("_type") == "SymLoadOrGenPassiveNode":
+            if info.get("_type") == PASSIVE_NODE_APPLIANCE:
                 appliance_ids.append(gen_id)
 
         # create new IDs and names for the sensors
@@ -30,28 +30,28 @@ class VoltageSensorList:
     def __init__(self, use_nominal_voltages: UMeasurementSubstitutionOptions):
         self.id = []
         self.measured_object = []
-        self.u_measured = []
-        self.sigma = []
+        self.u_rated = []
         self.use_nominal_voltages = use_nominal_voltages
 
     def to_input_data(self):
         arr = initialize_array("input", ComponentType.sym_voltage_sensor, len(self.id))
         arr["id"] = self.id
         arr["measured_object"] = self.measured_object
-        arr["u_measured"] = self.u_measured
-        arr["u_sigma"] = self.sigma
+        arr["u_measured"], arr["u_sigma"] = self.use_nominal_voltages.map_v_array(
+            self.u_rated
+        )
 
         return arr
 
     def append(self, sensor_id, measured_object, u_rated):
         self.id.append(sensor_id)
         self.measured_object.append(measured_object)
-        meas_v, sigma = self.use_nominal_voltages.map_v(u_rated)
-        self.u_measured.append(meas_v)
-        self.sigma.append(sigma)
+        self.u_rated.append(u_rated)
 
 
 class SymVoltageFromNominalVoltageBuilder(AbstractPgmComponentBuilder):
+    _reads = frozenset({ComponentType.node, ComponentType.sym_voltage_sensor, "_type"})
+
     def is_active(self) -> bool:
         return (
             self._converter_options.measurement_substitution.use_nominal_voltages.enable
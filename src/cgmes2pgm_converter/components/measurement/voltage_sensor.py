@@ -27,9 +27,25 @@ from cgmes2pgm_converter.common import (
 )
 
 from ..component import AbstractPgmComponentBuilder
+from .measurement_selection import select_median_measurements
 
 
 class SymVoltageBuilder(AbstractPgmComponentBuilder):
+    _reads = frozenset({ComponentType.node})
+    _measurement_queries = frozenset({"voltages"})
+    _result_dtypes = {
+        "voltages": {
+            "tn": "str",
+            "term": "str",
+            "u": "float64",
+            "nom_u": "float64",
+            "acc_u": "float64",
+            "sigma_u": "float64",
+            "name": "str",
+            "meas_u": "str",
+        },
+    }
+
     _query_meas_in_graph = """
         SELECT ?tn ?term ?u ?nom_u ?acc_u ?sigma_u ?name ?meas_u
         WHERE {
@@ -81,8 +97,6 @@ class SymVoltageBuilder(AbstractPgmComponentBuilder):
             OPTIONAL { ?measVal_v cim:MeasurementValue.sensorAccuracy ?acc_u. }
             OPTIONAL { ?measVal_v cim:MeasurementValue.sensorSigma ?sigma_u. }
 
-            VALUES ?type_u { "Voltage" "LineToLineVoltage" }
-
             ?term cim:Terminal.TopologicalNode ?tn.
 
             ?measVal_v cim:AnalogValue.value ?u.
@@ -92,6 +106,10 @@ class SymVoltageBuilder(AbstractPgmComponentBuilder):
             $TOPO_ISLAND
             #?topoIsland cim:IdentifiedObject.name "Network";
             #            cim:TopologicalIsland.TopologicalNodes ?tn
+
+            # after the patterns, so stores joining in order (e.g. rdflib)
+            # bind ?term and ?measVal_v first instead of joining all of them
+            VALUES ?type_u { "Voltage" "LineToLineVoltage" }
         }
         ORDER BY ?tn
     """
@@ -112,6 +130,9 @@ class SymVoltageBuilder(AbstractPgmComponentBuilder):
         self._use_nominal_voltages = (
             self._converter_options.measurement_substitution.use_nominal_voltages
         )
+        self._default_sigma = (
+            self._converter_options.measurement_substitution.default_sigma_pq
+        )
 
     def build_from_cgmes(self, _) -> tuple[np.ndarray, dict | None]:
         if self._source.split_profiles:
@@ -122,7 +143,7 @@ class SymVoltageBuilder(AbstractPgmComponentBuilder):
         arr = initialize_array(self._data_type, self.component_name(), res.shape[0])
 
         arr["id"] = self._id_mapping.add_cgmes_iris(res["meas_u"], res["name"])
-        arr["measured_object"] = [self._id_mapping.get_pgm_id(tn) for tn in res["tn"]]
+        arr["measured_object"] = self._id_mapping.get_pgm_ids(res["tn"])
 
         zero_voltages = res["u"] < 0.1
         if any(zero_voltages):
@@ -148,172 +169,98 @@ class SymVoltageBuilder(AbstractPgmComponentBuilder):
 
         return arr, extra_info
 
+    def get_queries(self) -> dict[str, str]:
+        if self._source.split_profiles:
+            named_graphs = self._source.named_graphs
+            args = {
+                "$TOPO_ISLAND": self._at_topo_island_node_graph("?tn"),
+                "$OP_GRAPH": named_graphs.format_for_query(Profile.OP),
+                "$MEAS_GRAPH": named_graphs.format_for_query(Profile.MEAS),
+                "$TP_GRAPH": named_graphs.format_for_query(Profile.TP),
+                "$EQ_GRAPH": named_graphs.format_for_query(Profile.EQ),
+                "$SV_GRAPH": named_graphs.format_for_query(Profile.SV),
+            }
+            return {"voltages": self._replace(self._query_meas_in_graph, args)}
+
+        args = {"$TOPO_ISLAND": self._at_topo_island_node("?tn")}
+        return {"voltages": self._replace(self._query_meas_in_default, args)}
+
     def _read_meas_from_graph(self):
-        named_graphs = self._source.named_graphs
-        args = {
-            "$TOPO_ISLAND": self._at_topo_island_node_graph("?tn"),
-            "$OP_GRAPH": named_graphs.format_for_query(Profile.OP),
-            "$MEAS_GRAPH": named_graphs.format_for_query(Profile.MEAS),
-            "$TP_GRAPH": named_graphs.format_for_query(Profile.TP),
-            "$EQ_GRAPH": named_graphs.format_for_query(Profile.EQ),
-            "$SV_GRAPH": named_graphs.format_for_query(Profile.SV),
-        }
-        q = self._replace(self._query_meas_in_graph, args)
-        res = self._source.query(q)
+        res = self._fetch_result("voltages")
         res["meas_type"] = VoltageMeasType.FIELD
 
-        sigma_by_nomv = [
-            self._converter_options.measurement_substitution.default_sigma_pq.get_sigma_u(
-                nomv
-            )
-            for nomv in res["nom_u"]
-        ]
-        missing_sigma_u = res["sigma_u"].isna()
-        res.loc[missing_sigma_u, "sigma_u"] = sigma_by_nomv
+        missing_sigma_u = res["sigma_u"].isna().to_numpy()
+        res.loc[missing_sigma_u, "sigma_u"] = self._default_sigma.get_sigma_u_array(
+            res["nom_u"].to_numpy(dtype=float)[missing_sigma_u]
+        )
 
         return self._process_measurements(res)
 
     def _read_meas_from_default_graph(self):
-        args = {"$TOPO_ISLAND": self._at_topo_island_node("?tn")}
-        q = self._replace(self._query_meas_in_default, args)
-        res = self._source.query(q)
+        res = self._fetch_result("voltages")
         res["meas_type"] = VoltageMeasType.FIELD
 
         return self._process_measurements(res)
 
     def _process_measurements(self, res: pd.DataFrame) -> pd.DataFrame:
-        meas_by_tn = self._join_measurements_by_node(res)
-
-        tn = []
-        u = []
-        u_sigma = []
-        u_meas = []
-        u_name = []
-        meas_type = []
+        # one row per node in the order of their first measurement
+        tn_codes, _ = pd.factorize(res["tn"], use_na_sentinel=False)
+        first_rows = np.unique(tn_codes, return_index=True)[1]
+        self._check_unique_nominal_voltage(res, tn_codes, first_rows)
 
         # get one u-measurement per node for the potentially many available
-        for key, val in meas_by_tn.items():
-            meas_u = val.get("meas_u")
+        u_all = res["u"].to_numpy(dtype=float)
+        sigma_all = res["sigma_u"].to_numpy(dtype=float)
+        selected, use_sigma = select_median_measurements(
+            tn_codes, len(first_rows), u_all, sigma_all
+        )
+        is_selected = selected != -1
 
-            u_m, u_s, u_n, u_mm, u_type = self._get_one_measurement_and_sigma(
-                meas_u, val["nom_u"]
-            )
+        nom_u = res["nom_u"].to_numpy(dtype=float)[first_rows]
+        default_sigma = self._default_sigma.get_sigma_u_array(nom_u)
 
-            if u_m == 0:
-                continue
+        u = np.where(is_selected, u_all[selected], 0.0)
+        u_sigma = np.where(
+            is_selected & use_sigma,
+            sigma_all[selected],
+            np.where(is_selected, default_sigma, 0.0),
+        )
+        u_meas = np.where(is_selected, res["meas_u"].to_numpy()[selected], None)
+        u_name = np.where(is_selected, res["name"].to_numpy()[selected], None)
 
-            tn.append(key)
-            u.append(u_m)
-            u_sigma.append(u_s)
-            u_name.append(u_n)
-            u_meas.append(u_mm)
-            meas_type.append(u_type)
+        # 0 kV is invalid for PGM, derive measurement from nominal voltage
+        substituted = u == 0.0
+        u[substituted] = self._use_nominal_voltages.map_kv_array(nom_u[substituted])[0]
+        u_sigma[substituted] = default_sigma[substituted]
 
+        meas_type = np.full(len(u), VoltageMeasType.FIELD, dtype=object)
+        meas_type[substituted] = VoltageMeasType.SUBSTITUTED_NOM_V
+
+        keep = u != 0
         res_data = {
-            "tn": tn,
-            "u": u,
-            "meas_u": u_meas,
-            "name": u_name,
-            "sigma_u": u_sigma,
-            "meas_type": meas_type,
+            "tn": res["tn"].to_numpy()[first_rows][keep],
+            "u": u[keep],
+            "nom_u": nom_u[keep],
+            "meas_u": u_meas[keep],
+            "name": u_name[keep],
+            "sigma_u": u_sigma[keep],
+            "meas_type": meas_type[keep],
         }
         res = pd.DataFrame(res_data)
         return res
 
-    def _join_measurements_by_node(self, res):
-        meas_by_tn = {}
-        for idx in range(res.shape[0]):
-            term = res["tn"][idx]
-            val = meas_by_tn.setdefault(term, {})
-            self.set(val, "nom_u", res["nom_u"][idx])
-            self.append(
-                val,
-                "meas_u",
-                {
-                    "name": res["name"][idx],
-                    "meas_u": res["meas_u"][idx],
-                    "u": res["u"][idx],
-                    "sigma_u": res["sigma_u"][idx],
-                },
-            )
-        return meas_by_tn
-
-    def _get_one_measurement_and_sigma(
-        self, meas_u, nom_u
-    ) -> tuple[
-        float | None,
-        float | None,
-        str | None,
-        str | None,
-        VoltageMeasType,
-    ]:
-        has_sigma = (
-            any(not np.isnan(m["sigma_u"]) for m in meas_u)
-            if meas_u is not None
-            else False
-        )
-        has_value = (
-            any(not np.isnan(m["u"]) for m in meas_u) if meas_u is not None else False
-        )
-
-        value = 0.0
-        sigma = 0.0
-        name = None
-        meas = None
-        meas_type = VoltageMeasType.FIELD
-
-        if has_sigma and has_value:
-            # remove measurements that have no sigma
-            meas_filtered = [v for v in meas_u if not np.isnan(v["sigma_u"])]
-
-            # get median value if the available measurements
-            meas_val = self._get_median_value(meas_filtered, "u")
-
-            value = meas_val["u"]
-            sigma = meas_val["sigma_u"]
-
-            name = meas_val["name"]
-            meas = meas_val["meas_u"]
-        elif has_value:
-            # there is no sigma -> get median value and use default sigma
-            meas_val = self._get_median_value(meas_u, "u")
-
-            value = meas_val["u"]
-            sigma = self._converter_options.measurement_substitution.default_sigma_pq.get_sigma_u(
-                nom_u
-            )
-
-            name = meas_val["name"]
-            meas = meas_val["meas_u"]
-
-        if value == 0.0:
-            # 0 kV is invalid for PGM, derive measurement from nominal voltage
-            value, sigma = self._use_nominal_voltages.map_kv(nom_u)
-            sigma = self._converter_options.measurement_substitution.default_sigma_pq.get_sigma_u(
-                nom_u
+    def _check_unique_nominal_voltage(
+        self, res: pd.DataFrame, tn_codes: np.ndarray, first_rows: np.ndarray
+    ):
+        """All measurements of a node have to share its nominal voltage"""
+        values = res["nom_u"].to_numpy()
+        expected = values[first_rows][tn_codes]
+        differs = (values != expected) & ~(pd.isna(values) & pd.isna(expected))
+        if np.any(differs):
+            idx = np.flatnonzero(differs)[0]
+            raise ValueError(
+                f"Key nom_u already set to {expected[idx]}, cannot set to {values[idx]}"
             )
-            meas_type = VoltageMeasType.SUBSTITUTED_NOM_V
-
-        return value, sigma, name, meas, meas_type
-
-    def _get_median_value(self, arr: list[dict], key: str):
-        arr.sort(key=lambda x: x[key])
-        ll = len(arr)
-        return arr[ll // 2]
 
     def component_name(self) -> ComponentType:
         return ComponentType.sym_voltage_sensor
-
-    def set(self, dic, key, val):
-        old_val = dic.get(key)
-        if old_val is None:
-            dic[key] = val
-        elif old_val != val:
-            raise ValueError(f"Key {key} already set to {old_val}, cannot set to {val}")
-
-    def append(self, dic, key, val):
-        old_val = dic.get(key)
-        if old_val is None:
-            dic[key] = [val]
-        else:
-            dic[key].append(val)
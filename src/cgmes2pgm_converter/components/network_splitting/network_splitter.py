@@ -18,10 +18,10 @@ from power_grid_model.enum import LoadGenType
 from power_grid_model_io.data_types import ExtraInfo
 
 from cgmes2pgm_converter.common import (
+    TOPOLOGY_COMPONENTS,
     AbstractCgmesIdMapping,
     CgmesDataset,
     ConverterOptions,
-    Topology,
 )
 
 from ..component import AbstractPgmComponentBuilder
@@ -42,6 +42,12 @@ class NetworkSplitter(AbstractPgmComponentBuilder):
     remains the same in the network.
     """
 
+    _reads = frozenset(TOPOLOGY_COMPONENTS)
+    _modifies = frozenset(
+        {ComponentType.line, ComponentType.generic_branch, "source1", "source2"}
+    )
+    _uses_topology = True
+
     SPLITTABLE_TYPES = {ComponentType.line, ComponentType.generic_branch}
 
     def __init__(
@@ -65,6 +71,9 @@ class NetworkSplitter(AbstractPgmComponentBuilder):
             else set()
         )
 
+    def uses_topology(self) -> bool:
+        return self.enable
+
     def component_name(self) -> ComponentType:
         return (
             ComponentType.source
@@ -77,7 +86,7 @@ class NetworkSplitter(AbstractPgmComponentBuilder):
             arr = initialize_array(self._data_type, self.component_name(), 0)
             return arr, {}
 
-        topo = Topology(input_data, self._extra_info)
+        topo = self._get_topology(input_data)
         # get branches from topology
         all_branches = [
             self._filter_branch(branch)
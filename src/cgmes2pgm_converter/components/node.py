@@ -28,6 +28,19 @@ class NodeBuilder(AbstractPgmComponentBuilder):
     from CGMES data based on cim:TopologicalNode.
     """
 
+    _result_dtypes = {
+        "nodes": {
+            "tn": "str",
+            "name": "str",
+            "voltage": "float64",
+            "substationName": "str",
+            "substation": "str",
+            "containerType": "str",
+            "container": "str",
+            "containerName": "str",
+        },
+    }
+
     _query = """
         SELECT DISTINCT ?tn ?name ?voltage ?substationName ?substation ?containerType ?container ?containerName
         WHERE {
@@ -114,7 +127,7 @@ class NodeBuilder(AbstractPgmComponentBuilder):
         ORDER BY ?tn
     """
 
-    def build_from_cgmes(self, _) -> tuple[np.ndarray, dict | None]:
+    def get_queries(self) -> dict[str, str]:
         if self._source.split_profiles:
             named_graphs = self._source.named_graphs
             args = {
@@ -123,12 +136,13 @@ class NodeBuilder(AbstractPgmComponentBuilder):
                 "$EQ_GRAPH": named_graphs.format_for_query(Profile.EQ),
                 "$SV_GRAPH": named_graphs.format_for_query(Profile.SV),
             }
-            q = self._replace(self._query_in_graph, args)
-            query_result = self._source.query(q)
-        else:
-            args = {"$TOPO_ISLAND": self._at_topo_island_node("?tn")}
-            q = self._replace(self._query, args)
-            query_result = self._source.query(q)
+            return {"nodes": self._replace(self._query_in_graph, args)}
+
+        args = {"$TOPO_ISLAND": self._at_topo_island_node("?tn")}
+        return {"nodes": self._replace(self._query, args)}
+
+    def build_from_cgmes(self, _) -> tuple[np.ndarray, dict | None]:
+        query_result = self._fetch_result("nodes")
 
         arr = initialize_array(
             self._data_type, self.component_name(), query_result.shape[0]
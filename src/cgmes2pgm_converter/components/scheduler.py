@@ -0,0 +1,95 @@
+# Copyright [2025] [SOPTIM AG]
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import logging
+
+from .component import AbstractPgmComponentBuilder
+
+
+class BuilderScheduler:
+    """Selects the component builders to run based on their declared data
+    dependencies.
+
+    The builders are given in the order in which they are run.
+    Builders that are not active are skipped, as well as builders that require
+    a component or extra info key that no scheduled builder writes.
+
+    A builder depends on an earlier builder, if
+        - it reads something the earlier builder writes,
+        - it modifies something the earlier builder reads or modifies.
+    Creating the same component type is no conflict, as the created components
+    are appended in the original order.
+    """
+
+    def __init__(self, builders: list[AbstractPgmComponentBuilder]):
+        self._builders = self._filter_builders(builders)
+        self._dependencies = self._build_dependencies(self._builders)
+
+    def get_builders(self) -> list[AbstractPgmComponentBuilder]:
+        """Scheduled builders in their original order"""
+        return list(self._builders)
+
+    def get_dependents(
+        self, builders: list[AbstractPgmComponentBuilder]
+    ) -> list[AbstractPgmComponentBuilder]:
+        """Builders that directly or indirectly depend on the given builders,
+        including the given builders themselves, in their original order.
+        """
+        dependents = set(self._indices(builders))
+        for j, deps in enumerate(self._dependencies):
+            if deps & dependents:
+                dependents.add(j)
+
+        return [self._builders[j] for j in sorted(dependents)]
+
+    def _indices(self, builders: list[AbstractPgmComponentBuilder]) -> list[int]:
+        selected = {id(b) for b in builders}
+        return [j for j, b in enumerate(self._builders) if id(b) in selected]
+
+    def _filter_builders(
+        self, builders: list[AbstractPgmComponentBuilder]
+    ) -> list[AbstractPgmComponentBuilder]:
+        scheduled = []
+        written: set[str] = set()
+        for builder in builders:
+            if not builder.is_active():
+                continue
+
+            missing = builder.requires() - written
+            if missing:
+                logging.debug(
+                    "\tSkipping %s, nothing writes %s",
+                    type(builder).__name__,
+                    ", ".join(sorted(missing)),
+                )
+                continue
+
+            scheduled.append(builder)
+            written |= builder.writes()
+
+        return scheduled
+
+    def _build_dependencies(
+        self, builders: list[AbstractPgmComponentBuilder]
+    ) -> list[set[int]]:
+        reads = [b.reads() for b in builders]
+        writes = [b.writes() for b in builders]
+        modifies = [b.modifies() for b in builders]
+
+        dependencies: list[set[int]] = []
+        for j in range(len(builders)):
+            dependencies.append(
+                {i for i in range(j) if writes[i] & reads[j] or reads[i] & modifies[j]}
+            )
+        return dependencies
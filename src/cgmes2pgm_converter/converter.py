@@ -14,8 +14,10 @@
 
 import logging
 from abc import ABC, abstractmethod
+from concurrent.futures import ThreadPoolExecutor
 
 import numpy as np
+import pandas as pd
 from power_grid_model import ComponentType, initialize_array
 from power_grid_model_io.data_types import ExtraInfo
 
@@ -25,6 +27,7 @@ from cgmes2pgm_converter.common import (
     CgmesPgmIdMapping,
     ConverterOptions,
     Timer,
+    Topology,
 )
 
 
@@ -66,6 +69,9 @@ class CgmesToPgmConverter(AbstractCgmesToPgmConverter):
         self._input_data = {}
         self._extra_info: ExtraInfo = {}
 
+        # shared by the builders evaluating the topology, built on first use
+        self._topology: Topology | None = None
+
         # Initialize empty arrays for all component types
         for comp in ComponentType:
             self._input_data[comp] = initialize_array("input", comp, 0)
@@ -73,27 +79,125 @@ class CgmesToPgmConverter(AbstractCgmesToPgmConverter):
     def convert(self) -> tuple[dict[ComponentType, np.ndarray], dict]:
         logging.debug("Starting conversion")
 
-        builders = self._get_component_builders()
+        scheduler = c.BuilderScheduler(self._get_component_builders())
+        builders = scheduler.get_builders()
+
+        with Timer("\tFetching query results", loglevel=logging.DEBUG):
+            for builder, results in self._fetch_query_results(builders).items():
+                builder.set_query_results(results)
+
+        self._build(builders)
+
+        self._append_extra_info(self._id_mapping.build_extra_info())
+
+        return self._input_data, self._extra_info
+
+    def _build(self, builders: list[c.AbstractPgmComponentBuilder]):
+        """Build the given scheduled builders in their order.
+
+        The builders are run one after another, so the PGM IDs are allocated
+        in the same order in every conversion.
+        """
         for builder in builders:
-            if not builder.is_active():
-                continue
+            builder.set_extra_info(self._extra_info)
+            if builder.uses_topology():
+                builder.set_topology(self._get_topology())
+
+            input_data, extra_info = self._build_component(builder)
 
             component_name = builder.component_name()
+            self._input_data[component_name] = np.concatenate(
+                (self._input_data[component_name], input_data)
+            )
 
-            with Timer(f"\tBuilding {component_name}", loglevel=logging.DEBUG):
-                builder.set_extra_info(self._extra_info)
-                input_data, extra_info = builder.build_from_cgmes(self._input_data)
+            if extra_info:
+                self._append_extra_info(extra_info)
 
-                self._input_data[component_name] = np.concatenate(
-                    (self._input_data[component_name], input_data)
-                )
+    def _get_topology(self) -> Topology:
+        """Returns the topology of the components built so far.
+        It is built once and updated with the changes of later builders.
+        """
+        if self._topology is None:
+            with Timer("\tBuilding topology", loglevel=logging.DEBUG):
+                self._topology = Topology(self._input_data, self._extra_info)
+        else:
+            with Timer("\tUpdating topology", loglevel=logging.DEBUG):
+                self._topology.update(self._input_data)
+        return self._topology
 
-                if extra_info:
-                    self._append_extra_info(extra_info)
+    def _build_component(self, builder: c.AbstractPgmComponentBuilder):
+        with Timer(f"\tBuilding {builder.component_name()}", loglevel=logging.DEBUG):
+            return builder.build_from_cgmes(self._input_data)
 
-        self._append_extra_info(self._id_mapping.build_extra_info())
+    def _fetch_query_results(
+        self,
+        builders: list[c.AbstractPgmComponentBuilder],
+        measurement_only: bool = False,
+    ) -> dict[c.AbstractPgmComponentBuilder, dict[str, pd.DataFrame]]:
+        """Execute the queries of all builders in advance.
 
-        return self._input_data, self._extra_info
+        The queries are independent of the components built before, so they are
+        sent concurrently to the datasource instead of one after another while
+        building. Identical queries of different builders are executed only once.
+
+        Results cached by the datasource are only used for models that have not
+        been replaced since, see `CgmesDataset.refresh_fingerprints`.
+
+        Args:
+            builders (list[c.AbstractPgmComponentBuilder]): Builders to fetch for
+            measurement_only (bool, optional): Only execute the queries reading
+                measurement values, bypassing the result cache of the datasource,
+                as the values may have changed without a new model.
+                Defaults to False.
+
+        Returns:
+            dict: Query results by query name per builder
+        """
+        consumers: dict[str, list[tuple[c.AbstractPgmComponentBuilder, str]]] = {}
+        for builder in builders:
+            queries = builder.get_queries()
+            names = builder.measurement_queries() if measurement_only else queries
+            for name in names:
+                consumers.setdefault(queries[name], []).append((builder, name))
+
+        queries = list(consumers)
+
+        if not measurement_only:
+            self._datasource.refresh_fingerprints()
+
+        def run_query(query: str):
+            # identical queries have the same result columns
+            builder, name = consumers[query][0]
+            return self._datasource.query(
+                query,
+                dtypes=builder.get_result_dtypes(name),
+                use_cache=not measurement_only,
+            )
+
+        workers = min(self._options.query_workers, len(queries))
+        if workers > 1:
+            with ThreadPoolExecutor(max_workers=workers) as executor:
+                results = list(executor.map(run_query, queries))
+        else:
+            results = [run_query(q) for q in queries]
+
+        query_results: dict[c.AbstractPgmComponentBuilder, dict] = {}
+        for query, result in zip(queries, results):
+            # builders may modify their results, so each one gets its own copy,
+            # builders only reading a result share the original
+            readers = consumers[query]
+            original_used = any(name in b.read_only_queries() for b, name in readers)
+            for builder, name in readers:
+                if name in builder.read_only_queries():
+                    builder_result = result
+                elif original_used:
+                    builder_result = result.copy()
+                else:
+                    builder_result = result
+                    original_used = True
+                query_results.setdefault(builder, {})[name] = builder_result
+
+        return query_results
 
     def get_id_mapping(self):
         return self._id_mapping
@@ -0,0 +1,173 @@
+# Copyright [2025] [SOPTIM AG]
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import logging
+
+import numpy as np
+import pandas as pd
+from power_grid_model import ComponentType
+from power_grid_model_io.data_types import ExtraInfo
+
+import cgmes2pgm_converter.components as c
+from cgmes2pgm_converter.common import (
+    CgmesDataset,
+    CgmesPgmIdMapping,
+    ConverterOptions,
+    Timer,
+)
+
+from .converter import CgmesToPgmConverter
+
+
+class MeasurementSession(CgmesToPgmConverter):
+    """
+    Converts a CGMES model once and refreshes the measurements afterwards.
+
+    `convert` runs a full conversion and keeps the state of the static grid:
+    the PGM components, the id mapping and the query results of all builders
+    that do not depend on measurement values.
+
+    `refresh` only executes the queries reading measurement values again and
+    rebuilds the sensors (and the components substituted from them)
+    on top of the static grid. The result equals a full conversion, as long as
+    only the measurement values have changed in the dataset.
+    """
+
+    def __init__(
+        self,
+        datasource: CgmesDataset,
+        options: ConverterOptions | None = None,
+    ):
+        """
+        Args:
+            datasource (CgmesDataset): Datasource containing the CGMES data to convert.
+            options (ConverterOptions, optional): Configuration options for the conversion.
+        """
+        super().__init__(datasource, options)
+
+        # positions of the builders depending on measurement values
+        # in the scheduled builders, None before the first conversion
+        self._measurement_positions: list[int] | None = None
+
+        # state after building all static builders
+        self._static_id_mapping = CgmesPgmIdMapping()
+        self._static_input_data: dict[ComponentType, np.ndarray] = {}
+        self._static_extra_info: ExtraInfo = {}
+        self._static_query_results: list[dict[str, pd.DataFrame]] = []
+
+    def convert(self) -> tuple[dict[ComponentType, np.ndarray], dict]:
+        logging.debug("Starting conversion")
+
+        scheduler = c.BuilderScheduler(self._get_component_builders())
+        builders = scheduler.get_builders()
+
+        # builders depending on measurement values, directly or via other builders
+        measurement_builders = scheduler.get_dependents(
+            [b for b in builders if b.measurement_queries()]
+        )
+        static_builders = [b for b in builders if b not in measurement_builders]
+
+        with Timer("\tFetching query results", loglevel=logging.DEBUG):
+            query_results = self._fetch_query_results(builders)
+
+        self._static_query_results = []
+        for builder in measurement_builders:
+            results = query_results.get(builder, {})
+            measurement_queries = builder.measurement_queries()
+            # builders modify their results, keep the originals for refreshing
+            self._static_query_results.append(
+                {
+                    name: _copy_result(builder, name, result)
+                    for name, result in results.items()
+                    if name not in measurement_queries
+                }
+            )
+
+        for builder, results in query_results.items():
+            builder.set_query_results(results)
+
+        self._build(static_builders)
+
+        self._static_id_mapping = self._id_mapping.copy()
+        self._static_input_data = _copy_input_data(self._input_data)
+        self._static_extra_info = _copy_extra_info(self._extra_info)
+        self._measurement_positions = [builders.index(b) for b in measurement_builders]
+
+        self._build(measurement_builders)
+        self._append_extra_info(self._id_mapping.build_extra_info())
+
+        return self._input_data, self._extra_info
+
+    def refresh(self) -> tuple[dict[ComponentType, np.ndarray], dict]:
+        """Rebuild the measurements with the current measurement values
+        of the dataset, reusing the static grid of the last conversion.
+
+        Raises:
+            RuntimeError: If `convert` has not been called before
+
+        Returns:
+            tuple[dict, dict]: data, extra_info
+        """
+        if self._measurement_positions is None:
+            raise RuntimeError("convert() has to be called before refresh()")
+
+        self._id_mapping = self._static_id_mapping.copy()
+        self._input_data = _copy_input_data(self._static_input_data)
+        self._extra_info = _copy_extra_info(self._static_extra_info)
+        # the topology refers to the replaced data, it is built again on demand
+        self._topology = None
+
+        # builders keep state while building, so new ones are created
+        # using the restored id mapping, they are scheduled equally
+        scheduler = c.BuilderScheduler(self._get_component_builders())
+        scheduled = scheduler.get_builders()
+        builders = [scheduled[pos] for pos in self._measurement_positions]
+
+        with Timer("\tFetching measurement values", loglevel=logging.DEBUG):
+            measurement_results = self._fetch_query_results(
+                builders, measurement_only=True
+            )
+
+        for builder, static_results in zip(builders, self._static_query_results):
+            results = {
+                name: _copy_result(builder, name, result)
+                for name, result in static_results.items()
+            }
+            results.update(measurement_results.get(builder, {}))
+            builder.set_query_results(results)
+
+        self._build(builders)
+        self._append_extra_info(self._id_mapping.build_extra_info())
+
+        return self._input_data, self._extra_info
+
+
+def _copy_result(
+    builder: c.AbstractPgmComponentBuilder, name: str, result: pd.DataFrame
+) -> pd.DataFrame:
+    # results only read by the builder can be shared
+    if name in builder.read_only_queries():
+        return result
+    return result.copy()
+
+
+def _copy_input_data(
+    input_data: dict[ComponentType, np.ndarray],
+) -> dict[ComponentType, np.ndarray]:
+    return {component: arr.copy() for component, arr in input_data.items()}
+
+
+def _copy_extra_info(extra_info: ExtraInfo) -> ExtraInfo:
+    # builders update the entries of existing ids, e.g. "_type"
+    return {pgm_id: dict(info) for pgm_id, info in extra_info.items()}
@@ -0,0 +1,102 @@
+# Copyright [2025] [SOPTIM AG]
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import threading
+import time
+
+import pytest
+
+from cgmes2pgm_converter.common import CgmesDataset, GraphStoreOptions
+
+GRAPH = "http://example.com/eq"
+
+
+class _UploadDataset(CgmesDataset):
+    """Dataset recording the uploads instead of sending them"""
+
+    def __init__(self, workers: int, fail_at: int | None = None):
+        super().__init__("http://localhost:3030/grid", "http://iec.ch/TC57/CIM100#")
+        self.graph_store = GraphStoreOptions(enable=True, workers=workers)
+        self.fail_at = fail_at
+        self.produced = 0
+        self.uploaded: list[bytes] = []
+        # documents produced but not uploaded yet, when producing the next one
+        self.max_in_memory = 0
+        self._lock = threading.Lock()
+
+    def documents(self, count: int):
+        for i in range(count):
+            with self._lock:
+                self.produced += 1
+                self.max_in_memory = max(
+                    self.max_in_memory, self.produced - len(self.uploaded)
+                )
+            yield str(i).encode()
+
+    def upload_graph(self, graph, data, compressed=False):
+        time.sleep(0.005)
+        if data == str(self.fail_at).encode():
+            raise RuntimeError("upload failed")
+        with self._lock:
+            self.uploaded.append(data)
+
+
+@pytest.mark.parametrize("workers", [1, 2, 4])
+def test_upload_documents(workers):
+    dataset = _UploadDataset(workers)
+
+    dataset._upload_documents(dataset.documents(40), GRAPH)
+
+    assert sorted(dataset.uploaded) == sorted(str(i).encode() for i in range(40))
+    # the documents are consumed while uploading
+    assert dataset.max_in_memory <= workers + 1
+
+
+def test_upload_documents_raises_errors():
+    dataset = _UploadDataset(workers=4, fail_at=3)
+
+    with pytest.raises(RuntimeError, match="upload failed"):
+        dataset._upload_documents(dataset.documents(40), GRAPH)
+
+    # no further documents are created after the failure
+    assert dataset.produced < 40
+
+
+def _with_fingerprints(dataset: CgmesDataset) -> CgmesDataset:
+    dataset._graph_fingerprints = {GRAPH: "model@2025", "other": "other@2025"}
+    return dataset
+
+
+def test_failed_upload_invalidates_graph():
+    dataset = _with_fingerprints(_UploadDataset(workers=2, fail_at=3))
+
+    with pytest.raises(RuntimeError, match="upload failed"):
+        dataset._upload_documents(dataset.documents(10), GRAPH)
+
+    assert dataset._modified_graphs == {GRAPH: "model@2025"}
+    assert dataset._graph_fingerprints == {GRAPH: None, "other": "other@2025"}
+
+
+def test_failed_update_invalidates_graph():
+    dataset = _with_fingerprints(_UploadDataset(workers=1))
+
+    def execute(query, *, method="GET", add_prefixes=True):
+        raise RuntimeError("update failed")
+
+    dataset._execute = execute
+    with pytest.raises(RuntimeError, match="update failed"):
+        dataset.update(f"INSERT DATA {{ GRAPH <{GRAPH}> {{ <a> <b> <c> }} }}")
+
+    assert dataset._modified_graphs == {GRAPH: "model@2025"}
+    assert dataset._graph_fingerprints[GRAPH] is None
@@ -0,0 +1,168 @@
+# Copyright [2025] [SOPTIM AG]
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import io
+import zipfile
+
+import pytest
+
+from cgmes2pgm_converter.common import CgmesFileReader, Triple
+from cgmes2pgm_converter.common.cgmes_file_reader import RDF_TYPE
+
+BASE = "urn:test"
+CIM16 = "http://iec.ch/TC57/2013/CIM-schema-cim16#"
+CIM100 = "http://iec.ch/TC57/CIM100#"
+XSD_FLOAT = "http://www.w3.org/2001/XMLSchema#float"
+
+# CGMES 2.4: resources identified by rdf:ID, references relative to the document
+EQ_24 = f"""<?xml version="1.0" encoding="UTF-8"?>
+<rdf:RDF xmlns:rdf="http://www.w3.org/1999/02/22-rdf-syntax-ns#"
+         xmlns:cim="{CIM16}"
+         xmlns:md="http://iec.ch/TC57/61970-552/ModelDescription/1#">
+  <md:FullModel rdf:about="urn:uuid:model-eq">
+    <md:Model.scenarioTime>2025-01-01T00:00:00Z</md:Model.scenarioTime>
+  </md:FullModel>
+  <cim:ACLineSegment rdf:ID="_line">
+    <cim:IdentifiedObject.name>Line 1</cim:IdentifiedObject.name>
+    <cim:Conductor.length rdf:datatype="{XSD_FLOAT}">12.5</cim:Conductor.length>
+    <cim:IdentifiedObject.description xml:lang="de">Leitung</cim:IdentifiedObject.description>
+    <cim:Equipment.EquipmentContainer rdf:resource="#_line-container"/>
+  </cim:ACLineSegment>
+  <rdf:Description rdf:about="#_line">
+    <cim:IdentifiedObject.shortName></cim:IdentifiedObject.shortName>
+  </rdf:Description>
+</rdf:RDF>
+""".encode()
+
+# CGMES 3.0: resources identified by rdf:about with absolute IRIs
+SSH_30 = f"""<?xml version="1.0" encoding="UTF-8"?>
+<rdf:RDF xmlns:rdf="http://www.w3.org/1999/02/22-rdf-syntax-ns#"
+         xmlns:cim="{CIM100}"
+         xml:base="http://example.com/model#">
+  <cim:Terminal rdf:about="urn:uuid:term">
+    <cim:ACDCTerminal.connected>true</cim:ACDCTerminal.connected>
+  </cim:Terminal>
+  <cim:EnergyConsumer rdf:ID="_load">
+    <cim:EnergyConsumer.p>10</cim:EnergyConsumer.p>
+    <cim:Equipment.EquipmentContainer rdf:resource="#_vl"/>
+    <cim:Equipment.Other rdf:resource="other.xml#_x"/>
+    <cim:Equipment.Absolute rdf:resource="urn:uuid:abs"/>
+  </cim:EnergyConsumer>
+</rdf:RDF>
+""".encode()
+
+
+def _read(data: bytes, base: str = BASE):
+    reader = CgmesFileReader(base)
+    namespaces = {}
+    triples = list(reader.iter_triples(io.BytesIO(data), namespaces))
+    return triples, namespaces
+
+
+def _zip(members: dict[str, bytes]) -> bytes:
+    buffer = io.BytesIO()
+    with zipfile.ZipFile(buffer, "w") as archive:
+        for name, data in members.items():
+            archive.writestr(name, data)
+    return buffer.getvalue()
+
+
+def test_cgmes_24_document():
+    triples, namespaces = _read(EQ_24)
+
+    line = f"{BASE}#_line"
+    assert triples == [
+        Triple("urn:uuid:model-eq", RDF_TYPE, namespaces["md"] + "FullModel"),
+        Triple(
+            "urn:uuid:model-eq",
+            namespaces["md"] + "Model.scenarioTime",
+            "2025-01-01T00:00:00Z",
+            literal=True,
+        ),
+        Triple(line, RDF_TYPE, CIM16 + "ACLineSegment"),
+        Triple(line, CIM16 + "IdentifiedObject.name", "Line 1", literal=True),
+        Triple(
+            line, CIM16 + "Conductor.length", "12.5", literal=True, datatype=XSD_FLOAT
+        ),
+        Triple(
+            line,
+            CIM16 + "IdentifiedObject.description",
+            "Leitung",
+            literal=True,
+            language="de",
+        ),
+        Triple(line, CIM16 + "Equipment.EquipmentContainer", f"{BASE}#_line-container"),
+        # rdf:about="#_line" refers to the same resource, no type for Description
+        Triple(line, CIM16 + "IdentifiedObject.shortName", "", literal=True),
+    ]
+    assert namespaces["cim"] == CIM16
+
+
+def test_cgmes_30_document_with_xml_base():
+    triples, namespaces = _read(SSH_30)
+
+    load = "http://example.com/model#_load"
+    assert triples == [
+        Triple("urn:uuid:term", RDF_TYPE, CIM100 + "Terminal"),
+        Triple(
+            "urn:uuid:term", CIM100 + "ACDCTerminal.connected", "true", literal=True
+        ),
+        Triple(load, RDF_TYPE, CIM100 + "EnergyConsumer"),
+        Triple(load, CIM100 + "EnergyConsumer.p", "10", literal=True),
+        Triple(
+            load,
+            CIM100 + "Equipment.EquipmentContainer",
+            "http://example.com/model#_vl",
+        ),
+        Triple(load, CIM100 + "Equipment.Other", "http://example.com/other.xml#_x"),
+        Triple(load, CIM100 + "Equipment.Absolute", "urn:uuid:abs"),
+    ]
+    assert namespaces["cim"] == CIM100
+
+
+@pytest.mark.parametrize("base", ["urn:test", "urn:test#", "urn:test#fragment"])
+def test_rdf_id_with_fragment_in_base(base):
+    triples, _ = _read(EQ_24, base)
+
+    assert triples[2].subject == "urn:test#_line"
+    assert triples[6].object == "urn:test#_line-container"
+
+
+def test_read_files_archives_and_directories(tmp_path):
+    (tmp_path / "a_eq.xml").write_bytes(EQ_24)
+    (tmp_path / "readme.txt").write_text("ignored")
+    (tmp_path / "sub").mkdir()
+    # CGM bundle containing the IGM archives
+    igm = _zip({"ssh.xml": SSH_30, "notes.txt": b"ignored"})
+    (tmp_path / "sub" / "cgm.zip").write_bytes(_zip({"igm.zip": igm, "folder/": b""}))
+
+    documents = list(CgmesFileReader(BASE).read(tmp_path))
+
+    assert [d.name for d in documents] == [
+        str(tmp_path / "a_eq.xml"),
+        str(tmp_path / "sub" / "cgm.zip") + "/igm.zip/ssh.xml",
+    ]
+    assert len(documents[0].triples) == 8
+    assert len(documents[1].triples) == 7
+    assert documents[1].namespaces["cim"] == CIM100
+
+
+def test_read_errors(tmp_path):
+    reader = CgmesFileReader(BASE)
+    (tmp_path / "model.txt").write_text("text")
+
+    with pytest.raises(ValueError, match="Unsupported"):
+        list(reader.read(tmp_path / "model.txt"))
+    with pytest.raises(FileNotFoundError):
+        list(reader.read(tmp_path / "missing.xml"))
@@ -0,0 +1,150 @@
+# Copyright [2025] [SOPTIM AG]
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+
+import gzip
+from collections import Counter
+
+import numpy as np
+import pytest
+from power_grid_model import ComponentType
+
+from cgmes2pgm_converter import CgmesFileDataset, CgmesToPgmConverter
+from cgmes2pgm_converter.common import EmbeddedSparqlDataSource
+
+pytest.importorskip("rdflib")
+
+GRAPH = "urn:test/graph/extra"
+TRIPLES = b"""
+<urn:test#a> <urn:test#value> "1" .
+<urn:test#b> <urn:test#value> "2" .
+"""
+
+
+def _values(datasource, graph: str = GRAPH) -> list[str]:
+    result = datasource.query(
+        f"SELECT ?v WHERE {{ GRAPH <{graph}> {{ ?s <urn:test#value> ?v }} }} "
+        "ORDER BY ?v",
+        dtypes={"v": "str"},
+    )
+    return result["v"].tolist()
+
+
+def _convert(grid_path, split_profiles: bool):
+    dataset = CgmesFileDataset(grid_path, split_profiles=split_profiles)
+    if split_profiles:
+        dataset.populate_named_graph_mapping()
+    return CgmesToPgmConverter(dataset).convert()
+
+
+def test_load_stores_documents_in_named_graphs(grid_path):
+    datasource = EmbeddedSparqlDataSource()
+
+    graphs = datasource.load(grid_path)
+
+    assert len(graphs) == len(set(graphs)) > 1
+    assert all(g.startswith(datasource.graph_name(str(grid_path))) for g in graphs)
+
+    cim = datasource.namespaces["cim"]
+    result = datasource.query(
+        f"SELECT ?g (COUNT(?tr) AS ?n) "
+        f"WHERE {{ GRAPH ?g {{ ?tr a <{cim}PowerTransformer> }} }} GROUP BY ?g",
+        dtypes={"n": int},
+    )
+    # typed in the EQ and SSH documents
+    assert len(result) == 2
+    assert set(result["g"]) <= set(graphs)
+    assert result["n"].tolist() == [7, 7]
+
+
+@pytest.mark.parametrize("split_profiles", [False, True])
+def test_conversion(grid_path, split_profiles):
+    input_data, extra_info = _convert(grid_path, split_profiles)
+
+    branches = input_data[ComponentType.generic_branch]
+    types = Counter(extra_info[pgm_id]["_type"] for pgm_id in branches["id"])
+    assert types["PowerTransformer-2W"] == 6
+    # one branch per winding to the star point of the transformer
+    assert types["PowerTransformer-3W"] == 3
+    assert len(input_data[ComponentType.node]) > 0
+    assert len(input_data[ComponentType.sym_power_sensor]) > 0
+
+
+def test_conversion_of_split_profiles_matches_union(grid_path):
+    union, _ = _convert(grid_path, split_profiles=False)
+    split, _ = _convert(grid_path, split_profiles=True)
+
+    # the split profiles default missing voltage sigmas before selecting
+    # the median measurement, the union does not
+    del union[ComponentType.sym_voltage_sensor]
+    for component, arr in union.items():
+        for attr in arr.dtype.names:
+            np.testing.assert_array_equal(
+                split[component][attr], arr[attr], err_msg=f"{component}.{attr}"
+            )
+
+
+def test_upload_graph():
+    datasource = EmbeddedSparqlDataSource()
+
+    datasource.upload_graph(GRAPH, TRIPLES)
+    assert _values(datasource) == ["1", "2"]
+
+    # appended, the triple of b is not duplicated
+    datasource.upload_graph(
+        GRAPH,
+        b'<urn:test#b> <urn:test#value> "2" .\n<urn:test#c> <urn:test#value> "3" .',
+        content_type="application/n-triples",
+    )
+    assert _values(datasource) == ["1", "2", "3"]
+
+    datasource.upload_graph(
+        GRAPH,
+        gzip.compress(b'<urn:test#c> <urn:test#value> "4" .'),
+        replace=True,
+        compressed=True,
+    )
+    assert _values(datasource) == ["4"]
+
+
+def test_update_and_drop_graph():
+    datasource = EmbeddedSparqlDataSource(prefixes={"t": "urn:test#"})
+    datasource.upload_graph(GRAPH, TRIPLES)
+    datasource.upload_graph("urn:test/graph/other", TRIPLES)
+
+    datasource.update(
+        f"DELETE {{ GRAPH <{GRAPH}> {{ t:a t:value ?v }} }} "
+        f"INSERT {{ GRAPH <{GRAPH}> {{ t:a t:value '5' }} }} "
+        f"WHERE {{ GRAPH <{GRAPH}> {{ t:a t:value ?v }} }}"
+    )
+    assert _values(datasource) == ["2", "5"]
+
+    datasource.drop_graph(GRAPH)
+    assert not _values(datasource)
+    assert _values(datasource, "urn:test/graph/other") == ["1", "2"]
+
+
+def test_file_dataset_delegates_to_embedded_store(grid_path):
+    dataset = CgmesFileDataset(grid_path)
+
+    dataset.upload_graph(GRAPH, TRIPLES)
+    dataset.update(
+        f"INSERT DATA {{ GRAPH <{GRAPH}> {{ <urn:test#c> <urn:test#value> '3' }} }}"
+    )
+
+    assert _values(dataset.embedded) == ["1", "2", "3"]
+    assert _values(dataset) == ["1", "2", "3"]
+
+    dataset.drop_graph(GRAPH)
+    assert not _values(dataset.embedded)
@@ -0,0 +1,188 @@
+# Copyright [2025] [SOPTIM AG]
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import gzip
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import pytest
+
+from cgmes2pgm_converter.common import HttpError, HttpTransport
+
+
+class _Handler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+
+    def do_GET(self):
+        if self.path.startswith("/missing"):
+            self._respond(404, b"Not Found: /missing")
+        else:
+            self._respond(200, b"result")
+
+    def do_POST(self):
+        body = self.rfile.read(int(self.headers["Content-Length"]))
+        if b"malformed" in body:
+            self._respond(400, b"Parse error")
+        else:
+            self._respond(200, body)
+
+    def _respond(self, status: int, body: bytes):
+        if "gzip" in self.headers.get("Accept-Encoding", ""):
+            body = gzip.compress(body)
+        self.send_response(status)
+        self.send_header("Content-Length", str(len(body)))
+        if "gzip" in self.headers.get("Accept-Encoding", ""):
+            self.send_header("Content-Encoding", "gzip")
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, format, *args):  # pylint: disable=redefined-builtin
+        pass
+
+
+@pytest.fixture(name="url")
+def _server():
+    server = ThreadingHTTPServer(("127.0.0.1", 0), _Handler)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    yield f"http://127.0.0.1:{server.server_port}"
+    server.shutdown()
+    server.server_close()
+
+
+@pytest.mark.parametrize("compress", [True, False])
+def test_request_reuses_connections(url, compress):
+    transport = HttpTransport(pool_size=2, compress=compress)
+
+    for idx in range(5):
+        body = f"update {idx}".encode()
+        assert transport.request("POST", url + "/update", body=body) == body
+    assert transport.request("GET", url + "/query?query=x") == b"result"
+
+    # all requests were sent sequentially over one connection
+    assert len(transport._pools) == 1
+    assert next(iter(transport._pools.values()))._idle.qsize() == 1
+    transport.close()
+
+
+def test_error_status_raises_http_error(url):
+    transport = HttpTransport()
+
+    with pytest.raises(HttpError) as error:
+        transport.request("POST", url + "/update", body=b"malformed")
+
+    assert isinstance(error.value, RuntimeError)
+    assert error.value.status == 400
+    assert error.value.reason == "Bad Request"
+    assert error.value.body == "Parse error"
+    assert "POST " + url + "/update failed with 400" in str(error.value)
+
+    with pytest.raises(HttpError) as error:
+        transport.request("GET", url + "/missing?query=x")
+    assert error.value.status == 404
+
+    # the connection is still usable after an error
+    assert transport.request("GET", url + "/query") == b"result"
+
+
+class _ProxyHandler(BaseHTTPRequestHandler):
+    """Proxy answering requests itself and rejecting tunnels"""
+
+    protocol_version = "HTTP/1.1"
+    requests: list[tuple[str, str, str | None]] = []
+
+    def do_GET(self):
+        self.requests.append(
+            ("GET", self.path, self.headers.get("Proxy-Authorization"))
+        )
+        body = b"proxied"
+        self.send_response(200)
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def do_CONNECT(self):
+        self.requests.append(
+            ("CONNECT", self.path, self.headers.get("Proxy-Authorization"))
+        )
+        self.send_response(403)
+        self.send_header("Content-Length", "0")
+        self.end_headers()
+
+    def log_message(self, format, *args):  # pylint: disable=redefined-builtin
+        pass
+
+
+@pytest.fixture(name="proxy")
+def _proxy_server(monkeypatch):
+    for name in ("http_proxy", "https_proxy", "no_proxy"):
+        monkeypatch.delenv(name, raising=False)
+        monkeypatch.delenv(name.upper(), raising=False)
+
+    _ProxyHandler.requests = []
+    server = ThreadingHTTPServer(("127.0.0.1", 0), _ProxyHandler)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    yield f"127.0.0.1:{server.server_port}"
+    server.shutdown()
+    server.server_close()
+
+
+def test_request_via_proxy(proxy):
+    transport = HttpTransport(
+        compress=False, proxies={"http": f"http://user:p%40ss@{proxy}"}
+    )
+
+    assert transport.request("GET", "http://sparql.test:3030/ds/query?x=1") == (
+        b"proxied"
+    )
+    assert transport.request("GET", "http://sparql.test/query") == b"proxied"
+
+    # user:p@ss
+    auth = "Basic dXNlcjpwQHNz"
+    assert _ProxyHandler.requests == [
+        ("GET", "http://sparql.test:3030/ds/query?x=1", auth),
+        ("GET", "http://sparql.test/query", auth),
+    ]
+
+
+def test_https_request_is_tunneled_via_proxy(proxy):
+    transport = HttpTransport(proxies={"https": f"http://{proxy}"})
+
+    with pytest.raises(OSError, match="403"):
+        transport.request("GET", "https://sparql.test/query")
+
+    assert _ProxyHandler.requests == [("CONNECT", "sparql.test:443", None)]
+
+
+def test_proxy_from_environment(proxy, url, monkeypatch):
+    monkeypatch.setenv("http_proxy", f"http://{proxy}")
+    monkeypatch.setenv("no_proxy", "localhost,127.0.0.1")
+
+    assert HttpTransport().request("GET", "http://sparql.test/query") == b"proxied"
+    # hosts in no_proxy are requested directly
+    assert HttpTransport().request("GET", url + "/query") == b"result"
+    # explicitly given proxies replace the environment
+    assert HttpTransport(proxies={}).request("GET", url + "/query") == b"result"
+
+    assert [path for _, path, _ in _ProxyHandler.requests] == [
+        "http://sparql.test/query"
+    ]
+
+
+def test_unsupported_proxy_scheme(proxy):
+    transport = HttpTransport(proxies={"http": f"socks5://{proxy}"})
+
+    with pytest.raises(ValueError, match="proxy scheme"):
+        transport.request("GET", "http://sparql.test/query")
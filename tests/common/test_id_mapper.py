@@ -0,0 +1,101 @@
+# Copyright [2025] [SOPTIM AG]
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from cgmes2pgm_converter.common import CgmesPgmIdMapping
+
+
+@pytest.fixture(name="mapping")
+def _mapping() -> CgmesPgmIdMapping:
+    mapping = CgmesPgmIdMapping()
+    mapping.add_cgmes_iris([f"eq{i}" for i in range(10)], [f"n{i}" for i in range(10)])
+    mapping.add_cgmes_term_iris(["eq1", "eq1", "eq2"], ["t1a", "t1b", "t2"], "abc")
+    mapping.add_cgmes_iri("eq10", "n10")
+    # replacing the load of a terminal again keeps its last ID
+    mapping.add_cgmes_term_iri("eq2", "t2", "d")
+    return mapping
+
+
+def test_add_cgmes_iris(mapping: CgmesPgmIdMapping):
+    assert mapping.get_pgm_id("eq0") == 1
+    assert mapping.get_pgm_id("eq10") == 14
+    assert mapping.get_cgmes_iri(11) == "eq1,t1a"
+    assert mapping.get_name_from_pgm(13) == "c"
+
+    with pytest.raises(ValueError):
+        mapping.add_cgmes_iris(["new", "eq3"], ["", ""])
+    with pytest.raises(ValueError):
+        mapping.add_cgmes_iris(["new", "new"], ["", ""])
+    # nothing added by the failed calls
+    assert "new" not in mapping
+    assert 16 not in mapping
+
+
+def test_get_pgm_ids_matches_get_pgm_id(mapping: CgmesPgmIdMapping):
+    rng = np.random.default_rng(0)
+    iris = rng.choice([f"eq{i}" for i in range(11)], 200).tolist()
+    terms = rng.choice(["t1a", "t1b", "t2", "other"], 200).tolist()
+
+    np.testing.assert_array_equal(
+        mapping.get_pgm_ids(iris), [mapping.get_pgm_id(iri) for iri in iris]
+    )
+    np.testing.assert_array_equal(
+        mapping.get_pgm_ids(pd.Series(iris), np.array(terms)),
+        [mapping.get_pgm_id(iri, term) for iri, term in zip(iris, terms)],
+    )
+
+
+def test_get_pgm_ids(mapping: CgmesPgmIdMapping):
+    np.testing.assert_array_equal(
+        mapping.get_pgm_ids(["eq2", "eq0", "eq10"]), [3, 1, 14]
+    )
+    # terminals of the equipment, others fall back to the equipment itself
+    np.testing.assert_array_equal(
+        mapping.get_pgm_ids(
+            ["eq1", "eq2", "eq10", "eq1", "eq3"], ["t1b", "t2", "x", "t1a", "t9"]
+        ),
+        [12, 15, 14, 11, 4],
+    )
+
+
+def test_get_pgm_ids_after_adding(mapping: CgmesPgmIdMapping):
+    mapping.get_pgm_ids(["eq0"])
+    mapping.add_cgmes_iri("eq11", "n11")
+    np.testing.assert_array_equal(mapping.get_pgm_ids(["eq11", "eq0"]), [16, 1])
+
+
+def test_get_pgm_ids_errors(mapping: CgmesPgmIdMapping):
+    with pytest.raises(KeyError, match="unknown"):
+        mapping.get_pgm_ids(["eq0", "unknown"])
+    with pytest.raises(KeyError):
+        mapping.get_pgm_ids(["unknown"], ["t1a"])
+    with pytest.raises(ValueError):
+        mapping.get_pgm_ids(["eq0", "eq1"], ["t1a"])
+
+
+def test_get_pgm_ids_empty(mapping: CgmesPgmIdMapping):
+    ids = mapping.get_pgm_ids([])
+    assert ids.dtype == np.int32
+    assert ids.size == 0
+
+
+def test_copy(mapping: CgmesPgmIdMapping):
+    copy = mapping.copy()
+    copy.add_cgmes_iri("eq11", "n11")
+    assert "eq11" in copy
+    assert "eq11" not in mapping
+    assert mapping.add_cgmes_iri("other", "") == copy.get_pgm_id("eq11")
@@ -0,0 +1,113 @@
+# Copyright [2025] [SOPTIM AG]
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import numpy as np
+import pytest
+
+from cgmes2pgm_converter.common import DefaultSigma, UMeasurementSubstitutionOptions
+
+VOLTAGES = np.array(
+    [0.0, 0.4, 10.0, 20.0, 109.9, 110.0, 110.1, 150.0, 220.0, 380.0, 400.0, 420.0]
+    + [420.1, 1000.0, np.nan]
+)
+
+
+def _upper_level_scalar(levels: dict[float, float], default: float, voltage: float):
+    """Lookup by iterating the sorted levels"""
+    for level, sigma in sorted(levels.items()):
+        if voltage <= level:
+            return sigma
+    return default
+
+
+@pytest.mark.parametrize(
+    "default_sigma",
+    [
+        DefaultSigma(),
+        DefaultSigma(discrete_p_q={}, discrete_u={}),
+        DefaultSigma(discrete_p_q={20.0: 3.0, 0.4: 7.0}, discrete_u={380.0: 1.0}),
+    ],
+)
+def test_get_sigma_array_matches_scalar(default_sigma: DefaultSigma):
+    np.testing.assert_array_equal(
+        default_sigma.get_sigma_pq_array(VOLTAGES),
+        [
+            _upper_level_scalar(default_sigma.discrete_p_q, default_sigma.sigma_p_q, v)
+            for v in VOLTAGES
+        ],
+    )
+    np.testing.assert_array_equal(
+        default_sigma.get_sigma_u_array(VOLTAGES),
+        [
+            _upper_level_scalar(default_sigma.discrete_u, default_sigma.sigma_u, v)
+            for v in VOLTAGES
+        ],
+    )
+    assert default_sigma.get_sigma_pq(110.0) == _upper_level_scalar(
+        default_sigma.discrete_p_q, default_sigma.sigma_p_q, 110.0
+    )
+    assert isinstance(default_sigma.get_sigma_u(110.0), float)
+
+
+def test_default_sigmas():
+    default_sigma = DefaultSigma()
+    voltages = [0.4, 110.0, 110.1, 380.0, 420.0, 420.1, np.nan]
+
+    # the sigma of the next higher level, the default above all levels
+    np.testing.assert_array_equal(
+        default_sigma.get_sigma_pq_array(voltages),
+        [0.8, 0.8, 0.8, 1.5, 1.5, 10.0, 10.0],
+    )
+    np.testing.assert_array_equal(
+        default_sigma.get_sigma_u_array(voltages),
+        [0.5, 0.5, 0.5, 2.0, 2.0, 5.0, 5.0],
+    )
+
+
+def test_nominal_voltage_measurements():
+    options = UMeasurementSubstitutionOptions(discrete_sigma={110.0: 2.0})
+
+    meas, sigma = options.map_kv_array([20.0, 110.0, 220.0, 380.0, 0.0])
+
+    # 1.05 times the nominal voltage or the discrete measurement
+    np.testing.assert_allclose(meas, [21.0, 115.5, 231.0, 410.0, 0.0])
+    np.testing.assert_array_equal(sigma, [100.0, 2.0, 100.0, 100.0, 100.0])
+
+
+@pytest.mark.parametrize(
+    "options",
+    [
+        UMeasurementSubstitutionOptions(),
+        UMeasurementSubstitutionOptions(discrete_meas={}, discrete_sigma={}),
+        UMeasurementSubstitutionOptions(
+            discrete_meas={380.0: 410.0, 110.0: 0.0, 0.4: 0.42},
+            discrete_sigma={220.0: 3.0, 380.0: 4.0},
+        ),
+    ],
+)
+def test_map_kv_array_matches_map_kv(options: UMeasurementSubstitutionOptions):
+    meas, sigma = options.map_kv_array(VOLTAGES)
+
+    expected = [options.map_kv(v) for v in VOLTAGES]
+    np.testing.assert_array_equal(meas, [m for m, _ in expected])
+    np.testing.assert_array_equal(sigma, [s for _, s in expected])
+
+
+def test_map_v_array_matches_map_v():
+    options = UMeasurementSubstitutionOptions(discrete_sigma={220.0: 3.0})
+    meas, sigma = options.map_v_array(VOLTAGES * 1e3)
+
+    expected = [options.map_v(v) for v in VOLTAGES * 1e3]
+    np.testing.assert_allclose(meas, [m for m, _ in expected])
+    np.testing.assert_allclose(sigma, [s for _, s in expected])
@@ -0,0 +1,279 @@
+# Copyright [2025] [SOPTIM AG]
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import threading
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from cgmes2pgm_converter.common import CgmesDataset, QueryResultCache
+
+pytest.importorskip("pyarrow")
+
+BASE_URL = "http://localhost:3030/grid"
+EQ_GRAPH = "http://example.com/eq"
+MEAS_GRAPH = "http://example.com/meas"
+
+EQ_QUERY = f"SELECT ?eq WHERE {{ GRAPH <{EQ_GRAPH}> {{ ?eq a cim:ACLineSegment }} }}"
+MEAS_QUERY = f"SELECT ?value WHERE {{ GRAPH <{MEAS_GRAPH}> {{ ?m cim:x ?value }} }}"
+
+
+class _FakeDataset(CgmesDataset):
+    """Dataset answering queries without an endpoint, counting the requests"""
+
+    def __init__(self, result_cache: QueryResultCache | None):
+        super().__init__(BASE_URL, "http://iec.ch/TC57/CIM100#")
+        self.result_cache = result_cache
+        self.full_models = [
+            (f"{BASE_URL}#_eq", "2025-01-01T00:00:00Z", EQ_GRAPH),
+            (f"{BASE_URL}#_meas", "2025-01-01T00:00:00Z", MEAS_GRAPH),
+        ]
+        self.requests: list[str] = []
+        self.value = 1
+        self._lock = threading.Lock()
+
+    def _execute(self, query, *, method="GET", add_prefixes=True):
+        with self._lock:
+            self.requests.append(query)
+        if method != "GET":
+            return b""
+
+        if "md:FullModel" in query:
+            rows = "".join(
+                f"{fm},http://entsoe.eu/CIM/EquipmentCore/3/1,MAS,{time},desc,{graph}\r\n"
+                for fm, time, graph in self.full_models
+            )
+            return (
+                b"fullModel,profile,mas,scenarioTime,description,graph\r\n"
+                + rows.encode()
+            )
+        return f"value\r\n{self.value}\r\n".encode()
+
+    def count(self, query: str) -> int:
+        return self.requests.count(query)
+
+
+@pytest.fixture(name="dataset")
+def _dataset(tmp_path):
+    return _FakeDataset(QueryResultCache(tmp_path))
+
+
+def test_make_key_ignores_whitespace():
+    cache = QueryResultCache.__new__(QueryResultCache)
+
+    key = cache.make_key("SELECT ?a\n  WHERE { ?a ?b ?c }", "fp")
+
+    assert key == cache.make_key("SELECT ?a WHERE {\t?a ?b ?c }", "fp")
+    assert key != cache.make_key("SELECT ?a WHERE { ?a ?b ?c }", "other fp")
+    assert key != cache.make_key("SELECT ?b WHERE { ?a ?b ?c }", "fp")
+
+
+def test_put_and_get(tmp_path):
+    cache = QueryResultCache(tmp_path)
+    result = pd.DataFrame({"a": [1.0, 2.0], "b": [True, False]})
+
+    assert cache.get("key") is None
+    cache.put("key", result)
+    pd.testing.assert_frame_equal(cache.get("key"), result)
+
+    cache.clear()
+    assert cache.get("key") is None
+
+
+def test_get_restores_decoded_dtypes(tmp_path):
+    cache = QueryResultCache(tmp_path)
+    # as decoded from CSV: unbound variables are NaN
+    result = pd.DataFrame(
+        {
+            "eq": ["_a", np.nan, "_c"],
+            "connected": [True, False, True],
+            "r": np.array([1.0, np.nan, 3.0]),
+            "seq": np.array([1, 2, 1], dtype="int64"),
+            "name": pd.Series(["x", np.nan, "z"], dtype=object),
+            "flag": pd.Series([True, np.nan, False], dtype=object),
+        }
+    )
+    dtypes = {"eq": "str", "connected": "bool", "r": "float64"}
+
+    cache.put("key", result)
+
+    pd.testing.assert_frame_equal(cache.get("key", dtypes), result)
+    pd.testing.assert_frame_equal(cache.get("key"), result)
+
+
+def test_empty_result(tmp_path):
+    cache = QueryResultCache(tmp_path)
+    result = pd.DataFrame({"eq": pd.Series([], dtype=object), "r": []})
+
+    cache.put("key", result)
+
+    cached = cache.get("key", {"eq": "str", "r": "float64"})
+    assert cached.shape == (0, 2)
+    assert cached["r"].dtype == np.float64
+
+
+def test_unsupported_results_are_not_cached(tmp_path):
+    cache = QueryResultCache(tmp_path)
+
+    cache.put("key", pd.DataFrame({"mixed": pd.Series(["a", 1], dtype=object)}))
+
+    assert cache.get("key") is None
+    assert list(tmp_path.iterdir()) == []
+
+
+def test_unreadable_files_are_ignored(tmp_path):
+    cache = QueryResultCache(tmp_path)
+    cache.put("key", pd.DataFrame({"a": [1.0]}))
+    cache._path("key").write_bytes(b"not parquet")
+
+    assert cache.get("key") is None
+
+
+def test_results_are_cached(dataset):
+    first = dataset.query(EQ_QUERY)
+    dataset.value = 2
+    second = dataset.query(EQ_QUERY)
+
+    assert dataset.count(EQ_QUERY) == 1
+    pd.testing.assert_frame_equal(first, second)
+
+
+def test_use_cache_false_bypasses_the_cache(dataset):
+    dataset.query(EQ_QUERY)
+    dataset.value = 2
+
+    result = dataset.query(EQ_QUERY, use_cache=False)
+
+    assert dataset.count(EQ_QUERY) == 2
+    assert result["value"].tolist() == [2]
+
+
+def test_updated_graphs_are_not_cached(dataset):
+    dataset.query(EQ_QUERY)
+    dataset.query(MEAS_QUERY)
+
+    dataset.update(f"INSERT DATA {{ GRAPH <{MEAS_GRAPH}> {{ <a> <b> <c> }} }}")
+    dataset.query(EQ_QUERY)
+    dataset.query(MEAS_QUERY)
+
+    assert dataset.count(EQ_QUERY) == 1
+    assert dataset.count(MEAS_QUERY) == 2
+
+
+def test_updated_graphs_are_not_cached_after_refresh(dataset):
+    first = dataset.query(MEAS_QUERY)
+
+    dataset.update(f"INSERT DATA {{ GRAPH <{MEAS_GRAPH}> {{ <a> <b> <c> }} }}")
+    dataset.value = 2
+    # the update does not change the FullModel of the graph
+    dataset.refresh_fingerprints()
+    second = dataset.query(MEAS_QUERY)
+
+    assert first["value"].tolist() == [1]
+    assert second["value"].tolist() == [2]
+    assert dataset.count(MEAS_QUERY) == 2
+
+
+def test_updated_default_graph_is_not_cached_after_refresh(dataset):
+    query = "SELECT ?value WHERE { ?m cim:x ?value }"
+    dataset.query(query)
+
+    dataset.update("INSERT DATA { <a> <b> <c> }")
+    dataset.refresh_fingerprints()
+    dataset.query(query)
+
+    assert dataset.count(query) == 2
+
+
+def test_updated_graphs_are_cached_again_with_a_new_model(dataset):
+    dataset.query(MEAS_QUERY)
+    dataset.update(f"INSERT DATA {{ GRAPH <{MEAS_GRAPH}> {{ <a> <b> <c> }} }}")
+
+    dataset.full_models[1] = (f"{BASE_URL}#_meas2", "2025-01-01T00:15:00Z", MEAS_GRAPH)
+    dataset.refresh_fingerprints()
+    dataset.query(MEAS_QUERY)
+    dataset.query(MEAS_QUERY)
+
+    assert dataset.count(MEAS_QUERY) == 2
+
+
+def test_refresh_fingerprints_detects_replaced_models(dataset):
+    dataset.query(EQ_QUERY)
+    dataset.query(MEAS_QUERY)
+
+    # another writer replaces the measurements with a new model
+    dataset.full_models[1] = (f"{BASE_URL}#_meas2", "2025-01-01T00:15:00Z", MEAS_GRAPH)
+    dataset.value = 2
+    dataset.refresh_fingerprints()
+
+    assert dataset.query(MEAS_QUERY)["value"].tolist() == [2]
+    dataset.query(EQ_QUERY)
+    assert dataset.count(MEAS_QUERY) == 2
+    assert dataset.count(EQ_QUERY) == 1
+
+
+def test_results_are_shared_between_dataset_instances(tmp_path):
+    _FakeDataset(QueryResultCache(tmp_path)).query(EQ_QUERY)
+
+    dataset = _FakeDataset(QueryResultCache(tmp_path))
+    dataset.query(EQ_QUERY)
+
+    assert dataset.count(EQ_QUERY) == 0
+
+
+def test_no_caching_without_full_models(dataset):
+    dataset.full_models = []
+
+    dataset.query(EQ_QUERY)
+    dataset.query(EQ_QUERY)
+
+    assert dataset.count(EQ_QUERY) == 2
+
+
+def test_no_caching_without_result_cache():
+    dataset = _FakeDataset(None)
+
+    dataset.query(EQ_QUERY)
+    dataset.query(EQ_QUERY)
+    dataset.refresh_fingerprints()
+
+    assert dataset.count(EQ_QUERY) == 2
+    # FullModels are only read for the cache
+    assert len(dataset.requests) == 2
+
+
+def test_concurrent_queries_and_updates(dataset):
+    graphs = [f"http://example.com/g{idx}" for idx in range(200)]
+    # updates are tracked once the FullModels have been read
+    dataset.query(EQ_QUERY)
+
+    def update():
+        for graph in graphs:
+            dataset.update(f"INSERT DATA {{ GRAPH <{graph}> {{ <a> <b> <c> }} }}")
+
+    def query():
+        for graph in graphs:
+            dataset.query(f"SELECT ?a WHERE {{ GRAPH <{graph}> {{ ?a ?b ?c }} }}")
+
+    threads = [threading.Thread(target=f) for f in (update, query, query)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    # all updated graphs are excluded from caching afterwards
+    before = len(dataset.requests)
+    query()
+    assert len(dataset.requests) == before + len(graphs)
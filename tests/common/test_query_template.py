@@ -0,0 +1,109 @@
+# Copyright [2025] [SOPTIM AG]
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+
+import pytest
+
+from cgmes2pgm_converter.common import QueryTemplate
+from cgmes2pgm_converter.common.sparql_datasource import SparqlDataSource
+from cgmes2pgm_converter.components.measurement.voltage_sensor import (
+    SymVoltageBuilder,
+)
+
+
+def _replace_loop(text: str, params: dict) -> str:
+    """Replacement of the placeholders before the templates"""
+    for a, b in params.items():
+        text = text.replace(a, str(b))
+    return text
+
+
+def test_render_matches_replace_loop():
+    text = SymVoltageBuilder._query_meas_in_graph
+    params = {
+        # nested placeholder, replaced by the loop in a later iteration
+        "$TOPO_ISLAND": "VALUES ?sv_graph { $SV_GRAPH } GRAPH ?sv_graph { ?i ?p ?tn }",
+        "$OP_GRAPH": "<urn:op>",
+        "$MEAS_GRAPH": "<urn:meas>",
+        "$TP_GRAPH": "<urn:tp>",
+        "$EQ_GRAPH": "<urn:eq1> <urn:eq2>",
+        "$SV_GRAPH": "<urn:sv>",
+    }
+
+    rendered = QueryTemplate.get(text).render(params)
+
+    assert rendered == _replace_loop(text, params)
+    assert "$" not in rendered
+
+
+def test_nested_placeholders():
+    template = QueryTemplate("SELECT * WHERE { $A $B }")
+
+    params = {"$B": "?x", "$A": "$B $C", "$C": 1}
+    assert template.render(params) == "SELECT * WHERE { ?x 1 ?x }"
+    # the loop only replaces placeholders of values inserted before
+    assert _replace_loop(template.text, params) == "SELECT * WHERE { $B 1 ?x }"
+
+    # a value containing its own placeholder is not replaced again
+    assert template.render({"$A": "$A", "$B": ""}) == "SELECT * WHERE { $A  }"
+
+
+@pytest.mark.parametrize(
+    "params",
+    [
+        {"$EQ": "<urn:eq>", "$EQ_GRAPH": "<urn:eq-graph>"},
+        {"$EQ_GRAPH": "<urn:eq-graph>", "$EQ": "<urn:eq>"},
+    ],
+)
+def test_prefix_placeholders(params):
+    text = "GRAPH $EQ_GRAPH { ?s ?p $EQ }"
+
+    rendered = QueryTemplate(text).render(params)
+
+    assert rendered == "GRAPH <urn:eq-graph> { ?s ?p <urn:eq> }"
+    # equal to the loop if longer placeholders are replaced first
+    longest_first = dict(sorted(params.items(), key=lambda kv: -len(kv[0])))
+    assert rendered == _replace_loop(text, longest_first)
+
+
+def test_prefix_placeholders_differ_from_replace_loop():
+    text = "GRAPH $EQ_GRAPH { $EQX }"
+    params = {"$EQ": "<urn:eq>", "$EQ_GRAPH": "<urn:eq-graph>"}
+
+    # only whole placeholders are replaced
+    assert QueryTemplate(text).render(params) == "GRAPH <urn:eq-graph> { $EQX }"
+    assert _replace_loop(text, params) == "GRAPH <urn:eq>_GRAPH { <urn:eq>X }"
+
+
+def test_unknown_placeholders_are_unchanged():
+    text = "SELECT ?x WHERE { $KNOWN $UNKNOWN $1 $ ?x }"
+    template = QueryTemplate(text)
+
+    assert template.slots == {"$KNOWN", "$UNKNOWN"}
+    assert template.render({"$KNOWN": 5}) == "SELECT ?x WHERE { 5 $UNKNOWN $1 $ ?x }"
+    assert template.render({}) == text
+    assert QueryTemplate("no placeholders").render({"$A": 1}) == "no placeholders"
+
+
+def test_get_reuses_templates():
+    text = "SELECT * WHERE { $A }"
+    assert QueryTemplate.get(text) is QueryTemplate.get(text)
+
+
+def test_format_query():
+    datasource = SparqlDataSource("http://localhost:3030/grid", {})
+
+    assert datasource.format_query("$A $AB", {"$A": 1, "$AB": 2}) == "1 2"
+    # other keys than placeholders are replaced like before
+    assert datasource.format_query("?a ?ab", {"?a": "?c"}) == "?c ?cb"
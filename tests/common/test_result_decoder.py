@@ -0,0 +1,172 @@
+# Copyright [2025] [SOPTIM AG]
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import json
+from io import BytesIO
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from cgmes2pgm_converter.common import (
+    ArrowResultDecoder,
+    CsvResultDecoder,
+    JsonResultDecoder,
+    TsvResultDecoder,
+)
+
+BASE = "http://example.com/grid#"
+
+# solutions of ?eq ?name ?r ?connected ?step, the last one without ?connected
+CSV = (
+    "eq,name,r,connected,step\r\n"
+    f"{BASE}_1,Line 1,0.5,true,3\r\n"
+    f'{BASE}_2,"Line, 2",1.25,false,-1\r\n'
+    "urn:other:_3,Line 3,2,,7\r\n"
+).encode()
+
+TSV = (
+    "?eq\t?name\t?r\t?connected\t?step\n"
+    f'<{BASE}_1>\t"Line 1"\t"0.5"^^<xsd:double>\t"true"^^<xsd:boolean>\t3\n'
+    f'<{BASE}_2>\t"Line, 2"@en\t1.25\tfalse\t-1\n'
+    '<urn:other:_3>\t"Line 3"\t2\t\t"7"\n'
+).encode()
+
+
+def _binding(value, kind="literal"):
+    return {"type": kind, "value": value}
+
+
+JSON = json.dumps(
+    {
+        "head": {"vars": ["eq", "name", "r", "connected", "step"]},
+        "results": {
+            "bindings": [
+                {
+                    "eq": _binding(BASE + "_1", "uri"),
+                    "name": _binding("Line 1"),
+                    "r": _binding("0.5"),
+                    "connected": _binding("true"),
+                    "step": _binding("3"),
+                },
+                {
+                    "eq": _binding(BASE + "_2", "uri"),
+                    "name": _binding("Line, 2"),
+                    "r": _binding("1.25"),
+                    "connected": _binding("false"),
+                    "step": _binding("-1"),
+                },
+                {
+                    "eq": _binding("urn:other:_3", "uri"),
+                    "name": _binding("Line 3"),
+                    "r": _binding("2"),
+                    "step": _binding("7"),
+                },
+            ]
+        },
+    }
+).encode()
+
+DTYPES = {"r": "float64", "connected": "bool", "step": "int64", "name": "str"}
+
+
+def _arrow() -> bytes:
+    pa = pytest.importorskip("pyarrow")
+    table = pa.table(
+        {
+            "eq": [BASE + "_1", BASE + "_2", "urn:other:_3"],
+            "name": ["Line 1", "Line, 2", "Line 3"],
+            "r": [0.5, 1.25, 2.0],
+            "connected": [True, False, None],
+            "step": [3, -1, 7],
+        }
+    )
+    sink = pa.BufferOutputStream()
+    with pa.ipc.new_stream(sink, table.schema) as writer:
+        writer.write_table(table)
+    return sink.getvalue().to_pybytes()
+
+
+@pytest.fixture(name="decoded", params=["csv", "tsv", "json", "arrow"], ids=lambda p: p)
+def _decoded(request):
+    decoders = {
+        "csv": (CsvResultDecoder(), CSV),
+        "tsv": (TsvResultDecoder(), TSV),
+        "json": (JsonResultDecoder(), JSON),
+        "arrow": (ArrowResultDecoder(), None),
+    }
+    decoder, raw = decoders[request.param]
+    if raw is None:
+        raw = _arrow()
+
+    def decode(dtypes=None, strip_prefix=None):
+        return decoder.decode(raw, dtypes, strip_prefix)
+
+    return decode
+
+
+def test_declared_types(decoded):
+    result = decoded(DTYPES)
+
+    assert list(result.columns) == ["eq", "name", "r", "connected", "step"]
+    assert result["r"].dtype == np.float64
+    assert result["step"].dtype == np.int64
+    assert result["connected"].dtype == bool
+    np.testing.assert_array_equal(result["r"], [0.5, 1.25, 2.0])
+    np.testing.assert_array_equal(result["step"], [3, -1, 7])
+    # unbound bool variables are false
+    np.testing.assert_array_equal(result["connected"], [True, False, False])
+    assert list(result["name"]) == ["Line 1", "Line, 2", "Line 3"]
+
+
+def test_strip_prefix(decoded):
+    result = decoded(DTYPES, strip_prefix=BASE)
+
+    assert list(result["eq"]) == ["_1", "_2", "urn:other:_3"]
+    assert list(result["name"]) == ["Line 1", "Line, 2", "Line 3"]
+
+
+def test_strip_prefix_without_declared_types(decoded):
+    result = decoded(strip_prefix=BASE)
+
+    assert list(result["eq"]) == ["_1", "_2", "urn:other:_3"]
+    assert list(result["connected"][:2]) == [True, False]
+
+
+@pytest.mark.parametrize(
+    "decoder, raw",
+    [(TsvResultDecoder(), TSV), (JsonResultDecoder(), JSON)],
+    ids=["tsv", "json"],
+)
+def test_inferred_types_equal_read_csv(decoder, raw):
+    expected = pd.read_csv(BytesIO(CSV))
+
+    result = decoder.decode(raw)
+
+    pd.testing.assert_frame_equal(result, expected)
+
+
+def test_csv_equals_read_csv():
+    expected = pd.read_csv(BytesIO(CSV), dtype={"r": "float64", "name": "str"})
+
+    result = CsvResultDecoder().decode(CSV, {"r": "float64", "name": "str"})
+
+    pd.testing.assert_frame_equal(result, expected)
+
+
+def test_empty_result():
+    result = CsvResultDecoder().decode(b"eq,r\r\n", {"r": "float64"})
+
+    assert result.empty
+    assert list(result.columns) == ["eq", "r"]
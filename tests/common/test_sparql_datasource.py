@@ -0,0 +1,113 @@
+# Copyright [2025] [SOPTIM AG]
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+
+import re
+
+import pytest
+
+from cgmes2pgm_converter.common import CgmesDataset
+from cgmes2pgm_converter.common.sparql_datasource import SparqlDataSource
+
+BASE_URL = "http://localhost:3030/grid"
+PAGE = re.compile(r"ORDER BY (.+)\nLIMIT (\d+) OFFSET (\d+)$")
+
+
+class _PagedRows:
+    """Answers paged queries from a list of rows in the SPARQL CSV format"""
+
+    def __init__(self, rows: list[tuple[str, str]]):
+        self.rows = rows
+        self.requests: list[tuple[str, str, int, int]] = []
+
+    def __call__(self, query, *, method="GET", add_prefixes=True) -> bytes:
+        order, limit, offset = PAGE.search(query).groups()
+        self.requests.append((method, order, int(limit), int(offset)))
+        page = self.rows[int(offset) : int(offset) + int(limit)]
+        return "".join(f"{s},{v}\r\n" for s, v in [("s", "v"), *page]).encode()
+
+
+def _datasource(rows, cls=SparqlDataSource):
+    if cls is CgmesDataset:
+        datasource = CgmesDataset(BASE_URL, "http://iec.ch/TC57/CIM100#")
+    else:
+        datasource = cls(BASE_URL, {})
+    fake = _PagedRows(rows)
+    datasource._execute = fake
+    return datasource, fake
+
+
+def _rows(count: int) -> list[tuple[str, str]]:
+    return [(f"{BASE_URL}#_{i}", str(i)) for i in range(count)]
+
+
+def test_query_chunks():
+    datasource, fake = _datasource(_rows(5))
+
+    chunks = list(
+        datasource.query_chunks("SELECT ?s ?v WHERE {}", ["?s", "?v"], chunk_size=2)
+    )
+
+    assert [c["v"].tolist() for c in chunks] == [[0, 1], [2, 3], [4]]
+    assert fake.requests == [
+        ("GET", "?s ?v", 2, 0),
+        ("GET", "?s ?v", 2, 2),
+        ("GET", "?s ?v", 2, 4),
+    ]
+
+
+def test_query_chunks_exact_multiple_of_chunk_size():
+    datasource, fake = _datasource(_rows(4))
+
+    chunks = list(datasource.query_chunks("SELECT ?s ?v WHERE {}", "?s", 2))
+
+    # the empty page ending the result is requested, but not yielded
+    assert [len(c) for c in chunks] == [2, 2]
+    assert [offset for *_, offset in fake.requests] == [0, 2, 4]
+
+
+def test_query_chunks_empty_result():
+    datasource, fake = _datasource([])
+
+    chunks = list(datasource.query_chunks("SELECT ?s ?v WHERE {}", "?s", 2))
+
+    assert len(chunks) == 1
+    assert chunks[0].empty
+    assert list(chunks[0].columns) == ["s", "v"]
+    assert len(fake.requests) == 1
+
+
+@pytest.mark.parametrize(
+    ("order_by", "chunk_size"), [("?s", 0), ("?s", -1), ("", 2), ([], 2)]
+)
+def test_query_chunks_invalid_arguments(order_by, chunk_size):
+    datasource, fake = _datasource(_rows(1))
+
+    with pytest.raises(ValueError):
+        list(datasource.query_chunks("SELECT ?s WHERE {}", order_by, chunk_size))
+    assert not fake.requests
+
+
+def test_cgmes_dataset_query_chunks_strips_base_uri():
+    dataset, _ = _datasource(_rows(3), CgmesDataset)
+
+    chunks = list(dataset.query_chunks("SELECT ?s ?v WHERE {}", "?s", 2))
+    assert [c["s"].tolist() for c in chunks] == [["_0", "_1"], ["_2"]]
+
+    chunks = list(
+        dataset.query_chunks(
+            "SELECT ?s ?v WHERE {}", "?s", 2, remove_uuid_base_uri=False
+        )
+    )
+    assert chunks[1]["s"].tolist() == [f"{BASE_URL}#_2"]
@@ -0,0 +1,146 @@
+# Copyright [2025] [SOPTIM AG]
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+
+import numpy as np
+import pytest
+from power_grid_model import ComponentType, initialize_array
+
+from cgmes2pgm_converter.common import Topology, TopologyIndex
+from cgmes2pgm_converter.common.converter_literals import COMPONENT_TYPE
+
+# unsorted node ids
+NODE_IDS = [5, 1, 3, 2, 6, 4]
+
+# connected branches per node in the order of the input data
+BRANCHES = {1: [10, 14], 2: [10, 11], 3: [11, 12, 14], 4: [12, 13], 5: [13], 6: [14]}
+APPLIANCES = {1: [20, 24], 2: [], 3: [22, 21], 4: [], 5: [], 6: [23]}
+
+
+def _branches(component_type, rows):
+    arr = initialize_array("input", component_type, len(rows))
+    for name, values in zip(
+        ("id", "from_node", "to_node", "from_status", "to_status"), zip(*rows)
+    ):
+        arr[name] = values
+    return arr
+
+
+def _appliances(component_type, rows):
+    arr = initialize_array("input", component_type, len(rows))
+    arr["id"] = [pgm_id for pgm_id, _ in rows]
+    arr["node"] = [node for _, node in rows]
+    arr["status"] = 1
+    return arr
+
+
+@pytest.fixture(name="input_data")
+def _input_data() -> dict[ComponentType, np.ndarray]:
+    input_data = {t: initialize_array("input", t, 0) for t in ComponentType}
+    input_data[ComponentType.node] = initialize_array("input", "node", len(NODE_IDS))
+    input_data[ComponentType.node]["id"] = NODE_IDS
+
+    # open at one or both sides, still connected to their nodes
+    input_data[ComponentType.line] = _branches("line", [(10, 1, 2, 0, 1)])
+    input_data[ComponentType.generic_branch] = _branches(
+        "generic_branch", [(11, 2, 3, 1, 1)]
+    )
+    input_data[ComponentType.link] = _branches("link", [(12, 3, 4, 0, 0)])
+    input_data[ComponentType.transformer] = _branches("transformer", [(13, 4, 5, 1, 0)])
+
+    tr3w = initialize_array("input", "three_winding_transformer", 1)
+    tr3w["id"] = 14
+    tr3w["node_1"], tr3w["node_2"], tr3w["node_3"] = 1, 3, 6
+    tr3w["status_1"], tr3w["status_2"], tr3w["status_3"] = 1, 0, 1
+    input_data[ComponentType.three_winding_transformer] = tr3w
+
+    input_data[ComponentType.source] = _appliances("source", [(20, 1)])
+    input_data[ComponentType.sym_load] = _appliances("sym_load", [(21, 3), (24, 1)])
+    input_data[ComponentType.sym_gen] = _appliances("sym_gen", [(22, 3)])
+    input_data[ComponentType.shunt] = _appliances("shunt", [(23, 6)])
+    return input_data
+
+
+def test_branches_and_degrees(input_data):
+    index = TopologyIndex(input_data)
+
+    np.testing.assert_array_equal(index.branch_degree(), [1, 2, 3, 2, 1, 2])
+    np.testing.assert_array_equal(index.branch_degree([3, 5]), [3, 1])
+
+    ids, owners = index.branches_at([3, 5, 1])
+    assert ids.tolist() == [11, 12, 14, 13, 10, 14]
+    assert owners.tolist() == [3, 3, 3, 5, 1, 1]
+
+    ids, owners = index.branches_at([])
+    assert ids.size == owners.size == 0
+
+
+def test_appliances(input_data):
+    index = TopologyIndex(input_data)
+
+    np.testing.assert_array_equal(index.appliance_count(), [0, 2, 2, 0, 1, 0])
+
+    ids, owners = index.appliances_at([3, 1, 6])
+    assert ids.tolist() == [22, 21, 20, 24, 23]
+    assert owners.tolist() == [3, 3, 1, 1, 6]
+
+    ids, owners = index.appliances_at(
+        [3, 1, 6], [ComponentType.sym_load, ComponentType.shunt]
+    )
+    assert ids.tolist() == [21, 24, 23]
+    assert owners.tolist() == [3, 1, 6]
+
+
+def test_index_matches_topology(input_data):
+    topology = Topology(input_data, {})
+    index = topology.get_index()
+
+    for node_id, degree in zip(NODE_IDS, index.branch_degree()):
+        branches = [
+            b[b[COMPONENT_TYPE]]["id"] for b in topology.get_attached_branches(node_id)
+        ]
+        appliances = [
+            a[a[COMPONENT_TYPE]]["id"]
+            for a in topology.get_attached_appliances(node_id)
+        ]
+        assert branches == BRANCHES[node_id] == index.branches_at([node_id])[0].tolist()
+        assert degree == len(branches)
+        assert appliances == APPLIANCES[node_id]
+        assert appliances == index.appliances_at([node_id])[0].tolist()
+
+
+def test_rows(input_data):
+    index = TopologyIndex(input_data)
+
+    np.testing.assert_array_equal(index.rows(ComponentType.node, [4, 5, 1]), [5, 0, 1])
+    np.testing.assert_array_equal(index.rows(ComponentType.sym_load, [24]), [1])
+    with pytest.raises(KeyError, match="7"):
+        index.rows(ComponentType.node, [1, 7])
+    with pytest.raises(KeyError):
+        index.rows(ComponentType.sym_gen, [21])
+
+
+def test_index_is_rebuilt_after_update(input_data):
+    topology = Topology(input_data, {})
+    index = topology.get_index()
+    assert topology.get_index() is index
+
+    input_data[ComponentType.line] = np.concatenate(
+        [input_data[ComponentType.line], _branches("line", [(15, 2, 6, 1, 1)])]
+    )
+    topology.update(input_data)
+
+    assert topology.get_index() is not index
+    np.testing.assert_array_equal(topology.get_index().branch_degree([2, 6]), [3, 2])
+    assert topology.get_index().branches_at([6])[0].tolist() == [15, 14]
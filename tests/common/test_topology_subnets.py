@@ -0,0 +1,105 @@
+# Copyright [2025] [SOPTIM AG]
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import numpy as np
+import pytest
+from power_grid_model import ComponentType, initialize_array
+
+from cgmes2pgm_converter.common.topology_index import BRANCH2_TYPES
+from cgmes2pgm_converter.common.topology_subnets import (
+    TopologySubnets,
+    label_subnets,
+    subnet_name,
+)
+
+
+def _random_grid(rng: np.random.Generator, nodes: int, branches: int) -> dict:
+    # unsorted and non-consecutive node ids
+    node_ids = rng.permutation(nodes * 3)[:nodes] + 1
+    input_data = {ComponentType.node: initialize_array("input", "node", nodes)}
+    input_data[ComponentType.node]["id"] = node_ids
+
+    for branch_type in BRANCH2_TYPES:
+        arr = initialize_array("input", branch_type, branches)
+        arr["from_node"] = rng.choice(node_ids, branches)
+        arr["to_node"] = rng.choice(node_ids, branches)
+        arr["from_status"] = rng.random(branches) < 0.8
+        arr["to_status"] = rng.random(branches) < 0.8
+        input_data[branch_type] = arr
+
+    tr3w = initialize_array("input", "three_winding_transformer", branches)
+    for side in (1, 2, 3):
+        tr3w[f"node_{side}"] = rng.choice(node_ids, branches)
+        tr3w[f"status_{side}"] = rng.random(branches) < 0.7
+    input_data[ComponentType.three_winding_transformer] = tr3w
+
+    return input_data
+
+
+def _subnet_names(input_data: dict) -> list[str]:
+    """Subnet names evaluating one branch after another"""
+    subnets = TopologySubnets()
+    for branch_type in BRANCH2_TYPES:
+        for branch in input_data[branch_type]:
+            subnets.eval_branch2(branch)
+    for tr3w in input_data[ComponentType.three_winding_transformer]:
+        subnets.eval_branch3(tr3w)
+
+    names = subnets.get_subnets()
+    markers = subnets.get_marker()
+    return [
+        names[markers[node_id].get_island_marker().id]
+        if node_id in markers
+        else "isolated"
+        for node_id in input_data[ComponentType.node]["id"].tolist()
+    ]
+
+
+@pytest.mark.parametrize(
+    ("nodes", "branches"), [(1, 0), (10, 2), (50, 10), (200, 20), (500, 200)]
+)
+@pytest.mark.parametrize("seed", [0, 1, 2])
+def test_label_subnets_matches_topology_subnets(nodes, branches, seed):
+    input_data = _random_grid(np.random.default_rng(seed), nodes, branches)
+
+    labels = label_subnets(input_data)
+
+    assert [subnet_name(label) for label in labels] == _subnet_names(input_data)
+
+
+def test_label_subnets_ordering():
+    input_data = _random_grid(np.random.default_rng(0), 7, 0)
+    input_data[ComponentType.node]["id"] = [7, 6, 5, 4, 3, 2, 1]
+    line = initialize_array("input", "line", 4)
+    line["from_node"] = [1, 2, 3, 6]
+    line["to_node"] = [2, 6, 4, 6]
+    line["from_status"] = [1, 1, 1, 1]
+    line["to_status"] = [1, 1, 1, 0]
+    input_data[ComponentType.line] = line
+
+    # {1, 2, 6} is the largest subnet, 5 and 7 have no branches
+    np.testing.assert_array_equal(label_subnets(input_data), [0, 1, 0, 2, 2, 1, 1])
+
+
+def test_eval_branch3_uses_status_3():
+    tr3w = initialize_array("input", "three_winding_transformer", 1)
+    tr3w["node_1"], tr3w["node_2"], tr3w["node_3"] = 1, 2, 3
+    tr3w["status_1"], tr3w["status_2"], tr3w["status_3"] = 1, 0, 1
+
+    subnets = TopologySubnets()
+    subnets.eval_branch3(tr3w[0])
+
+    markers = subnets.get_marker()
+    assert set(markers) == {1, 3}
+    assert markers[3].get_island_marker() is markers[1]
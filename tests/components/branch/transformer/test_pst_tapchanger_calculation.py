@@ -0,0 +1,153 @@
+# Copyright [2025] [SOPTIM AG]
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import logging
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from cgmes2pgm_converter.components.branch.transformer.util.pst_tapchanger_calculation import (
+    calc_theta_k_2w,
+    calc_theta_k_2w_array,
+    calc_theta_k_3w,
+    calc_theta_k_3w_array,
+)
+
+TAPCHANGER_TYPES = [
+    "PhaseTapChangerTabular",
+    "PhaseTapChangerLinear",
+    "PhaseTapChangerSymmetrical",
+    "PhaseTapChangerAsymmetrical",
+    "PhaseTapChanger",
+    "PhaseTapChangerNonLinear",
+    "Unknown",
+]
+
+
+def _random_trafos(rng: np.random.Generator, taptype: str, count: int) -> pd.DataFrame:
+    def values(low, high):
+        return rng.uniform(low, high, count)
+
+    def steps(low, high):
+        return rng.integers(low, high, count).astype(float)
+
+    def with_nan(arr):
+        arr[rng.random(count) < 0.5] = np.nan
+        return arr
+
+    data = {
+        "name1": [f"trafo{i}" for i in range(count)],
+        "nomU1": rng.choice([380.0, 220.0, 110.0], count),
+        "nomU2": rng.choice([220.0, 110.0, 20.0], count),
+        "ratedU1": values(100.0, 420.0),
+        "ratedU2": values(10.0, 240.0),
+        "tcAngle1": with_nan(values(-30.0, 30.0)),
+        "tcRatio1": with_nan(values(0.9, 1.1)),
+    }
+    for side in (1, 2):
+        data |= {
+            f"taptype{side}": np.full(count, taptype, dtype=object),
+            f"step{side}": steps(0, 33),
+            f"neutralStep{side}": steps(10, 20),
+            f"stepPhaseShift{side}": values(0.1, 2.0),
+            f"stepVoltageIncrement{side}": values(0.5, 2.5),
+            f"windingConnectionAngle{side}": rng.choice([60.0, 90.0, 120.0], count),
+            f"step{side}_rtc": steps(0, 21),
+            f"neutralStep{side}_rtc": steps(5, 15),
+            f"stepSize{side}": values(0.5, 1.5),
+        }
+    data["tcAngle2"] = values(-30.0, 30.0)
+    data["tcRatio2"] = with_nan(values(0.9, 1.1))
+    return pd.DataFrame(data)
+
+
+@pytest.mark.parametrize("taptype", TAPCHANGER_TYPES)
+def test_calc_theta_k_2w_array_matches_scalar(taptype):
+    rng = np.random.default_rng(0)
+    trafos = _random_trafos(rng, taptype, 60)
+    tapside = rng.integers(1, 3, 60)
+    tapside_rtc = rng.integers(0, 3, 60)
+
+    theta, k = calc_theta_k_2w_array(trafos, tapside, tapside_rtc)
+
+    expected = [
+        calc_theta_k_2w(trafos.iloc[i], tapside[i], tapside_rtc[i]) for i in range(60)
+    ]
+    np.testing.assert_allclose(theta, [t for t, _ in expected], rtol=1e-12, atol=1e-15)
+    np.testing.assert_allclose(k, [k for _, k in expected], rtol=1e-12)
+
+
+@pytest.mark.parametrize("taptype", TAPCHANGER_TYPES)
+def test_calc_theta_k_3w_array_matches_scalar(taptype):
+    rng = np.random.default_rng(1)
+    trafos = _random_trafos(rng, taptype, 60)
+    tapside = rng.integers(1, 3, 60)
+    current_side = rng.integers(1, 4, 60)
+
+    theta, k = calc_theta_k_3w_array(trafos, tapside, current_side)
+
+    expected = [
+        calc_theta_k_3w(trafos.iloc[i], tapside[i], current_side[i]) for i in range(60)
+    ]
+    np.testing.assert_allclose(theta, [t for t, _ in expected], rtol=1e-12, atol=1e-15)
+    np.testing.assert_allclose(k, [k for _, k in expected], rtol=1e-12)
+
+
+def test_calc_theta_k_2w_array():
+    nan = np.nan
+    trafos = _random_trafos(np.random.default_rng(3), "Unknown", 5)
+    trafos["taptype1"] = [
+        "PhaseTapChangerTabular",
+        "Unknown",
+        "PhaseTapChangerLinear",
+        "PhaseTapChangerSymmetrical",
+        "Unknown",
+    ]
+    trafos["taptype2"] = ["Unknown", "PhaseTapChangerTabular", *["Unknown"] * 3]
+    trafos["nomU1"] = 380.0
+    trafos["nomU2"] = 110.0
+    trafos["ratedU1"] = [400.0, 400.0, 380.0, 380.0, 380.0]
+    trafos["ratedU2"] = 110.0
+    trafos["tcAngle1"] = [10.0, nan, nan, nan, nan]
+    trafos["tcAngle2"] = [nan, -6.0, nan, nan, nan]
+    trafos["tcRatio1"] = [1.1, nan, nan, nan, nan]
+    trafos["tcRatio2"] = nan
+    trafos["step1"] = [0.0, 0.0, 12.0, 12.0, 0.0]
+    trafos["neutralStep1"] = 10.0
+    trafos["stepPhaseShift1"] = 1.5
+    trafos["stepVoltageIncrement1"] = 1.5
+
+    theta, k = calc_theta_k_2w_array(trafos, np.array([1, 2, 1, 1, 1]), 0)
+
+    # tabular: angle of the tap changer, negated at side 2,
+    # ratio of the rated voltages times tcRatio to the nominal ones
+    # linear: (neutral step - step) * shift, negated at side 1
+    # symmetrical: t = 1 / (1 + j * 2 steps * 1.5 %)
+    np.testing.assert_allclose(
+        theta, [np.radians(10.0), np.radians(6.0), np.radians(3.0), np.arctan(0.03), 0]
+    )
+    np.testing.assert_allclose(
+        k, [440.0 / 380.0, 400.0 / 380.0, 1.0, 1.0 / np.sqrt(1.0009), 1.0]
+    )
+
+
+def test_linear_warning_logged_once(caplog):
+    trafos = _random_trafos(np.random.default_rng(2), "PhaseTapChangerLinear", 5)
+
+    with caplog.at_level(logging.WARNING):
+        calc_theta_k_2w_array(trafos, 1, 0)
+
+    assert len(caplog.records) == 2
+    assert "Found 5 Transformer(s)" in caplog.records[0].getMessage()
@@ -0,0 +1,75 @@
+# Copyright [2025] [SOPTIM AG]
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import numpy as np
+import pytest
+
+from cgmes2pgm_converter.components.measurement.measurement_selection import (
+    select_median_measurements,
+)
+
+
+def _select_scalar(groups, n_groups, values, sigmas):
+    """Selection per group by sorting lists, like the builders did before"""
+    selected = np.full(n_groups, -1)
+    use_sigma = np.zeros(n_groups, dtype=bool)
+    for group in range(n_groups):
+        rows = [row for row in range(len(groups)) if groups[row] == group]
+        has_value = any(not np.isnan(values[row]) for row in rows)
+        has_sigma = any(not np.isnan(sigmas[row]) for row in rows)
+        if not has_value:
+            continue
+
+        if has_sigma:
+            rows = [row for row in rows if not np.isnan(sigmas[row])]
+            use_sigma[group] = True
+
+        rows.sort(key=lambda row: (np.isnan(values[row]), values[row]))
+        selected[group] = rows[len(rows) // 2]
+    return selected, use_sigma
+
+
+@pytest.mark.parametrize("seed", range(5))
+def test_select_median_matches_scalar(seed):
+    rng = np.random.default_rng(seed)
+    n_groups = 40
+    rows = 300
+    groups = rng.integers(0, n_groups, rows)
+    # few distinct values, so that ties occur
+    values = rng.integers(0, 5, rows).astype(float)
+    values[rng.random(rows) < 0.3] = np.nan
+    sigmas = rng.random(rows)
+    sigmas[rng.random(rows) < 0.6] = np.nan
+
+    selected, use_sigma = select_median_measurements(groups, n_groups, values, sigmas)
+
+    expected_selected, expected_use_sigma = _select_scalar(
+        groups, n_groups, values, sigmas
+    )
+    np.testing.assert_array_equal(selected, expected_selected)
+    np.testing.assert_array_equal(use_sigma, expected_use_sigma)
+
+
+def test_select_median():
+    nan = np.nan
+    groups = np.array([0, 0, 0, 0, 1, 1, 1, 2, 2, 3, 3])
+    values = np.array([4.0, 1.0, 3.0, 2.0, 5.0, 7.0, 6.0, nan, nan, 1.0, 1.0])
+    sigmas = np.array([nan, nan, nan, nan, 0.1, nan, 0.2, 0.1, nan, nan, nan])
+
+    selected, use_sigma = select_median_measurements(groups, 5, values, sigmas)
+
+    # 0: upper median of all, 1: median of the ones with a sigma,
+    # 2: no value, 3: equal values keep the row order, 4: no measurements
+    np.testing.assert_array_equal(selected, [2, 6, -1, 10, -1])
+    np.testing.assert_array_equal(use_sigma, [False, True, False, False, False])
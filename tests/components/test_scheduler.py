@@ -0,0 +1,104 @@
+# Copyright [2025] [SOPTIM AG]
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import numpy as np
+from power_grid_model import ComponentType
+
+from cgmes2pgm_converter.common import ConverterOptions
+from cgmes2pgm_converter.components import (
+    AbstractPgmComponentBuilder,
+    BuilderScheduler,
+)
+
+
+class _Builder(AbstractPgmComponentBuilder):
+    def __init__(
+        self,
+        component: str,
+        reads=(),
+        modifies=(),
+        requires=(),
+        active=True,
+    ):
+        super().__init__(None, None, ConverterOptions())
+        self._component = component
+        self._reads = frozenset(reads)
+        self._modifies = frozenset(modifies)
+        self._requires = frozenset(requires)
+        self._active = active
+
+    def build_from_cgmes(self, input_data):
+        return np.array([]), None
+
+    def component_name(self):
+        return self._component
+
+    def is_active(self):
+        return self._active
+
+
+def _builders():
+    node = _Builder(ComponentType.node)
+    line = _Builder(ComponentType.line, reads=[ComponentType.node])
+    link = _Builder(ComponentType.link, reads=[ComponentType.node])
+    load = _Builder(ComponentType.sym_load, reads=[ComponentType.node])
+    sensor = _Builder(
+        ComponentType.sym_power_sensor,
+        reads=[ComponentType.line, ComponentType.link, ComponentType.sym_load],
+    )
+    splitter = _Builder(ComponentType.sym_gen, modifies=[ComponentType.line])
+    return node, line, link, load, sensor, splitter
+
+
+def test_scheduled_builders_keep_their_order():
+    builders = list(_builders())
+
+    assert BuilderScheduler(builders).get_builders() == builders
+
+
+def test_inactive_builders_and_their_requirements_are_skipped():
+    node = _Builder(ComponentType.node)
+    shunt = _Builder(ComponentType.shunt, reads=[ComponentType.node], active=False)
+    sensor = _Builder(
+        ComponentType.sym_power_sensor,
+        reads=[ComponentType.shunt],
+        requires=[ComponentType.shunt],
+    )
+    # requires the skipped sensor
+    substitution = _Builder(
+        ComponentType.sym_voltage_sensor,
+        requires=[ComponentType.sym_power_sensor],
+    )
+
+    scheduler = BuilderScheduler([node, shunt, sensor, substitution])
+
+    assert scheduler.get_builders() == [node]
+
+
+def test_dependents():
+    node, line, link, load, sensor, splitter = _builders()
+    scheduler = BuilderScheduler([node, line, link, load, sensor, splitter])
+
+    assert scheduler.get_dependents([node]) == [
+        node,
+        line,
+        link,
+        load,
+        sensor,
+        splitter,
+    ]
+    assert scheduler.get_dependents([load]) == [load, sensor, splitter]
+    # modifying the lines depends on the sensors reading them
+    assert scheduler.get_dependents([sensor]) == [sensor, splitter]
+    assert scheduler.get_dependents([line, link]) == [line, link, sensor, splitter]
@@ -0,0 +1,31 @@
+# Copyright [2025] [SOPTIM AG]
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import sys
+from pathlib import Path
+
+import pytest
+
+# the synthetic grids of the benchmarks are used as test data
+sys.path.insert(0, str(Path(__file__).parents[1] / "benchmarks"))
+
+
+@pytest.fixture(name="grid_path", scope="session", params=["2.4", "3.0"])
+def _grid_path(request, tmp_path_factory) -> Path:
+    """Zip archive of a small synthetic CGMES grid for each CGMES version"""
+    pytest.importorskip("rdflib")
+    from synthetic_grid import SyntheticGridGenerator
+
+    path = tmp_path_factory.mktemp("grid") / f"grid-{request.param}.zip"
+    return SyntheticGridGenerator(12, request.param).write(path)
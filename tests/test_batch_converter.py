@@ -0,0 +1,130 @@
+# Copyright [2025] [SOPTIM AG]
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import logging
+
+import numpy as np
+from power_grid_model import ComponentType, initialize_array
+
+from cgmes2pgm_converter.batch_converter import BatchConverter, _get_iris
+
+COMPONENT = ComponentType.sym_load
+
+
+def _loads(ids, iris, p, node=1):
+    arr = initialize_array("input", COMPONENT, len(ids))
+    arr["id"] = ids
+    arr["node"] = node
+    arr["status"] = 1
+    arr["type"] = 0
+    arr["p_specified"] = p
+    arr["q_specified"] = np.asarray(p) / 2
+    extra_info = {pgm_id: {"_mrid": iri} for pgm_id, iri in zip(ids, iris)}
+    return arr, extra_info
+
+
+def _fill_update_scalar(update, base, base_extra_info, scenario, scenario_extra_info):
+    """Reference implementation matching components one by one"""
+    by_iri = {
+        scenario_extra_info[pgm_id]["_mrid"]: row
+        for pgm_id, row in zip(scenario["id"], scenario)
+    }
+    for i, pgm_id in enumerate(base["id"]):
+        row = by_iri.get(base_extra_info[pgm_id]["_mrid"])
+        if row is None:
+            continue
+        for attr in update.dtype.names:
+            if attr != "id":
+                update[attr][i] = row[attr]
+
+
+def _fill(base, base_extra_info, scenario, scenario_extra_info):
+    update = initialize_array("update", COMPONENT, len(base))
+    update["id"] = base["id"]
+    BatchConverter(None, [{}])._fill_update(  # type: ignore[arg-type]
+        COMPONENT,
+        update,
+        _get_iris(base["id"], base_extra_info),
+        base,
+        scenario,
+        scenario_extra_info,
+        0,
+    )
+    return update
+
+
+def test_get_iris():
+    _, extra_info = _loads([3, 1, 2], ["c", "a", "b"], 0.0)
+    assert _get_iris(np.array([1, 2, 3]), extra_info).tolist() == ["a", "b", "c"]
+
+
+def test_fill_update_matches_scalar():
+    rng = np.random.default_rng(0)
+    iris = [f"load-{i}" for i in range(50)]
+    base, base_extra_info = _loads(np.arange(50), iris, rng.random(50))
+
+    # different IDs and order, some components missing and some added
+    order = rng.permutation(50)[:40]
+    scenario_iris = [iris[i] for i in order] + [f"new-{i}" for i in range(5)]
+    scenario, scenario_extra_info = _loads(
+        np.arange(100, 145), scenario_iris, rng.random(45)
+    )
+    scenario["status"][::3] = 0
+
+    update = _fill(base, base_extra_info, scenario, scenario_extra_info)
+
+    expected = initialize_array("update", COMPONENT, len(base))
+    expected["id"] = base["id"]
+    _fill_update_scalar(expected, base, base_extra_info, scenario, scenario_extra_info)
+    for attr in expected.dtype.names:
+        np.testing.assert_array_equal(update[attr], expected[attr], err_msg=attr)
+
+
+def test_fill_update_matches_by_iri():
+    base, base_extra_info = _loads([1, 2, 3], ["a", "b", "c"], [1.0, 2.0, 3.0])
+    # other IDs and order, b is missing
+    scenario, scenario_extra_info = _loads([7, 8], ["c", "a"], [30.0, 10.0])
+    scenario["status"] = [1, 0]
+
+    update = _fill(base, base_extra_info, scenario, scenario_extra_info)
+
+    assert update["id"].tolist() == [1, 2, 3]
+    np.testing.assert_array_equal(update["p_specified"], [10.0, np.nan, 30.0])
+    np.testing.assert_array_equal(update["q_specified"], [5.0, np.nan, 15.0])
+    assert update["status"][[0, 2]].tolist() == [0, 1]
+
+
+def test_fill_update_keeps_missing_unset(caplog):
+    base, base_extra_info = _loads([1, 2], ["a", "b"], [1.0, 2.0])
+    scenario, scenario_extra_info = _loads([5, 6], ["b", "c"], [3.0, 4.0])
+
+    with caplog.at_level(logging.WARNING):
+        update = _fill(base, base_extra_info, scenario, scenario_extra_info)
+
+    # nan keeps the input value in the batch calculation
+    assert np.isnan(update["p_specified"][0])
+    assert update["p_specified"][1] == 3.0
+    assert "1 of 2" in caplog.text
+    assert "Ignoring 1" in caplog.text
+
+
+def test_fill_update_warns_on_fixed_attributes(caplog):
+    base, base_extra_info = _loads([1, 2], ["a", "b"], [1.0, 2.0])
+    scenario, scenario_extra_info = _loads([1, 2], ["a", "b"], [1.0, 2.0])
+    scenario["type"][1] = 1
+
+    with caplog.at_level(logging.WARNING):
+        _fill(base, base_extra_info, scenario, scenario_extra_info)
+
+    assert "type differs for 1 components" in caplog.text
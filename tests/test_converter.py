@@ -0,0 +1,40 @@
+# Copyright [2025] [SOPTIM AG]
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+from cgmes2pgm_converter import CgmesFileDataset, CgmesToPgmConverter
+from cgmes2pgm_converter.components import BuilderScheduler
+
+
+def test_fetch_query_results_shares_read_only_results(grid_path):
+    converter = CgmesToPgmConverter(CgmesFileDataset(grid_path))
+    builders = BuilderScheduler(converter._get_component_builders()).get_builders()
+
+    query_results = converter._fetch_query_results(builders)
+
+    terminals = [
+        results["terminals"]
+        for results in query_results.values()
+        if "terminals" in results
+    ]
+    assert len(terminals) > 1
+    assert all(result is terminals[0] for result in terminals)
+
+    # all other results are owned by their builder
+    others = [
+        id(result)
+        for results in query_results.values()
+        for name, result in results.items()
+        if name != "terminals"
+    ]
+    assert len(set(others)) == len(others)
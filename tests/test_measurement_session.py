@@ -0,0 +1,88 @@
+# Copyright [2025] [SOPTIM AG]
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import numpy as np
+import pytest
+from power_grid_model import ComponentType
+
+from cgmes2pgm_converter import (
+    CgmesFileDataset,
+    CgmesToPgmConverter,
+    MeasurementSession,
+)
+from cgmes2pgm_converter.common import QueryResultCache
+
+SENSORS = [ComponentType.sym_power_sensor, ComponentType.sym_voltage_sensor]
+
+# replaces all measurement values, like a writer updating the triplestore
+# without using the dataset
+SCALE_VALUES = """
+    PREFIX cim: <{cim}>
+    PREFIX xsd: <http://www.w3.org/2001/XMLSchema#>
+    DELETE {{ GRAPH ?g {{ ?v cim:AnalogValue.value ?x }} }}
+    INSERT {{ GRAPH ?g {{ ?v cim:AnalogValue.value ?y }} }}
+    WHERE {{
+        GRAPH ?g {{ ?v cim:AnalogValue.value ?x }}
+        BIND(STR(xsd:double(?x) * 1.5) AS ?y)
+    }}
+"""
+
+
+def _assert_equal(actual: dict, expected: dict):
+    # compared per attribute, as nan is not equal to nan in structured arrays
+    for component, arr in expected.items():
+        for attribute in arr.dtype.names:
+            np.testing.assert_array_equal(
+                actual[component][attribute],
+                arr[attribute],
+                err_msg=f"{component}.{attribute}",
+            )
+
+
+def test_convert_equals_converter(grid_path):
+    expected, expected_extra_info = CgmesToPgmConverter(
+        CgmesFileDataset(grid_path)
+    ).convert()
+
+    data, extra_info = MeasurementSession(CgmesFileDataset(grid_path)).convert()
+
+    _assert_equal(data, expected)
+    np.testing.assert_equal(extra_info, expected_extra_info)
+
+
+def test_refresh_reads_changed_values(grid_path, tmp_path):
+    pytest.importorskip("pyarrow")
+    dataset = CgmesFileDataset(grid_path, result_cache=QueryResultCache(tmp_path))
+    session = MeasurementSession(dataset)
+    before, _ = session.convert()
+    before = {c: before[c].copy() for c in SENSORS}
+
+    dataset.embedded.update(SCALE_VALUES.format(cim=dataset.cim_namespace))
+    data, extra_info = session.refresh()
+
+    # the same sensors with the new values
+    for component in SENSORS:
+        np.testing.assert_array_equal(data[component]["id"], before[component]["id"])
+    assert np.any(data[ComponentType.sym_power_sensor]["p_measured"] != 0)
+    assert not np.allclose(
+        data[ComponentType.sym_power_sensor]["p_measured"],
+        before[ComponentType.sym_power_sensor]["p_measured"],
+    )
+
+    # equal to a full conversion of the changed data
+    expected_dataset = CgmesFileDataset(grid_path)
+    expected_dataset.embedded.update(SCALE_VALUES.format(cim=dataset.cim_namespace))
+    expected, expected_extra_info = CgmesToPgmConverter(expected_dataset).convert()
+    _assert_equal(data, expected)
+    np.testing.assert_equal(extra_info, expected_extra_info)